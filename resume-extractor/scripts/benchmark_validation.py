@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Benchmark full vs trusted resume validation.
+
+Usage:
+    uv run scripts/benchmark_validation.py [--positions N] [--rounds N]
+
+Examples:
+    uv run scripts/benchmark_validation.py
+    uv run scripts/benchmark_validation.py --positions 5000 --rounds 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from schema import validate_resume, validation_stamp
+
+
+def build_resume(positions: int, bullets: int = 5) -> dict:
+    """Build a synthetic resume with one position per company."""
+    return {
+        "contact": {"name": "Benchmark User", "email": "bench@example.com"},
+        "summary": "Engineer with a long history of synthetic positions.",
+        "skills": {"Languages": ["Python", "Go"]},
+        "education": [{"institution": "State University", "degree": "BS, CS"}],
+        "experience": [
+            {
+                "company": f"Company {i}",
+                "positions": [
+                    {
+                        "title": "Engineer",
+                        "dates": "2020 - 2021",
+                        "achievements": [
+                            f"Built system {i}-{j} serving {j * 10}% more traffic"
+                            for j in range(bullets)
+                        ],
+                    }
+                ],
+            }
+            for i in range(positions)
+        ],
+    }
+
+
+def time_call(fn, rounds: int) -> float:
+    """Return mean seconds per call over ``rounds`` calls."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume validation paths")
+    parser.add_argument("--positions", type=int, default=1000, help="Number of positions")
+    parser.add_argument("--rounds", type=int, default=10, help="Calls per measurement")
+    args = parser.parse_args()
+
+    data = build_resume(args.positions)
+    stamp = validation_stamp(data)
+    validate_resume(data, trusted=True, stamp=stamp)  # prime the stamp cache
+
+    results = [
+        ("full", time_call(lambda: validate_resume(data), args.rounds)),
+        ("stamp", time_call(lambda: validation_stamp(data), args.rounds)),
+        (
+            "trusted (given stamp)",
+            time_call(lambda: validate_resume(data, trusted=True, stamp=stamp), args.rounds),
+        ),
+        (
+            "trusted (computed stamp)",
+            time_call(lambda: validate_resume(data, trusted=True), args.rounds),
+        ),
+    ]
+
+    print(f"Validation benchmark: {args.positions} positions, {args.rounds} rounds")
+    for label, seconds in results:
+        print(f"  {label:26} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Export the Resume pydantic model as JSON Schema.
+
+Writes references/resume_schema.json and checks that the documented
+example in references/resume_schema.yaml uses exactly the fields the
+models define. Run with --check in CI to fail when either drifts.
+
+Usage:
+    uv run scripts/export_json_schema.py [--output <file>] [--check]
+
+Examples:
+    uv run scripts/export_json_schema.py
+    uv run scripts/export_json_schema.py --check
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+REFERENCES_DIR = Path(__file__).parent.parent / "references"
+SCHEMA_JSON_PATH = REFERENCES_DIR / "resume_schema.json"
+SCHEMA_YAML_PATH = REFERENCES_DIR / "resume_schema.yaml"
+
+
+def build_json_schema() -> dict:
+    """Build the JSON Schema for the Resume model."""
+    from schema import Resume
+
+    schema = Resume.model_json_schema()
+    schema["$schema"] = "https://json-schema.org/draft/2020-12/schema"
+    return schema
+
+
+def render_json_schema(schema: dict) -> str:
+    """Serialize a schema deterministically for checking in."""
+    return json.dumps(schema, indent=2, sort_keys=True) + "\n"
+
+
+def _resolve(node: dict, defs: dict) -> dict:
+    """Follow $ref and unwrap Optional (anyOf with null) to the concrete node."""
+    if "$ref" in node:
+        return defs[node["$ref"].rsplit("/", 1)[-1]]
+    if "anyOf" in node:
+        branches = [b for b in node["anyOf"] if b.get("type") != "null"]
+        if len(branches) == 1:
+            return _resolve(branches[0], defs)
+    return node
+
+
+def check_reference_sync(schema: dict, example: dict) -> list[str]:
+    """Compare the YAML reference example against the JSON Schema.
+
+    Returns:
+        List of mismatch descriptions (empty when in sync)
+    """
+    defs = schema.get("$defs", {})
+    problems = []
+
+    def walk(node: dict, values: list, path: str) -> None:
+        node = _resolve(node, defs)
+        node_type = node.get("type")
+
+        if node_type == "array":
+            items = [item for value in values if isinstance(value, list) for item in value]
+            walk(node.get("items", {}), items, f"{path}[]")
+            return
+
+        properties = node.get("properties")
+        if node_type != "object" or properties is None:
+            return
+
+        mappings = [v for v in values if isinstance(v, dict)]
+        if not mappings:
+            return
+        seen = set()
+        for mapping in mappings:
+            seen.update(mapping)
+        for key in sorted(seen - set(properties)):
+            problems.append(f"{path}.{key}: documented in YAML but not in models".lstrip("."))
+        for key in properties:
+            if key not in seen:
+                problems.append(f"{path}.{key}: defined in models but not documented".lstrip("."))
+            else:
+                walk(properties[key], [m[key] for m in mappings if key in m], f"{path}.{key}")
+
+    walk(schema, [example], "")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export Resume model as JSON Schema")
+    parser.add_argument(
+        "-o", "--output", type=Path, default=SCHEMA_JSON_PATH,
+        help=f"Output path (default: {SCHEMA_JSON_PATH.name} in references/)",
+    )
+    parser.add_argument(
+        "--check", action="store_true",
+        help="Fail if the checked-in schema or YAML reference is out of date",
+    )
+    args = parser.parse_args()
+
+    import yaml
+
+    schema = build_json_schema()
+    rendered = render_json_schema(schema)
+    example = yaml.safe_load(SCHEMA_YAML_PATH.read_text())
+    problems = check_reference_sync(schema, example)
+
+    if args.check:
+        if not args.output.exists() or args.output.read_text() != rendered:
+            problems.append(
+                f"{args.output.name} is out of date; run scripts/export_json_schema.py"
+            )
+        if problems:
+            print("Schema check failed:", file=sys.stderr)
+            for problem in problems:
+                print(f"  - {problem}", file=sys.stderr)
+            sys.exit(1)
+        print("Schema artifacts are in sync", file=sys.stderr)
+        return
+
+    args.output.write_text(rendered)
+    print(f"JSON Schema written to: {args.output}", file=sys.stderr)
+    for problem in problems:
+        print(f"Warning: {problem}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+"""
+Generate a pydantic-free structural validator from the Resume JSON Schema.
+
+Reads references/resume_schema.json and emits scripts/resume_validator.py:
+straight-line Python checks (types, required keys, minLength, minItems)
+compiled ahead of time, in the style of fastjsonschema. Consumers that
+only need structural checks can import it without importing pydantic.
+
+Usage:
+    uv run scripts/generate_validator.py [--schema <file>] [--output <file>] [--check]
+
+Examples:
+    uv run scripts/generate_validator.py
+    uv run scripts/generate_validator.py --check
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).parent
+SCHEMA_JSON_PATH = SCRIPTS_DIR.parent / "references" / "resume_schema.json"
+VALIDATOR_PATH = SCRIPTS_DIR / "resume_validator.py"
+
+HEADER = '''"""Structural validator for resume data.
+
+GENERATED by generate_validator.py from references/resume_schema.json.
+Do not edit by hand; regenerate after changing schema.py.
+
+Checks types, required fields, minLength and minItems without importing
+pydantic. Value-level rules implemented as pydantic validators (email
+format, blank achievements) are not covered; use schema.validate_resume
+for those.
+"""
+
+
+def _join(path, key):
+    return f"{path}.{key}" if path else key
+
+
+def _type_name(value):
+    return "null" if value is None else type(value).__name__
+'''
+
+FOOTER = '''
+
+def validate(data) -> list[str]:
+    """Validate resume data structurally.
+
+    Returns:
+        List of error messages (empty when valid)
+    """
+    errors = []
+    _validate_root(data, "", errors)
+    return errors
+
+
+def is_valid(data) -> bool:
+    """Return True if resume data passes structural validation."""
+    return not validate(data)
+'''
+
+TYPE_CHECKS = {
+    "string": "isinstance({v}, str)",
+    "array": "isinstance({v}, list)",
+    "object": "isinstance({v}, dict)",
+    "null": "{v} is None",
+    "boolean": "isinstance({v}, bool)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool))",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+}
+
+
+class ValidatorGenerator:
+    """Emit Python source for a JSON Schema subset used by pydantic models."""
+
+    def __init__(self, schema: dict):
+        self.schema = schema
+        self.defs = schema.get("$defs", {})
+        self.functions: list[list[str]] = []
+        self._branch_count = 0
+
+    def generate(self) -> str:
+        for name in sorted(self.defs):
+            self._emit_function(f"_validate_{name}", self.defs[name])
+        self._emit_function("_validate_root", self.schema)
+        body = "\n\n\n".join("\n".join(lines) for lines in self.functions)
+        return f"{HEADER}\n\n{body}\n{FOOTER}"
+
+    def _emit_function(self, name: str, node: dict) -> None:
+        lines = [f"def {name}(v0, path, errors):"]
+        lines.extend(self._emit_node(node, "v0", "path", 1, 0))
+        if len(lines) == 1:
+            lines.append("    pass")
+        self.functions.append(lines)
+
+    def _emit_node(self, node: dict, var: str, path: str, indent: int, depth: int) -> list[str]:
+        pad = "    " * indent
+
+        if "$ref" in node:
+            target = node["$ref"].rsplit("/", 1)[-1]
+            return [f"{pad}_validate_{target}({var}, {path}, errors)"]
+
+        if "anyOf" in node:
+            return self._emit_any_of(node["anyOf"], var, path, indent, depth)
+
+        node_type = node.get("type")
+        if node_type is None:
+            return []
+
+        check = TYPE_CHECKS[node_type].format(v=var)
+        label = self._label(path)
+        lines = [
+            f"{pad}if not {check}:",
+            f'{pad}    errors.append(f"{{{label}}}: expected {node_type}, '
+            f'got {{_type_name({var})}}")',
+        ]
+        inner = self._emit_constraints(node, node_type, var, path, indent + 1, depth)
+        if inner:
+            lines.append(f"{pad}else:")
+            lines.extend(inner)
+        return lines
+
+    @staticmethod
+    def _label(path: str) -> str:
+        # Only a function's own path argument can be empty (the document root)
+        return f"{path} or '<root>'" if path == "path" else path
+
+    def _emit_constraints(
+        self, node: dict, node_type: str, var: str, path: str, indent: int, depth: int
+    ) -> list[str]:
+        pad = "    " * indent
+        lines = []
+
+        if node_type == "string" and "minLength" in node:
+            n = node["minLength"]
+            lines += [
+                f"{pad}if len({var}) < {n}:",
+                f'{pad}    errors.append(f"{{{path}}}: must have at least {n} character(s)")',
+            ]
+
+        if node_type == "array":
+            if "minItems" in node:
+                n = node["minItems"]
+                lines += [
+                    f"{pad}if len({var}) < {n}:",
+                    f'{pad}    errors.append(f"{{{path}}}: must have at least {n} item(s)")',
+                ]
+            items = node.get("items")
+            if items:
+                item_var, index = f"v{depth + 1}", f"i{depth + 1}"
+                item_path = f"p{depth + 1}"
+                body = self._emit_node(items, item_var, item_path, indent + 1, depth + 1)
+                if body:
+                    lines += [
+                        f"{pad}for {index}, {item_var} in enumerate({var}):",
+                        f'{pad}    {item_path} = f"{{{path}}}[{{{index}}}]"',
+                    ] + body
+
+        if node_type == "object":
+            required = node.get("required", [])
+            for key in required:
+                lines += [
+                    f"{pad}if {key!r} not in {var}:",
+                    f'{pad}    errors.append(f"{{_join({path}, {key!r})}}: field required")',
+                ]
+            for key, prop in node.get("properties", {}).items():
+                child_var, child_path = f"v{depth + 1}", f"p{depth + 1}"
+                body = self._emit_node(prop, child_var, child_path, indent + 1, depth + 1)
+                if body:
+                    lines += [
+                        f"{pad}if {key!r} in {var}:",
+                        f"{pad}    {child_var} = {var}[{key!r}]",
+                        f"{pad}    {child_path} = _join({path}, {key!r})",
+                    ] + body
+
+            extra = node.get("additionalProperties")
+            if extra is False:
+                allowed = tuple(node.get("properties", {}))
+                lines += [
+                    f"{pad}for k{depth} in {var}:",
+                    f"{pad}    if k{depth} not in {allowed!r}:",
+                    f'{pad}        errors.append(f"{{_join({path}, k{depth})}}: '
+                    f'extra field not permitted")',
+                ]
+            elif isinstance(extra, dict) and extra:
+                known = tuple(node.get("properties", {}))
+                child_var, child_path = f"v{depth + 1}", f"p{depth + 1}"
+                body = self._emit_node(extra, child_var, child_path, indent + 1, depth + 1)
+                if body:
+                    lines.append(f"{pad}for k{depth}, {child_var} in {var}.items():")
+                    if known:
+                        lines += [
+                            f"{pad}    if k{depth} in {known!r}:",
+                            f"{pad}        continue",
+                        ]
+                    lines.append(f"{pad}    {child_path} = _join({path}, k{depth})")
+                    lines += body
+
+        return lines
+
+    def _emit_any_of(
+        self, branches: list[dict], var: str, path: str, indent: int, depth: int
+    ) -> list[str]:
+        pad = "    " * indent
+        nullable = any(b.get("type") == "null" for b in branches)
+        others = [b for b in branches if b.get("type") != "null"]
+
+        if nullable and len(others) == 1:
+            body = self._emit_node(others[0], var, path, indent + 1, depth)
+            if not body:
+                return []
+            return [f"{pad}if {var} is not None:"] + body
+
+        names = []
+        for branch in others:
+            self._branch_count += 1
+            name = f"_branch_{self._branch_count}"
+            self._emit_function(name, branch)
+            names.append(name)
+
+        lines = []
+        if nullable:
+            lines.append(f"{pad}if {var} is not None:")
+            pad += "    "
+        lines += [
+            f"{pad}for check in ({', '.join(names)},):",
+            f"{pad}    branch_errors = []",
+            f"{pad}    check({var}, {path}, branch_errors)",
+            f"{pad}    if not branch_errors:",
+            f"{pad}        break",
+            f"{pad}else:",
+            f'{pad}    errors.append(f"{{{self._label(path)}}}: does not match any allowed type")',
+        ]
+        return lines
+
+
+def generate_validator_source(schema: dict) -> str:
+    """Generate validator module source for a JSON Schema."""
+    return ValidatorGenerator(schema).generate()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate a pydantic-free resume validator from JSON Schema"
+    )
+    parser.add_argument("--schema", type=Path, default=SCHEMA_JSON_PATH, help="JSON Schema file")
+    parser.add_argument("-o", "--output", type=Path, default=VALIDATOR_PATH, help="Output module")
+    parser.add_argument(
+        "--check", action="store_true", help="Fail if the generated module is out of date"
+    )
+    args = parser.parse_args()
+
+    schema = json.loads(args.schema.read_text())
+    source = generate_validator_source(schema)
+
+    if args.check:
+        if not args.output.exists() or args.output.read_text() != source:
+            print(
+                f"Error: {args.output.name} is out of date; run scripts/generate_validator.py",
+                file=sys.stderr,
+            )
+            sys.exit(1)
+        print(f"{args.output.name} is up to date", file=sys.stderr)
+        return
+
+    args.output.write_text(source)
+    print(f"Validator written to: {args.output}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Multi-pattern phrase scanner for resume bullet linting.
+
+Builds an Aho-Corasick automaton over categorized phrase dictionaries
+(weak verbs, buzzwords, banned phrases, ATS keywords, ...) and reports
+every occurrence in a single pass over the text. Scan time is linear in
+the text length plus the number of matches, independent of how many
+phrases are loaded.
+
+Dictionaries are plain mappings of category -> list of phrases, or YAML
+files with that shape (see resume-optimizer/references/lint_phrases.yaml).
+"""
+
+from pathlib import Path
+from typing import Iterable, NamedTuple, Optional
+
+# Achievements should not start with these; shared by schema.py and
+# validate_yaml.py (lint_phrases.yaml extends the list)
+WEAK_VERBS = ["worked", "helped", "responsible", "participated", "involved", "assisted"]
+
+
+class PhraseMatch(NamedTuple):
+    """A dictionary phrase found in scanned text."""
+
+    category: str
+    phrase: str
+    start: int
+    end: int
+
+
+def _fold(ch: str) -> str:
+    """Lowercase a single character without changing text offsets."""
+    lowered = ch.lower()
+    return lowered if len(lowered) == 1 else ch
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+class PhraseScanner:
+    """Aho-Corasick automaton over categorized phrases.
+
+    Matching is case-insensitive. With ``whole_words`` (the default), a
+    match only counts when it is not glued to neighbouring letters or
+    digits, so "led" does not fire inside "called".
+    """
+
+    def __init__(
+        self,
+        dictionaries: Optional[dict[str, Iterable[str]]] = None,
+        whole_words: bool = True,
+    ):
+        self.whole_words = whole_words
+        self._patterns: list[tuple[str, str]] = []
+        self._seen: set[tuple[str, str]] = set()
+        # Trie: goto transitions, failure links, per-node pattern ids and a
+        # dictionary-suffix link to the nearest node that has outputs.
+        self._goto: list[dict[str, int]] = [{}]
+        self._out: list[list[int]] = [[]]
+        self._fail: list[int] = [0]
+        self._dict_link: list[int] = [0]
+        self._built = True
+        for category, phrases in (dictionaries or {}).items():
+            self.add_all(category, phrases)
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    @property
+    def categories(self) -> set[str]:
+        return {category for category, _ in self._patterns}
+
+    def phrases(self, category: str) -> list[str]:
+        """Return the normalized phrases loaded for a category."""
+        return [phrase for cat, phrase in self._patterns if cat == category]
+
+    def copy(self) -> "PhraseScanner":
+        """Return an independent scanner with the same phrases."""
+        clone = PhraseScanner(whole_words=self.whole_words)
+        for category, phrase in self._patterns:
+            clone.add(category, phrase)
+        return clone
+
+    def add(self, category: str, phrase: str) -> None:
+        """Add a phrase under a category."""
+        normalized = " ".join(phrase.split()).lower()
+        if not normalized or (category, normalized) in self._seen:
+            return
+        self._seen.add((category, normalized))
+
+        node = 0
+        for ch in normalized:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._out.append([])
+                self._fail.append(0)
+                self._dict_link.append(0)
+                self._goto[node][ch] = nxt
+            node = nxt
+        self._out[node].append(len(self._patterns))
+        self._patterns.append((category, normalized))
+        self._built = False
+
+    def add_all(self, category: str, phrases: Iterable[str]) -> None:
+        """Add several phrases under one category."""
+        for phrase in phrases:
+            self.add(category, str(phrase))
+
+    def _build(self) -> None:
+        """Compute failure and dictionary-suffix links breadth-first."""
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+        queue = []
+        for child in goto[0].values():
+            fail[child] = 0
+            dict_link[child] = 0
+            queue.append(child)
+
+        for node in queue:
+            for ch, child in goto[node].items():
+                state = fail[node]
+                while state and ch not in goto[state]:
+                    state = fail[state]
+                target = goto[state].get(ch, 0)
+                fail[child] = target if target != child else 0
+                dict_link[child] = fail[child] if out[fail[child]] else dict_link[fail[child]]
+                queue.append(child)
+
+        self._built = True
+
+    def scan(self, text: str, categories: Optional[set[str]] = None) -> list[PhraseMatch]:
+        """Find every dictionary phrase in ``text``.
+
+        Args:
+            text: Text to scan
+            categories: Only report these categories (default: all)
+
+        Returns:
+            Matches ordered by end position, then longest first
+        """
+        if not self._built:
+            self._build()
+
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+        patterns = self._patterns
+        matches = []
+        state = 0
+        for i, raw in enumerate(text):
+            ch = _fold(raw)
+            if ch.isspace():
+                ch = " "
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+
+            node = state if out[state] else dict_link[state]
+            while node:
+                for pid in out[node]:
+                    category, phrase = patterns[pid]
+                    if categories is not None and category not in categories:
+                        continue
+                    end = i + 1
+                    start = end - len(phrase)
+                    if self.whole_words and not self._on_word_boundary(text, start, end):
+                        continue
+                    matches.append(PhraseMatch(category, phrase, start, end))
+                node = dict_link[node]
+
+        return matches
+
+    @staticmethod
+    def _on_word_boundary(text: str, start: int, end: int) -> bool:
+        if start > 0 and _is_word_char(text[start - 1]) and _is_word_char(text[start]):
+            return False
+        if end < len(text) and _is_word_char(text[end]) and _is_word_char(text[end - 1]):
+            return False
+        return True
+
+    def leading_match(
+        self, text: str, categories: Optional[set[str]] = None
+    ) -> Optional[PhraseMatch]:
+        """Return the longest match that starts at the first word of ``text``."""
+        offset = len(text) - len(text.lstrip())
+        leading = [m for m in self.scan(text, categories) if m.start == offset]
+        if not leading:
+            return None
+        return max(leading, key=lambda m: m.end)
+
+
+def load_dictionaries(path: Path) -> dict[str, list[str]]:
+    """Load category -> phrases mappings from a YAML file."""
+    import yaml
+
+    with open(path) as f:
+        data = yaml.safe_load(f) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"Phrase dictionary must be a mapping of category -> phrases: {path}")
+    return {
+        str(category): [str(p) for p in phrases or []]
+        for category, phrases in data.items()
+    }
@@ -0,0 +1,571 @@
+"""Structural validator for resume data.
+
+GENERATED by generate_validator.py from references/resume_schema.json.
+Do not edit by hand; regenerate after changing schema.py.
+
+Checks types, required fields, minLength and minItems without importing
+pydantic. Value-level rules implemented as pydantic validators (email
+format, blank achievements) are not covered; use schema.validate_resume
+for those.
+"""
+
+
+def _join(path, key):
+    return f"{path}.{key}" if path else key
+
+
+def _type_name(value):
+    return "null" if value is None else type(value).__name__
+
+
+def _validate_Award(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'name' not in v0:
+            errors.append(f"{_join(path, 'name')}: field required")
+        if 'date' in v0:
+            v1 = v0['date']
+            p1 = _join(path, 'date')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'description' in v0:
+            v1 = v0['description']
+            p1 = _join(path, 'description')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'issuer' in v0:
+            v1 = v0['issuer']
+            p1 = _join(path, 'issuer')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'name' in v0:
+            v1 = v0['name']
+            p1 = _join(path, 'name')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+
+
+def _validate_Certification(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'name' not in v0:
+            errors.append(f"{_join(path, 'name')}: field required")
+        if 'credential_id' in v0:
+            v1 = v0['credential_id']
+            p1 = _join(path, 'credential_id')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'date' in v0:
+            v1 = v0['date']
+            p1 = _join(path, 'date')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'issuer' in v0:
+            v1 = v0['issuer']
+            p1 = _join(path, 'issuer')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'name' in v0:
+            v1 = v0['name']
+            p1 = _join(path, 'name')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'url' in v0:
+            v1 = v0['url']
+            p1 = _join(path, 'url')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _validate_Contact(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'name' not in v0:
+            errors.append(f"{_join(path, 'name')}: field required")
+        if 'email' in v0:
+            v1 = v0['email']
+            p1 = _join(path, 'email')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'github' in v0:
+            v1 = v0['github']
+            p1 = _join(path, 'github')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'linkedin' in v0:
+            v1 = v0['linkedin']
+            p1 = _join(path, 'linkedin')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'location' in v0:
+            v1 = v0['location']
+            p1 = _join(path, 'location')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'name' in v0:
+            v1 = v0['name']
+            p1 = _join(path, 'name')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'phone' in v0:
+            v1 = v0['phone']
+            p1 = _join(path, 'phone')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'title' in v0:
+            v1 = v0['title']
+            p1 = _join(path, 'title')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'website' in v0:
+            v1 = v0['website']
+            p1 = _join(path, 'website')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _validate_Education(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'institution' not in v0:
+            errors.append(f"{_join(path, 'institution')}: field required")
+        if 'degree' not in v0:
+            errors.append(f"{_join(path, 'degree')}: field required")
+        if 'degree' in v0:
+            v1 = v0['degree']
+            p1 = _join(path, 'degree')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'gpa' in v0:
+            v1 = v0['gpa']
+            p1 = _join(path, 'gpa')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'graduation_year' in v0:
+            v1 = v0['graduation_year']
+            p1 = _join(path, 'graduation_year')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'honors' in v0:
+            v1 = v0['honors']
+            p1 = _join(path, 'honors')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'institution' in v0:
+            v1 = v0['institution']
+            p1 = _join(path, 'institution')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'location' in v0:
+            v1 = v0['location']
+            p1 = _join(path, 'location')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'minor' in v0:
+            v1 = v0['minor']
+            p1 = _join(path, 'minor')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _validate_Experience(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'company' not in v0:
+            errors.append(f"{_join(path, 'company')}: field required")
+        if 'positions' not in v0:
+            errors.append(f"{_join(path, 'positions')}: field required")
+        if 'company' in v0:
+            v1 = v0['company']
+            p1 = _join(path, 'company')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'location' in v0:
+            v1 = v0['location']
+            p1 = _join(path, 'location')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'positions' in v0:
+            v1 = v0['positions']
+            p1 = _join(path, 'positions')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 item(s)")
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Position(v2, p2, errors)
+
+
+def _validate_Language(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'language' not in v0:
+            errors.append(f"{_join(path, 'language')}: field required")
+        if 'language' in v0:
+            v1 = v0['language']
+            p1 = _join(path, 'language')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'proficiency' in v0:
+            v1 = v0['proficiency']
+            p1 = _join(path, 'proficiency')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _validate_Position(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'title' not in v0:
+            errors.append(f"{_join(path, 'title')}: field required")
+        if 'dates' not in v0:
+            errors.append(f"{_join(path, 'dates')}: field required")
+        if 'achievements' in v0:
+            v1 = v0['achievements']
+            p1 = _join(path, 'achievements')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    if not isinstance(v2, str):
+                        errors.append(f"{p2}: expected string, got {_type_name(v2)}")
+        if 'dates' in v0:
+            v1 = v0['dates']
+            p1 = _join(path, 'dates')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'title' in v0:
+            v1 = v0['title']
+            p1 = _join(path, 'title')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+
+
+def _validate_Project(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'name' not in v0:
+            errors.append(f"{_join(path, 'name')}: field required")
+        if 'achievements' in v0:
+            v1 = v0['achievements']
+            p1 = _join(path, 'achievements')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    if not isinstance(v2, str):
+                        errors.append(f"{p2}: expected string, got {_type_name(v2)}")
+        if 'dates' in v0:
+            v1 = v0['dates']
+            p1 = _join(path, 'dates')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'description' in v0:
+            v1 = v0['description']
+            p1 = _join(path, 'description')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'name' in v0:
+            v1 = v0['name']
+            p1 = _join(path, 'name')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'technologies' in v0:
+            v1 = v0['technologies']
+            p1 = _join(path, 'technologies')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    if not isinstance(v2, str):
+                        errors.append(f"{p2}: expected string, got {_type_name(v2)}")
+        if 'url' in v0:
+            v1 = v0['url']
+            p1 = _join(path, 'url')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _validate_Publication(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'title' not in v0:
+            errors.append(f"{_join(path, 'title')}: field required")
+        if 'authors' in v0:
+            v1 = v0['authors']
+            p1 = _join(path, 'authors')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'date' in v0:
+            v1 = v0['date']
+            p1 = _join(path, 'date')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'title' in v0:
+            v1 = v0['title']
+            p1 = _join(path, 'title')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'url' in v0:
+            v1 = v0['url']
+            p1 = _join(path, 'url')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'venue' in v0:
+            v1 = v0['venue']
+            p1 = _join(path, 'venue')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _validate_Volunteer(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'organization' not in v0:
+            errors.append(f"{_join(path, 'organization')}: field required")
+        if 'achievements' in v0:
+            v1 = v0['achievements']
+            p1 = _join(path, 'achievements')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    if not isinstance(v2, str):
+                        errors.append(f"{p2}: expected string, got {_type_name(v2)}")
+        if 'dates' in v0:
+            v1 = v0['dates']
+            p1 = _join(path, 'dates')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'description' in v0:
+            v1 = v0['description']
+            p1 = _join(path, 'description')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'organization' in v0:
+            v1 = v0['organization']
+            p1 = _join(path, 'organization')
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+            else:
+                if len(v1) < 1:
+                    errors.append(f"{p1}: must have at least 1 character(s)")
+        if 'role' in v0:
+            v1 = v0['role']
+            p1 = _join(path, 'role')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _branch_1(v0, path, errors):
+    if not isinstance(v0, list):
+        errors.append(f"{path or '<root>'}: expected array, got {_type_name(v0)}")
+    else:
+        for i1, v1 in enumerate(v0):
+            p1 = f"{path}[{i1}]"
+            if not isinstance(v1, str):
+                errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+
+
+def _branch_2(v0, path, errors):
+    if not isinstance(v0, str):
+        errors.append(f"{path or '<root>'}: expected string, got {_type_name(v0)}")
+
+
+def _validate_root(v0, path, errors):
+    if not isinstance(v0, dict):
+        errors.append(f"{path or '<root>'}: expected object, got {_type_name(v0)}")
+    else:
+        if 'contact' not in v0:
+            errors.append(f"{_join(path, 'contact')}: field required")
+        if 'awards' in v0:
+            v1 = v0['awards']
+            p1 = _join(path, 'awards')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Award(v2, p2, errors)
+        if 'certifications' in v0:
+            v1 = v0['certifications']
+            p1 = _join(path, 'certifications')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Certification(v2, p2, errors)
+        if 'contact' in v0:
+            v1 = v0['contact']
+            p1 = _join(path, 'contact')
+            _validate_Contact(v1, p1, errors)
+        if 'education' in v0:
+            v1 = v0['education']
+            p1 = _join(path, 'education')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Education(v2, p2, errors)
+        if 'experience' in v0:
+            v1 = v0['experience']
+            p1 = _join(path, 'experience')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Experience(v2, p2, errors)
+        if 'languages' in v0:
+            v1 = v0['languages']
+            p1 = _join(path, 'languages')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Language(v2, p2, errors)
+        if 'projects' in v0:
+            v1 = v0['projects']
+            p1 = _join(path, 'projects')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Project(v2, p2, errors)
+        if 'publications' in v0:
+            v1 = v0['publications']
+            p1 = _join(path, 'publications')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Publication(v2, p2, errors)
+        if 'skills' in v0:
+            v1 = v0['skills']
+            p1 = _join(path, 'skills')
+            if v1 is not None:
+                if not isinstance(v1, dict):
+                    errors.append(f"{p1}: expected object, got {_type_name(v1)}")
+                else:
+                    for k1, v2 in v1.items():
+                        p2 = _join(p1, k1)
+                        for check in (_branch_1, _branch_2,):
+                            branch_errors = []
+                            check(v2, p2, branch_errors)
+                            if not branch_errors:
+                                break
+                        else:
+                            errors.append(f"{p2}: does not match any allowed type")
+        if 'summary' in v0:
+            v1 = v0['summary']
+            p1 = _join(path, 'summary')
+            if v1 is not None:
+                if not isinstance(v1, str):
+                    errors.append(f"{p1}: expected string, got {_type_name(v1)}")
+        if 'volunteer' in v0:
+            v1 = v0['volunteer']
+            p1 = _join(path, 'volunteer')
+            if not isinstance(v1, list):
+                errors.append(f"{p1}: expected array, got {_type_name(v1)}")
+            else:
+                for i2, v2 in enumerate(v1):
+                    p2 = f"{p1}[{i2}]"
+                    _validate_Volunteer(v2, p2, errors)
+
+
+def validate(data) -> list[str]:
+    """Validate resume data structurally.
+
+    Returns:
+        List of error messages (empty when valid)
+    """
+    errors = []
+    _validate_root(data, "", errors)
+    return errors
+
+
+def is_valid(data) -> bool:
+    """Return True if resume data passes structural validation."""
+    return not validate(data)
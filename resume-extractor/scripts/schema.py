@@ -4,9 +4,13 @@ These models match the structure defined in references/resume_schema.yaml
 and provide type-safe validation for resume data.
 """
 
-from typing import Optional, Union
+import hashlib
+import json
+from typing import Any, Optional, Union, get_args, get_origin
 
-from pydantic import BaseModel, EmailStr, Field, HttpUrl, field_validator
+from pydantic import BaseModel, EmailStr, Field, HttpUrl, TypeAdapter, field_validator
+
+from phrase_scanner import WEAK_VERBS, PhraseScanner
 
 
 class Contact(BaseModel):
@@ -178,18 +182,38 @@ class Resume(BaseModel):
     model_config = {"extra": "allow"}  # Allow unknown fields for forward compatibility
 
 
-def validate_resume(data: dict) -> tuple[Resume, list[str]]:
-    """Validate resume data and return model with warnings.
+# Validators are built once at import time and shared by every caller.
+RESUME_ADAPTER = TypeAdapter(Resume)
+SECTION_ADAPTERS: dict[str, TypeAdapter] = {
+    name: TypeAdapter(field.annotation) for name, field in Resume.model_fields.items()
+}
+# Item validators for list sections, used when items arrive one at a time
+ITEM_ADAPTERS: dict[str, TypeAdapter] = {
+    name: TypeAdapter(get_args(field.annotation)[0])
+    for name, field in Resume.model_fields.items()
+    if get_origin(field.annotation) is list
+}
 
-    Args:
-        data: Resume data dictionary (typically loaded from YAML)
+_WEAK_VERB_SCANNER = PhraseScanner({"weak_verbs": WEAK_VERBS})
 
-    Returns:
-        Tuple of (validated Resume model, list of warning messages)
+# Stamps of data that already passed full validation, mapped to the
+# validated model and its warnings
+_VALIDATED_STAMPS: dict[str, tuple[Resume, list[str]]] = {}
+_MAX_CACHED_STAMPS = 256
 
-    Raises:
-        pydantic.ValidationError: If required fields are missing or invalid
+
+def validation_stamp(data: dict) -> str:
+    """Compute a content stamp for resume data.
+
+    Callers that already hold the raw YAML bytes can hash those instead and
+    pass the result as ``stamp`` to ``validate_resume``; both are opaque keys.
     """
+    payload = json.dumps(data, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def collect_warnings(data: dict) -> list[str]:
+    """Collect non-fatal quality warnings for resume data."""
     warnings = []
 
     # Check for recommended but missing sections
@@ -202,21 +226,118 @@ def validate_resume(data: dict) -> tuple[Resume, list[str]]:
     if not data.get("education"):
         warnings.append("Missing 'education' section - strongly recommended")
 
-    # Check for weak action verbs in achievements
-    weak_verbs = {"helped", "worked", "responsible", "participated", "assisted"}
-    for exp in data.get("experience", []):
+    warnings.extend(experience_warnings(data.get("experience", [])))
+    return warnings
+
+
+def experience_warnings(experience: list) -> list[str]:
+    """Check achievements in experience entries for weak action verbs."""
+    warnings = []
+    for exp in experience:
         for pos in exp.get("positions", []):
             for achievement in pos.get("achievements", []):
-                first_word = achievement.split()[0].lower().rstrip(",.:;")
-                if first_word in weak_verbs:
+                match = _WEAK_VERB_SCANNER.leading_match(achievement)
+                if match:
                     warnings.append(
-                        f"Weak verb '{first_word}' in achievement: {achievement[:50]}..."
+                        f"Weak verb '{match.phrase}' in achievement: {achievement[:50]}..."
                     )
+    return warnings
+
+
+def validate_resume(
+    data: dict,
+    trusted: bool = False,
+    stamp: Optional[str] = None,
+) -> tuple[Resume, list[str]]:
+    """Validate resume data and return model with warnings.
+
+    Args:
+        data: Resume data dictionary (typically loaded from YAML)
+        trusted: If True and ``stamp`` matches data that already passed full
+            validation in this process, skip validation and return a deep
+            copy of the model validated then.
+        stamp: Content stamp for ``data`` (default: ``validation_stamp(data)``)
+
+    Returns:
+        Tuple of (validated Resume model, list of warning messages)
+
+    Raises:
+        pydantic.ValidationError: If required fields are missing or invalid
+    """
+    if trusted:
+        if stamp is None:
+            stamp = validation_stamp(data)
+        cached = _VALIDATED_STAMPS.get(stamp)
+        if cached is not None:
+            resume, warnings = cached
+            return resume.model_copy(deep=True), list(warnings)
+
+    warnings = collect_warnings(data)
+    resume = RESUME_ADAPTER.validate_python(data)
+
+    if stamp is not None:
+        if len(_VALIDATED_STAMPS) >= _MAX_CACHED_STAMPS:
+            _VALIDATED_STAMPS.pop(next(iter(_VALIDATED_STAMPS)))
+        _VALIDATED_STAMPS[stamp] = (resume.model_copy(deep=True), list(warnings))
 
-    resume = Resume.model_validate(data)
     return resume, warnings
 
 
+def validate_section(name: str, value: Any) -> Any:
+    """Validate a single top-level section against its field type.
+
+    Raises:
+        KeyError: If ``name`` is not a known section
+        pydantic.ValidationError: If the section is invalid
+    """
+    return SECTION_ADAPTERS[name].validate_python(value)
+
+
+class ResumeView:
+    """Read-only attribute view over validated resume data.
+
+    Renderers get ``view.contact.name`` style access without building
+    pydantic models. Nested mappings and lists of mappings are wrapped
+    lazily on access; missing keys read as None.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        object.__setattr__(self, "_data", data)
+
+    @staticmethod
+    def _wrap(value: Any) -> Any:
+        if isinstance(value, dict):
+            return ResumeView(value)
+        if isinstance(value, list):
+            return [ResumeView(v) if isinstance(v, dict) else v for v in value]
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self._wrap(self._data.get(name))
+
+    def __getitem__(self, key: str) -> Any:
+        return self._wrap(self._data[key])
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("ResumeView is read-only")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._wrap(self._data.get(key, default))
+
+    def keys(self):
+        return self._data.keys()
+
+    def __repr__(self) -> str:
+        return f"ResumeView({self._data!r})"
+
+
 if __name__ == "__main__":
     # Example usage
     import sys
@@ -0,0 +1,371 @@
+"""Streaming loader for very large resume YAML files.
+
+``yaml.safe_load`` builds the whole document before anything else can
+happen. For academic CVs with thousands of publications and talks, this
+module reads the YAML event stream instead. Top-level sections arrive one
+at a time, and the items of list sections are composed, constructed and
+validated one by one. Peak memory is bounded by the largest single item,
+and validation errors are reported as soon as the offending item is read.
+
+Two entry points:
+
+- ``iter_sections(path)`` yields ``(key, value)`` pairs in file order.
+  List sections come back as a single-pass ``SectionStream``.
+- ``StreamingResume(path)`` is a read-only mapping that template engines
+  can render from. Small sections are parsed up front. List sections are
+  streamed when the template reaches them. Consuming them in file order
+  keeps memory bounded. Skipping ahead buffers any list section that has
+  not been consumed yet.
+"""
+
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping, Optional
+
+import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import (
+    AliasEvent,
+    MappingEndEvent,
+    MappingStartEvent,
+    ScalarEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+)
+from yaml.resolver import Resolver
+
+try:
+    from yaml.cyaml import CParser
+
+    _EventLoader = yaml.CSafeLoader
+
+    class _StreamLoader(CParser, Composer, SafeConstructor, Resolver):
+        """libyaml event parser with the pure-Python composer, so single
+        nodes can be composed on demand instead of whole documents."""
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+
+except ImportError:
+    _EventLoader = yaml.SafeLoader
+
+    class _StreamLoader(yaml.SafeLoader):
+        """Pure-Python fallback when PyYAML was built without libyaml."""
+
+
+ErrorCallback = Callable[[str, str], None]
+
+
+def scan_section_keys(path: Path) -> list[str]:
+    """List the top-level keys of a YAML mapping without building any nodes."""
+    keys = []
+    depth = 0
+    at_key = True
+    with open(path) as f:
+        for event in yaml.parse(f, Loader=_EventLoader):
+            if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+                if depth == 0 and not isinstance(event, MappingStartEvent):
+                    raise ValueError("Resume YAML must be a mapping at the top level")
+                depth += 1
+            elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+                depth -= 1
+                if depth == 1:
+                    at_key = not at_key
+            elif isinstance(event, (ScalarEvent, AliasEvent)):
+                if depth == 0:
+                    raise ValueError("Resume YAML must be a mapping at the top level")
+                if depth == 1:
+                    if at_key and isinstance(event, ScalarEvent):
+                        keys.append(event.value)
+                    at_key = not at_key
+    return keys
+
+
+def _format_errors(exc: Exception, prefix: str = "") -> list[str]:
+    errors = getattr(exc, "errors", None)
+    if not callable(errors):
+        return [str(exc)]
+    messages = []
+    for err in errors():
+        loc = "".join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in err["loc"])
+        messages.append(f"{prefix}{loc}: {err['msg']}" if loc else err["msg"])
+    return messages
+
+
+class SectionStream:
+    """Single-pass iterator over the items of a top-level list section.
+
+    Truth-testing peeks at the first item, so ``{% if publications %}``
+    works in templates. Once iterated, the items are gone unless the
+    stream was buffered with ``materialize()``.
+    """
+
+    def __init__(self, key: str, loader: _StreamLoader, validator: Optional[Callable]):
+        self.key = key
+        self._loader = loader
+        self._validator = validator
+        self._buffer: deque = deque()
+        self._index = 0
+        self._done = False
+        self._iterated = False
+        self._nonempty: Optional[bool] = None
+
+    def _read(self) -> bool:
+        """Read the next item into the buffer; return False at the end."""
+        if self._done:
+            return False
+        loader = self._loader
+        if loader.check_event(SequenceEndEvent):
+            loader.get_event()
+            self._done = True
+            return False
+        node = loader.compose_node(None, None)
+        item = loader.construct_document(node)
+        if self._validator is not None:
+            self._validator(self.key, self._index, item, node.start_mark.line + 1)
+        self._index += 1
+        self._buffer.append(item)
+        return True
+
+    def __bool__(self) -> bool:
+        if self._nonempty is None:
+            self._nonempty = bool(self._buffer) or self._read()
+        return self._nonempty
+
+    def __iter__(self) -> Iterator[Any]:
+        if self._iterated:
+            raise RuntimeError(f"Streamed section '{self.key}' can only be iterated once")
+        self._iterated = True
+        while self._buffer or self._read():
+            self._nonempty = True
+            yield self._buffer.popleft()
+
+    def materialize(self) -> None:
+        """Read all remaining items into memory (needed to skip past this section)."""
+        while self._read():
+            pass
+
+    def drain(self) -> None:
+        """Read and discard all unread items (they are still validated).
+
+        Items already buffered by ``materialize()`` are kept.
+        """
+        while self._read():
+            self._buffer.pop()
+
+    def __repr__(self) -> str:
+        state = "exhausted" if self._done else "streaming"
+        return f"SectionStream({self.key!r}, {state}, read={self._index})"
+
+
+class _SectionValidator:
+    """Validates sections and items as they arrive and reports problems."""
+
+    def __init__(self, on_error: ErrorCallback, on_warning: Optional[ErrorCallback]):
+        from schema import ITEM_ADAPTERS, SECTION_ADAPTERS, experience_warnings
+
+        self._items = ITEM_ADAPTERS
+        self._sections = SECTION_ADAPTERS
+        self._experience_warnings = experience_warnings
+        self.on_error = on_error
+        self.on_warning = on_warning
+
+    def section(self, key: str, value: Any, line: int) -> None:
+        adapter = self._sections.get(key)
+        if adapter is None:
+            return
+        try:
+            adapter.validate_python(value)
+        except Exception as e:
+            for message in _format_errors(e, key):
+                self.on_error(f"line {line}", message)
+
+    def item(self, key: str, index: int, item: Any, line: int) -> None:
+        adapter = self._items.get(key)
+        if adapter is None:
+            return
+        try:
+            adapter.validate_python(item)
+        except Exception as e:
+            for message in _format_errors(e, f"{key}[{index}]"):
+                self.on_error(f"line {line}", message)
+            return
+        if key == "experience" and self.on_warning is not None:
+            for warning in self._experience_warnings([item]):
+                self.on_warning(f"line {line}", warning)
+
+
+def _skip_node(loader) -> None:
+    """Consume the events of one node without composing it."""
+    depth = 0
+    while True:
+        event = loader.get_event()
+        if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+
+
+def iter_sections(
+    path: Path,
+    validate: bool = False,
+    on_error: Optional[ErrorCallback] = None,
+    on_warning: Optional[ErrorCallback] = None,
+    lists: bool = True,
+    others: bool = True,
+) -> Iterator[tuple[str, Any]]:
+    """Yield top-level ``(key, value)`` pairs from a resume YAML file.
+
+    Sequences are yielded as ``SectionStream`` objects; any items left
+    unread are drained before the next section is produced.
+
+    Args:
+        path: YAML file to read
+        validate: Validate each section/item against the schema as it arrives
+        on_error: Called with (location, message) for each validation error
+        on_warning: Called with (location, message) for content warnings
+        lists: Yield list sections (skipped without being parsed if False)
+        others: Yield non-list sections (skipped without being parsed if False)
+
+    Raises:
+        ValueError: If the document is not a mapping
+        yaml.YAMLError: On syntax errors (raised when the bad part is reached)
+    """
+    validator = None
+    if validate:
+        validator = _SectionValidator(on_error or (lambda where, msg: None), on_warning)
+
+    with open(path) as f:
+        loader = _StreamLoader(f)
+        try:
+            loader.get_event()  # StreamStart
+            if loader.check_event(yaml.events.StreamEndEvent):
+                return
+            loader.get_event()  # DocumentStart
+            if not loader.check_event(MappingStartEvent):
+                raise ValueError("Resume YAML must be a mapping at the top level")
+            loader.get_event()
+
+            while not loader.check_event(MappingEndEvent):
+                key = loader.construct_document(loader.compose_node(None, None))
+                is_list = loader.check_event(SequenceStartEvent)
+                if not (lists if is_list else others):
+                    _skip_node(loader)
+                elif is_list:
+                    loader.get_event()
+                    stream = SectionStream(key, loader, validator.item if validator else None)
+                    yield key, stream
+                    stream.drain()
+                else:
+                    node = loader.compose_node(None, None)
+                    value = loader.construct_document(node)
+                    if validator is not None:
+                        validator.section(key, value, node.start_mark.line + 1)
+                    yield key, value
+        finally:
+            loader.dispose()
+
+
+class _LazySection:
+    """Placeholder for a list section that has not been reached yet.
+
+    Template engines look up every name a template uses before rendering
+    starts (Jinja resolves them at the top of the render function), so
+    list sections are handed out as placeholders and only advance the
+    stream when they are truth-tested or iterated.
+    """
+
+    __slots__ = ("_resume", "_key")
+
+    def __init__(self, resume: "StreamingResume", key: str):
+        self._resume = resume
+        self._key = key
+
+    def __bool__(self) -> bool:
+        return bool(self._resume._stream(self._key))
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self._resume._stream(self._key))
+
+    def __repr__(self) -> str:
+        return f"<streamed section {self._key!r}>"
+
+
+class StreamingResume(Mapping):
+    """Read-only mapping over a streamed resume file.
+
+    A first pass over the event stream parses (and validates) the small
+    non-list sections such as contact, summary and skills, and skips over
+    list contents without building them. List sections are then streamed
+    from a second pass, one item at a time, when the consumer reaches
+    them. Consuming lists in file order keeps memory bounded; reaching a
+    later list first buffers the skipped ones.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        validate: bool = False,
+        on_error: Optional[ErrorCallback] = None,
+        on_warning: Optional[ErrorCallback] = None,
+    ):
+        self._values: dict[str, Any] = {}
+        for key, value in iter_sections(path, validate, on_error, on_warning, lists=False):
+            self._values[key] = value
+        self._keys = scan_section_keys(path)
+        self._lazy = {
+            key: _LazySection(self, key) for key in self._keys if key not in self._values
+        }
+        self._streams: dict[str, SectionStream] = {}
+        self._open: Optional[SectionStream] = None
+        self._sections = iter_sections(path, validate, on_error, on_warning, others=False)
+
+        if validate and on_error is not None and "contact" not in self._values:
+            on_error("line 1", "contact: Field required")
+        if on_warning is not None:
+            for section in ("summary", "experience", "skills", "education"):
+                if section not in self._values and section not in self._lazy:
+                    on_warning("line 1", f"Missing '{section}' section - strongly recommended")
+
+    def _stream(self, key: str) -> SectionStream:
+        while key not in self._streams:
+            if self._open is not None:
+                # Skipping past an unconsumed list: keep its items for later
+                self._open.materialize()
+            try:
+                name, stream = next(self._sections)
+            except StopIteration:
+                raise KeyError(key) from None
+            self._streams[name] = self._open = stream
+        return self._streams[key]
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        return self._lazy[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._values or key in self._lazy
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def finish(self) -> None:
+        """Read (and validate) any list sections the consumer never touched."""
+        if self._open is not None:
+            self._open.drain()
+            self._open = None
+        for _, stream in self._sections:
+            stream.drain()
+
+    def close(self) -> None:
+        self._sections.close()
@@ -3,13 +3,18 @@
 Convert resume YAML to Typst format using specified template.
 
 Usage:
-    uv run scripts/yaml_to_typst.py <yaml_file> <template> [--output <output_file>]
+    uv run scripts/yaml_to_typst.py <yaml_file> <template> [--output <output_file>] [--stream]
 
 Templates are discovered from assets/templates/typst/*.typ.j2
 
 Examples:
     uv run scripts/yaml_to_typst.py resume.yaml modern
     uv run scripts/yaml_to_typst.py resume.yaml modern-tech --output resume.typ
+    uv run scripts/yaml_to_typst.py long_cv.yaml executive --stream --output cv.typ
+
+--stream reads the YAML event by event and renders while parsing, for very
+large CVs (thousands of publications/talks). Items are validated as they
+arrive and errors are reported with line numbers.
 """
 
 import argparse
@@ -65,8 +70,8 @@ def load_yaml(yaml_path: Path, validate: bool = True) -> dict:
         sys.exit(1)
 
 
-def render_typst(resume_data: dict, template_name: str, script_dir: Path) -> str:
-    """Render Typst from resume data using specified template."""
+def get_template(template_name: str, script_dir: Path):
+    """Load a Typst Jinja template with the Typst-safe filters installed."""
     try:
         from jinja2 import Environment, FileSystemLoader
     except ImportError:
@@ -94,10 +99,57 @@ def render_typst(resume_data: dict, template_name: str, script_dir: Path) -> str
     env.filters["typst_escape"] = typst_escape
     env.filters["url_escape"] = url_escape
 
-    template = env.get_template(template_file)
+    return env.get_template(template_file)
+
+
+def render_typst(resume_data: dict, template_name: str, script_dir: Path) -> str:
+    """Render Typst from resume data using specified template."""
+    template = get_template(template_name, script_dir)
     return template.render(**resume_data)
 
 
+def render_typst_stream(yaml_path: Path, template_name: str, script_dir: Path,
+                        out, validate: bool = True) -> int:
+    """Render Typst while streaming the YAML file, writing chunks to ``out``.
+
+    Sections are parsed only when the template reaches them and list items
+    are validated one at a time, so memory stays bounded by the largest
+    item and errors surface before the whole file has been read. Output
+    is written before validation has finished: discard it unless this
+    returns 0.
+
+    Returns:
+        Number of validation errors reported (0 on success)
+    """
+    from stream_loader import StreamingResume
+
+    template = get_template(template_name, script_dir)
+    errors = []
+
+    def on_error(where: str, message: str) -> None:
+        errors.append(message)
+        print(f"Error ({where}): {message}", file=sys.stderr)
+
+    def on_warning(where: str, message: str) -> None:
+        print(f"Warning ({where}): {message}", file=sys.stderr)
+
+    data = StreamingResume(
+        yaml_path,
+        validate=validate,
+        on_error=on_error,
+        on_warning=on_warning if validate else None,
+    )
+    try:
+        # List sections stay lazy proxies in the context; items are parsed
+        # as the template iterates them
+        for chunk in template.generate(data):
+            out.write(chunk)
+        data.finish()
+    finally:
+        data.close()
+    return len(errors)
+
+
 def typst_escape(text: str) -> str:
     r"""Escape special Typst characters in text.
 
@@ -177,6 +229,8 @@ def main():
     parser.add_argument("-o", "--output", type=Path, help="Output .typ file path (default: stdout)")
     parser.add_argument("--skip-validation", action="store_true",
                         help="Skip schema validation (for legacy YAML formats)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Stream-parse and render incrementally (for very large CVs)")
 
     args = parser.parse_args()
 
@@ -184,6 +238,10 @@ def main():
         print(f"Error: File not found: {args.yaml_file}", file=sys.stderr)
         sys.exit(1)
 
+    if args.stream:
+        stream_to_output(args, script_dir)
+        return
+
     resume_data = load_yaml(args.yaml_file, validate=not args.skip_validation)
     typst_output = render_typst(resume_data, args.template, script_dir)
 
@@ -194,5 +252,51 @@ def main():
         print(typst_output)
 
 
+def stream_to_output(args, script_dir: Path) -> None:
+    """Run a streaming render into a temp file, published only without errors.
+
+    With --output the temp file is renamed over the output file; otherwise
+    it is copied to stdout. Invalid input never produces partial output.
+    """
+    import shutil
+    import tempfile
+
+    import yaml
+
+    validate = not args.skip_validation
+    try:
+        if not args.output:
+            with tempfile.TemporaryFile("w+") as out:
+                error_count = render_typst_stream(args.yaml_file, args.template,
+                                                  script_dir, out, validate)
+                if not error_count:
+                    out.seek(0)
+                    shutil.copyfileobj(out, sys.stdout)
+        else:
+            fd, tmp_name = tempfile.mkstemp(dir=args.output.parent, prefix=args.output.name,
+                                            suffix=".tmp")
+            tmp_path = Path(tmp_name)
+            try:
+                with open(fd, "w") as out:
+                    error_count = render_typst_stream(args.yaml_file, args.template,
+                                                      script_dir, out, validate)
+                if error_count:
+                    tmp_path.unlink()
+                else:
+                    tmp_path.replace(args.output)
+            except BaseException:
+                tmp_path.unlink(missing_ok=True)
+                raise
+    except (yaml.YAMLError, ValueError) as e:
+        print(f"Error loading YAML: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if error_count:
+        print(f"Schema validation failed: {error_count} error(s)", file=sys.stderr)
+        sys.exit(1)
+    if args.output:
+        print(f"Typst written to: {args.output}", file=sys.stderr)
+
+
 if __name__ == "__main__":
     main()
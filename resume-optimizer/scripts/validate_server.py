@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""Incremental resume YAML validation server.
+
+Speaks LSP-framed JSON-RPC over stdio (Content-Length headers), so editors
+can run it as a language server. The document is kept in memory and split
+into chunks: one per top-level section, and one per item of block-sequence
+sections such as experience or publications. On each change only chunks
+whose text changed are re-parsed and re-validated; diagnostics carry YAML
+line/column positions taken from the composer's node marks.
+
+Usage:
+    uv run scripts/validate_server.py                  # stdio server
+    uv run scripts/validate_server.py --check resume.yaml
+    uv run scripts/validate_server.py --check resume.yaml --json
+
+Methods:
+    initialize, shutdown, exit
+    textDocument/didOpen, textDocument/didChange, textDocument/didClose
+        -> textDocument/publishDiagnostics notifications
+    resume/validate {"uri"?, "text"} -> {"diagnostics": [...]}
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "resume-extractor" / "scripts"))
+
+from pydantic import ValidationError
+from schema import SECTION_ADAPTERS
+from validate_yaml import build_scanner
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# LSP DiagnosticSeverity
+ERROR, WARNING, INFO, HINT = 1, 2, 3, 4
+SEVERITY_NAMES = {ERROR: "error", WARNING: "warning", INFO: "info", HINT: "hint"}
+
+REQUIRED_SECTIONS = ["contact"]
+RECOMMENDED_SECTIONS = ["summary", "experience", "education", "skills"]
+
+# A top-level mapping key at column 0: not indented, not a comment,
+# sequence item or document marker.
+TOP_LEVEL_KEY = re.compile(r"""^(?![\s#\-]|\.\.\.|---)(?P<key>"[^"]*"|'[^']*'|[^:#]+?)\s*:(?:\s|$)""")
+SEQUENCE_ITEM = re.compile(r"^(?P<indent> *)- ")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    """A piece of the document validated independently."""
+
+    section: Optional[str]  # None for content before the first section
+    index: Optional[int]  # item index within a sequence section
+    start_line: int
+    text: str
+    has_items: bool = False  # section header whose items are separate chunks
+
+    @property
+    def path(self) -> str:
+        if self.section is None:
+            return "<document>"
+        if self.index is None:
+            return self.section
+        return f"{self.section}[{self.index}]"
+
+
+# Diagnostic positions inside a chunk are relative to its first line, and
+# paths are relative to the chunk, so unchanged chunks can be reused after
+# lines are inserted above them or items are reordered.
+@dataclass(frozen=True)
+class RelativeDiagnostic:
+    line: int
+    column: int
+    end_line: int
+    end_column: int
+    severity: int
+    loc: tuple
+    message: str
+
+
+def split_chunks(text: str) -> list[Chunk]:
+    """Split a resume document into section and sequence-item chunks."""
+    lines = text.splitlines(keepends=True)
+    sections: list[tuple[Optional[str], int, int]] = []
+    current, start = None, 0
+    for i, line in enumerate(lines):
+        match = TOP_LEVEL_KEY.match(line)
+        if match:
+            if i > start or current is not None:
+                sections.append((current, start, i))
+            current, start = match.group("key").strip("\"'"), i
+    sections.append((current, start, len(lines)))
+
+    chunks = []
+    for section, begin, end in sections:
+        if section is None:
+            if "".join(lines[begin:end]).strip():
+                chunks.append(Chunk(None, None, begin, "".join(lines[begin:end])))
+            continue
+        chunks.extend(_split_section(section, lines, begin, end))
+    return chunks
+
+
+def _split_section(section: str, lines: list[str], begin: int, end: int) -> list[Chunk]:
+    header = lines[begin]
+    inline = header.split(":", 1)[1].strip() if ":" in header else ""
+    item_indent = None
+    if not inline or inline.startswith("#"):
+        for i in range(begin + 1, end):
+            stripped = lines[i].strip()
+            if not stripped or stripped.startswith("#"):
+                continue
+            match = SEQUENCE_ITEM.match(lines[i])
+            if match:
+                item_indent = match.group("indent")
+            break
+
+    if item_indent is None:
+        return [Chunk(section, None, begin, "".join(lines[begin:end]))]
+
+    starts = [
+        i for i in range(begin + 1, end)
+        if lines[i].startswith(f"{item_indent}- ") or lines[i].rstrip("\n") == f"{item_indent}-"
+    ]
+    chunks = [Chunk(section, None, begin, "".join(lines[begin:starts[0]]), has_items=True)]
+    bounds = starts + [end]
+    for index, (a, b) in enumerate(zip(bounds, bounds[1:])):
+        chunks.append(Chunk(section, index, a, "".join(lines[a:b])))
+    return chunks
+
+
+def _compose(text: str) -> tuple[Any, Any]:
+    """Compose and construct a chunk, returning (node, value)."""
+    loader = _Loader(text)
+    try:
+        node = loader.get_single_node()
+        value = loader.construct_document(node) if node is not None else None
+    finally:
+        loader.dispose()
+    return node, value
+
+
+def _node_at(node: Any, loc: tuple) -> Any:
+    """Descend to the node addressed by a validation loc, as far as it exists."""
+    for part in loc:
+        if isinstance(node, MappingNode):
+            for key_node, value_node in node.value:
+                if isinstance(key_node, ScalarNode) and key_node.value == str(part):
+                    node = value_node
+                    break
+            else:
+                return node
+        elif isinstance(node, SequenceNode) and isinstance(part, int) and part < len(node.value):
+            node = node.value[part]
+        else:
+            return node
+    return node
+
+
+def _span(node: Any, severity: int, loc: tuple, message: str) -> RelativeDiagnostic:
+    start, end = node.start_mark, node.end_mark
+    if end.line > start.line:
+        # Multi-line nodes: underline only the first line
+        end_line, end_column = start.line, start.column + 1
+    else:
+        end_line, end_column = end.line, end.column
+    return RelativeDiagnostic(
+        start.line, start.column, end_line, max(end_column, start.column + 1), severity, loc, message
+    )
+
+
+def _format_loc(loc: tuple) -> str:
+    out = ""
+    for part in loc:
+        out += f"[{part}]" if isinstance(part, int) else f".{part}"
+    return out
+
+
+class ValidationSession:
+    """Validated documents keyed by URI, with a per-chunk result cache."""
+
+    def __init__(self, scanner=None):
+        self.scanner = scanner or build_scanner()
+        self._documents: dict[str, dict[tuple, list[RelativeDiagnostic]]] = {}
+        self.chunks_validated = 0
+
+    def close(self, uri: str) -> None:
+        self._documents.pop(uri, None)
+
+    def update(self, uri: str, text: str) -> list[dict]:
+        """Replace a document's text and return its diagnostics."""
+        previous = self._documents.get(uri, {})
+        current: dict[tuple, list[RelativeDiagnostic]] = {}
+        diagnostics = []
+
+        chunks = split_chunks(text)
+        for chunk in chunks:
+            key = (chunk.section, chunk.index is not None, chunk.has_items, chunk.text)
+            relative = current.get(key)
+            if relative is None:
+                relative = previous.get(key)
+            if relative is None:
+                relative = self._validate_chunk(chunk)
+                self.chunks_validated += 1
+            current[key] = relative
+            diagnostics.extend(self._place(chunk, d) for d in relative)
+
+        diagnostics.extend(self._document_diagnostics(chunks))
+        self._documents[uri] = current
+        diagnostics.sort(key=lambda d: (d["line"], d["column"]))
+        return diagnostics
+
+    @staticmethod
+    def _place(chunk: Chunk, diag: RelativeDiagnostic) -> dict:
+        path = chunk.path + _format_loc(diag.loc)
+        return {
+            "line": chunk.start_line + diag.line,
+            "column": diag.column,
+            "end_line": chunk.start_line + diag.end_line,
+            "end_column": diag.end_column,
+            "severity": diag.severity,
+            "path": path,
+            "message": f"{path}: {diag.message}",
+        }
+
+    def _document_diagnostics(self, chunks: list[Chunk]) -> list[dict]:
+        diagnostics = []
+        seen: dict[str, int] = {}
+        for chunk in chunks:
+            if chunk.section is None or chunk.index is not None:
+                continue
+            if chunk.section in seen:
+                diagnostics.append(self._document_diagnostic(
+                    chunk.start_line, ERROR,
+                    f"Duplicate section '{chunk.section}' (first defined on line "
+                    f"{seen[chunk.section] + 1}); the last one wins",
+                ))
+            else:
+                seen[chunk.section] = chunk.start_line
+
+        present = set(seen)
+        for section in REQUIRED_SECTIONS:
+            if section not in present:
+                diagnostics.append(
+                    self._document_diagnostic(0, ERROR, f"Missing required section: {section}")
+                )
+        for section in RECOMMENDED_SECTIONS:
+            if section not in present:
+                diagnostics.append(
+                    self._document_diagnostic(0, WARNING, f"Missing recommended section: {section}")
+                )
+        return diagnostics
+
+    @staticmethod
+    def _document_diagnostic(line: int, severity: int, message: str) -> dict:
+        return {
+            "line": line, "column": 0, "end_line": line, "end_column": 1,
+            "severity": severity, "path": "<document>", "message": message,
+        }
+
+    def _validate_chunk(self, chunk: Chunk) -> list[RelativeDiagnostic]:
+        try:
+            node, value = _compose(chunk.text)
+        except yaml.YAMLError as e:
+            mark = getattr(e, "problem_mark", None) or getattr(e, "context_mark", None)
+            line, column = (mark.line, mark.column) if mark else (0, 0)
+            last_line = max(chunk.text.count("\n") - 1, 0)
+            if line > last_line:
+                # Errors at end of stream point past the chunk; keep them inside it
+                line, column = last_line, 0
+            problem = getattr(e, "problem", None) or str(e)
+            return [RelativeDiagnostic(line, column, line, column + 1, ERROR, (), f"YAML syntax error: {problem}")]
+
+        if chunk.section is None:
+            if node is None:
+                return []
+            return [_span(node, ERROR, (), "Content outside of a top-level section")]
+
+        if chunk.has_items:
+            return []
+
+        if chunk.index is None:
+            if not isinstance(node, MappingNode) or not node.value:
+                return []
+            section_node = node.value[0][1]
+            section_value = value.get(chunk.section) if isinstance(value, dict) else None
+            return self._validate_value(chunk.section, section_node, section_value, item=False)
+
+        # Sequence item: the chunk composes to a one-element sequence
+        if not isinstance(node, SequenceNode) or not node.value:
+            return []
+        return self._validate_value(chunk.section, node.value[0], value[0], item=True)
+
+    def _validate_value(self, section: str, node: Any, value: Any, item: bool) -> list[RelativeDiagnostic]:
+        diagnostics = []
+        adapter = SECTION_ADAPTERS.get(section)
+        if adapter is not None:
+            try:
+                adapter.validate_python([value] if item else value)
+            except ValidationError as e:
+                for err in e.errors():
+                    loc = tuple(err["loc"])
+                    if item and loc and loc[0] == 0:
+                        loc = loc[1:]
+                    target = _node_at(node, loc)
+                    diagnostics.append(_span(target, ERROR, loc, err["msg"]))
+            except (TypeError, ValueError) as e:
+                diagnostics.append(_span(node, ERROR, (), str(e)))
+
+        if section == "experience":
+            diagnostics.extend(self._lint_experience(node))
+        return diagnostics
+
+    def _lint_experience(self, node: Any) -> list[RelativeDiagnostic]:
+        """Bullet-level content checks with positions inside each bullet."""
+        diagnostics = []
+        positions = _node_at(node, ("positions",))
+        if not isinstance(positions, SequenceNode):
+            return diagnostics
+
+        for p, position in enumerate(positions.value):
+            bullets = _node_at(position, ("achievements",))
+            if not isinstance(bullets, SequenceNode):
+                continue
+            for b, bullet in enumerate(bullets.value):
+                if not isinstance(bullet, ScalarNode):
+                    continue
+                loc = ("positions", p, "achievements", b)
+                text = bullet.value
+                quote = 1 if bullet.style in ('"', "'") else 0
+                leading = len(text) - len(text.lstrip())
+
+                for match in self.scanner.scan(text):
+                    where = (bullet.start_mark.line, bullet.start_mark.column + quote + match.start)
+                    if match.category == "weak_verbs" and match.start == leading:
+                        severity, message = INFO, f"Starts with weak verb '{match.phrase}'"
+                    elif match.category == "buzzwords":
+                        severity, message = INFO, f"Buzzword '{match.phrase}'"
+                    elif match.category == "banned_phrases":
+                        severity, message = WARNING, f"Avoid phrase '{match.phrase}'"
+                    else:
+                        continue
+                    diagnostics.append(RelativeDiagnostic(
+                        where[0], where[1], where[0], where[1] + len(match.phrase),
+                        severity, loc, message,
+                    ))
+
+                if not any(ch.isdigit() for ch in text) and "%" not in text and "$" not in text:
+                    diagnostics.append(_span(bullet, HINT, loc, "Consider adding quantifiable metrics"))
+        return diagnostics
+
+
+# =============================================================================
+# JSON-RPC over stdio
+# =============================================================================
+
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+
+
+class RPCError(Exception):
+    """A request failed; answered with a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def read_message(stream) -> Optional[dict]:
+    """Read one Content-Length framed JSON-RPC message.
+
+    Returns:
+        The message, or None at end of input
+
+    Raises:
+        RPCError: PARSE_ERROR for a bad header, Content-Length or JSON body
+            (the frame is consumed, so the next message can still be read)
+    """
+    length = None
+    bad_header = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode("ascii", "replace").partition(":")
+        if name.lower() == "content-length":
+            try:
+                length = int(value.strip())
+            except ValueError:
+                bad_header = f"Invalid Content-Length: {value.strip()!r}"
+            else:
+                if length < 0:
+                    bad_header = f"Invalid Content-Length: {length}"
+    if bad_header:
+        raise RPCError(PARSE_ERROR, bad_header)
+    if length is None:
+        raise RPCError(PARSE_ERROR, "Missing Content-Length header")
+    body = stream.read(length)
+    try:
+        return json.loads(body)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise RPCError(PARSE_ERROR, f"Invalid JSON: {e}")
+
+
+def write_message(stream, message: dict) -> None:
+    body = json.dumps(message).encode()
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    stream.flush()
+
+
+def to_lsp(diagnostic: dict) -> dict:
+    return {
+        "range": {
+            "start": {"line": diagnostic["line"], "character": diagnostic["column"]},
+            "end": {"line": diagnostic["end_line"], "character": diagnostic["end_column"]},
+        },
+        "severity": diagnostic["severity"],
+        "source": "resume",
+        "message": diagnostic["message"],
+    }
+
+
+def _param(params: dict, *path: str, kind: type = str) -> Any:
+    """Look up a required parameter, e.g. _param(params, "textDocument", "uri").
+
+    Raises:
+        RPCError: INVALID_PARAMS if it is missing or of the wrong type
+    """
+    value: Any = params
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            raise RPCError(INVALID_PARAMS, f"Missing params.{'.'.join(path)}")
+        value = value[key]
+    if not isinstance(value, kind):
+        raise RPCError(INVALID_PARAMS, f"params.{'.'.join(path)} must be a {kind.__name__}")
+    return value
+
+
+def serve(instream, outstream) -> int:
+    """Run the server loop until exit.
+
+    A malformed message or a failing handler is answered with a JSON-RPC
+    error (or, for notifications, logged to stderr); the loop keeps going.
+    """
+    session = ValidationSession()
+    shutting_down = False
+
+    def publish(uri: str, diagnostics: list[dict]) -> None:
+        write_message(outstream, {
+            "jsonrpc": "2.0",
+            "method": "textDocument/publishDiagnostics",
+            "params": {"uri": uri, "diagnostics": [to_lsp(d) for d in diagnostics]},
+        })
+
+    def handle(method: Any, params: dict) -> Any:
+        nonlocal shutting_down
+        if method == "initialize":
+            return {
+                "capabilities": {"textDocumentSync": 1},
+                "serverInfo": {"name": "resume-validate", "version": "1.0"},
+            }
+        if method == "shutdown":
+            shutting_down = True
+        elif method == "textDocument/didOpen":
+            uri = _param(params, "textDocument", "uri")
+            publish(uri, session.update(uri, _param(params, "textDocument", "text")))
+        elif method == "textDocument/didChange":
+            uri = _param(params, "textDocument", "uri")
+            changes = params.get("contentChanges") or []
+            if not isinstance(changes, list):
+                raise RPCError(INVALID_PARAMS, "params.contentChanges must be a list")
+            if changes:
+                publish(uri, session.update(uri, _param(changes[-1], "text")))
+        elif method == "textDocument/didClose":
+            uri = _param(params, "textDocument", "uri")
+            session.close(uri)
+            publish(uri, [])
+        elif method == "resume/validate":
+            uri = params.get("uri", "untitled:resume.yaml")
+            if not isinstance(uri, str):
+                raise RPCError(INVALID_PARAMS, "params.uri must be a str")
+            return {"diagnostics": session.update(uri, _param(params, "text"))}
+        else:
+            raise RPCError(METHOD_NOT_FOUND, f"Method not found: {method}")
+        return None
+
+    while True:
+        msg_id = None
+        try:
+            message = read_message(instream)
+            if message is None:
+                return 0 if shutting_down else 1
+            if not isinstance(message, dict):
+                raise RPCError(INVALID_REQUEST, "A message must be a JSON object")
+            msg_id = message.get("id")
+            method = message.get("method")
+            if method == "exit":
+                return 0 if shutting_down else 1
+            params = message.get("params")
+            if params is None:
+                params = {}
+            elif not isinstance(params, dict):
+                raise RPCError(INVALID_PARAMS, "params must be an object")
+            response = {"jsonrpc": "2.0", "id": msg_id, "result": handle(method, params)}
+        except RPCError as e:
+            response = {"jsonrpc": "2.0", "id": msg_id,
+                        "error": {"code": e.code, "message": e.message}}
+        except Exception as e:
+            response = {"jsonrpc": "2.0", "id": msg_id,
+                        "error": {"code": INTERNAL_ERROR, "message": f"{type(e).__name__}: {e}"}}
+
+        if msg_id is not None:
+            write_message(outstream, response)
+        elif "error" in response:
+            if response["error"]["code"] == PARSE_ERROR:
+                # The spec answers unparseable messages with a null id
+                write_message(outstream, response)
+            elif response["error"]["code"] != METHOD_NOT_FOUND:
+                # Notifications get no response
+                print(f"resume-validate: {response['error']['message']}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Incremental resume YAML validation server (LSP-framed JSON-RPC on stdio)"
+    )
+    parser.add_argument("--check", type=Path, help="Validate one file and exit")
+    parser.add_argument("--json", "-j", action="store_true", help="With --check, output JSON")
+    args = parser.parse_args()
+
+    if args.check is None:
+        sys.exit(serve(sys.stdin.buffer, sys.stdout.buffer))
+
+    if not args.check.exists():
+        print(f"[ERROR] File not found: {args.check}", file=sys.stderr)
+        sys.exit(1)
+
+    diagnostics = ValidationSession().update(args.check.as_uri(), args.check.read_text())
+    if args.json:
+        print(json.dumps(diagnostics, indent=2))
+    else:
+        for d in diagnostics:
+            severity = SEVERITY_NAMES[d["severity"]]
+            print(f"{args.check}:{d['line'] + 1}:{d['column'] + 1}: {severity}: {d['message']}")
+    sys.exit(1 if any(d["severity"] == ERROR for d in diagnostics) else 0)
+
+
+if __name__ == "__main__":
+    main()
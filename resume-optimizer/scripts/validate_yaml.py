@@ -5,6 +5,8 @@ Usage:
     uv run scripts/validate_yaml.py resume.yaml
     uv run scripts/validate_yaml.py resume.yaml --json
     uv run scripts/validate_yaml.py resume.yaml --strict
+    uv run scripts/validate_yaml.py resume.yaml --fast
+    uv run scripts/validate_yaml.py resume.yaml --keywords job_keywords.txt
 """
 
 import argparse
@@ -14,13 +16,20 @@ from pathlib import Path
 
 import yaml
 
-# Import Pydantic schema if available
-try:
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent / "resume-extractor" / "scripts"))
-    from schema import Resume, validate_resume as pydantic_validate
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    PYDANTIC_AVAILABLE = False
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "resume-extractor" / "scripts"))
+
+from phrase_scanner import WEAK_VERBS, PhraseScanner, load_dictionaries
+
+DEFAULT_PHRASES_PATH = Path(__file__).parent.parent / "references" / "lint_phrases.yaml"
+
+
+def _import_pydantic_validator():
+    """Import the Pydantic schema validator lazily (pydantic is slow to import)."""
+    try:
+        from schema import validate_resume
+    except ImportError:
+        return None
+    return validate_resume
 
 
 def load_yaml(filepath: Path) -> tuple[dict | None, str | None]:
@@ -125,11 +134,82 @@ def validate_structure(data: dict) -> tuple[list[str], list[str]]:
     return errors, warnings
 
 
-def validate_content_quality(data: dict) -> tuple[list[str], list[str]]:
-    """Check for content quality issues."""
+def build_scanner(dictionaries: list[Path] | None = None) -> PhraseScanner:
+    """Build a phrase scanner from the default and user-supplied dictionaries."""
+    scanner = PhraseScanner()
+    if DEFAULT_PHRASES_PATH.exists():
+        for category, phrases in load_dictionaries(DEFAULT_PHRASES_PATH).items():
+            scanner.add_all(category, phrases)
+    else:
+        scanner.add_all("weak_verbs", WEAK_VERBS)
+
+    for path in dictionaries or []:
+        for category, phrases in load_dictionaries(path).items():
+            scanner.add_all(category, phrases)
+    return scanner
+
+
+def load_keywords(filepath: Path) -> list[str]:
+    """Load required ATS keywords from a YAML list or a one-per-line text file."""
+    text = filepath.read_text()
+    if filepath.suffix.lower() in (".yaml", ".yml"):
+        data = yaml.safe_load(text) or []
+        if isinstance(data, dict):
+            return [str(k) for values in data.values() for k in values or []]
+        return [str(k) for k in data]
+    return [
+        line.strip()
+        for line in text.splitlines()
+        if line.strip() and not line.strip().startswith("#")
+    ]
+
+
+def _iter_text_fields(data: dict):
+    """Yield free-text resume fields for keyword coverage checks."""
+    if isinstance(data.get("summary"), str):
+        yield data["summary"]
+
+    skills = data.get("skills")
+    if isinstance(skills, dict):
+        for category, values in skills.items():
+            yield str(category)
+            if isinstance(values, list):
+                yield from (str(v) for v in values)
+            elif values:
+                yield str(values)
+    elif isinstance(skills, list):
+        yield from (str(v) for v in skills)
+
+    for exp in data.get("experience") or []:
+        if not isinstance(exp, dict):
+            continue
+        for pos in exp.get("positions") or []:
+            if isinstance(pos, dict) and isinstance(pos.get("title"), str):
+                yield pos["title"]
+
+
+def validate_content_quality(
+    data: dict,
+    scanner: PhraseScanner | None = None,
+    required_keywords: list[str] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Check for content quality issues.
+
+    Each bullet is scanned once for every loaded phrase category. The
+    ``required_keywords`` are added to a copy, so ``scanner`` can be
+    reused across calls.
+    """
     warnings = []
     suggestions = []
 
+    if scanner is None:
+        scanner = build_scanner()
+    elif required_keywords:
+        scanner = scanner.copy()
+    if required_keywords:
+        scanner.add_all("ats_keywords", required_keywords)
+    found_keywords = set()
+
     # Check summary length
     if "summary" in data and isinstance(data["summary"], str):
         summary = data["summary"]
@@ -139,8 +219,6 @@ def validate_content_quality(data: dict) -> tuple[list[str], list[str]]:
             warnings.append("Professional summary is quite long (> 800 chars)")
 
     # Check experience bullets
-    weak_verbs = {"worked", "helped", "responsible", "participated", "involved", "assisted"}
-
     if "experience" in data and isinstance(data["experience"], list):
         for exp in data["experience"]:
             if not isinstance(exp, dict):
@@ -166,14 +244,26 @@ def validate_content_quality(data: dict) -> tuple[list[str], list[str]]:
                         continue
 
                     bullet_lower = bullet.lower()
-                    first_word = bullet_lower.split()[0] if bullet_lower.split() else ""
-
-                    # Check for weak verbs
-                    if first_word.rstrip(",.;:") in weak_verbs:
-                        suggestions.append(
-                            f"{company}: Starts with weak verb '{first_word}' - "
-                            f"consider stronger action verb"
-                        )
+                    leading = len(bullet) - len(bullet.lstrip())
+
+                    # Check for weak verbs, buzzwords, banned phrases and keywords
+                    for match in scanner.scan(bullet):
+                        if match.category == "weak_verbs" and match.start == leading:
+                            suggestions.append(
+                                f"{company}: Starts with weak verb '{match.phrase}' - "
+                                f"consider stronger action verb"
+                            )
+                        elif match.category == "buzzwords":
+                            suggestions.append(
+                                f"{company}: Buzzword '{match.phrase}' at col {match.start} - "
+                                f"replace with concrete evidence"
+                            )
+                        elif match.category == "banned_phrases":
+                            warnings.append(
+                                f"{company}: Avoid phrase '{match.phrase}' at col {match.start}"
+                            )
+                        elif match.category == "ats_keywords":
+                            found_keywords.add(match.phrase)
 
                     # Check for metrics
                     has_number = any(char.isdigit() for char in bullet)
@@ -192,12 +282,22 @@ def validate_content_quality(data: dict) -> tuple[list[str], list[str]]:
                             f"{company}: Bullet is long (>300 chars) - consider condensing"
                         )
 
+    # Check required ATS keyword coverage
+    if required_keywords:
+        for text in _iter_text_fields(data):
+            for match in scanner.scan(text, categories={"ats_keywords"}):
+                found_keywords.add(match.phrase)
+        missing = [k for k in scanner.phrases("ats_keywords") if k not in found_keywords]
+        for keyword in missing:
+            suggestions.append(f"Missing ATS keyword: '{keyword}'")
+
     return warnings, suggestions
 
 
 def validate_with_pydantic(data: dict) -> tuple[list[str], list[str]]:
     """Validate using Pydantic schema if available."""
-    if not PYDANTIC_AVAILABLE:
+    pydantic_validate = _import_pydantic_validator()
+    if pydantic_validate is None:
         return [], ["Pydantic validation not available (schema.py not found)"]
 
     try:
@@ -207,8 +307,29 @@ def validate_with_pydantic(data: dict) -> tuple[list[str], list[str]]:
         return [f"Pydantic validation error: {e}"], []
 
 
-def run_validation(filepath: Path, use_json: bool = False, strict: bool = False) -> bool:
-    """Run all validations on resume YAML."""
+def validate_with_generated(data: dict) -> tuple[list[str], list[str]]:
+    """Validate structure with the generated validator (no pydantic import)."""
+    try:
+        from resume_validator import validate
+    except ImportError:
+        return [], ["Generated validator not available (resume_validator.py not found)"]
+
+    return [f"Schema error: {error}" for error in validate(data)], []
+
+
+def run_validation(
+    filepath: Path,
+    use_json: bool = False,
+    strict: bool = False,
+    dictionaries: list[Path] | None = None,
+    keywords: list[str] | None = None,
+    fast: bool = False,
+) -> bool:
+    """Run all validations on resume YAML.
+
+    With ``fast``, schema checks use the generated structural validator
+    instead of Pydantic, which avoids importing pydantic entirely.
+    """
     results = {
         "file": str(filepath),
         "valid": True,
@@ -237,12 +358,17 @@ def run_validation(filepath: Path, use_json: bool = False, strict: bool = False)
         results["valid"] = False
 
     # Validate content quality
-    content_warnings, suggestions = validate_content_quality(data)
+    content_warnings, suggestions = validate_content_quality(
+        data, scanner=build_scanner(dictionaries), required_keywords=keywords
+    )
     results["warnings"].extend(content_warnings)
     results["suggestions"].extend(suggestions)
 
-    # Pydantic validation
-    pydantic_errors, pydantic_warnings = validate_with_pydantic(data)
+    # Schema validation
+    if fast:
+        pydantic_errors, pydantic_warnings = validate_with_generated(data)
+    else:
+        pydantic_errors, pydantic_warnings = validate_with_pydantic(data)
     results["errors"].extend(pydantic_errors)
     results["warnings"].extend(pydantic_warnings)
 
@@ -304,6 +430,9 @@ Examples:
   uv run scripts/validate_yaml.py resume.yaml
   uv run scripts/validate_yaml.py resume.yaml --json
   uv run scripts/validate_yaml.py resume.yaml --strict
+  uv run scripts/validate_yaml.py resume.yaml --fast
+  uv run scripts/validate_yaml.py resume.yaml --keywords job_keywords.txt
+  uv run scripts/validate_yaml.py resume.yaml --dictionary team_phrases.yaml
         """,
     )
     parser.add_argument("file", type=Path, help="Resume YAML file to validate")
@@ -314,13 +443,34 @@ Examples:
         "--strict", "-s", action="store_true", help="Treat warnings as errors"
     )
 
+    parser.add_argument(
+        "--fast", "-f", action="store_true",
+        help="Structural schema checks only, without importing pydantic",
+    )
+    parser.add_argument(
+        "--dictionary", "-d", type=Path, action="append", default=[],
+        help="Extra phrase dictionary YAML (category -> phrases); repeatable",
+    )
+    parser.add_argument(
+        "--keywords", "-k", type=Path,
+        help="Required ATS keywords (YAML list or one per line)",
+    )
+
     args = parser.parse_args()
 
     if not args.file.exists():
         print(f"[ERROR] File not found: {args.file}")
         sys.exit(1)
 
-    success = run_validation(args.file, use_json=args.json, strict=args.strict)
+    keywords = load_keywords(args.keywords) if args.keywords else None
+    success = run_validation(
+        args.file,
+        use_json=args.json,
+        strict=args.strict,
+        dictionaries=args.dictionary,
+        keywords=keywords,
+        fast=args.fast,
+    )
     sys.exit(0 if success else 1)
 
 
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Convert a project's state between project.json and project.db (SQLite).
+
+The SQLite backend keeps one indexed row per version, so lookups,
+switching and creating versions stay fast as history grows. Conversion
+is one-shot: the old file is kept with a .bak suffix.
+
+Usage:
+    uv run scripts/convert_backend.py [--project <name> | --all] [--to sqlite|json]
+
+Examples:
+    uv run scripts/convert_backend.py --to sqlite
+    uv run scripts/convert_backend.py --all --to sqlite
+    uv run scripts/convert_backend.py -p ml_engineer --to json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from state_utils import (
+    DB_FILE,
+    JOURNAL_FILE,
+    PROJECT_FILE,
+    get_project_path,
+    get_store_path,
+    list_projects,
+    load_project_state,
+    open_project_db,
+    project_lock,
+    resolve_project,
+)
+
+
+def convert_project(project: str, to: str, store_path: Path) -> bool:
+    """Convert one project's state to the given backend.
+
+    Returns:
+        True if converted, False if already using that backend
+
+    Raises:
+        FileNotFoundError: If the project does not exist
+    """
+    project_path = get_project_path(project, store_path)
+    json_file = project_path / PROJECT_FILE
+    db_file = project_path / DB_FILE
+    with project_lock(project, store_path):
+        state = load_project_state(project, store_path, upgrade=True)
+
+        if to == "sqlite":
+            if db_file.exists():
+                return False
+            with open_project_db(project, store_path) as db:
+                db.save_state(state)
+            json_file.replace(json_file.with_name(PROJECT_FILE + ".bak"))
+            journal = project_path / JOURNAL_FILE
+            if journal.exists():
+                journal.replace(journal.with_name(JOURNAL_FILE + ".bak"))
+            return True
+
+        if not db_file.exists():
+            return False
+        json_file.write_text(json.dumps(state, indent=2))
+        for suffix in ("", "-wal", "-shm"):
+            sidecar = db_file.with_name(DB_FILE + suffix)
+            if sidecar.exists():
+                sidecar.replace(sidecar.with_name(sidecar.name + ".bak"))
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert project state between JSON and SQLite backends"
+    )
+    parser.add_argument(
+        "--project", "-p",
+        help="Project name (default: active project)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Convert every project in the store",
+    )
+    parser.add_argument(
+        "--to",
+        choices=["sqlite", "json"],
+        default="sqlite",
+        help="Target backend (default: sqlite)",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        if args.all:
+            projects = list_projects(store_path)
+        else:
+            projects = [resolve_project(args.project, store_path)]
+
+        for project in projects:
+            if convert_project(project, args.to, store_path):
+                print(f"Converted {project} to {args.to}")
+            else:
+                print(f"{project} already uses {args.to}")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,21 +2,22 @@
 """Create a new version from an existing one."""
 
 import argparse
-import shutil
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from delta_store import read_version_yaml
+from object_store import copy_file
+from search_index import update_index
 from state_utils import (
-    get_next_version_id,
+    append_version,
+    get_active_version_id,
     get_store_path,
-    get_version_entry,
+    get_version,
     get_version_path,
-    load_project_state,
     now_iso,
     resolve_project,
-    save_project_state,
 )
 
 
@@ -26,6 +27,10 @@ def create_version(
     tag: str | None = None,
     notes: str = "",
     operation: str = "manual_edit",
+    store_path: Path | None = None,
+    content: str | None = None,
+    source_info: dict | None = None,
+    activate: bool = True,
 ) -> tuple[str, Path]:
     """Create a new version derived from an existing one.
 
@@ -34,21 +39,25 @@ def create_version(
         from_version: Version ID to copy from (default: active version)
         tag: Optional tag for the new version
         notes: Notes about this version
-        operation: Operation type (manual_edit, optimize, tailor)
+        operation: Operation type (manual_edit, optimize, tailor, rebase)
+        store_path: Resolved store (default: discovered from cwd)
+        content: YAML for the new version instead of a copy of the parent's
+        source_info: Extra fields to record in the entry's source
+        activate: Make the new version active
 
     Returns:
         Tuple of (version_id, version_path)
     """
-    store_path = get_store_path()
-    state = load_project_state(project, store_path)
+    if store_path is None:
+        store_path = get_store_path()
 
     # Determine source version
     if from_version is None:
-        from_version = state.get("active_version")
+        from_version = get_active_version_id(project, store_path)
         if not from_version:
             raise ValueError("No active version to derive from")
 
-    parent_entry = get_version_entry(state, from_version)
+    parent_entry = get_version(project, from_version, store_path)
     if not parent_entry:
         raise ValueError(f"Version not found: {from_version}")
 
@@ -57,35 +66,41 @@ def create_version(
         project, from_version, parent_entry.get("tag"), store_path
     )
     parent_yaml = parent_path / "resume.yaml"
-    if not parent_yaml.exists():
+    if not parent_yaml.exists() and not parent_entry.get("packed"):
         raise ValueError(f"Parent YAML not found: {parent_yaml}")
 
-    # Create new version
-    version_id = get_next_version_id(state)
-    version_path = get_version_path(project, version_id, tag, store_path)
-    version_path.mkdir(parents=True, exist_ok=True)
-
-    # Copy YAML from parent
-    new_yaml = version_path / "resume.yaml"
-    shutil.copy2(parent_yaml, new_yaml)
-
-    # Update project state
-    version_entry = {
-        "id": version_id,
-        "tag": tag,
-        "created_at": now_iso(),
-        "source": {
-            "type": "derived",
-            "operation": operation,
-        },
-        "parent": from_version,
-        "notes": notes or f"Derived from {from_version}",
-    }
-    state["versions"].append(version_entry)
-    state["active_version"] = version_id
-    save_project_state(project, state, store_path)
-
-    return version_id, version_path
+    def make_entry(version_id: str) -> dict:
+        version_path = get_version_path(project, version_id, tag, store_path)
+        version_path.mkdir(parents=True, exist_ok=True)
+
+        # Link the parent's YAML content (reflink where supported, else copy)
+        new_yaml = version_path / "resume.yaml"
+        if content is not None:
+            new_yaml.write_text(content)
+        elif parent_yaml.exists():
+            copy_file(parent_yaml, new_yaml)
+        else:
+            new_yaml.write_text(read_version_yaml(project, parent_entry, store_path))
+
+        return {
+            "id": version_id,
+            "tag": tag,
+            "created_at": now_iso(),
+            "source": {
+                "type": "derived",
+                "operation": operation,
+                **(source_info or {}),
+            },
+            "parent": from_version,
+            "notes": notes or f"Derived from {from_version}",
+        }
+
+    # Allocate the ID, copy files and record the version together
+    version_entry = append_version(project, make_entry, activate, store_path)
+    version_id = version_entry["id"]
+    update_index(project, store_path)
+
+    return version_id, get_version_path(project, version_id, tag, store_path)
 
 
 def main():
@@ -117,13 +132,15 @@ def main():
     args = parser.parse_args()
 
     try:
-        project = resolve_project(args.project)
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
         version_id, version_path = create_version(
             project,
             from_version=args.from_version,
             tag=args.tag,
             notes=args.notes,
             operation=args.operation,
+            store_path=store_path,
         )
         print(f"Created {version_id} in project: {project}")
         print(f"  Parent: {args.from_version or 'active'}")
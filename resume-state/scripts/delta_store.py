@@ -0,0 +1,253 @@
+"""Delta-compressed storage for version YAML.
+
+Packing replaces the ``resume.yaml`` of inactive versions with a compact
+line delta against the parent's content. Every ``snapshot_every`` links
+of a chain, the full text is stored instead, which bounds the cost of
+rebuilding any version. Deltas and snapshots are content-addressed in the
+store's ``objects/`` directory (see object_store), keyed by the SHA-256 of
+the YAML they reproduce:
+
+- ``objects/ab/cdef...``        full snapshot
+- ``objects/ab/cdef....delta``  JSON: base digest + copy/insert ops
+
+A packed version's entry records ``"packed": {"sha256": ...}``. Reads
+rebuild the text through an in-process cache keyed by digest; content is
+immutable, so the cache never goes stale. ``ensure_version_yaml()``
+writes the file back when a version becomes active or is needed on disk.
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import tempfile
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from lineage import lineage_index
+from object_store import object_path
+from state_utils import (
+    get_store_path,
+    get_version_entry,
+    get_version_path,
+    load_project_state,
+    project_lock,
+    save_project_state,
+)
+
+SNAPSHOT_EVERY = 10
+DELTA_SUFFIX = ".delta"
+
+
+def make_delta(base: list[str], target: list[str]) -> list:
+    """Encode ``target`` as ops over ``base`` lines.
+
+    Ops are ``[start, end]`` (copy base[start:end]) or a list of strings
+    (insert these lines).
+    """
+    ops = []
+    matcher = difflib.SequenceMatcher(None, base, target, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append([i1, i2])
+        elif j2 > j1:
+            ops.append({"+": target[j1:j2]})
+    return ops
+
+
+def apply_delta(base: list[str], ops: list) -> list[str]:
+    """Rebuild target lines from base lines and delta ops."""
+    out = []
+    for op in ops:
+        if isinstance(op, dict):
+            out.extend(op["+"])
+        else:
+            out.extend(base[op[0]:op[1]])
+    return out
+
+
+def _delta_path(digest: str, store_path: Path) -> Path:
+    path = object_path(digest, store_path)
+    return path.with_name(path.name + DELTA_SUFFIX)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o444)
+        Path(tmp_path).replace(path)
+    except:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def has_object(digest: str, store_path: Path) -> bool:
+    """Return True if a snapshot or delta exists for ``digest``."""
+    return object_path(digest, store_path).exists() or _delta_path(digest, store_path).exists()
+
+
+def _chain(digest: str, store_path: Path) -> list[str]:
+    """Digests from ``digest`` down to the snapshot it is rebuilt from."""
+    chain = [digest]
+    while not object_path(digest, store_path).exists():
+        digest = json.loads(_delta_path(digest, store_path).read_text())["base"]
+        chain.append(digest)
+    return chain
+
+
+def chain_digests(digest: str, store_path: Path) -> list[str]:
+    """Digests of every object needed to rebuild ``digest``, itself first."""
+    return _chain(digest, store_path)
+
+
+def chain_depth(digest: str, store_path: Path) -> int:
+    """Number of deltas to apply to rebuild ``digest`` (0 for a snapshot)."""
+    return len(_chain(digest, store_path)) - 1
+
+
+@lru_cache(maxsize=256)
+def _read_cached(digest: str, store_root: str) -> str:
+    store_path = Path(store_root)
+    full = object_path(digest, store_path)
+    if full.exists():
+        return full.read_text()
+    delta = json.loads(_delta_path(digest, store_path).read_text())
+    base = _read_cached(delta["base"], store_root).splitlines(keepends=True)
+    text = "".join(apply_delta(base, delta["ops"]))
+    if hashlib.sha256(text.encode()).hexdigest() != digest:
+        raise ValueError(f"Corrupt delta object: {digest}")
+    return text
+
+
+def read_object(digest: str, store_path: Path) -> str:
+    """Rebuild the YAML text stored under ``digest`` (cached)."""
+    if not has_object(digest, store_path):
+        raise FileNotFoundError(f"Object not found: {digest}")
+    return _read_cached(digest, str(store_path))
+
+
+def put_text(
+    text: str,
+    store_path: Path,
+    base: Optional[str] = None,
+    snapshot_every: int = SNAPSHOT_EVERY,
+) -> str:
+    """Store YAML text as a delta against ``base`` or as a snapshot.
+
+    A snapshot is written when there is no base, when the base chain is
+    already ``snapshot_every - 1`` deltas deep, or when the delta would not
+    be smaller than the text itself. Content already stored in full is
+    left as it is: the object may be shared (a snapshot other chains
+    delta against, or a file hardlinked to it), and a snapshot never
+    deepens any chain.
+
+    Returns:
+        The text's digest
+    """
+    digest = hashlib.sha256(text.encode()).hexdigest()
+    if has_object(digest, store_path):
+        return digest
+
+    # With no object for ``digest`` yet, no chain can pass through it
+    if base is not None:
+        if len(_chain(base, store_path)) < snapshot_every:
+            base_lines = read_object(base, store_path).splitlines(keepends=True)
+            ops = make_delta(base_lines, text.splitlines(keepends=True))
+            payload = json.dumps({"base": base, "ops": ops}, separators=(",", ":")).encode()
+            if len(payload) < len(text.encode()):
+                _write_atomic(_delta_path(digest, store_path), payload)
+                return digest
+
+    _write_atomic(object_path(digest, store_path), text.encode())
+    return digest
+
+
+def stored_size(digest: str, store_path: Path) -> int:
+    """Bytes used on disk by the snapshot or delta stored for ``digest``."""
+    delta = _delta_path(digest, store_path)
+    return (delta if delta.exists() else object_path(digest, store_path)).stat().st_size
+
+
+def read_version_yaml(project: str, entry: dict, store_path: Optional[Path] = None) -> str:
+    """Read a version's YAML, from disk or from packed storage."""
+    if store_path is None:
+        store_path = get_store_path()
+    yaml_path = get_version_path(project, entry["id"], entry.get("tag"), store_path) / "resume.yaml"
+    if yaml_path.exists():
+        return yaml_path.read_text()
+    packed = entry.get("packed")
+    if not packed:
+        raise ValueError(f"YAML not found for {entry['id']}: {yaml_path}")
+    return read_object(packed["sha256"], store_path)
+
+
+def ensure_version_yaml(project: str, entry: dict, store_path: Optional[Path] = None) -> Path:
+    """Make sure a version's resume.yaml exists on disk (unpacking if needed).
+
+    The packed copy is kept, so repacking an unchanged file is free.
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    yaml_path = get_version_path(project, entry["id"], entry.get("tag"), store_path) / "resume.yaml"
+    if not yaml_path.exists() and entry.get("packed"):
+        yaml_path.parent.mkdir(parents=True, exist_ok=True)
+        yaml_path.write_text(read_object(entry["packed"]["sha256"], store_path))
+    return yaml_path
+
+
+def pack_project(
+    project: str,
+    snapshot_every: int = SNAPSHOT_EVERY,
+    store_path: Optional[Path] = None,
+) -> dict:
+    """Pack every inactive version's YAML into delta/snapshot storage.
+
+    Versions are processed depth-first along their lineage, so a parent
+    is always stored before the children that delta against it, even
+    when a child has the lower ID.
+
+    Returns:
+        Stats dict: packed (versions packed now), bytes_before (their YAML
+        size), and snapshots, deltas, bytes_after (for all packed versions)
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    with project_lock(project, store_path):
+        state = load_project_state(project, store_path, upgrade=True)
+        active = state.get("active_version")
+        digests: dict[str, str] = {}
+        stats = {"packed": 0, "snapshots": 0, "deltas": 0, "bytes_before": 0, "bytes_after": 0}
+
+        for vid in lineage_index(state).preorder:
+            entry = get_version_entry(state, vid)
+            yaml_path = get_version_path(project, vid, entry.get("tag"), store_path) / "resume.yaml"
+            if not yaml_path.exists():
+                if entry.get("packed"):
+                    digests[vid] = entry["packed"]["sha256"]
+                continue
+
+            text = yaml_path.read_text()
+            digest = put_text(text, store_path, digests.get(entry.get("parent")), snapshot_every)
+            digests[vid] = digest
+            if vid == active:
+                # Keep the working copy; children can still delta against it
+                continue
+
+            stats["bytes_before"] += len(text.encode())
+            entry["packed"] = {"sha256": digest}
+            yaml_path.unlink()
+            stats["packed"] += 1
+
+        for digest in {e["packed"]["sha256"] for e in state.get("versions", []) if e.get("packed")}:
+            if _delta_path(digest, store_path).exists():
+                stats["deltas"] += 1
+            else:
+                stats["snapshots"] += 1
+            stats["bytes_after"] += stored_size(digest, store_path)
+
+        save_project_state(project, state, store_path)
+    return stats
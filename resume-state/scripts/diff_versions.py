@@ -1,34 +1,65 @@
 #!/usr/bin/env python3
-"""Compare YAML content between two versions."""
+"""Compare YAML content between two versions.
+
+By default prints a unified diff of the YAML lines. --structural compares
+the parsed resumes instead and reports per-field changes, matching
+companies, positions and bullets by identity and similarity (see
+structural_diff.py).
+
+For reports across a whole project, --lineage diffs every version (or
+one version's ancestry) against its parent, and --matrix scores how
+similar every pair of versions is. Both spread reading and parsing over
+a worker pool (--jobs) and parse each version once.
+
+Usage:
+    python diff_versions.py <version_a> <version_b> [--project NAME]
+                            [--context N] [--structural] [--json]
+    python diff_versions.py --lineage [VERSION] [--jobs N] [--json]
+    python diff_versions.py --matrix [--jobs N] [--json]
+
+Examples:
+    python diff_versions.py v1 v2
+    python diff_versions.py v1 v2 --structural
+    python diff_versions.py v1 v2 --json > changes.json
+    python diff_versions.py --lineage            # every version vs its parent
+    python diff_versions.py --lineage v12        # v12's ancestry back to the root
+    python diff_versions.py --matrix --json > drift.json
+"""
 
 import argparse
 import difflib
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+import yaml
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from delta_store import read_version_yaml
+from lineage import lineage_index
 from state_utils import (
     get_store_path,
     get_version_entry,
-    get_version_path,
     load_project_state,
     resolve_project,
 )
+from structural_diff import (
+    Change,
+    changes_to_json,
+    diff_texts,
+    format_changes,
+    resume_facts,
+    summarize,
+)
 
 
-def diff_versions(
-    project: str,
-    version_a: str,
-    version_b: str,
-    context_lines: int = 3,
-) -> str:
-    """Generate a diff between two versions' YAML files.
-
-    Returns:
-        Unified diff string
-    """
-    store_path = get_store_path()
+def _read_pair(
+    project: str, version_a: str, version_b: str, store_path: Path
+) -> tuple[str, str]:
     state = load_project_state(project, store_path)
 
     # Get version entries
@@ -40,21 +71,30 @@ def diff_versions(
     if not entry_b:
         raise ValueError(f"Version not found: {version_b}")
 
-    # Get YAML paths
-    path_a = get_version_path(project, version_a, entry_a.get("tag"), store_path)
-    path_b = get_version_path(project, version_b, entry_b.get("tag"), store_path)
+    # Read YAML (packed versions are rebuilt from their deltas)
+    return (
+        read_version_yaml(project, entry_a, store_path),
+        read_version_yaml(project, entry_b, store_path),
+    )
 
-    yaml_a = path_a / "resume.yaml"
-    yaml_b = path_b / "resume.yaml"
 
-    if not yaml_a.exists():
-        raise ValueError(f"YAML not found for {version_a}: {yaml_a}")
-    if not yaml_b.exists():
-        raise ValueError(f"YAML not found for {version_b}: {yaml_b}")
+def diff_versions(
+    project: str,
+    version_a: str,
+    version_b: str,
+    context_lines: int = 3,
+    store_path: Optional[Path] = None,
+) -> str:
+    """Generate a diff between two versions' YAML files.
 
-    # Read files
-    lines_a = yaml_a.read_text().splitlines(keepends=True)
-    lines_b = yaml_b.read_text().splitlines(keepends=True)
+    Returns:
+        Unified diff string
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    text_a, text_b = _read_pair(project, version_a, version_b, store_path)
+    lines_a = text_a.splitlines(keepends=True)
+    lines_b = text_b.splitlines(keepends=True)
 
     # Generate diff
     diff = difflib.unified_diff(
@@ -68,10 +108,195 @@ def diff_versions(
     return "".join(diff)
 
 
+def structural_diff_versions(
+    project: str,
+    version_a: str,
+    version_b: str,
+    store_path: Optional[Path] = None,
+) -> list[Change]:
+    """Structurally diff two versions' resume data.
+
+    Returns:
+        Per-field changes from version_a to version_b
+
+    Raises:
+        ValueError: If a version is not found or its YAML does not parse
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    text_a, text_b = _read_pair(project, version_a, version_b, store_path)
+    try:
+        return diff_texts(text_a, text_b)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Cannot parse version YAML: {e}") from e
+
+
+def _parse_error(entry: dict, error: yaml.YAMLError) -> ValueError:
+    return ValueError(f"Cannot parse YAML of {entry['id']}: {error}")
+
+
+def _lineage_task(task: tuple) -> list[Change]:
+    """Worker: diff one version against its parent."""
+    project, entry, parent, store_path = task
+    try:
+        return diff_texts(
+            read_version_yaml(project, parent, store_path),
+            read_version_yaml(project, entry, store_path),
+        )
+    except yaml.YAMLError as e:
+        raise _parse_error(entry, e) from e
+
+
+def _facts_task(task: tuple) -> frozenset:
+    """Worker: read a version and extract its facts."""
+    project, entry, store_path = task
+    try:
+        return resume_facts(read_version_yaml(project, entry, store_path))
+    except yaml.YAMLError as e:
+        raise _parse_error(entry, e) from e
+
+
+def run_tasks(fn, tasks: list, jobs: Optional[int]) -> list:
+    """Map ``fn`` over tasks, in a process pool when there is more than one job.
+
+    Tasks go out in contiguous chunks, so a worker usually reads a
+    version right after its parent and reuses the cached parse.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) < 2:
+        return [fn(task) for task in tasks]
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        return list(pool.map(fn, tasks, chunksize=chunksize))
+
+
+def lineage_diffs(
+    project: str,
+    version: Optional[str] = None,
+    jobs: Optional[int] = None,
+    store_path: Optional[Path] = None,
+) -> list[dict]:
+    """Structurally diff versions against their parents.
+
+    Args:
+        project: Project name
+        version: Only diff this version's ancestry (root first); all
+            versions with a parent if None
+        jobs: Worker processes (default: CPU count; 1 runs inline)
+        store_path: Store root
+
+    Returns:
+        One dict per version: version, parent, summary, changes
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    state = load_project_state(project, store_path)
+
+    index = lineage_index(state)
+    if version is None:
+        ids = [v["id"] for v in state.get("versions", [])]
+    else:
+        ids = [version, *index.ancestors(version)][::-1]
+
+    # Versions whose parent no longer exists are roots and have nothing to diff
+    tasks = [
+        (project, get_version_entry(state, vid), get_version_entry(state, index.parent[vid]), store_path)
+        for vid in ids if vid in index.parent
+    ]
+
+    results = run_tasks(_lineage_task, tasks, jobs)
+    return [
+        {"version": task[1]["id"], "parent": task[2]["id"],
+         "summary": summarize(changes), "changes": changes}
+        for task, changes in zip(tasks, results)
+    ]
+
+
+def similarity_matrix(
+    project: str,
+    versions: Optional[list[str]] = None,
+    jobs: Optional[int] = None,
+    store_path: Optional[Path] = None,
+) -> tuple[list[str], list[list[float]]]:
+    """Score the similarity of every pair of versions.
+
+    Each version is reduced to a set of (field path, value) facts that
+    ignores ordering, and pairs are scored by Jaccard similarity (as in
+    structural_diff.fact_similarity). Fact extraction runs on the worker
+    pool; the pairwise scores are bitmask popcounts.
+
+    Args:
+        project: Project name
+        versions: Version IDs to include (default: all)
+        jobs: Worker processes (default: CPU count; 1 runs inline)
+        store_path: Store root
+
+    Returns:
+        Tuple of (version IDs, symmetric matrix of scores in 0-1)
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    state = load_project_state(project, store_path)
+    if versions is None:
+        entries = state.get("versions", [])
+    else:
+        entries = []
+        for vid in versions:
+            entry = get_version_entry(state, vid)
+            if not entry:
+                raise ValueError(f"Version not found: {vid}")
+            entries.append(entry)
+
+    facts = run_tasks(_facts_task, [(project, e, store_path) for e in entries], jobs)
+
+    # Versions share most facts, so number each distinct fact once and turn
+    # every set into an int bitmask: a pair then costs one AND and a popcount
+    bits: dict = {}
+    masks = []
+    for fact_set in facts:
+        mask = 0
+        for fact in fact_set:
+            mask |= 1 << bits.setdefault(fact, len(bits))
+        masks.append(mask)
+
+    n = len(masks)
+    matrix = [[1.0] * n for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            union = (masks[i] | masks[j]).bit_count()
+            score = (masks[i] & masks[j]).bit_count() / union if union else 1.0
+            matrix[i][j] = matrix[j][i] = score
+    return [e["id"] for e in entries], matrix
+
+
+def format_lineage(report: list[dict]) -> str:
+    """Render a lineage report as text."""
+    blocks = []
+    for item in report:
+        counts = ", ".join(f"{n} {op}" for op, n in item["summary"].items() if n)
+        header = f"{item['version']} <- {item['parent']}: {counts or 'no changes'}"
+        body = format_changes(item["changes"])
+        blocks.append(header + ("\n" + _indent(body) if body else ""))
+    return "\n\n".join(blocks)
+
+
+def _indent(text: str) -> str:
+    return "\n".join("  " + line for line in text.splitlines())
+
+
+def format_matrix(ids: list[str], matrix: list[list[float]]) -> str:
+    """Render a similarity matrix as a percentage table."""
+    width = max([len(vid) for vid in ids] + [4])
+    lines = [" " * width + "".join(f" {vid:>{width}}" for vid in ids)]
+    for vid, row in zip(ids, matrix):
+        lines.append(f"{vid:<{width}}" + "".join(f" {score * 100:>{width - 1}.0f}%" for score in row))
+    return "\n".join(lines)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Compare YAML between two versions")
-    parser.add_argument("version_a", help="First version ID (e.g., v1)")
-    parser.add_argument("version_b", help="Second version ID (e.g., v2)")
+    parser.add_argument("version_a", nargs="?", help="First version ID (e.g., v1)")
+    parser.add_argument("version_b", nargs="?", help="Second version ID (e.g., v2)")
     parser.add_argument(
         "--project", "-p",
         help="Project name (default: active project)",
@@ -82,15 +307,94 @@ def main():
         default=3,
         help="Number of context lines (default: 3)",
     )
+    parser.add_argument(
+        "--structural", "-s",
+        action="store_true",
+        help="Compare parsed resume data instead of YAML lines",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output structural changes as JSON (implies --structural)",
+    )
+    parser.add_argument(
+        "--lineage",
+        nargs="?",
+        const="",
+        metavar="VERSION",
+        help="Diff every version (or VERSION's ancestry) against its parent",
+    )
+    parser.add_argument(
+        "--matrix",
+        action="store_true",
+        help="Pairwise similarity of all versions",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Worker processes for --lineage/--matrix (default: CPU count)",
+    )
     args = parser.parse_args()
 
+    report_mode = args.lineage is not None or args.matrix
+    if report_mode and (args.version_a or args.version_b):
+        parser.error("--lineage and --matrix do not take version arguments")
+    if not report_mode and not (args.version_a and args.version_b):
+        parser.error("two versions are required (or use --lineage / --matrix)")
+
     try:
-        project = resolve_project(args.project)
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+        if args.lineage is not None:
+            report = lineage_diffs(
+                project, args.lineage or None, jobs=args.jobs, store_path=store_path
+            )
+            if args.json:
+                print(json.dumps([
+                    {**item, "changes": changes_to_json(item["changes"])} for item in report
+                ], indent=2, default=str))
+            elif report:
+                print(format_lineage(report))
+            else:
+                print("No versions with a parent")
+            return
+
+        if args.matrix:
+            ids, matrix = similarity_matrix(project, jobs=args.jobs, store_path=store_path)
+            if args.json:
+                print(json.dumps({"versions": ids, "matrix": matrix}, indent=2))
+            elif ids:
+                print(format_matrix(ids, matrix))
+            else:
+                print(f"No versions in project: {project}")
+            return
+
+        if args.structural or args.json:
+            changes = structural_diff_versions(
+                project, args.version_a, args.version_b, store_path=store_path
+            )
+            if args.json:
+                print(json.dumps({
+                    "from": args.version_a,
+                    "to": args.version_b,
+                    "summary": summarize(changes),
+                    "changes": changes_to_json(changes),
+                }, indent=2, default=str))
+            elif changes:
+                print(format_changes(changes))
+                counts = summarize(changes)
+                print()
+                print(", ".join(f"{n} {op}" for op, n in counts.items() if n))
+            else:
+                print(f"No differences between {args.version_a} and {args.version_b}")
+            return
+
         diff_output = diff_versions(
             project,
             args.version_a,
             args.version_b,
             context_lines=args.context,
+            store_path=store_path,
         )
 
         if diff_output:
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Set the notes of a version.
+
+Usage:
+    uv run scripts/edit_notes.py VERSION NOTES [--project NAME]
+
+Examples:
+    uv run scripts/edit_notes.py v3 "Sent to Acme, 2 Oct"
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from state_utils import get_store_path, resolve_project, set_version_notes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Set the notes of a version")
+    parser.add_argument("version", help="Version ID (e.g., v1, v2)")
+    parser.add_argument("notes", help="New notes (empty string to clear)")
+    parser.add_argument(
+        "--project", "-p",
+        help="Project name (default: active project)",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+        set_version_notes(project, args.version, args.notes, store_path)
+        print(f"Updated notes of {args.version}")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
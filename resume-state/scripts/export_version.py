@@ -1,40 +1,92 @@
 #!/usr/bin/env python3
-"""Export version files to a target directory."""
+"""Export version files to a target directory or an archive.
+
+With --archive, any number of versions (one, --all, or those selected by
+--tag/--since/--until) are streamed straight into a .tar.gz, .tar or
+.zip file. Files are read in chunks and written sequentially with no
+intermediate copies, and each one is hashed on the way through. The
+archive ends with manifest.json, which lists every file's SHA-256 and
+size along with the version metadata.
+
+Usage:
+    python export_version.py <version> <output_dir> [--format pdf|yaml|all]
+    python export_version.py [<version> | --all | --tag T | --since D | --until D]
+                             --archive FILE [--format pdf|yaml|all]
+
+Examples:
+    python export_version.py v2 ~/applications/google/
+    python export_version.py --all --archive history.tar.gz
+    python export_version.py --since 2025-06 --tag google --archive google.zip
+"""
 
 import argparse
+import hashlib
+import io
+import json
 import shutil
 import sys
+import tarfile
+import tempfile
+import zipfile
+from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO, Iterable, Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from delta_store import read_version_yaml
 from state_utils import (
+    copy_file,
     get_store_path,
     get_version_entry,
     get_version_path,
+    iter_versions,
     load_project_state,
+    now_iso,
     resolve_project,
 )
 
+# Map format to file extensions
+EXTENSIONS = {
+    "pdf": [".pdf"],
+    "yaml": [".yaml", ".yml"],
+    "all": [".pdf", ".yaml", ".yml", ".typ"],
+}
+
+ARCHIVE_FORMATS = ("tar.gz", "tar", "zip")
+MANIFEST_NAME = "manifest.json"
+
+_CHUNK_SIZE = 1 << 20
+# Already-compressed files are stored as-is in zip archives
+_STORED_SUFFIXES = {".pdf"}
+
 
 def export_version(
     project: str,
     version_id: str,
     output_dir: Path,
     format: str = "all",
-) -> list[Path]:
+    store_path: Optional[Path] = None,
+) -> list[tuple[Path, str]]:
     """Export version files to a target directory.
 
+    Files are copied with the cheapest strategy the filesystem supports
+    (a reflink on Btrfs/XFS; see object_store.copy_file). They are never
+    hardlinked, so editing an export cannot change the store.
+
     Args:
         project: Project name
         version_id: Version to export
         output_dir: Target directory
         format: What to export (pdf, yaml, all)
+        store_path: Resolved store (default: discovered from cwd)
 
     Returns:
-        List of exported file paths
+        List of (exported file path, copy strategy); a packed version's
+        rebuilt resume.yaml has strategy "unpacked"
     """
-    store_path = get_store_path()
+    if store_path is None:
+        store_path = get_store_path()
     state = load_project_state(project, store_path)
 
     version_entry = get_version_entry(state, version_id)
@@ -48,28 +100,187 @@ def export_version(
     output_dir.mkdir(parents=True, exist_ok=True)
     exported = []
 
-    # Map format to file extensions
-    extensions = {
-        "pdf": [".pdf"],
-        "yaml": [".yaml", ".yml"],
-        "all": [".pdf", ".yaml", ".yml", ".typ"],
-    }
-    allowed = extensions.get(format, extensions["all"])
+    allowed = EXTENSIONS.get(format, EXTENSIONS["all"])
 
     # Copy matching files
     for f in version_path.iterdir():
         if f.is_file() and f.suffix.lower() in allowed:
             dest = output_dir / f.name
-            shutil.copy2(f, dest)
-            exported.append(dest)
+            exported.append((dest, copy_file(f, dest)))
+
+    # Packed versions have no resume.yaml on disk; rebuild it
+    if ".yaml" in allowed and not (version_path / "resume.yaml").exists():
+        if version_entry.get("packed"):
+            dest = output_dir / "resume.yaml"
+            dest.write_text(read_version_yaml(project, version_entry, store_path))
+            exported.append((dest, "unpacked"))
 
     return exported
 
 
+class _HashingReader:
+    """File wrapper that hashes and counts bytes as they are read."""
+
+    def __init__(self, f: BinaryIO):
+        self._f = f
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def read(self, n: int = -1) -> bytes:
+        data = self._f.read(n)
+        self.sha256.update(data)
+        self.size += len(data)
+        return data
+
+
+class _TarWriter:
+    def __init__(self, f: BinaryIO, compress: bool):
+        mode = "w:gz" if compress else "w"
+        kwargs = {"compresslevel": 6} if compress else {}
+        self._tar = tarfile.open(fileobj=f, mode=mode, **kwargs)
+
+    def add(self, name: str, f: BinaryIO, size: int, mtime: float) -> None:
+        info = tarfile.TarInfo(name)
+        info.size = size
+        info.mtime = int(mtime)
+        info.mode = 0o644
+        self._tar.addfile(info, f)
+
+    def close(self) -> None:
+        self._tar.close()
+
+
+class _ZipWriter:
+    def __init__(self, f: BinaryIO):
+        self._zip = zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6)
+
+    def add(self, name: str, f: BinaryIO, size: int, mtime: float) -> None:
+        info = zipfile.ZipInfo(name, date_time=_zip_time(mtime))
+        info.external_attr = 0o644 << 16
+        if Path(name).suffix.lower() in _STORED_SUFFIXES:
+            info.compress_type = zipfile.ZIP_STORED
+        else:
+            info.compress_type = zipfile.ZIP_DEFLATED
+        with self._zip.open(info, "w", force_zip64=size > zipfile.ZIP64_LIMIT) as out:
+            shutil.copyfileobj(f, out, _CHUNK_SIZE)
+
+    def close(self) -> None:
+        self._zip.close()
+
+
+def _zip_time(mtime: float) -> tuple:
+    return max(datetime.fromtimestamp(mtime).timetuple()[:6], (1980, 1, 1, 0, 0, 0))
+
+
+def archive_format_for(path: Path) -> str:
+    """Infer the archive format from a file name."""
+    name = path.name.lower()
+    if name.endswith((".tar.gz", ".tgz")):
+        return "tar.gz"
+    if name.endswith(".tar"):
+        return "tar"
+    if name.endswith(".zip"):
+        return "zip"
+    raise ValueError(f"Cannot tell archive format from '{path.name}' (use .tar.gz, .tar or .zip)")
+
+
+def export_archive(
+    project: str,
+    versions: Iterable[dict],
+    archive_path: Path,
+    format: str = "all",
+    archive_format: Optional[str] = None,
+    store_path: Optional[Path] = None,
+) -> dict:
+    """Stream version files into a tar/zip archive with a hash manifest.
+
+    Each version's files go under ``<project>/<version dir>/``. Files are
+    copied from disk in chunks and hashed as they stream; packed YAML is
+    rebuilt one version at a time. The archive is written to a temporary
+    file next to ``archive_path`` and renamed into place on success.
+
+    Args:
+        project: Project name
+        versions: Version entries to export, e.g. from iter_versions()
+        archive_path: Archive to write
+        format: What to export per version (pdf, yaml, all)
+        archive_format: "tar.gz", "tar" or "zip" (default: from the file name)
+        store_path: Store root
+
+    Returns:
+        The manifest (also stored in the archive as manifest.json)
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    if archive_format is None:
+        archive_format = archive_format_for(archive_path)
+    allowed = EXTENSIONS.get(format, EXTENSIONS["all"])
+    manifest = {"project": project, "created_at": now_iso(), "versions": [], "files": []}
+
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=archive_path.parent, suffix=".tmp")
+    tmp_path = Path(tmp_name)
+    try:
+        with open(fd, "wb") as f:
+            if archive_format == "zip":
+                writer = _ZipWriter(f)
+            else:
+                writer = _TarWriter(f, compress=archive_format == "tar.gz")
+
+            for entry in versions:
+                version_path = get_version_path(project, entry["id"], entry.get("tag"), store_path)
+                prefix = f"{project}/{version_path.name}/"
+                manifest["versions"].append(entry)
+
+                files = sorted(version_path.iterdir()) if version_path.is_dir() else []
+                for file in files:
+                    if not (file.is_file() and file.suffix.lower() in allowed):
+                        continue
+                    stat = file.stat()
+                    with open(file, "rb") as src:
+                        reader = _HashingReader(src)
+                        writer.add(prefix + file.name, reader, stat.st_size, stat.st_mtime)
+                    manifest["files"].append({
+                        "path": prefix + file.name,
+                        "version": entry["id"],
+                        "sha256": reader.sha256.hexdigest(),
+                        "size": reader.size,
+                    })
+
+                # Packed versions have no resume.yaml on disk; rebuild it
+                if ".yaml" in allowed and entry.get("packed") and not (version_path / "resume.yaml").exists():
+                    data = read_version_yaml(project, entry, store_path).encode()
+                    writer.add(prefix + "resume.yaml", io.BytesIO(data), len(data),
+                               _created_timestamp(entry))
+                    manifest["files"].append({
+                        "path": prefix + "resume.yaml",
+                        "version": entry["id"],
+                        "sha256": hashlib.sha256(data).hexdigest(),
+                        "size": len(data),
+                    })
+
+            data = json.dumps(manifest, indent=2).encode()
+            writer.add(MANIFEST_NAME, io.BytesIO(data), len(data), _created_timestamp(manifest))
+            writer.close()
+        tmp_path.chmod(0o644)
+        tmp_path.replace(archive_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return manifest
+
+
+def _created_timestamp(record: dict) -> float:
+    try:
+        return datetime.fromisoformat(record["created_at"]).timestamp()
+    except (KeyError, ValueError):
+        return 0.0
+
+
 def main():
-    parser = argparse.ArgumentParser(description="Export version files to a directory")
-    parser.add_argument("version", help="Version ID to export (e.g., v1, v2)")
-    parser.add_argument("output", type=Path, help="Target directory")
+    parser = argparse.ArgumentParser(description="Export version files to a directory or archive")
+    parser.add_argument("version", nargs="?", help="Version ID to export (e.g., v1, v2)")
+    parser.add_argument("output", nargs="?", type=Path, help="Target directory")
     parser.add_argument(
         "--project", "-p",
         help="Project name (default: active project)",
@@ -80,21 +291,77 @@ def main():
         default="all",
         help="What to export (default: all)",
     )
+    parser.add_argument(
+        "--archive", "-a",
+        type=Path,
+        help="Stream the selected versions into this .tar.gz, .tar or .zip file",
+    )
+    parser.add_argument(
+        "--archive-format",
+        choices=ARCHIVE_FORMATS,
+        help="Archive format (default: from the archive file name)",
+    )
+    parser.add_argument("--all", action="store_true", help="Export every version (needs --archive)")
+    parser.add_argument("--tag", "-t", help="Export versions with this tag (needs --archive)")
+    parser.add_argument("--since", help="Export versions created on or after this date (needs --archive)")
+    parser.add_argument("--until", help="Export versions created on or before this date (needs --archive)")
     args = parser.parse_args()
 
+    bulk = args.all or args.tag or args.since or args.until
+    if bulk and args.version:
+        parser.error("give either a version or --all/--tag/--since/--until, not both")
+    if args.archive is None:
+        if bulk:
+            parser.error("--all, --tag, --since and --until need --archive")
+        if not (args.version and args.output):
+            parser.error("a version and an output directory are required (or use --archive)")
+    elif args.output:
+        parser.error("--archive replaces the output directory argument")
+    elif not (bulk or args.version):
+        parser.error("choose a version, --all, or filters with --tag/--since/--until")
+
     try:
-        project = resolve_project(args.project)
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+
+        if args.archive is not None:
+            if args.version:
+                entry = get_version_entry(load_project_state(project, store_path), args.version)
+                if not entry:
+                    raise ValueError(f"Version not found: {args.version}")
+                versions = [entry]
+            else:
+                versions = iter_versions(
+                    project, tag=args.tag, since=args.since, until=args.until,
+                    store_path=store_path,
+                )
+            manifest = export_archive(
+                project,
+                versions,
+                args.archive,
+                format=args.format,
+                archive_format=args.archive_format,
+                store_path=store_path,
+            )
+            total = sum(f["size"] for f in manifest["files"])
+            print(
+                f"Exported {len(manifest['versions'])} version(s), {len(manifest['files'])} "
+                f"file(s) ({total:,} bytes) to {args.archive}"
+            )
+            return
+
         exported = export_version(
             project,
             args.version,
             args.output,
             format=args.format,
+            store_path=store_path,
         )
 
         if exported:
             print(f"Exported {len(exported)} file(s) to {args.output}:")
-            for f in exported:
-                print(f"  {f.name}")
+            for f, method in exported:
+                print(f"  {f.name} ({method})")
         else:
             print(f"No matching files found in {args.version}")
 
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Check the integrity of the version store.
+
+Verifies every project: version entries against the directories on
+disk, that each resume.yaml parses, that imported source files exist and
+match their recorded SHA-256, and that every stored object and packed
+delta matches its hash. Hashing runs in parallel. See store_fsck.py for
+the checks and what --repair does.
+
+Exits with status 1 if problems remain.
+
+Usage:
+    uv run scripts/fsck_store.py [--project NAME] [--repair] [--jobs N] [--json]
+
+Examples:
+    uv run scripts/fsck_store.py
+    uv run scripts/fsck_store.py --repair
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pack_versions import format_size
+from state_utils import get_store_path
+from store_fsck import check_store
+
+
+def print_report(result: dict, store_path: Path, repair: bool) -> None:
+    """Print check statistics and problems."""
+    stats = result["stats"]
+    print(f"Store: {store_path}")
+    print(f"  {stats['projects']} project(s), {stats['versions']} version(s), "
+          f"{stats['objects']} object(s); hashed {stats['files_hashed']} file(s), "
+          f"{format_size(stats['bytes_hashed'])}")
+    problems = result["problems"]
+    print()
+    if not problems:
+        print("No problems found")
+        return
+    print(f"{len(problems)} problem(s):")
+    for p in problems:
+        where = "/".join(part for part in (p.project, p.version) if part) or "store"
+        path = f" ({p.path.relative_to(store_path)})" if p.path is not None else ""
+        print(f"  {p.kind:<19} {where}{path}: {p.detail}")
+        if repair:
+            print(f"  {'':<19} -> {p.repaired or 'not repaired'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the integrity of the version store")
+    parser.add_argument(
+        "--project", "-p",
+        action="append",
+        help="Only check this project's state (repeatable; objects are always checked)",
+    )
+    parser.add_argument(
+        "--repair",
+        action="store_true",
+        help="Repair what can be repaired and quarantine damaged files",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Hashing threads (default: CPU count + 4, max 32)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the report as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        if not store_path.is_dir():
+            raise FileNotFoundError(f"No resume store found at {store_path}")
+        result = check_store(store_path, projects=args.project, repair=args.repair, jobs=args.jobs)
+
+        if args.json:
+            print(json.dumps({
+                "store": str(store_path),
+                "stats": result["stats"],
+                "problems": [p.to_dict(store_path) for p in result["problems"]],
+            }, indent=2))
+        else:
+            print_report(result, store_path, args.repair)
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if any(p.repaired is None for p in result["problems"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
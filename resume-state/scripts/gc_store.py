@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Report store size and remove garbage.
+
+Shows the space used per project, file kind and version. Then removes
+leftover *.tmp files and orphaned version directories, sources and
+objects, and compacts SQLite state. With --prune-artifacts it also
+removes generated .typ/.pdf files that are stale or expired, outside the
+retention policy. See store_gc.py for the rules.
+
+Usage:
+    uv run scripts/gc_store.py [--dry-run] [--prune-artifacts] [--keep-recent N]
+                               [--max-age DAYS] [--top N] [--jobs N] [--json]
+
+Examples:
+    uv run scripts/gc_store.py --dry-run
+    uv run scripts/gc_store.py --prune-artifacts --keep-recent 5 --max-age 14
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pack_versions import format_size
+from state_utils import get_store_path
+from store_gc import KEEP_RECENT, MAX_AGE_DAYS, collect_garbage
+
+
+def print_report(result: dict, store_path: Path, top: int, dry_run: bool) -> None:
+    """Print usage and collection results."""
+    usage = result["usage"]
+    print(f"Store: {store_path}")
+    print(f"  {format_size(usage['total'])} in {usage['files']} files "
+          f"({format_size(usage['unique'])} on disk, counting hardlinks once)")
+
+    for title, sizes, limit in (
+        ("By project", usage["by_project"], None),
+        ("By kind", usage["by_kind"], None),
+        (f"Largest versions (top {top})", usage["by_version"], top),
+    ):
+        rows = sorted(sizes.items(), key=lambda kv: kv[1], reverse=True)[:limit]
+        if not rows:
+            continue
+        print()
+        print(f"{title}:")
+        width = max(len(name) for name, _ in rows)
+        for name, size in rows:
+            print(f"  {name:<{width}}  {format_size(size):>8}")
+
+    removed = result["removed"]
+    print()
+    for project, error in sorted(result["unreadable"].items()):
+        print(f"Warning: skipped {project} (state unreadable: {error})")
+    if result["unreadable"]:
+        print("Objects are kept until every project's state can be read")
+        print()
+    verb = "Would remove" if dry_run else "Removed"
+    if not removed:
+        print("Nothing to remove")
+    else:
+        by_reason: dict[str, list[int]] = {}
+        for _, reason, size in removed:
+            by_reason.setdefault(reason, []).append(size)
+        total = sum(size for _, _, size in removed)
+        print(f"{verb} {len(removed)} item(s), {format_size(total)}:")
+        for reason, sizes in sorted(by_reason.items()):
+            print(f"  {reason:<17} {len(sizes):>5}  {format_size(sum(sizes)):>8}")
+        if dry_run:
+            for path, reason, _ in removed:
+                print(f"    {reason}: {path.relative_to(store_path)}")
+    if result["compacted"]:
+        print(f"Compacted state files: saved {format_size(result['compacted'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report store size and remove garbage")
+    parser.add_argument(
+        "--dry-run", "-n",
+        action="store_true",
+        help="Only report what would be removed",
+    )
+    parser.add_argument(
+        "--prune-artifacts",
+        action="store_true",
+        help="Also remove stale or expired .typ/.pdf files outside the retention policy",
+    )
+    parser.add_argument(
+        "--keep-recent",
+        type=int,
+        default=KEEP_RECENT,
+        help=f"With --prune-artifacts, keep generated files of the N newest versions "
+             f"per project (default: {KEEP_RECENT})",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        default=MAX_AGE_DAYS,
+        help=f"With --prune-artifacts, keep generated files modified within this many days "
+             f"(default: {MAX_AGE_DAYS})",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=10,
+        help="Number of largest versions to show (default: 10)",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Parallel directory scanners (default: 4 per CPU, max 32)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the report as JSON",
+    )
+    args = parser.parse_args()
+
+    if args.keep_recent < 0 or args.max_age < 0:
+        print("Error: --keep-recent and --max-age must not be negative", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        store_path = get_store_path()
+        if not store_path.is_dir():
+            raise FileNotFoundError(f"No resume store found at {store_path}")
+        result = collect_garbage(
+            store_path,
+            keep_recent=args.keep_recent,
+            max_age_days=args.max_age,
+            dry_run=args.dry_run,
+            jobs=args.jobs,
+            prune_artifacts=args.prune_artifacts,
+        )
+
+        if args.json:
+            print(json.dumps({
+                "store": str(store_path),
+                "dry_run": args.dry_run,
+                "usage": result["usage"],
+                "removed": [
+                    {"path": str(path.relative_to(store_path)), "reason": reason, "size": size}
+                    for path, reason, size in result["removed"]
+                ],
+                "compacted": result["compacted"],
+                "unreadable": result["unreadable"],
+            }, indent=2))
+        else:
+            print_report(result, store_path, args.top, args.dry_run)
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Get the path to the active version's YAML file."""
+"""Get the path to the active version's YAML file.
+
+For the active project the path comes from the store summary
+(status.json) when it is present, without loading project state.
+"""
 
 import argparse
 import sys
@@ -9,6 +13,8 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from state_utils import (
     get_active_version_path,
+    get_store_path,
+    get_summary_yaml_path,
     resolve_project,
 )
 
@@ -29,8 +35,11 @@ def main():
     args = parser.parse_args()
 
     try:
-        project = resolve_project(args.project)
-        yaml_path = get_active_version_path(project)
+        store_path = get_store_path()
+        yaml_path = get_summary_yaml_path(args.project, store_path)
+        if yaml_path is None:
+            project = resolve_project(args.project, store_path)
+            yaml_path = get_active_version_path(project, store_path)
 
         if args.dir:
             print(yaml_path.parent)
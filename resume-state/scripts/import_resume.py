@@ -1,24 +1,37 @@
 #!/usr/bin/env python3
-"""Import a PDF/DOCX resume as a new version."""
+"""Import a PDF/DOCX resume as a new version, or a directory of them.
+
+Usage:
+    uv run scripts/import_resume.py FILE [--project NAME] [--tag TAG] [--notes TEXT]
+    uv run scripts/import_resume.py --dir DIR [--jobs N] [--project NAME] [--tag TAG]
+
+Examples:
+    uv run scripts/import_resume.py resume.pdf
+    uv run scripts/import_resume.py --dir inbox/ --jobs 8
+"""
 
 import argparse
+import importlib.util
 import os
 import subprocess
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from object_store import link_object, put_object
+from search_index import update_index
 from state_utils import (
-    copy_file,
-    get_next_version_id,
+    append_version,
+    append_versions,
     get_project_path,
     get_store_path,
     get_version_path,
-    load_project_state,
     now_iso,
     resolve_project,
-    save_project_state,
 )
 
 
@@ -77,12 +90,73 @@ def find_extractor_scripts() -> Path:
     )
 
 
+PLACEHOLDER_YAML = """# Resume extracted from: {name}
+# Version: {version_id}
+# Created: {created}
+#
+# TODO: Parse extracted_text.txt into structured YAML format
+# See references/resume_schema.yaml for the expected structure
+
+contact:
+  name: ""
+  email: ""
+  phone: ""
+  location: ""
+
+summary: ""
+
+experience: []
+
+education: []
+
+skills: []
+"""
+
+
+# Suffixes picked up by a directory import, and the extractor for each
+EXTRACTORS = {
+    ".pdf": ("extract_pdf.py", "extract_pdf_text"),
+    ".docx": ("extract_docx.py", "extract_docx_text"),
+    ".doc": ("extract_docx.py", "extract_docx_text"),
+}
+
+
+def _import_entry(
+    version_id: str,
+    file_path: Path,
+    source_filename: str,
+    source_digest: str,
+    tag: str | None,
+    notes: str,
+) -> dict:
+    return {
+        "id": version_id,
+        "tag": tag,
+        "created_at": now_iso(),
+        "source": {
+            "type": "import",
+            "file": source_filename,
+            "original_name": file_path.name,
+            "sha256": source_digest,
+        },
+        "parent": None,
+        "notes": notes or f"Imported from {file_path.name}",
+    }
+
+
+def _write_placeholder(version_path: Path, file_path: Path, version_id: str) -> None:
+    (version_path / "resume.yaml").write_text(PLACEHOLDER_YAML.format(
+        name=file_path.name, version_id=version_id, created=now_iso()
+    ))
+
+
 def import_resume(
     file_path: Path,
     project: str,
     notes: str = "",
     tag: str | None = None,
     strict: bool = False,
+    store_path: Path | None = None,
 ) -> tuple[str, Path]:
     """Import a resume file as a new version.
 
@@ -92,6 +166,7 @@ def import_resume(
         notes: Optional notes about this import
         tag: Optional version tag
         strict: If True, fail on extraction errors instead of warning
+        store_path: Resolved store (default: discovered from cwd)
 
     Returns:
         Tuple of (version_id, version_path)
@@ -99,25 +174,12 @@ def import_resume(
     Raises:
         RuntimeError: If strict=True and extraction fails
     """
-    store_path = get_store_path()
-    state = load_project_state(project, store_path)
+    if store_path is None:
+        store_path = get_store_path()
 
     # Find extractor scripts
     extractor_scripts = find_extractor_scripts()
 
-    # Determine version ID
-    version_id = get_next_version_id(state)
-
-    # Copy source file
-    project_path = get_project_path(project, store_path)
-    source_filename = f"{version_id}_{file_path.name}"
-    source_dest = project_path / "sources" / source_filename
-    copy_file(file_path, source_dest)
-
-    # Create version directory
-    version_path = get_version_path(project, version_id, tag, store_path)
-    version_path.mkdir(parents=True, exist_ok=True)
-
     # Extract text using appropriate extractor
     suffix = file_path.suffix.lower()
     if suffix == ".pdf":
@@ -127,67 +189,193 @@ def import_resume(
     else:
         raise ValueError(f"Unsupported file type: {suffix}")
 
-    extracted_text_path = version_path / "extracted_text.txt"
-    result = subprocess.run(
-        ["uv", "run", str(extractor), str(file_path), "-o", str(extracted_text_path)],
-        capture_output=True,
-        text=True,
-    )
-    if result.returncode != 0:
-        error_msg = f"Extraction failed: {result.stderr}"
-        if strict:
-            raise RuntimeError(error_msg)
-        print(f"Warning: {error_msg}", file=sys.stderr)
-        print("Continuing with import. You may need to manually extract text.", file=sys.stderr)
-
-    # Create placeholder YAML
-    yaml_path = version_path / "resume.yaml"
-    yaml_content = f"""# Resume extracted from: {file_path.name}
-# Version: {version_id}
-# Created: {now_iso()}
-#
-# TODO: Parse extracted_text.txt into structured YAML format
-# See references/resume_schema.yaml for the expected structure
+    # Store the source and extract its text before taking the project lock:
+    # extraction can take seconds, and every other writer would wait on it
+    project_path = get_project_path(project, store_path)
+    if not project_path.is_dir():
+        raise FileNotFoundError(f"Project not found: {project}")
+    source_digest = put_object(file_path, store_path)
+    fd, extracted_tmp = tempfile.mkstemp(dir=project_path, prefix="extract-", suffix=".tmp")
+    os.close(fd)
+    extracted_tmp = Path(extracted_tmp)
+    try:
+        result = subprocess.run(
+            ["uv", "run", str(extractor), str(file_path), "-o", str(extracted_tmp)],
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode != 0:
+            error_msg = f"Extraction failed: {result.stderr}"
+            if strict:
+                raise RuntimeError(error_msg)
+            print(f"Warning: {error_msg}", file=sys.stderr)
+            print("Continuing with import. You may need to manually extract text.", file=sys.stderr)
+            extracted_tmp.unlink(missing_ok=True)
+
+        def make_entry(version_id: str) -> dict:
+            # Only links and renames run under the lock
+            source_filename = f"{version_id}_{file_path.name}"
+            link_object(source_digest, project_path / "sources" / source_filename, store_path,
+                        mutable=False)
+            version_path = get_version_path(project, version_id, tag, store_path)
+            version_path.mkdir(parents=True, exist_ok=True)
+            if extracted_tmp.exists():
+                os.replace(extracted_tmp, version_path / "extracted_text.txt")
+            _write_placeholder(version_path, file_path, version_id)
+            return _import_entry(version_id, file_path, source_filename, source_digest, tag, notes)
+
+        # Allocate the ID, link the files and record the version together
+        version_entry = append_version(project, make_entry, store_path=store_path)
+    finally:
+        extracted_tmp.unlink(missing_ok=True)
+    version_id = version_entry["id"]
+    update_index(project, store_path)
+
+    return version_id, get_version_path(project, version_id, tag, store_path)
+
+
+@lru_cache(maxsize=None)
+def _load_extractor(script: str):
+    """Import an extractor script as a module (once per process)."""
+    spec = importlib.util.spec_from_file_location(Path(script).stem, script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def extract_text(file_path: Path, extractor_scripts: Path) -> str:
+    """Extract a resume's text in-process with the resume-extractor functions.
 
-contact:
-  name: ""
-  email: ""
-  phone: ""
-  location: ""
+    Raises:
+        ValueError: If the file type is not supported
+        RuntimeError: If extraction fails
+    """
+    try:
+        script, function = EXTRACTORS[file_path.suffix.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported file type: {file_path.suffix}")
+    extract = getattr(_load_extractor(str(extractor_scripts / script)), function)
+    try:
+        return extract(file_path)
+    except SystemExit:
+        # The extractors exit when their parsing library is missing
+        raise RuntimeError("extraction library not available (run: uv sync)")
+    except Exception as e:
+        raise RuntimeError(f"{type(e).__name__}: {e}")
 
-summary: ""
 
-experience: []
+def _bulk_task(task: tuple) -> tuple[str, str | None, str | None]:
+    """Store one file's content and extract its text (runs in a worker).
 
-education: []
+    Returns:
+        Tuple of (source digest, text or None, error or None)
+    """
+    file_path, extractor_scripts, store_path = task
+    digest = put_object(file_path, store_path)
+    try:
+        return digest, extract_text(file_path, extractor_scripts), None
+    except RuntimeError as e:
+        return digest, None, str(e)
 
-skills: []
-"""
-    yaml_path.write_text(yaml_content)
 
-    # Update project state
-    version_entry = {
-        "id": version_id,
-        "tag": tag,
-        "created_at": now_iso(),
-        "source": {
-            "type": "import",
-            "file": source_filename,
-            "original_name": file_path.name,
-        },
-        "parent": None,
-        "notes": notes or f"Imported from {file_path.name}",
-    }
-    state["versions"].append(version_entry)
-    state["active_version"] = version_id
-    save_project_state(project, state, store_path)
+def import_directory(
+    directory: Path,
+    project: str,
+    jobs: int | None = None,
+    notes: str = "",
+    tag: str | None = None,
+    strict: bool = False,
+    store_path: Path | None = None,
+) -> list[tuple[str, Path, str | None]]:
+    """Import every PDF/DOCX file in a directory, in parallel.
+
+    Each file is stored once as a content-addressed object and its text
+    extracted in-process, on a pool of ``jobs`` worker processes. The
+    versions are then allocated and recorded in one locked transaction,
+    in file name order; the last one becomes active.
+
+    Args:
+        directory: Directory to import (not recursive)
+        project: Project name
+        jobs: Worker processes (default: one per CPU)
+        notes: Notes for every version (default: "Imported from <name>")
+        tag: Optional tag for every version
+        strict: If True, import nothing when any extraction fails
+        store_path: Resolved store (default: discovered from cwd)
 
-    return version_id, version_path
+    Returns:
+        List of (version_id, version_path, extraction error or None)
+
+    Raises:
+        FileNotFoundError: If the directory does not exist
+        RuntimeError: If strict=True and an extraction fails
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    if not directory.is_dir():
+        raise FileNotFoundError(f"Directory not found: {directory}")
+    files = sorted(
+        (f for f in directory.iterdir() if f.is_file() and f.suffix.lower() in EXTRACTORS),
+        key=lambda f: f.name,
+    )
+    if not files:
+        return []
+
+    extractor_scripts = find_extractor_scripts()
+    tasks = [(f, extractor_scripts, store_path) for f in files]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+    if jobs == 1:
+        results = [_bulk_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_bulk_task, tasks))
+
+    failed = [(f, error) for f, (_, _, error) in zip(files, results) if error]
+    if failed and strict:
+        details = "; ".join(f"{f.name}: {error}" for f, error in failed)
+        raise RuntimeError(f"Extraction failed for {len(failed)} file(s): {details}")
+    for f, error in failed:
+        print(f"Warning: Extraction failed for {f.name}: {error}", file=sys.stderr)
+
+    project_path = get_project_path(project, store_path)
+
+    def builder(file_path: Path, digest: str, text: str | None):
+        def make_entry(version_id: str) -> dict:
+            source_filename = f"{version_id}_{file_path.name}"
+            link_object(digest, project_path / "sources" / source_filename, store_path, mutable=False)
+            version_path = get_version_path(project, version_id, tag, store_path)
+            version_path.mkdir(parents=True, exist_ok=True)
+            if text is not None:
+                (version_path / "extracted_text.txt").write_text(text)
+            _write_placeholder(version_path, file_path, version_id)
+            return _import_entry(version_id, file_path, source_filename, digest, tag, notes)
+        return make_entry
+
+    entries = append_versions(
+        project,
+        [builder(f, digest, text) for f, (digest, text, _) in zip(files, results)],
+        store_path=store_path,
+    )
+    update_index(project, store_path)
+    return [
+        (entry["id"], get_version_path(project, entry["id"], tag, store_path), error)
+        for entry, (_, _, error) in zip(entries, results)
+    ]
 
 
 def main():
     parser = argparse.ArgumentParser(description="Import a PDF/DOCX resume as a new version")
-    parser.add_argument("file", type=Path, help="Path to PDF or DOCX file")
+    parser.add_argument("file", type=Path, nargs="?", help="Path to PDF or DOCX file")
+    parser.add_argument(
+        "--dir", "-d",
+        type=Path,
+        help="Import every PDF/DOCX file in this directory",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Worker processes for --dir (default: one per CPU)",
+    )
     parser.add_argument(
         "--project", "-p",
         help="Project name (default: active project)",
@@ -208,18 +396,46 @@ def main():
     )
     args = parser.parse_args()
 
+    if (args.file is None) == (args.dir is None):
+        parser.error("give either a file or --dir")
+
     try:
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+
+        if args.dir is not None:
+            imported = import_directory(
+                args.dir,
+                project,
+                jobs=args.jobs,
+                notes=args.notes,
+                tag=args.tag,
+                strict=args.strict,
+                store_path=store_path,
+            )
+            if not imported:
+                print(f"No PDF/DOCX files in {args.dir}")
+                return
+            failed = sum(1 for _, _, error in imported if error)
+            print(f"Imported {len(imported)} file(s) into project: {project} "
+                  f"({imported[0][0]}..{imported[-1][0]})")
+            if failed:
+                print(f"  {failed} without extracted text (see warnings above)")
+            print()
+            print("Next: Parse each extracted_text.txt into resume.yaml")
+            return
+
         if not args.file.exists():
             print(f"Error: File not found: {args.file}", file=sys.stderr)
             sys.exit(1)
 
-        project = resolve_project(args.project)
         version_id, version_path = import_resume(
             args.file,
             project,
             notes=args.notes,
             tag=args.tag,
             strict=args.strict,
+            store_path=store_path,
         )
         print(f"Imported as {version_id} in project: {project}")
         print(f"  Source: {args.file.name}")
@@ -232,7 +448,7 @@ def main():
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
-    except ValueError as e:
+    except (ValueError, RuntimeError) as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
@@ -4,6 +4,7 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -15,15 +16,28 @@ from state_utils import (
     get_project_path,
     get_store_path,
     now_iso,
-    save_config,
-    load_config,
+    open_project_db,
     save_project_state,
+    set_active_project,
 )
 
 
-def init_project(name: str, set_active: bool = True) -> Path:
-    """Initialize a new project with directory structure."""
-    store_path = get_store_path()
+def init_project(
+    name: str,
+    set_active: bool = True,
+    backend: str = "json",
+    store_path: Optional[Path] = None,
+) -> Path:
+    """Initialize a new project with directory structure.
+
+    Args:
+        name: Project name
+        set_active: Make this the active project
+        backend: State backend, "json" (project.json) or "sqlite" (project.db)
+        store_path: Resolved store (default: discovered from cwd)
+    """
+    if store_path is None:
+        store_path = get_store_path()
     ensure_store_exists(store_path)
 
     project_path = get_project_path(name, store_path)
@@ -34,6 +48,9 @@ def init_project(name: str, set_active: bool = True) -> Path:
     (project_path / "sources").mkdir(parents=True)
     (project_path / "versions").mkdir(parents=True)
     (project_path / "jobs").mkdir(parents=True)
+    if backend == "sqlite":
+        # Creating project.db switches state_utils to the SQLite backend
+        open_project_db(name, store_path).close()
 
     # Initialize project state
     state = {
@@ -49,9 +66,7 @@ def init_project(name: str, set_active: bool = True) -> Path:
 
     # Set as active project if first or requested
     if set_active or get_active_project(store_path) is None:
-        config = load_config(store_path)
-        config["active_project"] = name
-        save_config(config, store_path)
+        set_active_project(name, store_path)
 
     return project_path
 
@@ -64,10 +79,18 @@ def main():
         action="store_true",
         help="Don't set as active project",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["json", "sqlite"],
+        default="json",
+        help="State storage backend (default: json; sqlite for large histories)",
+    )
     args = parser.parse_args()
 
     try:
-        project_path = init_project(args.name, set_active=not args.no_activate)
+        project_path = init_project(
+            args.name, set_active=not args.no_activate, backend=args.backend
+        )
         print(f"Created project: {args.name}")
         print(f"  Path: {project_path}")
         if not args.no_activate:
@@ -0,0 +1,176 @@
+"""Lineage graph of a project's versions.
+
+Every version entry records the ``parent`` it was derived from, which
+makes the versions a forest: imports are roots, and tailored versions
+hang below the version they were branched from. ``LineageIndex`` builds
+that graph once per loaded state and precomputes:
+
+- a depth-first (preorder) numbering, so "is A an ancestor of B" is two
+  comparisons and the descendants of a version are one list slice
+- a binary-lifting table, so the nearest common ancestor of two versions
+  takes O(log depth) steps however deep the history is
+
+A parent that no longer exists (e.g. an undone version) makes its child
+a root, and so does a parent cycle left by hand-edited state.
+"""
+
+from typing import Optional
+
+from state_utils import ProjectState
+
+
+class LineageIndex:
+    """Parent/child graph over a project's versions."""
+
+    def __init__(self, versions: list[dict]):
+        ids = [v["id"] for v in versions]
+        self.tags: dict[str, Optional[str]] = {v["id"]: v.get("tag") for v in versions}
+        self.children: dict[str, list[str]] = {vid: [] for vid in ids}
+        self.parent: dict[str, str] = {}
+        for v in versions:
+            parent = v.get("parent")
+            if parent in self.children and parent != v["id"]:
+                self.parent[v["id"]] = parent
+                self.children[parent].append(v["id"])
+
+        self.depth: dict[str, int] = {}
+        self.preorder: list[str] = []
+        self._tin: dict[str, int] = {}
+        self._tout: dict[str, int] = {}
+        self.roots = [vid for vid in ids if vid not in self.parent]
+        for root in self.roots:
+            self._number(root, 0)
+        # Versions still unnumbered sit on a parent cycle: cut it at the
+        # oldest one
+        for vid in ids:
+            if vid not in self._tin:
+                self.children[self.parent.pop(vid)].remove(vid)
+                self.roots.append(vid)
+                self._number(vid, 0)
+
+        # _up[k][v] is v's 2**k-th ancestor (or v's root)
+        self._up = [{vid: self.parent.get(vid, vid) for vid in ids}]
+        for _ in range(max(self.depth.values(), default=0).bit_length() - 1):
+            prev = self._up[-1]
+            self._up.append({vid: prev[prev[vid]] for vid in ids})
+
+    def _number(self, root: str, depth: int) -> None:
+        stack = [(root, depth, False)]
+        while stack:
+            vid, d, done = stack.pop()
+            if done:
+                self._tout[vid] = len(self.preorder)
+                continue
+            self._tin[vid] = len(self.preorder)
+            self.preorder.append(vid)
+            self.depth[vid] = d
+            stack.append((vid, d, True))
+            stack.extend((child, d + 1, False) for child in reversed(self.children[vid]))
+
+    def __contains__(self, version_id: str) -> bool:
+        return version_id in self.children
+
+    def _check(self, *version_ids: str) -> None:
+        for vid in version_ids:
+            if vid not in self.children:
+                raise ValueError(f"Version not found: {vid}")
+
+    def ancestors(self, version_id: str) -> list[str]:
+        """Ancestors of a version, parent first, root last."""
+        self._check(version_id)
+        chain = []
+        while version_id in self.parent:
+            version_id = self.parent[version_id]
+            chain.append(version_id)
+        return chain
+
+    def descendants(self, version_id: str) -> list[str]:
+        """All versions derived from a version, depth-first."""
+        self._check(version_id)
+        return self.preorder[self._tin[version_id] + 1:self._tout[version_id]]
+
+    def is_ancestor(self, ancestor: str, version_id: str) -> bool:
+        """True if ``version_id`` derives (directly or not) from ``ancestor``."""
+        self._check(ancestor, version_id)
+        return self._tin[ancestor] < self._tin[version_id] < self._tout[ancestor]
+
+    def common_ancestor(self, a: str, b: str) -> Optional[str]:
+        """Nearest version both derive from (one of them, if it is the other's
+        ancestor), or None if they share no root."""
+        self._check(a, b)
+        if self.depth[a] < self.depth[b]:
+            a, b = b, a
+        diff = self.depth[a] - self.depth[b]
+        for k, up in enumerate(self._up):
+            if diff >> k & 1:
+                a = up[a]
+        if a == b:
+            return a
+        for up in reversed(self._up):
+            if up[a] != up[b]:
+                a, b = up[a], up[b]
+        return self.parent.get(a) if self.parent.get(a) == self.parent.get(b) else None
+
+    def leaves(self) -> list[str]:
+        """Versions nothing was derived from, in history order."""
+        return [vid for vid in self.children if not self.children[vid]]
+
+    def to_dict(self) -> dict:
+        """JSON-serializable form of the graph."""
+        return {
+            "roots": self.roots,
+            "leaves": self.leaves(),
+            "versions": {
+                vid: {
+                    "tag": self.tags[vid],
+                    "parent": self.parent.get(vid),
+                    "children": self.children[vid],
+                    "depth": self.depth[vid],
+                }
+                for vid in self.preorder
+            },
+        }
+
+
+def lineage_index(state: dict) -> LineageIndex:
+    """Get the lineage index of a loaded state (built once per load)."""
+    if isinstance(state, ProjectState):
+        return state.derived("lineage", LineageIndex)
+    return LineageIndex(state.get("versions", []))
+
+
+def render_tree(
+    index: LineageIndex,
+    root: Optional[str] = None,
+    active: Optional[str] = None,
+    max_depth: Optional[int] = None,
+) -> str:
+    """Draw the graph (or the subtree under ``root``) as an ASCII tree.
+
+    The active version is marked with ``*``; branches cut off by
+    ``max_depth`` end in ``...`` with the number of hidden versions.
+    """
+    def label(vid: str) -> str:
+        text = vid
+        if index.tags.get(vid):
+            text += f" ({index.tags[vid]})"
+        return text + (" *" if vid == active else "")
+
+    roots = index.roots if root is None else [root]
+    lines = []
+    stack = [(r, "", "", 0) for r in reversed(roots)]
+    while stack:
+        vid, prefix, branch, depth = stack.pop()
+        lines.append(prefix + branch + label(vid))
+        children = index.children[vid]
+        if not children:
+            continue
+        child_prefix = prefix + ("" if not branch else ("|   " if branch == "|-- " else "    "))
+        if max_depth is not None and depth >= max_depth:
+            hidden = len(index.descendants(vid))
+            lines.append(f"{child_prefix}`-- ... ({hidden} more)")
+            continue
+        for i in reversed(range(len(children))):
+            last = i == len(children) - 1
+            stack.append((children[i], child_prefix, "`-- " if last else "|-- ", depth + 1))
+    return "\n".join(lines)
@@ -1,16 +1,34 @@
 #!/usr/bin/env python3
-"""List versions in a project."""
+"""List versions in a project.
+
+Large projects can be filtered and paged; only the requested page is
+read from the SQLite backend.
+
+Usage:
+    python list_versions.py [--project NAME] [--tag TAG] [--since DATE] [--until DATE]
+                            [--source-type TYPE] [--parent ID]
+                            [--limit N] [--offset N] [--newest-first] [--verbose]
+
+Examples:
+    python list_versions.py
+    python list_versions.py --tag google
+    python list_versions.py --since 2025-06 --source-type edit --limit 20
+    python list_versions.py --newest-first --limit 20 --offset 20
+"""
 
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
 from state_utils import (
     get_active_project,
+    get_active_version_id,
+    get_store_path,
+    iter_versions,
     list_projects,
-    load_project_state,
     resolve_project,
 )
 
@@ -20,20 +38,41 @@ def format_date(iso_date: str) -> str:
     return iso_date[:10] if iso_date else "N/A"
 
 
-def list_versions(project: str, verbose: bool = False) -> None:
-    """Print version list for a project."""
-    state = load_project_state(project)
-    active_version = state.get("active_version")
-    versions = state.get("versions", [])
-
-    if not versions:
-        print(f"No versions in project: {project}")
-        return
-
-    print(f"{project} versions:")
-    print()
-
+def list_versions(
+    project: str,
+    verbose: bool = False,
+    store_path: Optional[Path] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    **filters,
+) -> None:
+    """Print version list for a project.
+
+    Args:
+        project: Project name
+        verbose: Show parent, source file and operation for each version
+        store_path: Store root
+        limit: Print at most this many versions
+        offset: Skip this many matching versions
+        **filters: tag, since, until, source_type, parent, newest_first
+            (see state_utils.iter_versions)
+    """
+    active_version = get_active_version_id(project, store_path)
+    # Fetch one extra entry to tell whether another page follows
+    fetch = None if limit is None else limit + 1
+    versions = iter_versions(project, offset=offset, limit=fetch, store_path=store_path, **filters)
+
+    shown = 0
     for v in versions:
+        if limit is not None and shown == limit:
+            print()
+            print(f"More versions follow; use --offset {offset + shown} to see the next page")
+            break
+        if shown == 0:
+            print(f"{project} versions:")
+            print()
+        shown += 1
+
         marker = "*" if v["id"] == active_version else " "
         source_type = v.get("source", {}).get("type", "unknown")
         tag_str = v.get("tag") or ""
@@ -55,6 +94,12 @@ def list_versions(project: str, verbose: bool = False) -> None:
                 print(f"         operation: {source['operation']}")
             print()
 
+    if shown == 0:
+        if filters or offset:
+            print(f"No matching versions in project: {project}")
+        else:
+            print(f"No versions in project: {project}")
+
 
 def main():
     parser = argparse.ArgumentParser(description="List versions in a project")
@@ -72,12 +117,21 @@ def main():
         action="store_true",
         help="List all projects instead of versions",
     )
+    parser.add_argument("--tag", "-t", help="Only versions with this tag")
+    parser.add_argument("--since", help="Only versions created on or after this date (YYYY-MM-DD)")
+    parser.add_argument("--until", help="Only versions created on or before this date (YYYY-MM-DD)")
+    parser.add_argument("--source-type", help="Only versions from this source (import, edit, ...)")
+    parser.add_argument("--parent", help="Only direct children of this version")
+    parser.add_argument("--limit", "-n", type=int, help="Show at most N versions")
+    parser.add_argument("--offset", type=int, default=0, help="Skip the first N matching versions")
+    parser.add_argument("--newest-first", action="store_true", help="List newest versions first")
     args = parser.parse_args()
 
     try:
+        store_path = get_store_path()
         if args.list_projects:
-            projects = list_projects()
-            active = get_active_project()
+            projects = list_projects(store_path)
+            active = get_active_project(store_path)
             if not projects:
                 print("No projects found")
                 return
@@ -87,8 +141,28 @@ def main():
                 print(f"{marker} {p}")
             return
 
-        project = resolve_project(args.project)
-        list_versions(project, verbose=args.verbose)
+        project = resolve_project(args.project, store_path)
+        filters = {
+            name: value
+            for name, value in (
+                ("tag", args.tag),
+                ("since", args.since),
+                ("until", args.until),
+                ("source_type", args.source_type),
+                ("parent", args.parent),
+            )
+            if value is not None
+        }
+        if args.newest_first:
+            filters["newest_first"] = True
+        list_versions(
+            project,
+            verbose=args.verbose,
+            store_path=store_path,
+            limit=args.limit,
+            offset=args.offset,
+            **filters,
+        )
 
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Upgrade the version store to the current schema.
+
+Runs the registered migrations on config.json and on every project whose
+state was written under an older schema, upgrading projects in parallel.
+Each project is saved in one atomic write. Reads upgrade older state in
+memory only and a project is otherwise upgraded by the first change made
+to it; this command upgrades the whole store up front. See store_migrate.py for the migration registry.
+
+Usage:
+    uv run scripts/migrate_store.py [--project NAME] [--dry-run] [--jobs N] [--json]
+
+Examples:
+    uv run scripts/migrate_store.py --dry-run
+    uv run scripts/migrate_store.py
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from state_utils import CONFIG_SCHEMA_VERSION, PROJECT_SCHEMA_VERSION, get_store_path
+from store_migrate import migrate_store
+
+
+def print_result(result: dict, store_path: Path, dry_run: bool) -> None:
+    """Print the upgrades made (or planned)."""
+    verb = "Would upgrade" if dry_run else "Upgraded"
+    print(f"Store: {store_path}")
+    print(f"  Schemas: config {CONFIG_SCHEMA_VERSION}, project {PROJECT_SCHEMA_VERSION}")
+    config = result["config"]
+    if config:
+        print(f"  {verb} config.json: {config['from']} -> {config['to']}")
+    if not result["projects"] and not config:
+        print()
+        print("Everything is up to date")
+        return
+    for upgrade in result["projects"]:
+        print(f"  {verb} {upgrade['project']}: {upgrade['from']} -> {upgrade['to']}")
+        for step in upgrade["steps"]:
+            print(f"    {step}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Upgrade the version store to the current schema")
+    parser.add_argument(
+        "--project", "-p",
+        action="append",
+        help="Only upgrade this project (repeatable)",
+    )
+    parser.add_argument(
+        "--dry-run", "-n",
+        action="store_true",
+        help="Report what would be upgraded without writing",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Projects upgraded in parallel (default: CPU count + 4, max 32)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the result as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        if not store_path.is_dir():
+            raise FileNotFoundError(f"No resume store found at {store_path}")
+        result = migrate_store(store_path, projects=args.project, dry_run=args.dry_run, jobs=args.jobs)
+
+        if args.json:
+            print(json.dumps({"store": str(store_path), **result}, indent=2))
+        else:
+            print_result(result, store_path, args.dry_run)
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
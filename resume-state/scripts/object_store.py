@@ -0,0 +1,235 @@
+"""Content-addressed object storage for version files.
+
+File contents are stored once under ``.resume_versions/objects/`` and
+named by their SHA-256 (``objects/ab/cdef...``). Version and source
+directories link into it:
+
+- Immutable files (imported PDFs/DOCXs) are hardlinked, so every copy
+  shares one inode and costs no extra space.
+- Mutable files (``resume.yaml``) are reflinked where the filesystem
+  supports copy-on-write clones (Btrfs, XFS, ...). Elsewhere they are
+  copied, because editors rewrite files in place and a hardlink would
+  change the shared object.
+
+``copy_file()`` is the copy strategy layer behind both, and behind
+exports: reflink, then (for immutable sources) hardlink, then in-kernel
+copy_file_range()/sendfile(), then a plain byte copy.
+
+Objects are written read-only. Store size scales with unique content,
+not with the number of versions.
+"""
+
+import errno
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no FICLONE, always copy
+    fcntl = None
+
+OBJECTS_DIR = "objects"
+
+# ioctl request number for FICLONE (Linux): clone src into dst (reflink)
+_FICLONE = 0x40049409
+_CHUNK_SIZE = 1 << 20
+# Bytes per copy_file_range()/sendfile() call
+_KERNEL_CHUNK = 1 << 30
+
+
+def hash_file(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def object_path(digest: str, store_path: Path) -> Path:
+    """Get the path of an object by digest."""
+    return store_path / OBJECTS_DIR / digest[:2] / digest[2:]
+
+
+def put_object(src: Path, store_path: Path) -> str:
+    """Store a file's contents as an object (no-op if already present).
+
+    The object's mtime is set to now, even when it already existed, so gc
+    leaves it alone while the caller links it (see store_gc.OBJECT_MIN_AGE).
+
+    Returns:
+        The object's digest
+    """
+    digest = hash_file(src)
+    dest = object_path(digest, store_path)
+    try:
+        os.utime(dest)
+        return digest
+    except FileNotFoundError:
+        pass
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=dest.parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        copy_file(src, Path(tmp_path))
+        # copy_file keeps the source's mtime
+        os.utime(tmp_path)
+        os.chmod(tmp_path, 0o444)
+        # Concurrent writers of the same content race harmlessly here
+        Path(tmp_path).replace(dest)
+    except:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    return digest
+
+
+def _reflink(src_fd: int, dst_fd: int, size: int) -> None:
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "FICLONE is not available")
+    fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+
+
+def _kernel_copy(copy_chunk):
+    """Build a strategy that loops ``copy_chunk(src_fd, dst_fd, offset, count)``."""
+    def copy(src_fd: int, dst_fd: int, size: int) -> None:
+        offset = 0
+        while offset < size:
+            sent = copy_chunk(src_fd, dst_fd, offset, min(size - offset, _KERNEL_CHUNK))
+            if sent == 0:
+                # Some filesystems report 0 instead of an error: let the
+                # next strategy take over
+                raise OSError(errno.EINVAL, "short kernel copy")
+            offset += sent
+    return copy
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+# Kernel strategies, cheapest first. copy_file_range() reflinks too on
+# Btrfs/XFS (kernel 5.3+) and otherwise copies inside the kernel, as does
+# sendfile(); the user-space byte copy always works.
+_KERNEL_STRATEGIES = [("reflink", _reflink)]
+if hasattr(os, "copy_file_range"):
+    _KERNEL_STRATEGIES.append(("copy_file_range", _kernel_copy(_copy_file_range)))
+if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+    _KERNEL_STRATEGIES.append(("sendfile", _kernel_copy(_sendfile)))
+
+COPY_STRATEGIES = ("reflink", "hardlink", "copy_file_range", "sendfile", "copy")
+
+
+def _copy_data(src: Path, dst: Path, strategies: list) -> Optional[str]:
+    """Write ``src``'s bytes to ``dst`` with the first strategy that works."""
+    size = os.stat(src).st_size
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        for name, strategy in strategies:
+            try:
+                strategy(s.fileno(), d.fileno(), size)
+                return name
+            except OSError:
+                # Unsupported here: discard any partial output
+                d.truncate(0)
+                d.seek(0)
+    return None
+
+
+def _unlink(path: Path) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _hardlink(src: Path, dst: Path) -> bool:
+    _unlink(dst)
+    try:
+        os.link(src, dst)
+        return True
+    except OSError:
+        # Cross-device or unsupported
+        return False
+
+
+def copy_file(src: Path, dst: Path, allow_hardlink: bool = False) -> str:
+    """Copy ``src`` to ``dst`` (replacing it) with the cheapest strategy that works.
+
+    Strategies are tried in COPY_STRATEGIES order: a reflink, a hardlink
+    (only with ``allow_hardlink``), copy_file_range(), sendfile() and a
+    plain byte copy. One the platform or filesystem refuses falls through
+    to the next. The hardlink comes before the kernel copies because
+    without reflink support they still copy every byte. Metadata is
+    copied as by ``shutil.copy2``, except for hardlinks, which share it.
+
+    Args:
+        src: Source file
+        dst: Destination file
+        allow_hardlink: The source is never modified in place (e.g. a
+            store object), so ``dst`` may share its inode. Not for files
+            users edit: an editor writing one in place would change both.
+
+    Returns:
+        The strategy used
+    """
+    # Never write through an existing dst: it may be a hardlink to an object
+    _unlink(dst)
+    method = _copy_data(src, dst, _KERNEL_STRATEGIES[:1])
+    if method is None and allow_hardlink and _hardlink(src, dst):
+        return "hardlink"
+    if method is None:
+        method = _copy_data(src, dst, _KERNEL_STRATEGIES[1:]) or "copy"
+        if method == "copy":
+            shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return method
+
+
+def link_object(digest: str, dst: Path, store_path: Path, mutable: bool) -> str:
+    """Materialize an object at ``dst``.
+
+    Args:
+        digest: Object digest
+        dst: Destination file (replaced if it exists, e.g. when left
+            behind by an interrupted import)
+        store_path: Store root
+        mutable: True for files users edit (a private, writable copy);
+            False for immutable files (hardlink where possible)
+
+    Returns:
+        The strategy used (see COPY_STRATEGIES)
+    """
+    src = object_path(digest, store_path)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.unlink(missing_ok=True)
+    if not mutable:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:
+            # Cross-device or unsupported: fall back to a private copy
+            pass
+    method = copy_file(src, dst)
+    if mutable:
+        os.chmod(dst, 0o644)
+    return method
+
+
+def add_file(src: Path, dst: Path, store_path: Path, mutable: bool) -> str:
+    """Store ``src`` as an object and link it at ``dst``.
+
+    Returns:
+        The object's digest
+    """
+    digest = put_object(src, store_path)
+    link_object(digest, dst, store_path, mutable)
+    return digest
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Pack inactive versions' YAML into delta-compressed storage.
+
+Each inactive version's resume.yaml is replaced by a compact delta
+against its parent, with a full snapshot every N links of a chain to
+bound rebuild cost. Packed versions are rebuilt transparently on read
+(diff, export, create from) and unpacked on switch.
+
+Usage:
+    uv run scripts/pack_versions.py [--project <name> | --all] [--snapshot-every N]
+
+Examples:
+    uv run scripts/pack_versions.py
+    uv run scripts/pack_versions.py --all --snapshot-every 20
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from delta_store import SNAPSHOT_EVERY, pack_project
+from state_utils import get_store_path, list_projects, resolve_project
+
+
+def format_size(num_bytes: int) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.0f} {unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} GB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack inactive versions into delta storage")
+    parser.add_argument(
+        "--project", "-p",
+        help="Project name (default: active project)",
+    )
+    parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Pack every project in the store",
+    )
+    parser.add_argument(
+        "--snapshot-every", "-n",
+        type=int,
+        default=SNAPSHOT_EVERY,
+        help=f"Store a full snapshot every N versions in a chain (default: {SNAPSHOT_EVERY})",
+    )
+    args = parser.parse_args()
+
+    if args.snapshot_every < 1:
+        print("Error: --snapshot-every must be at least 1", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        store_path = get_store_path()
+        if args.all:
+            projects = list_projects(store_path)
+        else:
+            projects = [resolve_project(args.project, store_path)]
+
+        for project in projects:
+            stats = pack_project(project, args.snapshot_every, store_path)
+            print(f"{project}: packed {stats['packed']} version(s)")
+            print(f"  Stored: {stats['deltas']} delta(s), {stats['snapshots']} snapshot(s), "
+                  f"{format_size(stats['bytes_after'])} total")
+            if stats["packed"]:
+                print(f"  Freed: {format_size(stats['bytes_before'])} of working YAML")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Carry tailored versions over to a newer base version.
+
+When the master resume gains a new job or fixes a typo, every version
+tailored from an older master still has the old content. Rebasing a
+version onto vN three-way merges it with vN, using their common ancestor
+in the lineage as the base (see three_way_merge.py). The result is
+recorded as a new version: a child of vN with the same tag. The original
+is left as it was, and the active version does not change.
+
+Without version arguments, every branch tip that shares history with vN
+is rebased. This skips vN's own ancestors and descendants, and versions
+already rebased onto vN. Merges run on a worker pool (--jobs).
+
+Usage:
+    uv run scripts/rebase_versions.py [VERSION ...] --onto vN [--prefer ours|theirs]
+                                      [--fail-on-conflict] [--dry-run] [--jobs N] [--json]
+
+Examples:
+    uv run scripts/rebase_versions.py --onto v20 --dry-run
+    uv run scripts/rebase_versions.py v12 v13 --onto v20
+    uv run scripts/rebase_versions.py --onto v20 --prefer ours --json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from create_version import create_version
+from delta_store import read_version_yaml
+from diff_versions import run_tasks
+from lineage import LineageIndex, lineage_index
+from state_utils import get_store_path, get_version_entry, load_project_state, resolve_project
+from structural_diff import parse_resume_text
+from three_way_merge import dump_resume, merge_data
+
+
+def default_targets(state: dict, index: LineageIndex, onto: str) -> list[str]:
+    """Branch tips that share history with ``onto`` and are not rebased onto it yet."""
+    done = {
+        (get_version_entry(state, child).get("source") or {}).get("rebased_from")
+        for child in index.descendants(onto)
+    }
+    return [
+        vid for vid in index.leaves()
+        if vid != onto
+        and vid not in done
+        and not index.is_ancestor(onto, vid)
+        and index.common_ancestor(vid, onto) is not None
+    ]
+
+
+def _merge_task(task: tuple) -> tuple[str, list[dict]]:
+    """Worker: merge one version with the target, given their ancestor."""
+    project, base, onto, entry, prefer, store_path = task
+    parsed = []
+    for e in (base, onto, entry):
+        try:
+            parsed.append(parse_resume_text(read_version_yaml(project, e, store_path)))
+        except yaml.YAMLError as error:
+            raise ValueError(f"Cannot parse YAML of {e['id']}: {error}") from error
+    merged, conflicts = merge_data(*parsed, prefer=prefer)
+    return dump_resume(merged), [c.to_dict() for c in conflicts]
+
+
+def rebase_onto(
+    project: str,
+    onto: str,
+    versions: Optional[list[str]] = None,
+    prefer: str = "theirs",
+    fail_on_conflict: bool = False,
+    dry_run: bool = False,
+    jobs: Optional[int] = None,
+    store_path: Optional[Path] = None,
+) -> list[dict]:
+    """Rebase versions onto ``onto``.
+
+    Args:
+        project: Project name
+        onto: Version to carry the changes onto
+        versions: Versions to rebase (default: see default_targets)
+        prefer: Side that wins conflicting edits: "theirs" (the version
+            being rebased) or "ours" (``onto``)
+        fail_on_conflict: Do not create versions whose merge had conflicts
+        dry_run: Merge and report without creating versions
+        jobs: Worker processes (default: CPU count; 1 runs inline)
+        store_path: Store root
+
+    Returns:
+        One dict per version: version, base, created (new version ID or
+        None), conflicts, and skipped (reason, when nothing was merged)
+
+    Raises:
+        ValueError: If a version is not found
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    state = load_project_state(project, store_path)
+    index = lineage_index(state)
+    if onto not in index:
+        raise ValueError(f"Version not found: {onto}")
+    targets = default_targets(state, index, onto) if versions is None else versions
+
+    results, tasks = [], []
+    onto_entry = get_version_entry(state, onto)
+    for vid in targets:
+        base = index.common_ancestor(vid, onto)
+        result = {"version": vid, "base": base, "created": None, "conflicts": [], "skipped": None}
+        results.append(result)
+        if base is None:
+            result["skipped"] = f"no common ancestor with {onto}"
+        elif base == vid:
+            result["skipped"] = f"already contained in {onto}"
+        elif base == onto:
+            result["skipped"] = f"already based on {onto}"
+        else:
+            tasks.append((project, get_version_entry(state, base), onto_entry,
+                          get_version_entry(state, vid), prefer, store_path))
+
+    merged = dict(zip((task[3]["id"] for task in tasks), run_tasks(_merge_task, tasks, jobs)))
+    for result in results:
+        if result["version"] not in merged:
+            continue
+        text, result["conflicts"] = merged[result["version"]]
+        if dry_run:
+            continue
+        if result["conflicts"] and fail_on_conflict:
+            result["skipped"] = f"{len(result['conflicts'])} conflict(s)"
+            continue
+        entry = get_version_entry(state, result["version"])
+        notes = f"{result['version']} rebased onto {onto}"
+        if result["conflicts"]:
+            notes += f" ({len(result['conflicts'])} conflict(s), {prefer} kept)"
+        result["created"], _ = create_version(
+            project,
+            from_version=onto,
+            tag=entry.get("tag"),
+            notes=notes,
+            operation="rebase",
+            store_path=store_path,
+            content=text,
+            source_info={"rebased_from": result["version"], "merge_base": result["base"]},
+            activate=False,
+        )
+    return results
+
+
+def _short(value) -> str:
+    text = "(none)" if value is None else (value if isinstance(value, str) else json.dumps(value))
+    text = " ".join(text.split())
+    return text if len(text) <= 70 else text[:67] + "..."
+
+
+def format_rebase(results: list[dict], onto: str, dry_run: bool) -> str:
+    """Render rebase results, with each conflict's three sides."""
+    lines = []
+    for r in results:
+        if r["skipped"]:
+            lines.append(f"{r['version']}: skipped, {r['skipped']}")
+        else:
+            target = r["created"] or ("(dry run)" if dry_run else "-")
+            lines.append(f"{r['version']} -> {target} (base {r['base']}, "
+                         f"{len(r['conflicts'])} conflict(s))")
+        for c in r["conflicts"]:
+            lines.append(f"  ! {c['path']}")
+            lines.append(f"      base:   {_short(c['base'])}")
+            lines.append(f"      {onto + ':':<7} {_short(c['ours'])}")
+            lines.append(f"      {r['version'] + ':':<7} {_short(c['theirs'])}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebase tailored versions onto a newer version")
+    parser.add_argument("versions", nargs="*", help="Versions to rebase (default: all branch tips)")
+    parser.add_argument("--onto", required=True, help="Version to rebase onto (e.g., v20)")
+    parser.add_argument(
+        "--project", "-p",
+        help="Project name (default: active project)",
+    )
+    parser.add_argument(
+        "--prefer",
+        choices=["theirs", "ours"],
+        default="theirs",
+        help="Keep the rebased version's edit (theirs, default) or the --onto version's "
+             "(ours) when both changed the same value",
+    )
+    parser.add_argument(
+        "--fail-on-conflict",
+        action="store_true",
+        help="Skip versions whose merge has conflicts",
+    )
+    parser.add_argument(
+        "--dry-run", "-n",
+        action="store_true",
+        help="Report merges and conflicts without creating versions",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Worker processes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+        results = rebase_onto(
+            project,
+            args.onto,
+            versions=args.versions or None,
+            prefer=args.prefer,
+            fail_on_conflict=args.fail_on_conflict,
+            dry_run=args.dry_run,
+            jobs=args.jobs,
+            store_path=store_path,
+        )
+        if args.json:
+            print(json.dumps(results, indent=2, default=str))
+        elif results:
+            print(format_rebase(results, args.onto, args.dry_run))
+        else:
+            print(f"Nothing to rebase onto {args.onto}")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
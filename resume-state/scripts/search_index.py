@@ -0,0 +1,312 @@
+"""Full-text search over every version in the store.
+
+The index is a SQLite FTS5 database at ``.resume_versions/search.db``.
+Each version's parsed resume.yaml is one document, with fielded columns:
+
+- ``company``: company, institution and organization names
+- ``title``: job titles, roles and degrees
+- ``bullets``: achievements, highlights and descriptions
+- ``skills``: the skills section and technologies lists
+- ``body``: every other text (summary, contact, ...)
+
+The index is maintained incrementally. ``refresh_index()`` compares each
+version's resume.yaml (mtime and size) or packed digest with the stamp
+stored at its last indexing, and re-parses only versions that changed.
+It also drops the rows of deleted versions and projects. Searching
+refreshes first, so edits made in an editor are picked up too. Creating
+or importing a version updates an existing index straight away.
+"""
+
+import os
+import shlex
+import sqlite3
+from pathlib import Path
+from typing import Any, Optional
+
+import yaml
+
+from delta_store import read_object
+from state_utils import get_project_path, get_version_dir_name, list_projects, load_project_state
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+INDEX_FILE = "search.db"
+INDEX_SCHEMA_VERSION = 1
+
+FIELDS = ("company", "title", "bullets", "skills", "body")
+
+# bm25 weights, in FIELDS order: a hit in a company name ranks above the
+# same word in a bullet
+FIELD_WEIGHTS = (4.0, 3.0, 1.5, 2.0, 1.0)
+
+# YAML keys whose subtree feeds a field; anything else goes to ``body``
+FIELD_KEYS = {
+    "company": "company",
+    "institution": "company",
+    "organization": "company",
+    "title": "title",
+    "role": "title",
+    "degree": "title",
+    "achievements": "bullets",
+    "highlights": "bullets",
+    "bullets": "bullets",
+    "responsibilities": "bullets",
+    "description": "bullets",
+    "skills": "skills",
+    "technologies": "skills",
+}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY,
+    project TEXT NOT NULL,
+    version TEXT NOT NULL,
+    tag TEXT,
+    stamp TEXT NOT NULL,
+    UNIQUE (project, version)
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS fts USING fts5(
+    {", ".join(FIELDS)},
+    tokenize = 'porter unicode61 remove_diacritics 2'
+);
+"""
+
+
+def index_path(store_path: Path) -> Path:
+    """Get the path of the search index."""
+    return store_path / INDEX_FILE
+
+
+def open_index(store_path: Path) -> sqlite3.Connection:
+    """Open (creating if needed) the search index (caller closes it)."""
+    conn = sqlite3.connect(index_path(store_path), timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    if conn.execute("PRAGMA user_version").fetchone()[0] < INDEX_SCHEMA_VERSION:
+        conn.executescript(_SCHEMA)
+        conn.execute(f"PRAGMA user_version={INDEX_SCHEMA_VERSION}")
+    return conn
+
+
+def _collect(value: Any, field: str, out: dict[str, list[str]]) -> None:
+    if isinstance(value, dict):
+        for k, v in value.items():
+            # The outermost field wins: a skills subtree is all skills
+            sub = FIELD_KEYS.get(str(k).lower(), "body") if field == "body" else field
+            if field == "skills":
+                out["skills"].append(str(k))
+            _collect(v, sub, out)
+    elif isinstance(value, list):
+        for item in value:
+            _collect(item, field, out)
+    elif value is not None:
+        out[field].append(str(value))
+
+
+def extract_fields(data: Any) -> dict[str, str]:
+    """Split a parsed resume into the index's text fields."""
+    out: dict[str, list[str]] = {name: [] for name in FIELDS}
+    _collect(data, "body", out)
+    return {name: "\n".join(parts) for name, parts in out.items()}
+
+
+def document_fields(text: str) -> dict[str, str]:
+    """Index fields for resume YAML text (raw text in ``body`` if it does not parse)."""
+    try:
+        data = yaml.load(text, Loader=_Loader)
+    except yaml.YAMLError:
+        return {**{name: "" for name in FIELDS}, "body": text}
+    return extract_fields(data)
+
+
+def _stamp(yaml_path: str, entry: dict) -> Optional[str]:
+    """Cheap change marker for a version's content, or None if it has none."""
+    try:
+        st = os.stat(yaml_path)
+        return f"{st.st_mtime_ns}:{st.st_size}"
+    except FileNotFoundError:
+        packed = entry.get("packed")
+        return f"sha256:{packed['sha256']}" if packed else None
+
+
+def refresh_index(store_path: Path, projects: Optional[list[str]] = None) -> dict:
+    """Bring the index up to date with the store.
+
+    Args:
+        store_path: Store root
+        projects: Only refresh these projects (default: all, and drop the
+            rows of projects that no longer exist)
+
+    Returns:
+        Stats dict: indexed (documents added or updated), removed, total
+    """
+    names = list_projects(store_path) if projects is None else projects
+    current: dict[tuple[str, str], tuple[Optional[str], str, str, dict]] = {}
+    for project in names:
+        try:
+            state = load_project_state(project, store_path)
+        except FileNotFoundError:
+            continue
+        # Plain string paths: this loop runs for every version on every search
+        versions_dir = str(get_project_path(project, store_path) / "versions")
+        for entry in state.get("versions", []):
+            dirname = get_version_dir_name(entry["id"], entry.get("tag"))
+            yaml_path = os.path.join(versions_dir, dirname, "resume.yaml")
+            stamp = _stamp(yaml_path, entry)
+            if stamp is not None:
+                current[(project, entry["id"])] = (entry.get("tag"), stamp, yaml_path, entry)
+
+    conn = open_index(store_path)
+    try:
+        indexed = {
+            (project, version): (doc_id, stamp)
+            for doc_id, project, version, stamp in conn.execute(
+                "SELECT id, project, version, stamp FROM docs"
+            )
+        }
+        scope = None if projects is None else set(projects)
+        stale = [
+            doc_id for key, (doc_id, _) in indexed.items()
+            if key not in current and (scope is None or key[0] in scope)
+        ]
+        changed = []
+        for key, (tag, stamp, yaml_path, entry) in current.items():
+            if key in indexed and indexed[key][1] == stamp:
+                continue
+            try:
+                with open(yaml_path) as f:
+                    text = f.read()
+            except FileNotFoundError:
+                text = read_object(entry["packed"]["sha256"], store_path)
+            changed.append((key, tag, stamp, document_fields(text)))
+
+        if stale or changed:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("DELETE FROM docs WHERE id = ?", [(i,) for i in stale])
+                conn.executemany("DELETE FROM fts WHERE rowid = ?", [(i,) for i in stale])
+                for (project, version), tag, stamp, fields in changed:
+                    doc_id = conn.execute(
+                        "INSERT INTO docs (project, version, tag, stamp) VALUES (?, ?, ?, ?) "
+                        "ON CONFLICT(project, version) DO UPDATE SET "
+                        "tag = excluded.tag, stamp = excluded.stamp RETURNING id",
+                        (project, version, tag, stamp),
+                    ).fetchone()[0]
+                    conn.execute("DELETE FROM fts WHERE rowid = ?", (doc_id,))
+                    conn.execute(
+                        f"INSERT INTO fts (rowid, {', '.join(FIELDS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                        (doc_id, *(fields[name] for name in FIELDS)),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        total = conn.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+    finally:
+        conn.close()
+    return {"indexed": len(changed), "removed": len(stale), "total": total}
+
+
+def update_index(project: str, store_path: Path) -> None:
+    """Refresh one project's documents, if the store has a search index.
+
+    Called after creating or importing a version; stores that never
+    searched pay nothing.
+    """
+    if index_path(store_path).exists():
+        refresh_index(store_path, [project])
+
+
+def rebuild_index(store_path: Path) -> dict:
+    """Drop and rebuild the whole index."""
+    for suffix in ("", "-wal", "-shm"):
+        Path(str(index_path(store_path)) + suffix).unlink(missing_ok=True)
+    return refresh_index(store_path)
+
+
+def _quote(term: str) -> str:
+    prefix = term.endswith("*")
+    term = term.rstrip("*")
+    quoted = '"' + term.replace('"', '""') + '"'
+    return quoted + " *" if prefix else quoted
+
+
+def build_query(query: str, field: Optional[str] = None) -> str:
+    """Turn a search string into an FTS5 query.
+
+    Words (and "quoted phrases") must all match. ``field:word`` limits a
+    word to one field, and a trailing ``*`` matches a prefix. ``field``
+    limits the whole query.
+
+    Raises:
+        ValueError: If the query is empty or names an unknown field
+    """
+    try:
+        terms = shlex.split(query)
+    except ValueError:
+        terms = query.split()
+    parts = []
+    for term in terms:
+        name, sep, rest = term.partition(":")
+        if sep and rest.strip("*"):
+            if name not in FIELDS:
+                raise ValueError(f"Unknown field: {name} (choose from {', '.join(FIELDS)})")
+            parts.append(f"{name} : {_quote(rest)}")
+        elif term.strip("*"):
+            parts.append(_quote(term))
+    if not parts:
+        raise ValueError("Empty search query")
+    match = " ".join(parts)
+    if field is not None:
+        if field not in FIELDS:
+            raise ValueError(f"Unknown field: {field} (choose from {', '.join(FIELDS)})")
+        match = f"{field} : ({match})"
+    return match
+
+
+def search(
+    store_path: Path,
+    query: str,
+    project: Optional[str] = None,
+    field: Optional[str] = None,
+    limit: int = 20,
+    refresh: bool = True,
+) -> list[dict]:
+    """Search every version in the store.
+
+    Args:
+        store_path: Store root
+        query: Search string (see build_query)
+        project: Only return hits from this project
+        field: Only match in this field
+        limit: Maximum number of hits
+        refresh: Bring the index up to date first
+
+    Returns:
+        Hits, best first: dicts with project, version, tag, score and
+        snippet (matches marked with [brackets])
+    """
+    match = build_query(query, field)
+    if refresh:
+        refresh_index(store_path, None if project is None else [project])
+    conn = open_index(store_path)
+    try:
+        weights = ", ".join(str(w) for w in FIELD_WEIGHTS)
+        where = "fts MATCH ?"
+        params: list = [match]
+        if project is not None:
+            where += " AND docs.project = ?"
+            params.append(project)
+        rows = conn.execute(
+            f"SELECT docs.project, docs.version, docs.tag, bm25(fts, {weights}) AS score, "
+            f"snippet(fts, -1, '[', ']', '...', 12) "
+            f"FROM fts JOIN docs ON docs.id = fts.rowid WHERE {where} "
+            f"ORDER BY score LIMIT ?",
+            [*params, limit],
+        ).fetchall()
+    finally:
+        conn.close()
+    return [
+        {"project": p, "version": v, "tag": t, "score": round(-score, 4), "snippet": snippet}
+        for p, v, t, score, snippet in rows
+    ]
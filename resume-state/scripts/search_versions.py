@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Search the content of every version in the store.
+
+Words must all match; "quoted phrases" match as a phrase. Prefix a word
+with a field (company:, title:, bullets:, skills:, body:) to match only
+there, and end it with * to match a prefix. Hits are ranked by BM25,
+weighting company and title matches above bullets and free text.
+
+The index (.resume_versions/search.db) is built on first use and then
+refreshed incrementally before each search.
+
+Usage:
+    uv run scripts/search_versions.py QUERY [--project NAME] [--field FIELD]
+                                      [--limit N] [--json] [--rebuild]
+
+Examples:
+    uv run scripts/search_versions.py kubernetes terraform
+    uv run scripts/search_versions.py "company:acme" "platform eng*"
+    uv run scripts/search_versions.py python --field skills --limit 50
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from search_index import FIELDS, rebuild_index, search
+from state_utils import get_store_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search the content of every version")
+    parser.add_argument("query", nargs="+", help="Search terms")
+    parser.add_argument(
+        "--project", "-p",
+        help="Only search this project (default: all projects)",
+    )
+    parser.add_argument(
+        "--field", "-f",
+        choices=FIELDS,
+        help="Only match in this field",
+    )
+    parser.add_argument(
+        "--limit", "-n",
+        type=int,
+        default=20,
+        help="Maximum number of hits (default: 20)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output hits as JSON",
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Rebuild the index from scratch first",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        if not store_path.is_dir():
+            raise FileNotFoundError(f"No resume store found at {store_path}")
+        if args.rebuild:
+            stats = rebuild_index(store_path)
+            print(f"Indexed {stats['total']} versions", file=sys.stderr)
+
+        start = time.perf_counter()
+        hits = search(store_path, " ".join(args.query), args.project, args.field, args.limit)
+        elapsed = (time.perf_counter() - start) * 1000
+
+        if args.json:
+            print(json.dumps(hits, indent=2))
+            return
+        if not hits:
+            print("No matches")
+            return
+        width = max(len(f"{h['project']}/{h['version']}") for h in hits)
+        for hit in hits:
+            name = f"{hit['project']}/{hit['version']}"
+            tag = f" ({hit['tag']})" if hit["tag"] else ""
+            print(f"{name:<{width}}  {hit['score']:>7.2f}{tag}")
+            print(f"    {' '.join(hit['snippet'].split())}")
+        print(f"\n{len(hits)} hit(s) in {elapsed:.0f} ms")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
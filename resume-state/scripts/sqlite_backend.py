@@ -0,0 +1,320 @@
+"""SQLite backend for project state.
+
+Stores the same data as project.json in project.db. Project-level fields
+live in a key/value table. Each version is its own row, indexed by id,
+tag, parent and created_at, so lookups, id allocation and appends do not
+need to read or rewrite the whole history. The database runs in WAL mode,
+and every mutation is a single transaction.
+
+state_utils picks this backend automatically for any project directory
+that contains project.db. Use convert_backend.py to migrate a project.
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+from state_utils import StateConflictError
+
+DB_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS project (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    id TEXT NOT NULL UNIQUE,
+    num INTEGER,
+    tag TEXT,
+    parent TEXT,
+    created_at TEXT,
+    source_type TEXT,
+    entry TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_versions_num ON versions(num);
+CREATE INDEX IF NOT EXISTS idx_versions_tag ON versions(tag);
+CREATE INDEX IF NOT EXISTS idx_versions_parent ON versions(parent);
+CREATE INDEX IF NOT EXISTS idx_versions_created_at ON versions(created_at);
+"""
+
+
+def _version_num(version_id: str) -> Optional[int]:
+    if version_id.startswith("v") and version_id[1:].isdigit():
+        return int(version_id[1:])
+    return None
+
+
+def _row_values(entry: dict) -> tuple:
+    return (
+        entry["id"],
+        _version_num(entry["id"]),
+        entry.get("tag"),
+        entry.get("parent"),
+        entry.get("created_at"),
+        (entry.get("source") or {}).get("type"),
+        json.dumps(entry),
+    )
+
+
+class SQLiteProjectStore:
+    """Project state stored in a SQLite database.
+
+    Args:
+        db_path: Path to project.db (created on first use)
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < DB_SCHEMA_VERSION:
+            self.conn.executescript(_SCHEMA)
+            self.conn.execute(f"PRAGMA user_version={DB_SCHEMA_VERSION}")
+
+    def __enter__(self) -> "SQLiteProjectStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def _begin(self) -> None:
+        # IMMEDIATE takes the write lock up front so id allocation and the
+        # insert that uses it cannot interleave with another writer
+        self.conn.execute("BEGIN IMMEDIATE")
+
+    # -- project fields -----------------------------------------------------
+
+    def get_field(self, key: str, default=None):
+        row = self.conn.execute("SELECT value FROM project WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def _set_fields(self, fields: dict) -> None:
+        self.conn.executemany(
+            "INSERT INTO project (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            [(k, json.dumps(v)) for k, v in fields.items()],
+        )
+
+    def _bump_revision(self) -> int:
+        revision = self.get_field("revision", 0) + 1
+        self._set_fields({"revision": revision})
+        return revision
+
+    # -- whole-state compatibility -------------------------------------------
+
+    def load_state(self) -> dict:
+        """Return the full state dict in the same shape as project.json."""
+        state = {k: json.loads(v) for k, v in self.conn.execute("SELECT key, value FROM project")}
+        state["versions"] = [
+            json.loads(row[0])
+            for row in self.conn.execute("SELECT entry FROM versions ORDER BY seq")
+        ]
+        return state
+
+    def save_state(self, state: dict, expected_revision: Optional[int] = None) -> None:
+        """Replace the stored state with ``state`` in one transaction.
+
+        Args:
+            state: Full state dict
+            expected_revision: If given, fail unless the stored revision
+                matches, then store ``expected_revision + 1``
+
+        Raises:
+            StateConflictError: If the stored revision does not match
+        """
+        versions = state.get("versions", [])
+        self._begin()
+        try:
+            if expected_revision is not None:
+                current = self.get_field("revision", 0)
+                if current != expected_revision:
+                    raise StateConflictError(
+                        f"Project state changed (revision {current}, expected "
+                        f"{expected_revision}); reload and retry"
+                    )
+                state["revision"] = expected_revision + 1
+            fields = {k: v for k, v in state.items() if k != "versions"}
+            self._set_fields(fields)
+            stale = {row[0] for row in self.conn.execute("SELECT key FROM project")} - set(fields)
+            self.conn.executemany("DELETE FROM project WHERE key = ?", [(k,) for k in stale])
+            existing = {row[0] for row in self.conn.execute("SELECT id FROM versions")}
+            keep = {v["id"] for v in versions}
+            self.conn.executemany(
+                "DELETE FROM versions WHERE id = ?", [(vid,) for vid in existing - keep]
+            )
+            self.conn.executemany(
+                "INSERT INTO versions (id, num, tag, parent, created_at, source_type, entry) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET "
+                "num = excluded.num, tag = excluded.tag, parent = excluded.parent, "
+                "created_at = excluded.created_at, source_type = excluded.source_type, "
+                "entry = excluded.entry",
+                [_row_values(v) for v in versions],
+            )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    # -- indexed operations ---------------------------------------------------
+
+    def get_version(self, version_id: str) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT entry FROM versions WHERE id = ?", (version_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_versions(
+        self,
+        tag: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        source_type: Optional[str] = None,
+        parent: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> Iterator[dict]:
+        """Yield entries matching the filters (see state_utils.iter_versions)."""
+        clauses, params = [], []
+        for column, value in (("tag", tag), ("source_type", source_type), ("parent", parent)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("substr(created_at, 1, ?) <= ?")
+            params.extend([len(until), until])
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        order = "DESC" if newest_first else "ASC"
+        sql = f"SELECT entry FROM versions {where}ORDER BY seq {order} LIMIT ? OFFSET ?"
+        params.extend([-1 if limit is None else limit, offset])
+        for row in self.conn.execute(sql, params):
+            yield json.loads(row[0])
+
+    def next_version_id(self) -> str:
+        row = self.conn.execute("SELECT MAX(num) FROM versions").fetchone()
+        # Carried over from a converted JSON project whose undone IDs stay retired
+        return f"v{max(row[0] or 0, self.get_field('version_high_water', 0)) + 1}"
+
+    def count_versions(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM versions").fetchone()[0]
+
+    def append_version(
+        self, make_entry: Callable[[str], dict], activate: bool, updated_at: str
+    ) -> dict:
+        """Allocate the next id, build the entry and insert it atomically.
+
+        ``make_entry`` runs inside the transaction; if it raises, nothing
+        is recorded.
+        """
+        self._begin()
+        try:
+            entry = make_entry(self.next_version_id())
+            self.conn.execute(
+                "INSERT INTO versions (id, num, tag, parent, created_at, source_type, entry) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                _row_values(entry),
+            )
+            fields = {"updated_at": updated_at}
+            if activate:
+                fields["active_version"] = entry["id"]
+            self._set_fields(fields)
+            self._bump_revision()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return entry
+
+    def append_versions(
+        self, make_entries: list[Callable[[str], dict]], activate: bool, updated_at: str
+    ) -> list[dict]:
+        """Allocate consecutive ids and insert all entries in one transaction."""
+        self._begin()
+        try:
+            first = int(self.next_version_id()[1:])
+            entries = [make_entry(f"v{first + i}") for i, make_entry in enumerate(make_entries)]
+            self.conn.executemany(
+                "INSERT INTO versions (id, num, tag, parent, created_at, source_type, entry) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [_row_values(entry) for entry in entries],
+            )
+            fields = {"updated_at": updated_at}
+            if activate and entries:
+                fields["active_version"] = entries[-1]["id"]
+            self._set_fields(fields)
+            self._bump_revision()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return entries
+
+    def insert_versions(self, entries: list[dict], updated_at: str) -> None:
+        """Insert entries with their own ids in one transaction.
+
+        Raises:
+            ValueError: If an id already exists (nothing is inserted)
+        """
+        self._begin()
+        try:
+            self.conn.executemany(
+                "INSERT INTO versions (id, num, tag, parent, created_at, source_type, entry) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [_row_values(entry) for entry in entries],
+            )
+            self._set_fields({"updated_at": updated_at})
+            self._bump_revision()
+            self.conn.execute("COMMIT")
+        except sqlite3.IntegrityError as e:
+            self.conn.execute("ROLLBACK")
+            raise ValueError(f"Version already exists: {e}") from e
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def set_fields(self, fields: dict) -> None:
+        """Update project-level fields in one transaction."""
+        self._begin()
+        try:
+            self._set_fields(fields)
+            self._bump_revision()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def update_version(self, version_id: str, fields: dict, updated_at: str) -> bool:
+        """Merge ``fields`` into one version's entry in one transaction.
+
+        Returns:
+            False if the version does not exist
+        """
+        self._begin()
+        try:
+            row = self.conn.execute(
+                "SELECT entry FROM versions WHERE id = ?", (version_id,)
+            ).fetchone()
+            if row is None:
+                self.conn.execute("ROLLBACK")
+                return False
+            entry = {**json.loads(row[0]), **fields}
+            self.conn.execute(
+                "UPDATE versions SET entry = ? WHERE id = ?", (json.dumps(entry), version_id)
+            )
+            self._set_fields({"updated_at": updated_at})
+            self._bump_revision()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        return True
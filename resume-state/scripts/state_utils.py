@@ -1,13 +1,22 @@
 """Shared utilities for resume state management."""
 
+import itertools
 import json
 import os
 import re
-import shutil
 import tempfile
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
+
+from object_store import copy_file as _copy_file
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, revision checks still apply
+    fcntl = None
 
 # Regex pattern for valid version IDs (v1, v2, v3, ...)
 VERSION_ID_PATTERN = re.compile(r"^v(\d+)$")
@@ -15,9 +24,73 @@ VERSION_ID_PATTERN = re.compile(r"^v(\d+)$")
 STORE_DIR = ".resume_versions"
 CONFIG_FILE = "config.json"
 PROJECT_FILE = "project.json"
+DB_FILE = "project.db"
+JOURNAL_FILE = "journal.jsonl"
+LOCK_FILE = ".lock"
+SUMMARY_FILE = "status.json"
 
+# Fold journal events into a project.json snapshot after this many
+JOURNAL_FOLD_EVERY = 64
+
+# Current schemas; older data is upgraded by the migrations in store_migrate.py
 CONFIG_SCHEMA_VERSION = "1.0.0"
-PROJECT_SCHEMA_VERSION = "1.0.0"
+PROJECT_SCHEMA_VERSION = "1.1.0"
+SUMMARY_SCHEMA_VERSION = 1
+
+
+# Per-process memo of resolved stores: start dir -> store
+_STORE_MEMO: dict[str, Path] = {}
+
+# Opt-in persisted start dir -> store map (set to a file path or "1")
+STORE_CACHE_ENV = "RESUME_STORE_CACHE"
+
+
+def _store_cache_file() -> Optional[Path]:
+    setting = os.environ.get(STORE_CACHE_ENV)
+    if not setting or setting == "0":
+        return None
+    if setting != "1":
+        return Path(setting).expanduser()
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "resume-skills" / "store_map.json"
+
+
+def _load_store_cache(cache_file: Path) -> dict:
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_store_cache(cache_file: Path, start: str, store: Path) -> None:
+    mapping = _load_store_cache(cache_file)
+    mapping[start] = str(store)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(mapping, f)
+        Path(tmp_path).replace(cache_file)
+    except OSError:
+        # The persisted map is only an optimization
+        pass
+
+
+def _find_store(start: str) -> Path:
+    """Walk upward once, checking for the store and the git root together."""
+    current = start
+    while True:
+        candidate = os.path.join(current, STORE_DIR)
+        if os.path.isdir(candidate):
+            return Path(candidate)
+        # Stop at the git root: the repo's store belongs there
+        if os.path.exists(os.path.join(current, ".git")):
+            return Path(candidate)
+        parent = os.path.dirname(current)
+        if parent == current:
+            # Not in git repo and no store found: global location
+            return Path.home() / STORE_DIR
+        current = parent
 
 
 def get_store_path(start_path: Optional[Path] = None) -> Path:
@@ -31,6 +104,10 @@ def get_store_path(start_path: Optional[Path] = None) -> Path:
     3. Otherwise: search upward from current directory for .resume_versions
     4. Fall back to global ~/.resume_versions
 
+    Results are memoized per process. With RESUME_STORE_CACHE set, stores
+    that exist are also remembered across processes; a cached entry is
+    trusted as long as that store directory still exists.
+
     Returns existing store path, or appropriate path for creation.
     """
     # Check environment variable
@@ -38,52 +115,82 @@ def get_store_path(start_path: Optional[Path] = None) -> Path:
     if env_path:
         return Path(env_path).expanduser()
 
-    # Start from current directory
-    if start_path is None:
-        start_path = Path.cwd()
+    # Start from current directory (getcwd is already absolute and resolved)
+    start = os.getcwd() if start_path is None else str(Path(start_path).resolve())
+    memo = _STORE_MEMO.get(start)
+    if memo is not None:
+        return memo
 
-    current = start_path.resolve()
-    git_root = None
+    cache_file = _store_cache_file()
+    if cache_file is not None:
+        cached = _load_store_cache(cache_file).get(start)
+        if cached and os.path.isdir(cached):
+            _STORE_MEMO[start] = Path(cached)
+            return _STORE_MEMO[start]
 
-    # First pass: find git root
-    temp = current
-    while True:
-        if (temp / ".git").exists():
-            git_root = temp
-            break
-        parent = temp.parent
-        if parent == temp:
-            break
-        temp = parent
+    store = _find_store(start)
+    _STORE_MEMO[start] = store
+    if cache_file is not None and store.is_dir():
+        _save_store_cache(cache_file, start, store)
+    return store
 
-    # If in a git repo, search only within repo boundaries
-    if git_root:
-        current = start_path.resolve()
-        while True:
-            candidate = current / STORE_DIR
-            if candidate.exists() and candidate.is_dir():
-                return candidate
 
-            # Stop at git root
-            if current == git_root:
-                return git_root / STORE_DIR
+def clear_store_cache() -> None:
+    """Forget memoized store locations (e.g. after creating a nearer store)."""
+    _STORE_MEMO.clear()
 
-            current = current.parent
-    else:
-        # Not in git repo: search upward normally
-        while True:
-            candidate = current / STORE_DIR
-            if candidate.exists() and candidate.is_dir():
-                return candidate
 
-            # Check if we've reached root
-            parent = current.parent
-            if parent == current:
-                break
-            current = parent
+class StateConflictError(RuntimeError):
+    """Project state changed on disk since it was loaded."""
+
+
+# Locks held by the current thread: lock path -> (fd, depth)
+_held_locks = threading.local()
+
 
-        # Fall back to global location
-        return Path.home() / STORE_DIR
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock on ``lock_path`` (re-entrant per thread).
+
+    Other processes, and other threads in this process, block until the
+    lock is released.
+    """
+    held = getattr(_held_locks, "locks", None)
+    if held is None:
+        held = _held_locks.locks = {}
+    key = str(lock_path)
+    if key in held:
+        fd, depth = held[key]
+        held[key] = (fd, depth + 1)
+        try:
+            yield
+        finally:
+            held[key] = (fd, depth)
+        return
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        held[key] = (fd, 1)
+        try:
+            yield
+        finally:
+            del held[key]
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def project_lock(project: str, store_path: Optional[Path] = None) -> Iterator[None]:
+    """Serialize state mutations for one project across processes."""
+    project_path = get_project_path(project, store_path)
+    if not project_path.is_dir():
+        raise FileNotFoundError(f"Project not found: {project}")
+    with file_lock(project_path / LOCK_FILE):
+        yield
 
 
 def ensure_store_exists(store_path: Optional[Path] = None) -> Path:
@@ -100,7 +207,13 @@ def load_config(store_path: Optional[Path] = None) -> dict:
         store_path = get_store_path()
     config_path = store_path / CONFIG_FILE
     if config_path.exists():
-        return json.loads(config_path.read_text())
+        config = json.loads(config_path.read_text())
+        if config.get("version") != CONFIG_SCHEMA_VERSION:
+            # Upgraded in memory; the next save writes the new schema
+            from store_migrate import migrate
+
+            migrate("config", config, store_path)
+        return config
     return {"version": CONFIG_SCHEMA_VERSION, "active_project": None}
 
 
@@ -120,6 +233,17 @@ def save_config(config: dict, store_path: Optional[Path] = None) -> None:
         raise
 
 
+def update_config(mutate: Callable[[dict], Any], store_path: Optional[Path] = None) -> Any:
+    """Load, mutate and save the global config under the store lock."""
+    store_path = ensure_store_exists(store_path)
+    with file_lock(store_path / LOCK_FILE):
+        config = load_config(store_path)
+        result = mutate(config)
+        save_config(config, store_path)
+        refresh_summary(store_path)
+    return result
+
+
 def get_project_path(project: str, store_path: Optional[Path] = None) -> Path:
     """Get path to a project directory."""
     if store_path is None:
@@ -137,30 +261,649 @@ def list_projects(store_path: Optional[Path] = None) -> list[str]:
     return sorted([p.name for p in projects_dir.iterdir() if p.is_dir()])
 
 
-def load_project_state(project: str, store_path: Optional[Path] = None) -> dict:
-    """Load project state from project.json."""
-    project_path = get_project_path(project, store_path)
+def uses_sqlite(project: str, store_path: Optional[Path] = None) -> bool:
+    """Return True if the project state lives in project.db."""
+    return (get_project_path(project, store_path) / DB_FILE).exists()
+
+
+def open_project_db(project: str, store_path: Optional[Path] = None):
+    """Open the SQLite store for a project (caller closes it)."""
+    from sqlite_backend import SQLiteProjectStore
+
+    return SQLiteProjectStore(get_project_path(project, store_path) / DB_FILE)
+
+
+class VersionIndex:
+    """Lookup tables over a project's versions: id -> entry, tag -> ids."""
+
+    def __init__(self, versions: list[dict]):
+        self.by_id: dict[str, dict] = {}
+        self.by_tag: dict[str, list[str]] = {}
+        for v in versions:
+            self.by_id[v["id"]] = v
+            if v.get("tag"):
+                self.by_tag.setdefault(v["tag"], []).append(v["id"])
+
+
+class ProjectState(dict):
+    """Project state dict with a version index built on first lookup.
+
+    The index (and anything cached with ``derived()``) is not part of the
+    saved state. It is rebuilt when the versions list is replaced, grows
+    or shrinks; after editing ids, tags or parents of existing entries in
+    place, call ``reindex()``.
+    """
+
+    _derived: Optional[dict] = None
+    _derived_key: Optional[tuple] = None
+
+    def derived(self, name: str, build: Callable[[list[dict]], Any]) -> Any:
+        """Return ``build(versions)``, cached until the versions change."""
+        versions = self.get("versions", [])
+        key = (id(versions), len(versions), versions[-1]["id"] if versions else None)
+        if self._derived is None or self._derived_key != key:
+            self._derived = {}
+            self._derived_key = key
+        if name not in self._derived:
+            self._derived[name] = build(versions)
+        return self._derived[name]
+
+    @property
+    def index(self) -> VersionIndex:
+        return self.derived("index", VersionIndex)
+
+    def reindex(self) -> None:
+        self._derived = None
+
+
+def version_index(state: dict) -> VersionIndex:
+    """Get the version index of a loaded state (built once per load)."""
+    if isinstance(state, ProjectState):
+        return state.index
+    return VersionIndex(state.get("versions", []))
+
+
+def read_journal(project: str, offset: int = 0, store_path: Optional[Path] = None) -> list[dict]:
+    """Read journal events starting at a byte offset.
+
+    A torn final line (a crash in the middle of an append) is ignored.
+    """
+    journal = get_project_path(project, store_path) / JOURNAL_FILE
+    try:
+        with open(journal, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+    except FileNotFoundError:
+        return []
+    events = []
+    for line in data.split(b"\n"):
+        if not line:
+            continue
+        try:
+            events.append(json.loads(line))
+        except ValueError:
+            break
+    return events
+
+
+def apply_event(state: dict, event: dict) -> None:
+    """Apply one journal event to a state dict in place."""
+    kind = event["event"]
+    if kind == "version_created":
+        state.setdefault("versions", []).append(event["entry"])
+        if event.get("activate"):
+            state["active_version"] = event["entry"]["id"]
+    elif kind == "version_removed":
+        state["versions"] = [v for v in state.get("versions", []) if v["id"] != event["version"]]
+        state["active_version"] = event.get("active")
+        # Removed IDs are never handed out again (see get_next_version_id)
+        match = VERSION_ID_PATTERN.match(event["version"])
+        if match:
+            state["version_high_water"] = max(state.get("version_high_water", 0), int(match.group(1)))
+    elif kind == "active_switched":
+        state["active_version"] = event["version"]
+    elif kind == "notes_edited":
+        entry = version_index(state).by_id.get(event["version"])
+        if entry is not None:
+            entry["notes"] = event["notes"]
+    # "state_saved" marks a full snapshot write and changes nothing itself
+    state["revision"] = event["revision"]
+    state["updated_at"] = event["at"]
+
+
+def _load_json_state(project_path: Path) -> tuple["ProjectState", int]:
+    """Read project.json and replay the journal written since.
+
+    Returns:
+        Tuple of (state, number of journal events replayed)
+    """
     state_file = project_path / PROJECT_FILE
     if not state_file.exists():
-        raise FileNotFoundError(f"Project not found: {project}")
-    return json.loads(state_file.read_text())
+        raise FileNotFoundError(f"Project not found: {project_path.name}")
+    state = ProjectState(json.loads(state_file.read_text()))
+    offset = state.pop("journal_offset", 0)
+    replayed = 0
+    for event in read_journal(project_path.name, offset, project_path.parent.parent):
+        # The revision check skips events a snapshot already contains
+        if event["revision"] > state.get("revision", 0):
+            apply_event(state, event)
+            replayed += 1
+    return state, replayed
+
+
+def read_project_state(project: str, store_path: Optional[Path] = None) -> ProjectState:
+    """Load project state as stored, whatever its schema version."""
+    project_path = get_project_path(project, store_path)
+    if (project_path / DB_FILE).exists():
+        with open_project_db(project, store_path) as db:
+            return ProjectState(db.load_state())
+    return _load_json_state(project_path)[0]
 
 
-def save_project_state(project: str, state: dict, store_path: Optional[Path] = None) -> None:
-    """Save project state to project.json."""
-    project_path = get_project_path(project, store_path)
-    state["updated_at"] = datetime.now(timezone.utc).isoformat()
-    state_file = project_path / PROJECT_FILE
+def load_project_state(
+    project: str, store_path: Optional[Path] = None, upgrade: bool = False
+) -> ProjectState:
+    """Load project state from project.db, or project.json plus its journal.
+
+    State written under an older schema is upgraded in memory; reading
+    never writes to the store.
+
+    Args:
+        project: Project name
+        store_path: Store root
+        upgrade: Upgrade older state on disk first. For callers that save
+            the loaded state back, with the project lock held.
+
+    Raises:
+        ValueError: If the state uses a schema newer than this code knows
+    """
+    state = read_project_state(project, store_path)
+    if state.get("version") != PROJECT_SCHEMA_VERSION:
+        if upgrade:
+            _upgrade_stored_state(project, store_path, state)
+            return read_project_state(project, store_path)
+        from store_migrate import migrate
+
+        migrate("project", state, store_path or get_store_path(), project, dry_run=True)
+    return state
+
+
+def _upgrade_stored_state(
+    project: str, store_path: Optional[Path] = None, state: Optional[dict] = None
+) -> bool:
+    """Upgrade a project written under an older schema, on disk.
+
+    Mutating entry points call this before they write, so the lazy
+    upgrade happens on the first change rather than on a read.
+
+    Args:
+        state: The stored state, if already read
+
+    Returns:
+        True if the project was upgraded
+    """
+    if state is not None:
+        version = state.get("version")
+    elif uses_sqlite(project, store_path):
+        with open_project_db(project, store_path) as db:
+            version = db.get_field("version")
+    else:
+        version = _load_json_state(get_project_path(project, store_path))[0].get("version")
+    if version == PROJECT_SCHEMA_VERSION:
+        return False
+    from store_migrate import upgrade_project
+
+    return upgrade_project(project, store_path) is not None
+
+
+def _repair_journal_tail(f) -> None:
+    """Cut a torn final line so the next event starts on a fresh line."""
+    end = f.seek(0, os.SEEK_END)
+    pos = end
+    while pos > 0:
+        start = max(0, pos - 4096)
+        f.seek(start)
+        chunk = f.read(pos - start)
+        if pos == end and chunk.endswith(b"\n"):
+            return
+        newline = chunk.rfind(b"\n")
+        if newline >= 0:
+            f.truncate(start + newline + 1)
+            return
+        pos = start
+    f.truncate(0)
+
+
+def _append_events(project_path: Path, state: dict, events: list[dict]) -> int:
+    """Append events to the journal in one write and apply them to ``state``.
+
+    Call with the project lock held and ``state`` freshly loaded.
+
+    Returns:
+        Journal size in bytes after the append
+    """
+    revision = state.get("revision", 0)
+    at = now_iso()
+    for offset, event in enumerate(events, 1):
+        event["revision"] = revision + offset
+        event["at"] = at
+    data = "".join(json.dumps(e, separators=(",", ":")) + "\n" for e in events).encode()
+    with open(project_path / JOURNAL_FILE, "a+b") as f:
+        _repair_journal_tail(f)
+        f.write(data)
+        end = f.tell()
+    for event in events:
+        apply_event(state, event)
+    return end
+
+
+def _write_snapshot(project_path: Path, state: dict, journal_offset: int) -> None:
+    """Atomically replace project.json with ``state`` (journal folded up to the offset)."""
     fd, tmp_path = tempfile.mkstemp(dir=project_path, suffix=".tmp")
     try:
         with os.fdopen(fd, "w") as f:
-            json.dump(state, f, indent=2)
-        Path(tmp_path).replace(state_file)
+            json.dump({**state, "journal_offset": journal_offset}, f, indent=2)
+        Path(tmp_path).replace(project_path / PROJECT_FILE)
     except:
         Path(tmp_path).unlink(missing_ok=True)
         raise
 
 
+def _record_events(
+    project: str, make_events: Callable[[dict], list[dict]], store_path: Optional[Path] = None
+) -> list[dict]:
+    """Journal events for a JSON-backed project, folding the journal when due.
+
+    ``make_events(state)`` builds the events from the current state under
+    the project lock (it may raise to abort). The write is one small
+    append whatever the history size; every ``JOURNAL_FOLD_EVERY`` events
+    project.json is rewritten so loads replay a bounded tail.
+
+    Returns:
+        The events, with their revisions and timestamps
+    """
+    project_path = get_project_path(project, store_path)
+    with project_lock(project, store_path):
+        state, pending = _load_json_state(project_path)
+        if _upgrade_stored_state(project, store_path, state):
+            state, pending = _load_json_state(project_path)
+        events = make_events(state)
+        if not events:
+            return events
+        end = _append_events(project_path, state, events)
+        if pending + len(events) >= JOURNAL_FOLD_EVERY:
+            _write_snapshot(project_path, state, end)
+        refresh_summary(store_path, project, state)
+    return events
+
+
+def _record_event(
+    project: str, make_event: Callable[[dict], dict], store_path: Optional[Path] = None
+) -> dict:
+    """Journal a single event (see _record_events)."""
+    return _record_events(project, lambda state: [make_event(state)], store_path)[0]
+
+
+def save_project_state(project: str, state: dict, store_path: Optional[Path] = None) -> None:
+    """Save project state to project.db or project.json.
+
+    The save is a compare-and-swap on the state's ``revision`` counter.
+    For project.json it writes a full snapshot (and journals a
+    ``state_saved`` marker); prefer the event helpers below for small
+    changes.
+
+    Raises:
+        StateConflictError: If another writer saved since ``state`` was loaded
+    """
+    project_path = get_project_path(project, store_path)
+    state["updated_at"] = datetime.now(timezone.utc).isoformat()
+    expected = state.get("revision", 0)
+    with project_lock(project, store_path):
+        if (project_path / DB_FILE).exists():
+            with open_project_db(project, store_path) as db:
+                db.save_state(state, expected_revision=expected)
+            refresh_summary(store_path, project, state)
+            return
+        current = {}
+        if (project_path / PROJECT_FILE).exists():
+            current = _load_json_state(project_path)[0]
+        if current.get("revision", 0) != expected:
+            raise StateConflictError(
+                f"Project {project} changed on disk (revision {current.get('revision', 0)}, "
+                f"expected {expected}); reload and retry"
+            )
+        end = _append_events(project_path, current, [{"event": "state_saved"}])
+        try:
+            state["revision"] = current["revision"]
+            _write_snapshot(project_path, state, end)
+        except:
+            state["revision"] = expected
+            raise
+        refresh_summary(store_path, project, state)
+
+
+def update_project_state(
+    project: str,
+    mutate: Callable[[dict], Any],
+    store_path: Optional[Path] = None,
+) -> Any:
+    """Load, mutate and save project state atomically with respect to other writers.
+
+    ``mutate(state)`` edits the state in place; its return value is passed
+    through. The project lock is held throughout, so concurrent callers
+    (other processes or threads) apply their changes one after another.
+    """
+    with project_lock(project, store_path):
+        state = load_project_state(project, store_path, upgrade=True)
+        result = mutate(state)
+        save_project_state(project, state, store_path)
+    return result
+
+
+def get_version(project: str, version_id: str, store_path: Optional[Path] = None) -> Optional[dict]:
+    """Look up a single version entry (indexed on the SQLite backend)."""
+    if uses_sqlite(project, store_path):
+        with open_project_db(project, store_path) as db:
+            return db.get_version(version_id)
+    return get_version_entry(load_project_state(project, store_path), version_id)
+
+
+def iter_versions(
+    project: str,
+    tag: Optional[str] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+    source_type: Optional[str] = None,
+    parent: Optional[str] = None,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    newest_first: bool = False,
+    store_path: Optional[Path] = None,
+) -> Iterator[dict]:
+    """Iterate over version entries matching the given filters, one page at a time.
+
+    On the SQLite backend the filters and paging run as an indexed query
+    and rows are decoded as they are consumed. project.json has to be
+    parsed whole, but entries are still filtered and yielded lazily.
+
+    Args:
+        project: Project name
+        tag: Only versions with this tag
+        since: Only versions created on or after this ISO date/time
+        until: Only versions created on or before this ISO date/time
+            (compared at the given precision, so "2025-06" includes all of June)
+        source_type: Only versions whose source type matches (import, edit, ...)
+        parent: Only direct children of this version
+        offset: Number of matching versions to skip
+        limit: Maximum number of versions to yield (None for all)
+        newest_first: Yield in reverse creation order
+        store_path: Store root
+    """
+    if uses_sqlite(project, store_path):
+        with open_project_db(project, store_path) as db:
+            yield from db.iter_versions(
+                tag=tag, since=since, until=until, source_type=source_type,
+                parent=parent, offset=offset, limit=limit, newest_first=newest_first,
+            )
+        return
+
+    state = load_project_state(project, store_path)
+    versions = state.get("versions", [])
+    if tag is not None:
+        versions = get_versions_by_tag(state, tag)
+    if newest_first:
+        versions = reversed(versions)
+    matches = (
+        v for v in versions
+        if (since is None or v.get("created_at", "") >= since)
+        and (until is None or v.get("created_at", "")[:len(until)] <= until)
+        and (source_type is None or (v.get("source") or {}).get("type") == source_type)
+        and (parent is None or v.get("parent") == parent)
+    )
+    stop = None if limit is None else offset + limit
+    yield from itertools.islice(matches, offset, stop)
+
+
+def get_active_version_id(project: str, store_path: Optional[Path] = None) -> Optional[str]:
+    """Get the active version ID without loading the version history."""
+    if uses_sqlite(project, store_path):
+        with open_project_db(project, store_path) as db:
+            return db.get_field("active_version")
+    return load_project_state(project, store_path).get("active_version")
+
+
+def append_version(
+    project: str,
+    make_entry: Callable[[str], dict],
+    activate: bool = True,
+    store_path: Optional[Path] = None,
+) -> dict:
+    """Allocate the next version ID and record the entry built for it.
+
+    ``make_entry(version_id)`` does any file work for the new version and
+    returns its entry. Allocation, ``make_entry`` and the insert run under
+    the project lock (a single transaction on SQLite), so parallel callers
+    never get the same ID and a failure records nothing.
+
+    Returns:
+        The recorded version entry
+    """
+    if uses_sqlite(project, store_path):
+        with project_lock(project, store_path):
+            _upgrade_stored_state(project, store_path)
+            with open_project_db(project, store_path) as db:
+                entry = db.append_version(make_entry, activate, now_iso())
+            refresh_summary(store_path, project)
+        return entry
+
+    def created(state: dict) -> dict:
+        return {
+            "event": "version_created",
+            "entry": make_entry(get_next_version_id(state)),
+            "activate": activate,
+            "previous_active": state.get("active_version"),
+        }
+
+    return _record_event(project, created, store_path)["entry"]
+
+
+def append_versions(
+    project: str,
+    make_entries: list[Callable[[str], dict]],
+    activate: bool = True,
+    store_path: Optional[Path] = None,
+) -> list[dict]:
+    """Record several new versions in one locked transaction.
+
+    Like append_version(), for batches: consecutive IDs are allocated
+    once, each ``make_entries[i](version_id)`` builds its entry, and all
+    entries are recorded together (one journal append, or one SQLite
+    transaction). If any builder raises, nothing is recorded.
+
+    Args:
+        activate: Make the last new version active
+
+    Returns:
+        The recorded entries, in order
+    """
+    if not make_entries:
+        return []
+    if uses_sqlite(project, store_path):
+        with project_lock(project, store_path):
+            _upgrade_stored_state(project, store_path)
+            with open_project_db(project, store_path) as db:
+                entries = db.append_versions(make_entries, activate, now_iso())
+            refresh_summary(store_path, project)
+        return entries
+
+    def created(state: dict) -> list[dict]:
+        first = parse_version_id(get_next_version_id(state))
+        previous = state.get("active_version")
+        events = []
+        for offset, make_entry in enumerate(make_entries):
+            events.append({
+                "event": "version_created",
+                "entry": make_entry(f"v{first + offset}"),
+                "activate": activate,
+                "previous_active": previous,
+            })
+            if activate:
+                previous = events[-1]["entry"]["id"]
+        return events
+
+    return [event["entry"] for event in _record_events(project, created, store_path)]
+
+
+def insert_versions(project: str, entries: list[dict], store_path: Optional[Path] = None) -> None:
+    """Record entries that already carry their IDs (e.g. copied from another store).
+
+    The active version does not change. Callers that choose IDs from a
+    loaded state should hold the project lock from that load on.
+
+    Raises:
+        ValueError: If an ID is already taken (nothing is recorded)
+    """
+    if not entries:
+        return
+    if uses_sqlite(project, store_path):
+        with project_lock(project, store_path):
+            _upgrade_stored_state(project, store_path)
+            with open_project_db(project, store_path) as db:
+                db.insert_versions(entries, now_iso())
+            refresh_summary(store_path, project)
+        return
+
+    def created(state: dict) -> list[dict]:
+        taken = set(version_index(state).by_id)
+        events = []
+        for entry in entries:
+            if entry["id"] in taken:
+                raise ValueError(f"Version already exists: {entry['id']}")
+            taken.add(entry["id"])
+            events.append({
+                "event": "version_created",
+                "entry": entry,
+                "activate": False,
+                "previous_active": state.get("active_version"),
+            })
+        return events
+
+    _record_events(project, created, store_path)
+
+
+def set_active_version(project: str, version_id: str, store_path: Optional[Path] = None) -> None:
+    """Set the active version of a project."""
+    if uses_sqlite(project, store_path):
+        with project_lock(project, store_path):
+            _upgrade_stored_state(project, store_path)
+            with open_project_db(project, store_path) as db:
+                db.set_fields({"active_version": version_id, "updated_at": now_iso()})
+            refresh_summary(store_path, project)
+        return
+    _record_event(project, lambda state: {
+        "event": "active_switched", "version": version_id,
+        "previous": state.get("active_version"),
+    }, store_path)
+
+
+def set_version_notes(
+    project: str, version_id: str, notes: str, store_path: Optional[Path] = None
+) -> None:
+    """Replace a version's notes.
+
+    Raises:
+        ValueError: If the version does not exist
+    """
+    if uses_sqlite(project, store_path):
+        with project_lock(project, store_path):
+            _upgrade_stored_state(project, store_path)
+            with open_project_db(project, store_path) as db:
+                if not db.update_version(version_id, {"notes": notes}, now_iso()):
+                    raise ValueError(f"Version not found: {version_id}")
+            refresh_summary(store_path, project)
+        return
+
+    def edited(state: dict) -> dict:
+        entry = get_version_entry(state, version_id)
+        if not entry:
+            raise ValueError(f"Version not found: {version_id}")
+        return {"event": "notes_edited", "version": version_id,
+                "notes": notes, "previous": entry.get("notes", "")}
+
+    _record_event(project, edited, store_path)
+
+
+def _inverse_event(event: dict, state: dict) -> dict:
+    """Build the event that reverts ``event`` on top of the current state.
+
+    Raises:
+        ValueError: If a later full save removed what the event touched
+    """
+    by_id = version_index(state).by_id
+    kind, revision = event["event"], event["revision"]
+    if kind == "version_created":
+        version_id = event["entry"]["id"]
+        if version_id not in by_id:
+            raise ValueError(f"Cannot undo revision {revision}: version {version_id} no longer exists")
+        active = state.get("active_version")
+        if active == version_id:
+            previous = event.get("previous_active")
+            remaining = [v["id"] for v in state["versions"] if v["id"] != version_id]
+            active = previous if previous in by_id and previous != version_id else (
+                remaining[-1] if remaining else None)
+        return {"event": "version_removed", "version": version_id, "active": active}
+    if kind == "active_switched":
+        previous = event["previous"]
+        if previous is not None and previous not in by_id:
+            raise ValueError(f"Cannot undo revision {revision}: version {previous} no longer exists")
+        return {"event": "active_switched", "version": previous, "previous": event["version"]}
+    if kind == "notes_edited":
+        if event["version"] not in by_id:
+            raise ValueError(
+                f"Cannot undo revision {revision}: version {event['version']} no longer exists"
+            )
+        return {"event": "notes_edited", "version": event["version"],
+                "notes": event["previous"], "previous": event["notes"]}
+    raise ValueError(f"Cannot undo {kind} (revision {revision})")
+
+
+def undo_last_change(project: str, store_path: Optional[Path] = None) -> dict:
+    """Revert the most recent journaled change that has not been undone.
+
+    The undo is itself journaled (as the inverse event, with ``undo_of``
+    pointing at the reverted revision), so the journal stays a complete
+    audit trail. Undoing a version creation removes its entry; the
+    version's files are left for ``gc_store.py`` to collect, and its ID
+    is not reused.
+
+    Full saves (``state_saved``: packing, migrations, update_project_state)
+    record no inverse and are skipped, so the changes before them stay
+    undoable. The inverse is applied to the current state; if a full save
+    has since removed the version the change touched, undo refuses.
+
+    Returns:
+        The event that was undone
+
+    Raises:
+        ValueError: If the project uses SQLite, or there is nothing to undo
+    """
+    if uses_sqlite(project, store_path):
+        raise ValueError("Undo needs the journal of a JSON-backed project")
+    with project_lock(project, store_path):
+        events = read_journal(project, 0, store_path)
+        undone = {e["undo_of"] for e in events if "undo_of" in e}
+        for event in reversed(events):
+            if "undo_of" in event or event["revision"] in undone or event["event"] == "state_saved":
+                continue
+
+            def inverse(state: dict, event: dict = event) -> dict:
+                return {**_inverse_event(event, state), "undo_of": event["revision"]}
+
+            _record_event(project, inverse, store_path)
+            return event
+    raise ValueError(f"Nothing to undo in project: {project}")
+
+
 def get_active_project(store_path: Optional[Path] = None) -> Optional[str]:
     """Get the currently active project name."""
     config = load_config(store_path)
@@ -169,9 +912,7 @@ def get_active_project(store_path: Optional[Path] = None) -> Optional[str]:
 
 def set_active_project(project: str, store_path: Optional[Path] = None) -> None:
     """Set the active project."""
-    config = load_config(store_path)
-    config["active_project"] = project
-    save_config(config, store_path)
+    update_config(lambda config: config.update(active_project=project), store_path)
 
 
 def resolve_project(project: Optional[str], store_path: Optional[Path] = None) -> str:
@@ -184,6 +925,128 @@ def resolve_project(project: Optional[str], store_path: Optional[Path] = None) -
     return active
 
 
+def _build_summary(store_path: Path, project: Optional[str], state: Optional[dict]) -> dict:
+    summary = {
+        "version": SUMMARY_SCHEMA_VERSION,
+        "store": str(store_path),
+        "active_project": project,
+        "active_version": None,
+        "yaml_path": None,
+        "version_count": 0,
+        "updated_at": None,
+    }
+    if project is None or not get_project_path(project, store_path).is_dir():
+        return summary
+    if state is None and uses_sqlite(project, store_path):
+        # Indexed reads: no need to decode the whole history
+        with open_project_db(project, store_path) as db:
+            active = db.get_field("active_version")
+            entry = db.get_version(active) if active else None
+            summary["version_count"] = db.count_versions()
+            summary["updated_at"] = db.get_field("updated_at")
+    else:
+        if state is None:
+            state = read_project_state(project, store_path)
+        active = state.get("active_version")
+        # The active version is usually recent: a backward scan beats
+        # building the index of a freshly loaded state
+        entry = next((v for v in reversed(state.get("versions", [])) if v["id"] == active), None)
+        summary["version_count"] = len(state.get("versions", []))
+        summary["updated_at"] = state.get("updated_at")
+    if entry:
+        summary["active_version"] = active
+        summary["yaml_path"] = str(
+            get_version_path(project, active, entry.get("tag"), store_path) / "resume.yaml"
+        )
+    return summary
+
+
+def refresh_summary(
+    store_path: Optional[Path] = None,
+    project: Optional[str] = None,
+    state: Optional[dict] = None,
+) -> Optional[dict]:
+    """Rewrite status.json, the store summary read by status lines.
+
+    Called after every state or config change. The summary holds the
+    active project, its active version, YAML path, version count and last
+    update, so ``resume status`` and prompt integrations can read one
+    small file instead of loading project state. It is written
+    atomically under the store lock, from state read after the change,
+    so the last writer always leaves it current.
+
+    Args:
+        store_path: Store root
+        project: The project that changed (the summary is only rewritten
+            if it is the active project; None to always rewrite)
+        state: That project's state after the change, if already loaded
+            (with its project lock held)
+
+    Returns:
+        The summary written, or None if nothing was written
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    try:
+        with file_lock(store_path / LOCK_FILE):
+            active_project = load_config(store_path).get("active_project")
+            if project is not None and project != active_project:
+                return None
+            summary = _build_summary(store_path, active_project, state if project else None)
+            fd, tmp_path = tempfile.mkstemp(dir=store_path, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump(summary, f, indent=2)
+                Path(tmp_path).replace(store_path / SUMMARY_FILE)
+            except:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+    except OSError:
+        # The summary is only an optimization; readers fall back to the state
+        return None
+    return summary
+
+
+def read_summary(store_path: Optional[Path] = None) -> Optional[dict]:
+    """Read status.json without touching project state.
+
+    Returns:
+        The summary, or None if it is missing, unreadable, from another
+        summary schema or written before the store was moved (callers
+        then load the state and refresh it)
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    try:
+        summary = json.loads((store_path / SUMMARY_FILE).read_text())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(summary, dict) or summary.get("version") != SUMMARY_SCHEMA_VERSION:
+        return None
+    if summary.get("store") != str(store_path):
+        return None
+    return summary
+
+
+def get_summary_yaml_path(
+    project: Optional[str] = None, store_path: Optional[Path] = None
+) -> Optional[Path]:
+    """Get the active YAML path from status.json, without loading project state.
+
+    Returns:
+        The path, or None if the summary is missing, covers another
+        project, or the file is not on disk (e.g. a packed version);
+        use get_active_version_path() then
+    """
+    summary = read_summary(store_path)
+    if not summary or not summary.get("yaml_path"):
+        return None
+    if project is not None and project != summary.get("active_project"):
+        return None
+    yaml_path = Path(summary["yaml_path"])
+    return yaml_path if yaml_path.exists() else None
+
+
 def parse_version_id(version_id: str) -> int:
     """Parse a version ID and return its numeric component.
 
@@ -218,7 +1081,7 @@ def validate_version_id(version_id: str) -> bool:
 
 
 def get_next_version_id(state: dict) -> str:
-    """Get the next version ID (v1, v2, v3, ...).
+    """Get the next version ID (v1, v2, v3, ...), never reusing a removed one.
 
     Args:
         state: Project state dictionary
@@ -230,10 +1093,9 @@ def get_next_version_id(state: dict) -> str:
         ValueError: If existing version IDs have invalid format
     """
     versions = state.get("versions", [])
-    if not versions:
-        return "v1"
-
-    max_num = 0
+    # IDs of removed (undone) versions stay retired: their directories
+    # may still hold files
+    max_num = state.get("version_high_water", 0)
     for v in versions:
         vid = v.get("id", "")
         try:
@@ -249,10 +1111,13 @@ def get_next_version_id(state: dict) -> str:
 
 def get_version_entry(state: dict, version_id: str) -> Optional[dict]:
     """Get version entry by ID."""
-    for v in state.get("versions", []):
-        if v["id"] == version_id:
-            return v
-    return None
+    return version_index(state).by_id.get(version_id)
+
+
+def get_versions_by_tag(state: dict, tag: str) -> list[dict]:
+    """Get all version entries with a tag, oldest first."""
+    index = version_index(state)
+    return [index.by_id[vid] for vid in index.by_tag.get(tag, [])]
 
 
 def get_version_dir_name(version_id: str, tag: Optional[str] = None) -> str:
@@ -276,21 +1141,33 @@ def get_version_path(
 
 def get_active_version_path(project: str, store_path: Optional[Path] = None) -> Path:
     """Get path to the active version's YAML file."""
-    state = load_project_state(project, store_path)
-    active_id = state.get("active_version")
+    active_id = get_active_version_id(project, store_path)
     if not active_id:
         raise ValueError(f"No active version set for project: {project}")
-    version = get_version_entry(state, active_id)
+    version = get_version(project, active_id, store_path)
     if not version:
         raise ValueError(f"Active version not found: {active_id}")
+    if version.get("packed"):
+        # Packed by pack_versions.py: write the working copy back out
+        from delta_store import ensure_version_yaml
+
+        return ensure_version_yaml(project, version, store_path)
     version_dir = get_version_path(project, active_id, version.get("tag"), store_path)
     return version_dir / "resume.yaml"
 
 
-def copy_file(src: Path, dst: Path) -> None:
-    """Copy a file, creating parent directories if needed."""
+def copy_file(src: Path, dst: Path, immutable: bool = False) -> str:
+    """Copy a file, creating parent directories if needed.
+
+    Uses the cheapest strategy the filesystem supports (see
+    object_store.copy_file); ``immutable`` allows a hardlink.
+
+    Returns:
+        The strategy used: "reflink", "hardlink", "copy_file_range",
+        "sendfile" or "copy"
+    """
     dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    return _copy_file(src, dst, allow_hardlink=immutable)
 
 
 def now_iso() -> str:
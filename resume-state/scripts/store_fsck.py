@@ -0,0 +1,402 @@
+"""Integrity check for the version store.
+
+For every project, the check confirms that:
+
+- the project state loads, and its active version exists
+- each version entry has its directory and resume.yaml on disk (or a
+  packed copy), and the YAML parses
+- each ``source.file`` exists in ``sources/`` and hashes to the
+  ``source.sha256`` recorded at import
+- every object's content hashes to its name, and every packed version
+  rebuilds from its delta chain
+
+Version directories with no entry are reported too (``gc`` removes
+them). Files are hashed on a thread pool. Reads go through ``mmap``, and
+hashlib releases the GIL while it digests them, so hashing runs on every
+core and a large store is bound by disk speed. Hardlinked files (a
+source and its object) are hashed once.
+
+Repair relinks missing or damaged sources from their object, restores
+missing or corrupt objects from intact sources, and points a dangling
+active version at the newest version. Damaged files are moved to
+``.resume_versions/quarantine/<time>/`` rather than deleted.
+"""
+
+import hashlib
+import mmap
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import yaml
+
+from delta_store import DELTA_SUFFIX, chain_digests, read_object
+from object_store import OBJECTS_DIR, link_object, object_path, put_object
+from state_utils import (
+    get_project_path,
+    get_version_dir_name,
+    list_projects,
+    load_project_state,
+    project_lock,
+    set_active_version,
+)
+
+QUARANTINE_DIR = "quarantine"
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass
+class Problem:
+    """An integrity problem found by the check."""
+
+    kind: str
+    project: Optional[str]
+    version: Optional[str]
+    path: Optional[Path]
+    detail: str
+    repaired: Optional[str] = None  # what repair did, if anything
+
+    def to_dict(self, store_path: Path) -> dict:
+        data = asdict(self)
+        if self.path is not None:
+            data["path"] = str(self.path.relative_to(store_path))
+        return data
+
+
+def hash_file_mmap(path: Path) -> str:
+    """SHA-256 of a file, read through a memory map."""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:  # empty files cannot be mapped
+            return hashlib.sha256().hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def _hash_task(path: str) -> tuple[str, Optional[str], Optional[str]]:
+    try:
+        return path, hash_file_mmap(Path(path)), None
+    except OSError as e:
+        return path, None, e.strerror or str(e)
+
+
+def hash_files(paths: list[Path], jobs: Optional[int] = None) -> dict[Path, tuple[Optional[str], Optional[str]]]:
+    """Hash files in parallel, once per inode.
+
+    Returns:
+        Dict of path -> (digest, None), or (None, error) if unreadable
+    """
+    by_inode: dict[tuple, list[Path]] = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            key = (st.st_dev, st.st_ino)
+        except OSError:
+            key = ("path", str(path))
+        by_inode.setdefault(key, []).append(path)
+
+    tasks = [str(group[0]) for group in by_inode.values()]
+    jobs = jobs or min(32, (os.cpu_count() or 1) + 4)
+    if jobs == 1:
+        results = map(_hash_task, tasks)
+    else:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(_hash_task, tasks, chunksize=16))
+
+    hashed = {}
+    digests = {path: (digest, error) for path, digest, error in results}
+    for group in by_inode.values():
+        for path in group:
+            hashed[path] = digests[str(group[0])]
+    return hashed
+
+
+def _parse_task(text: str) -> Optional[str]:
+    try:
+        yaml.load(text, Loader=_Loader)
+        return None
+    except yaml.YAMLError as e:
+        return str(e).splitlines()[0]
+
+
+class _Checker:
+    def __init__(self, store_path: Path, jobs: Optional[int]):
+        self.store_path = store_path
+        self.jobs = jobs
+        self.problems: list[Problem] = []
+        self.bad_objects: set[str] = set()
+        # digest -> a source file verified to hash to it
+        self.intact_sources: dict[str, Path] = {}
+        self.stats = {"projects": 0, "versions": 0, "objects": 0, "files_hashed": 0, "bytes_hashed": 0}
+
+    def add(self, kind: str, project: Optional[str], version: Optional[str],
+            path: Optional[Path], detail: str) -> Problem:
+        problem = Problem(kind, project, version, path, detail)
+        self.problems.append(problem)
+        return problem
+
+    def check(self, projects: list[str]) -> None:
+        states = {}
+        for project in projects:
+            try:
+                states[project] = load_project_state(project, self.store_path)
+            except FileNotFoundError:
+                continue
+            except (ValueError, sqlite3.DatabaseError) as e:
+                self.add("unreadable-state", project, None, get_project_path(project, self.store_path),
+                         f"Cannot load project state: {e}")
+        self.stats["projects"] = len(states)
+
+        # Objects first: the source and packed checks need to know which are intact
+        object_files = self._object_files()
+        self.stats["objects"] = len(object_files)
+        sources = []  # (project, entry, path)
+        yaml_files = []  # (project, entry, path)
+        for project, state in states.items():
+            sources_dir = get_project_path(project, self.store_path) / "sources"
+            self._check_layout(project, state, yaml_files)
+            for entry in state.get("versions", []):
+                name = (entry.get("source") or {}).get("file")
+                if name:
+                    sources.append((project, entry, sources_dir / name))
+
+        to_hash = [path for path, _ in object_files] + [path for _, _, path in sources if path.exists()]
+        hashed = hash_files(to_hash, self.jobs)
+        inodes = {}
+        for path in to_hash:
+            st = path.stat()
+            inodes[(st.st_dev, st.st_ino)] = st.st_size
+        self.stats["files_hashed"] = len(inodes)
+        self.stats["bytes_hashed"] = sum(inodes.values())
+
+        for path, digest in object_files:
+            actual, error = hashed[path]
+            if actual != digest:
+                self.bad_objects.add(digest)
+                self.add("corrupt-object", None, None, path,
+                         error or f"Content hashes to {actual[:12]}, not {digest[:12]}")
+        self._check_deltas()
+        self._check_sources(sources, hashed)
+        self._check_yaml(yaml_files, states)
+
+    def _object_files(self) -> list[tuple[Path, str]]:
+        """Snapshot objects (not deltas), with the digest their name claims."""
+        root = self.store_path / OBJECTS_DIR
+        files = []
+        if not root.is_dir():
+            return files
+        for fan in os.scandir(root):
+            if not fan.is_dir():
+                continue
+            for entry in os.scandir(fan.path):
+                if entry.is_file() and not entry.name.endswith((".tmp", DELTA_SUFFIX)):
+                    files.append((Path(entry.path), fan.name + entry.name))
+        return files
+
+    def _check_layout(self, project: str, state: dict, yaml_files: list) -> None:
+        versions = state.get("versions", [])
+        self.stats["versions"] += len(versions)
+        ids = {v["id"] for v in versions}
+        active = state.get("active_version")
+        if active is not None and active not in ids:
+            self.add("dangling-active", project, active, None,
+                     f"Active version {active} has no entry")
+
+        versions_dir = get_project_path(project, self.store_path) / "versions"
+        expected = set()
+        for entry in versions:
+            dirname = get_version_dir_name(entry["id"], entry.get("tag"))
+            expected.add(dirname)
+            yaml_path = versions_dir / dirname / "resume.yaml"
+            if yaml_path.exists():
+                yaml_files.append((project, entry, yaml_path))
+            elif entry.get("packed"):
+                yaml_files.append((project, entry, None))
+            elif not yaml_path.parent.is_dir():
+                self.add("missing-version-dir", project, entry["id"], yaml_path.parent,
+                         "Version directory is missing")
+            else:
+                self.add("missing-yaml", project, entry["id"], yaml_path,
+                         "resume.yaml is missing and the version is not packed")
+        if versions_dir.is_dir():
+            for d in sorted(os.scandir(versions_dir), key=lambda d: d.name):
+                if d.is_dir() and d.name not in expected:
+                    self.add("orphan-version-dir", project, None, Path(d.path),
+                             "Version directory has no entry in project state")
+
+    def _check_deltas(self) -> None:
+        root = self.store_path / OBJECTS_DIR
+        if not root.is_dir():
+            return
+        deltas = []
+        for path in root.glob(f"*/*{DELTA_SUFFIX}"):
+            digest = path.parent.name + path.name.removesuffix(DELTA_SUFFIX)
+            try:
+                chain = chain_digests(digest, self.store_path)
+            except FileNotFoundError:
+                self.bad_objects.add(digest)
+                self.add("corrupt-object", None, None, path, "Delta's base object is missing")
+                continue
+            except (ValueError, KeyError) as e:
+                self.bad_objects.add(digest)
+                self.add("corrupt-object", None, None, path, f"Unreadable delta: {e}")
+                continue
+            deltas.append((len(chain), path, digest, chain))
+        # Bases first, so a delta is only blamed for its own damage
+        for _, path, digest, chain in sorted(deltas):
+            if self.bad_objects.intersection(chain):
+                self.bad_objects.add(digest)
+                continue
+            try:
+                read_object(digest, self.store_path)
+            except (ValueError, KeyError) as e:
+                self.bad_objects.add(digest)
+                self.add("corrupt-object", None, None, path, f"Delta does not rebuild: {e}")
+
+    def _check_sources(self, sources: list, hashed: dict) -> None:
+        for project, entry, path in sources:
+            expected = entry["source"].get("sha256")
+            if not path.exists():
+                self.add("missing-source", project, entry["id"], path, "Source file is missing")
+                continue
+            actual, error = hashed[path]
+            if actual and not error:
+                self.intact_sources.setdefault(actual, path)
+            if error:
+                self.add("unreadable-source", project, entry["id"], path, error)
+            elif expected and actual != expected:
+                self.add("corrupt-source", project, entry["id"], path,
+                         f"Content hashes to {actual[:12]}, not {expected[:12]}")
+            elif expected and not object_path(expected, self.store_path).exists():
+                self.add("missing-object", project, entry["id"], object_path(expected, self.store_path),
+                         "Object for this source is missing")
+
+    def _check_yaml(self, yaml_files: list, states: dict) -> None:
+        texts, owners = [], []
+        for project, entry, path in yaml_files:
+            if path is None:
+                digest = entry["packed"]["sha256"]
+                if digest in self.bad_objects:
+                    self.add("damaged-version", project, entry["id"], None,
+                             "Packed YAML depends on a corrupt object and cannot be rebuilt")
+                    continue
+                try:
+                    texts.append(read_object(digest, self.store_path))
+                except FileNotFoundError:
+                    self.add("missing-object", project, entry["id"], object_path(digest, self.store_path),
+                             "Packed YAML object is missing")
+                    continue
+                except (ValueError, KeyError) as e:
+                    self.add("corrupt-object", project, entry["id"], object_path(digest, self.store_path),
+                             f"Packed YAML does not rebuild: {e}")
+                    continue
+            else:
+                try:
+                    texts.append(path.read_text())
+                except (OSError, UnicodeDecodeError) as e:
+                    self.add("unreadable-yaml", project, entry["id"], path, str(e))
+                    continue
+            owners.append((project, entry, path))
+
+        jobs = self.jobs or min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            errors = list(pool.map(_parse_task, texts, chunksize=32))
+        for (project, entry, path), error in zip(owners, errors):
+            if error:
+                self.add("invalid-yaml", project, entry["id"], path, error)
+
+    def repair(self, states_loader) -> None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        for problem in self.problems:
+            problem.repaired = self._repair_one(problem, stamp, states_loader)
+
+    def _quarantine(self, path: Path, stamp: str) -> Path:
+        dest = self.store_path / QUARANTINE_DIR / stamp / path.relative_to(self.store_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(path, dest)
+        return dest
+
+    def _repair_one(self, problem: Problem, stamp: str, states_loader) -> Optional[str]:
+        kind, path = problem.kind, problem.path
+        if kind in ("missing-source", "corrupt-source", "unreadable-source"):
+            state = states_loader(problem.project)
+            entry = next(v for v in state["versions"] if v["id"] == problem.version)
+            digest = entry["source"].get("sha256")
+            if not digest or digest in self.bad_objects or not object_path(digest, self.store_path).exists():
+                if kind == "missing-source":
+                    return None
+                moved = self._quarantine(path, stamp)
+                return f"quarantined to {moved.relative_to(self.store_path)}"
+            if path.exists():
+                self._quarantine(path, stamp)
+            link_object(digest, path, self.store_path, mutable=False)
+            return "relinked from object"
+        if kind == "missing-object" and problem.version is not None:
+            state = states_loader(problem.project)
+            entry = next(v for v in state["versions"] if v["id"] == problem.version)
+            source = (entry.get("source") or {}).get("file")
+            if source and not entry.get("packed"):
+                src = get_project_path(problem.project, self.store_path) / "sources" / source
+                put_object(src, self.store_path)
+                return "restored from source"
+            return None
+        if kind == "corrupt-object":
+            moved = self._quarantine(path, stamp)
+            repaired = f"quarantined to {moved.relative_to(self.store_path)}"
+            digest = path.parent.name + path.name
+            src = self.intact_sources.get(digest)
+            if src is not None and not path.name.endswith(DELTA_SUFFIX):
+                if put_object(src, self.store_path) == digest:
+                    self.bad_objects.discard(digest)
+                    return repaired + ", restored from source"
+            return repaired
+        if kind == "dangling-active":
+            versions = states_loader(problem.project).get("versions", [])
+            if not versions:
+                return None
+            set_active_version(problem.project, versions[-1]["id"], self.store_path)
+            return f"active version set to {versions[-1]['id']}"
+        return None
+
+
+def check_store(
+    store_path: Path,
+    projects: Optional[list[str]] = None,
+    repair: bool = False,
+    jobs: Optional[int] = None,
+) -> dict:
+    """Verify the store and optionally repair what can be repaired.
+
+    Every project lock is held throughout, so the check never sees a
+    half-written version.
+
+    Args:
+        store_path: Store root
+        projects: Only check these projects' state (objects are always
+            checked; default: all projects)
+        repair: Repair or quarantine the problems found
+        jobs: Hashing threads (default: CPU count + 4, max 32)
+
+    Returns:
+        Dict with "problems" (list of Problem) and "stats" (projects,
+        versions, objects, files_hashed, bytes_hashed)
+    """
+    names = list_projects(store_path) if projects is None else projects
+    checker = _Checker(store_path, jobs)
+    with ExitStack() as locks:
+        # Sorted order, like every other multi-lock holder, avoids deadlocks
+        for project in sorted(names):
+            try:
+                locks.enter_context(project_lock(project, store_path))
+            except FileNotFoundError:
+                raise ValueError(f"Project not found: {project}")
+        checker.check(names)
+        if repair:
+            checker.repair(lambda project: load_project_state(project, store_path))
+    return {"problems": checker.problems, "stats": checker.stats}
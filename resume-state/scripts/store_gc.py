@@ -0,0 +1,393 @@
+"""Garbage collection and size accounting for the version store.
+
+A parallel scan walks the store, with one task per project subtree and
+per object fan-out directory. It attributes every file to a project, a
+version and a kind. Collection then removes files nothing refers to
+anymore:
+
+- ``tmp``: ``*.tmp`` files left by an interrupted atomic write
+- ``orphan-version``: version directories with no entry in project state
+  (e.g. from an import that failed half-way)
+- ``orphan-source``: files in ``sources/`` no version's source points to
+- ``orphan-object``: objects that no source, packed version or delta
+  chain refers to (e.g. snapshots of versions that were removed), once
+  untouched for ``OBJECT_MIN_AGE``
+
+Generated ``.typ``/``.pdf`` files are only removed with ``prune_artifacts``,
+and never in the active version or the newest ``keep_recent`` versions:
+
+- ``stale-artifact``: older than their version's resume.yaml, which they
+  no longer match
+- ``expired-artifact``: untouched for ``max_age_days``
+
+Objects are shared by every project, so they are only collected when the
+state of every project could be read: a project whose state fails to
+load (or whose delta chains cannot be followed) may still refer to any
+of them.
+
+Every project lock is held while planning and deleting, so collection
+never races with a running create, import or pack. SQLite state is then
+checkpointed and vacuumed.
+"""
+
+import os
+import shutil
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from delta_store import DELTA_SUFFIX, chain_digests
+from object_store import OBJECTS_DIR
+from search_index import INDEX_FILE
+from state_utils import (
+    DB_FILE,
+    JOURNAL_FILE,
+    SUMMARY_FILE,
+    get_version_dir_name,
+    list_projects,
+    load_project_state,
+    open_project_db,
+    project_lock,
+    uses_sqlite,
+)
+from store_sync import MANIFEST_FILE
+
+# Generated by the formatter and safe to rebuild from resume.yaml
+ARTIFACT_SUFFIXES = {".typ", ".pdf"}
+
+KEEP_RECENT = 10
+MAX_AGE_DAYS = 30
+
+# Leave very fresh *.tmp files alone, in case a writer that does not take
+# the project lock (an older script) is still using them
+TMP_MIN_AGE = 600
+
+# Imports store their objects before taking the project lock (a bulk
+# import, for its whole run); put_object refreshes the mtime, and
+# unreferenced objects younger than this are kept
+OBJECT_MIN_AGE = 86400
+
+_VERSION_KINDS = {".yaml": "yaml", ".yml": "yaml", ".typ": "typ", ".pdf": "pdf", ".txt": "text"}
+
+
+@dataclass
+class FileRecord:
+    """A file found by the store scan."""
+
+    path: Path
+    size: int
+    mtime: float
+    inode: tuple[int, int]
+    project: Optional[str]  # None for store-level files and objects
+    version: Optional[str]  # version directory name, if inside one
+    kind: str
+
+
+def _kind(name: str, area: str) -> str:
+    if name.endswith(".tmp"):
+        return "tmp"
+    if area == "objects":
+        return "delta" if name.endswith(DELTA_SUFFIX) else "object"
+    if area == "sources":
+        return "source"
+    if area == "version":
+        return _VERSION_KINDS.get(os.path.splitext(name)[1].lower(), "other")
+    if name.endswith(".bak"):
+        return "backup"
+    if (name in ("project.json", "config.json", JOURNAL_FILE, SUMMARY_FILE, ".lock")
+            or name.startswith(DB_FILE)):
+        return "state"
+    if name.startswith(INDEX_FILE) or name == MANIFEST_FILE:
+        return "index"
+    return "other"
+
+
+def _scan_tree(root: str, project: Optional[str], version: Optional[str], area: str) -> list[FileRecord]:
+    """Recursively list files below ``root`` with os.scandir (stat results are reused)."""
+    records = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = list(os.scandir(current))
+        except FileNotFoundError:
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(entry.path)
+                continue
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except FileNotFoundError:
+                continue
+            records.append(FileRecord(
+                Path(entry.path), st.st_size, st.st_mtime, (st.st_dev, st.st_ino),
+                project, version, _kind(entry.name, area),
+            ))
+    return records
+
+
+def _scan_tasks(store_path: Path) -> list[tuple]:
+    """Split the store into independent subtrees to scan in parallel."""
+    tasks = []
+    for entry in os.scandir(store_path):
+        if entry.is_file(follow_symlinks=False):
+            tasks.append(("file", entry.path, None, None, "store"))
+        elif entry.name == OBJECTS_DIR:
+            tasks.extend(("tree", sub.path, None, None, "objects")
+                         for sub in os.scandir(entry.path) if sub.is_dir())
+            tasks.extend(("file", sub.path, None, None, "objects")
+                         for sub in os.scandir(entry.path) if sub.is_file())
+        elif entry.name == "projects":
+            for proj in os.scandir(entry.path):
+                if not proj.is_dir():
+                    continue
+                for sub in os.scandir(proj.path):
+                    if sub.name == "versions" and sub.is_dir():
+                        tasks.extend(("tree", v.path, proj.name, v.name, "version")
+                                     for v in os.scandir(sub.path) if v.is_dir())
+                    elif sub.is_dir():
+                        tasks.append(("tree", sub.path, proj.name, None, sub.name))
+                    else:
+                        tasks.append(("file", sub.path, proj.name, None, "project"))
+        elif entry.is_dir():
+            tasks.append(("tree", entry.path, None, None, "store"))
+    return tasks
+
+
+def _run_scan_task(task: tuple) -> list[FileRecord]:
+    kind, path, project, version, area = task
+    if kind == "tree":
+        return _scan_tree(path, project, version, area)
+    try:
+        st = os.stat(path, follow_symlinks=False)
+    except FileNotFoundError:
+        return []
+    name = os.path.basename(path)
+    return [FileRecord(Path(path), st.st_size, st.st_mtime, (st.st_dev, st.st_ino),
+                       project, version, _kind(name, area))]
+
+
+def scan_store(store_path: Path, jobs: Optional[int] = None) -> list[FileRecord]:
+    """List every file in the store, scanning subtrees on a thread pool."""
+    if not store_path.is_dir():
+        return []
+    tasks = _scan_tasks(store_path)
+    jobs = jobs or min(32, (os.cpu_count() or 1) * 4)
+    if jobs == 1:
+        return [r for task in tasks for r in _run_scan_task(task)]
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return [r for records in pool.map(_run_scan_task, tasks) for r in records]
+
+
+def usage_report(records: list[FileRecord]) -> dict:
+    """Sum sizes by project, kind and version.
+
+    ``total`` counts every path; ``unique`` counts hardlinked files once.
+    """
+    report = {"total": 0, "unique": 0, "files": len(records),
+              "by_project": {}, "by_kind": {}, "by_version": {}}
+    seen = set()
+    for r in records:
+        report["total"] += r.size
+        if r.inode not in seen:
+            seen.add(r.inode)
+            report["unique"] += r.size
+        project = r.project or "(store)"
+        report["by_project"][project] = report["by_project"].get(project, 0) + r.size
+        report["by_kind"][r.kind] = report["by_kind"].get(r.kind, 0) + r.size
+        if r.version:
+            key = f"{r.project}/{r.version}"
+            report["by_version"][key] = report["by_version"].get(key, 0) + r.size
+    return report
+
+
+def _version_dir_names(state: dict) -> dict[str, dict]:
+    return {get_version_dir_name(v["id"], v.get("tag")): v for v in state.get("versions", [])}
+
+
+def plan_gc(
+    store_path: Path,
+    records: list[FileRecord],
+    states: dict[str, dict],
+    keep_recent: int = KEEP_RECENT,
+    max_age_days: float = MAX_AGE_DAYS,
+    now: Optional[float] = None,
+    prune_artifacts: bool = False,
+    collect_objects: bool = True,
+) -> list[tuple[Path, str, int]]:
+    """Decide what to remove.
+
+    Args:
+        store_path: Store root
+        records: Result of scan_store()
+        states: Loaded state of every project
+        keep_recent: Keep generated artifacts of this many newest versions
+        max_age_days: Keep generated artifacts modified within this many days
+        now: Current time (for tests)
+        prune_artifacts: Also remove generated artifacts (stale or expired)
+            outside the retention policy
+        collect_objects: Remove unreferenced objects; pass False unless
+            ``states`` holds every project in the store
+
+    Returns:
+        List of (path, reason, size); orphaned version directories are
+        listed once, as the directory
+    """
+    now = time.time() if now is None else now
+    plan = []
+
+    dirs = {name: _version_dir_names(state) for name, state in states.items()}
+    active = {}
+    protected = {}
+    for name, state in states.items():
+        versions = state.get("versions", [])
+        active[name] = {
+            dirname for dirname, v in dirs[name].items() if v["id"] == state.get("active_version")
+        }
+        recent = versions[-keep_recent:] if keep_recent else []
+        protected[name] = active[name] | {
+            get_version_dir_name(v["id"], v.get("tag")) for v in recent
+        }
+
+    referenced_sources = {
+        (name, (v.get("source") or {}).get("file"))
+        for name, state in states.items() for v in state.get("versions", [])
+    }
+    referenced_objects = set()
+    for state in states.values():
+        for v in state.get("versions", []):
+            digest = (v.get("source") or {}).get("sha256")
+            if digest:
+                referenced_objects.add(digest)
+            if v.get("packed") and collect_objects:
+                try:
+                    referenced_objects.update(chain_digests(v["packed"]["sha256"], store_path))
+                except (OSError, ValueError, KeyError):
+                    # A broken chain hides what it refers to (fsck reports it)
+                    collect_objects = False
+
+    yaml_mtime = {(r.project, r.version): r.mtime for r in records
+                  if r.version and r.path.name == "resume.yaml"}
+    orphan_dirs = set()
+
+    for r in records:
+        if r.kind == "tmp":
+            if now - r.mtime >= TMP_MIN_AGE:
+                plan.append((r.path, "tmp", r.size))
+        elif r.kind in ("object", "delta"):
+            if not collect_objects or now - r.mtime < OBJECT_MIN_AGE:
+                continue
+            digest = r.path.parent.name + r.path.name.removesuffix(DELTA_SUFFIX)
+            if digest not in referenced_objects:
+                plan.append((r.path, "orphan-object", r.size))
+        elif r.project not in states:
+            continue
+        elif r.kind == "source":
+            if r.path.parent.name == "sources" and (r.project, r.path.name) not in referenced_sources:
+                plan.append((r.path, "orphan-source", r.size))
+        elif r.version is not None:
+            if r.version not in dirs[r.project]:
+                orphan_dirs.add((r.project, r.version))
+            elif (prune_artifacts and r.path.suffix.lower() in ARTIFACT_SUFFIXES
+                  and r.path.parent.name == r.version
+                  and r.version not in protected[r.project]):
+                source_mtime = yaml_mtime.get((r.project, r.version))
+                if source_mtime is not None and r.mtime < source_mtime:
+                    plan.append((r.path, "stale-artifact", r.size))
+                elif now - r.mtime > max_age_days * 86400:
+                    plan.append((r.path, "expired-artifact", r.size))
+
+    for project, version in sorted(orphan_dirs):
+        path = store_path / "projects" / project / "versions" / version
+        size = sum(r.size for r in records if r.project == project and r.version == version)
+        plan.append((path, "orphan-version", size))
+    return plan
+
+
+def compact_state(project: str, store_path: Path) -> int:
+    """Checkpoint and vacuum a SQLite project database.
+
+    Returns:
+        Bytes saved
+    """
+    if not uses_sqlite(project, store_path):
+        return 0
+    db_path = store_path / "projects" / project / DB_FILE
+    wal_path = db_path.with_name(DB_FILE + "-wal")
+
+    def size() -> int:
+        return sum(p.stat().st_size for p in (db_path, wal_path) if p.exists())
+
+    before = size()
+    with open_project_db(project, store_path) as db:
+        db.conn.execute("VACUUM")
+        db.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return max(0, before - size())
+
+
+def collect_garbage(
+    store_path: Path,
+    keep_recent: int = KEEP_RECENT,
+    max_age_days: float = MAX_AGE_DAYS,
+    dry_run: bool = False,
+    jobs: Optional[int] = None,
+    prune_artifacts: bool = False,
+) -> dict:
+    """Scan the store, report usage and remove garbage.
+
+    Args:
+        store_path: Store root
+        keep_recent: Retention policy for ``prune_artifacts``
+        max_age_days: Retention policy for ``prune_artifacts``
+        dry_run: Only plan; remove nothing
+        jobs: Parallel directory scanners
+        prune_artifacts: Also remove generated artifacts (stale or expired)
+            outside the retention policy
+
+    Returns:
+        Dict with "usage" (usage_report before collection), "removed"
+        (list of (path, reason, size)), "compacted" (bytes saved by
+        compacting state files) and "unreadable" (project -> error for
+        projects whose state could not be loaded; objects are then kept)
+    """
+    projects = list_projects(store_path)
+    with ExitStack() as locks:
+        # Sorted order, like every other multi-lock holder, avoids deadlocks
+        for project in sorted(projects):
+            locks.enter_context(project_lock(project, store_path))
+        states = {}
+        unreadable = {}
+        for project in projects:
+            try:
+                states[project] = load_project_state(project, store_path)
+            except (OSError, ValueError, sqlite3.Error) as e:
+                # Leave the project alone; its references are unknown
+                unreadable[project] = str(e)
+
+        records = scan_store(store_path, jobs)
+        plan = plan_gc(
+            store_path, records, states, keep_recent, max_age_days,
+            prune_artifacts=prune_artifacts, collect_objects=not unreadable,
+        )
+        compacted = 0
+        if not dry_run:
+            for path, reason, _ in plan:
+                if reason == "orphan-version":
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    path.unlink(missing_ok=True)
+                    if reason == "orphan-object":
+                        try:
+                            path.parent.rmdir()  # drop emptied fan-out dirs
+                        except OSError:
+                            pass
+            for project in states:
+                compacted += compact_state(project, store_path)
+
+    return {"usage": usage_report(records), "removed": plan, "compacted": compacted,
+            "unreadable": unreadable}
@@ -0,0 +1,235 @@
+"""Schema migrations for config.json and project state.
+
+config.json and each project's state record the schema version they were
+written with (``version``). A migration upgrades one schema version to
+the next; ``register`` adds it to the registry and ``migrate`` applies
+the chain from the stored version up to the current one
+(``CONFIG_SCHEMA_VERSION`` / ``PROJECT_SCHEMA_VERSION`` in state_utils).
+
+Reads never write: load_project_state upgrades older state in memory
+(with ``dry_run`` set). A project is upgraded on disk by the first
+change made to it, or up front by ``migrate_store``, which upgrades a
+whole store one project per thread. Each project is upgraded
+under its lock and saved in one atomic write (a project.json snapshot
+replaced by rename, or one SQLite transaction), so an interrupted
+migration leaves every project either old or fully upgraded.
+
+To change a storage format: bump the schema version in state_utils and
+register a migration from the previous version here. Migrations receive
+the full state dict and edit it in place. They must be idempotent, must
+not write files when ``ctx.dry_run`` is set, and should stay cheap then:
+every read of an older project runs them that way.
+"""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from object_store import add_file
+from state_utils import (
+    CONFIG_FILE,
+    CONFIG_SCHEMA_VERSION,
+    PROJECT_SCHEMA_VERSION,
+    get_project_path,
+    get_store_path,
+    list_projects,
+    project_lock,
+    read_project_state,
+    save_project_state,
+    update_config,
+)
+
+CURRENT_VERSIONS = {"config": CONFIG_SCHEMA_VERSION, "project": PROJECT_SCHEMA_VERSION}
+
+# Data written before schema versions were recorded
+UNVERSIONED = "1.0.0"
+
+
+@dataclass
+class MigrationContext:
+    """Where the data being migrated lives."""
+
+    store_path: Path
+    project: Optional[str] = None
+    dry_run: bool = False
+
+
+# kind -> from_version -> (to_version, migration)
+Migration = Callable[[dict, MigrationContext], Optional[str]]
+MIGRATIONS: dict[str, dict[str, tuple[str, Migration]]] = {"config": {}, "project": {}}
+
+
+def register(kind: str, from_version: str, to_version: str) -> Callable[[Migration], Migration]:
+    """Register a migration from one schema version to the next.
+
+    The decorated function takes (data, ctx), edits data in place and may
+    return a short description of what it changed.
+    """
+    def decorator(fn: Migration) -> Migration:
+        if from_version in MIGRATIONS[kind]:
+            raise ValueError(f"Duplicate {kind} migration from {from_version}")
+        MIGRATIONS[kind][from_version] = (to_version, fn)
+        return fn
+
+    return decorator
+
+
+def _version_key(version: str) -> tuple:
+    try:
+        return tuple(int(part) for part in version.split("."))
+    except ValueError:
+        return ()
+
+
+def plan(kind: str, version: Optional[str]) -> list[tuple[str, str, Migration]]:
+    """Return the migrations that upgrade ``version`` to the current schema.
+
+    Returns:
+        List of (from_version, to_version, migration), in order
+
+    Raises:
+        ValueError: If the version is newer than the current schema or no
+            migration path leads from it
+    """
+    current = CURRENT_VERSIONS[kind]
+    version = version or UNVERSIONED
+    steps = []
+    while version != current:
+        if version not in MIGRATIONS[kind]:
+            if _version_key(version) > _version_key(current):
+                raise ValueError(
+                    f"{kind.capitalize()} schema {version} is newer than this version of "
+                    f"resume-state supports ({current}); upgrade resume-state"
+                )
+            raise ValueError(f"No migration from {kind} schema {version} to {current}")
+        to_version, fn = MIGRATIONS[kind][version]
+        steps.append((version, to_version, fn))
+        version = to_version
+    return steps
+
+
+def migrate(
+    kind: str,
+    data: dict,
+    store_path: Path,
+    project: Optional[str] = None,
+    dry_run: bool = False,
+) -> list[str]:
+    """Upgrade ``data`` in place to the current schema.
+
+    Args:
+        kind: "config" or "project"
+        data: config.json contents or a project's full state
+        store_path: Store root
+        project: Project name (for project state)
+        dry_run: Compute the upgrade without writing any files
+
+    Returns:
+        One line per migration applied (empty if already current)
+    """
+    ctx = MigrationContext(store_path, project, dry_run)
+    applied = []
+    for from_version, to_version, fn in plan(kind, data.get("version")):
+        note = fn(data, ctx)
+        data["version"] = to_version
+        applied.append(f"{from_version} -> {to_version}" + (f": {note}" if note else ""))
+    return applied
+
+
+def upgrade_project(
+    project: str, store_path: Optional[Path] = None, dry_run: bool = False
+) -> Optional[dict]:
+    """Upgrade one project's state to the current schema and save it.
+
+    Returns:
+        Dict with "project", "from", "to" and "steps", or None if the
+        project is already current
+    """
+    if store_path is None:
+        store_path = get_store_path()
+    with project_lock(project, store_path):
+        state = read_project_state(project, store_path)
+        from_version = state.get("version") or UNVERSIONED
+        if from_version == PROJECT_SCHEMA_VERSION:
+            return None
+        steps = migrate("project", state, store_path, project, dry_run)
+        if not dry_run:
+            save_project_state(project, state, store_path)
+    return {"project": project, "from": from_version, "to": PROJECT_SCHEMA_VERSION, "steps": steps}
+
+
+def migrate_store(
+    store_path: Path,
+    projects: Optional[list[str]] = None,
+    dry_run: bool = False,
+    jobs: Optional[int] = None,
+) -> dict:
+    """Upgrade config.json and every project in the store.
+
+    Args:
+        store_path: Store root
+        projects: Only upgrade these projects (default: all)
+        dry_run: Report what would change without writing anything
+        jobs: Projects upgraded in parallel (default: CPU count + 4, max 32)
+
+    Returns:
+        Dict with "config" (upgrade of config.json or None) and
+        "projects" (one dict per upgraded project, see upgrade_project)
+
+    Raises:
+        FileNotFoundError: If a requested project does not exist
+        ValueError: If some data uses a schema this code cannot upgrade
+    """
+    names = list_projects(store_path) if projects is None else projects
+    for project in names:
+        if not get_project_path(project, store_path).is_dir():
+            raise FileNotFoundError(f"Project not found: {project}")
+
+    config_result = None
+    config_file = store_path / CONFIG_FILE
+    if config_file.exists():
+        stored = json.loads(config_file.read_text()).get("version") or UNVERSIONED
+        if stored != CONFIG_SCHEMA_VERSION:
+            plan("config", stored)
+            config_result = {"from": stored, "to": CONFIG_SCHEMA_VERSION}
+            if not dry_run:
+                # load_config upgrades in memory; saving writes it back atomically
+                update_config(lambda config: None, store_path)
+
+    jobs = jobs or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(names) or 1))) as pool:
+        results = pool.map(lambda p: upgrade_project(p, store_path, dry_run), names)
+        upgraded = [r for r in results if r is not None]
+    return {"config": config_result, "projects": upgraded}
+
+
+# =============================================================================
+# MIGRATIONS
+# =============================================================================
+
+@register("project", "1.0.0", "1.1.0")
+def _store_import_sources(state: dict, ctx: MigrationContext) -> Optional[str]:
+    """Move imported sources into the object store and record their SHA-256.
+
+    Stores from before the object store kept each source as a plain copy
+    with no digest, so fsck could not verify it and identical files were
+    stored once per import.
+    """
+    sources = get_project_path(ctx.project, ctx.store_path) / "sources"
+    count = 0
+    for entry in state.get("versions", []):
+        source = entry.get("source") or {}
+        if source.get("type") != "import" or source.get("sha256") or not source.get("file"):
+            continue
+        path = sources / source["file"]
+        if not path.is_file():
+            # fsck reports the missing source
+            continue
+        if not ctx.dry_run:
+            # Without the object, a recorded digest would read as missing
+            source["sha256"] = add_file(path, path, ctx.store_path, mutable=False)
+        count += 1
+    return f"recorded SHA-256 of {count} imported source(s)" if count else None
@@ -0,0 +1,470 @@
+"""Incremental sync from one version store into another.
+
+``sync_stores(src, dst)`` brings everything in ``src`` into ``dst``
+without removing anything from ``dst``:
+
+- Objects are content-addressed, so one missing from ``dst`` by name is
+  a new blob and is copied. Existing objects are never read.
+- Other files (version directories, sources, cached job postings) are
+  compared by SHA-256. Each store keeps a manifest cache
+  (``sync-manifest.json``) of size, mtime and hash per file, so only
+  files that changed since the last sync are hashed again. A file that
+  differs on both sides is taken from ``src`` only if it is newer there.
+- Version lists are merged by id and creation time. An entry with the
+  same id and ``created_at`` on both sides is the same version. A new
+  version keeps its id if ``dst`` does not use it yet; otherwise it is
+  renumbered to the next free id, and its parent and source file names
+  are remapped. It records ``origin`` (``<id>@<created_at>`` in the store
+  it was created in), so later syncs in either direction match it up
+  instead of copying it again.
+
+Sync is resumable. Files are written to a temporary name and renamed into
+place, and a project's new versions are recorded only after all their
+files are in place. An interrupted sync leaves no half-written file or
+dangling entry, and rerunning it skips whatever was already copied.
+Manifests are saved after each project. Project state files are never
+copied: entries are recorded through the destination's own backend.
+"""
+
+import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from init_project import init_project
+from object_store import OBJECTS_DIR, copy_file, object_path
+from search_index import update_index
+from state_utils import (
+    DB_FILE,
+    JOURNAL_FILE,
+    LOCK_FILE,
+    PROJECT_FILE,
+    get_project_path,
+    get_version_dir_name,
+    insert_versions,
+    list_projects,
+    load_project_state,
+    parse_version_id,
+    project_lock,
+    set_active_version,
+    update_project_state,
+    uses_sqlite,
+)
+from store_fsck import hash_files
+
+MANIFEST_FILE = "sync-manifest.json"
+MANIFEST_SCHEMA_VERSION = 1
+
+# Project files that hold state; entries are merged instead
+_STATE_FILES = {PROJECT_FILE, JOURNAL_FILE, LOCK_FILE}
+
+# Source fields that name other versions of the same project
+_VERSION_REFS = ("rebased_from", "merge_base")
+
+
+@dataclass
+class SyncStats:
+    """What a sync did (or would do, in a dry run)."""
+
+    objects_copied: int = 0
+    files_copied: int = 0
+    files_unchanged: int = 0
+    bytes_copied: int = 0
+    versions_added: int = 0
+    projects_created: list[str] = field(default_factory=list)
+    renumbered: list[tuple[str, str, str]] = field(default_factory=list)  # project, src id, dst id
+    kept_newer: list[str] = field(default_factory=list)  # dst paths newer than src's copy
+
+    def to_dict(self) -> dict:
+        return {
+            "objects_copied": self.objects_copied,
+            "files_copied": self.files_copied,
+            "files_unchanged": self.files_unchanged,
+            "bytes_copied": self.bytes_copied,
+            "versions_added": self.versions_added,
+            "projects_created": self.projects_created,
+            "renumbered": [
+                {"project": p, "from": a, "to": b} for p, a, b in self.renumbered
+            ],
+            "kept_newer": self.kept_newer,
+        }
+
+
+class Manifest:
+    """Cached content hashes of a store's files, keyed by relative path."""
+
+    def __init__(self, store_path: Path):
+        self.store_path = store_path
+        self.path = store_path / MANIFEST_FILE
+        self.files: dict[str, list] = {}
+        try:
+            data = json.loads(self.path.read_text())
+            if data.get("version") == MANIFEST_SCHEMA_VERSION:
+                self.files = data["files"]
+        except (FileNotFoundError, ValueError, KeyError):
+            pass
+
+    def digests(self, relpaths: list[str], jobs: Optional[int] = None) -> dict[str, Optional[str]]:
+        """SHA-256 of each file (None if missing), hashing only changed files."""
+        result: dict[str, Optional[str]] = {}
+        stale = {}
+        for rel in relpaths:
+            try:
+                st = os.stat(self.store_path / rel)
+            except FileNotFoundError:
+                result[rel] = None
+                self.files.pop(rel, None)
+                continue
+            cached = self.files.get(rel)
+            if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+                result[rel] = cached[2]
+            else:
+                stale[rel] = st
+        hashed = hash_files([self.store_path / rel for rel in stale], jobs)
+        for rel, st in stale.items():
+            digest, _ = hashed[self.store_path / rel]
+            result[rel] = digest
+            if digest is not None:
+                self.files[rel] = [st.st_size, st.st_mtime_ns, digest]
+        return result
+
+    def record(self, rel: str, digest: str) -> None:
+        """Remember the hash of a file just written."""
+        st = os.stat(self.store_path / rel)
+        self.files[rel] = [st.st_size, st.st_mtime_ns, digest]
+
+    def save(self) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.store_path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"version": MANIFEST_SCHEMA_VERSION, "files": self.files}, f,
+                          separators=(",", ":"))
+            Path(tmp_path).replace(self.path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+def origin_key(entry: dict) -> str:
+    """Identity of a version across stores."""
+    return entry.get("origin") or f"{entry['id']}@{entry.get('created_at')}"
+
+
+def _copy_atomic(src: Path, dst: Path, read_only: bool = False) -> None:
+    """Copy ``src`` over ``dst`` through a temporary file."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=dst.parent, suffix=".tmp")
+    os.close(fd)
+    tmp = Path(tmp_name)
+    try:
+        copy_file(src, tmp)
+        if read_only:
+            os.chmod(tmp, 0o444)
+        tmp.replace(dst)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _run(fn, tasks: list, jobs: Optional[int]) -> None:
+    jobs = jobs or min(32, (os.cpu_count() or 1) * 4)
+    if jobs == 1 or len(tasks) < 2:
+        for task in tasks:
+            fn(*task)
+        return
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for _ in pool.map(lambda task: fn(*task), tasks):
+            pass
+
+
+def _list_objects(store_path: Path) -> dict[str, int]:
+    """Object file names (``ab/cdef...``, deltas included) with their sizes."""
+    root = store_path / OBJECTS_DIR
+    found = {}
+    if not root.is_dir():
+        return found
+    for fan in os.scandir(root):
+        if not fan.is_dir():
+            continue
+        for entry in os.scandir(fan.path):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                found[f"{fan.name}/{entry.name}"] = entry.stat().st_size
+    return found
+
+
+def sync_objects(src: Path, dst: Path, stats: SyncStats, dry_run: bool, jobs: Optional[int]) -> None:
+    """Copy objects missing from ``dst``."""
+    have = set(_list_objects(dst))
+    missing = [(name, size) for name, size in _list_objects(src).items() if name not in have]
+    stats.objects_copied += len(missing)
+    stats.bytes_copied += sum(size for _, size in missing)
+    if not dry_run:
+        _run(lambda name: _copy_atomic(src / OBJECTS_DIR / name, dst / OBJECTS_DIR / name,
+                                       read_only=True),
+             [(name,) for name, _ in missing], jobs)
+
+
+def _project_files(project_path: Path) -> list[str]:
+    """Files of a project below its directory, except state files."""
+    files = []
+    for root, dirs, names in os.walk(project_path):
+        for name in names:
+            if (name in _STATE_FILES or name.startswith(DB_FILE)
+                    or name.endswith((".tmp", ".bak"))):
+                continue
+            files.append(os.path.relpath(os.path.join(root, name), project_path))
+    return files
+
+
+def _owner(rel: str) -> Optional[str]:
+    """The version dir or source a project-relative path belongs to, if any."""
+    parts = rel.split(os.sep)
+    if parts[0] == "versions" and len(parts) > 2:
+        return os.path.join(parts[0], parts[1])
+    if parts[0] == "sources":
+        return rel
+    return None
+
+
+class _ProjectSync:
+    def __init__(self, project: str, src: Path, dst: Path, manifests: tuple[Manifest, Manifest],
+                 stats: SyncStats, dry_run: bool, jobs: Optional[int]):
+        self.project = project
+        self.src, self.dst = src, dst
+        self.src_manifest, self.dst_manifest = manifests
+        self.stats = stats
+        self.dry_run = dry_run
+        self.jobs = jobs
+
+    def plan_versions(self, src_state: dict, dst_state: dict) -> tuple[dict, list[dict]]:
+        """Map src ids to dst ids and build the entries new to ``dst``.
+
+        Returns:
+            Tuple of (src id -> dst id, new entries for dst)
+        """
+        by_key = {origin_key(v): v["id"] for v in dst_state.get("versions", [])}
+        id_map, new = {}, []
+        for entry in src_state.get("versions", []):
+            if origin_key(entry) in by_key:
+                id_map[entry["id"]] = by_key[origin_key(entry)]
+            else:
+                new.append(entry)
+
+        # New versions keep their ids where free; the rest go after all of them
+        taken = {v["id"] for v in dst_state.get("versions", [])}
+        # IDs of versions undone in DST are retired there (see get_next_version_id)
+        retired = dst_state.get("version_high_water", 0)
+        collided = []
+        for entry in new:
+            num = parse_version_id(entry["id"]) if entry["id"][1:].isdigit() else None
+            if entry["id"] in taken or (num is not None and num <= retired):
+                collided.append(entry)
+            else:
+                id_map[entry["id"]] = entry["id"]
+                taken.add(entry["id"])
+        next_num = max((parse_version_id(vid) for vid in taken if vid[1:].isdigit()),
+                       default=0)
+        next_num = max(next_num, retired) + 1
+        for entry in collided:
+            id_map[entry["id"]] = f"v{next_num}"
+            self.stats.renumbered.append((self.project, entry["id"], f"v{next_num}"))
+            next_num += 1
+
+        entries = []
+        for entry in new:
+            copy = json.loads(json.dumps(entry))
+            copy["id"] = id_map[entry["id"]]
+            if copy["id"] != entry["id"]:
+                copy["origin"] = origin_key(entry)
+            copy["parent"] = id_map.get(entry.get("parent"), entry.get("parent"))
+            source = copy.get("source") or {}
+            for ref in _VERSION_REFS:
+                if ref in source:
+                    source[ref] = id_map.get(source[ref], source[ref])
+            name = source.get("file")
+            if name and copy["id"] != entry["id"] and name.startswith(f"{entry['id']}_"):
+                source["file"] = f"{copy['id']}_{name[len(entry['id']) + 1:]}"
+            entries.append(copy)
+        return id_map, entries
+
+    def path_map(self, src_state: dict, dst_versions: dict, id_map: dict,
+                 new: dict) -> dict[str, str]:
+        """Map src project-relative paths of renamed version dirs and sources."""
+        renames = {}
+        for entry in src_state.get("versions", []):
+            dst_entry = dst_versions.get(id_map[entry["id"]]) or new[id_map[entry["id"]]]
+            src_dir = get_version_dir_name(entry["id"], entry.get("tag"))
+            dst_dir = get_version_dir_name(dst_entry["id"], dst_entry.get("tag"))
+            if src_dir != dst_dir:
+                renames[os.path.join("versions", src_dir)] = os.path.join("versions", dst_dir)
+            src_file = (entry.get("source") or {}).get("file")
+            dst_file = (dst_entry.get("source") or {}).get("file")
+            if src_file and dst_file and src_file != dst_file:
+                renames[os.path.join("sources", src_file)] = os.path.join("sources", dst_file)
+        return renames
+
+    @staticmethod
+    def _rename(rel: str, renames: dict) -> str:
+        owner = _owner(rel)
+        if owner in renames:
+            return renames[owner] + rel[len(owner):]
+        return rel
+
+    def sync_files(self, src_state: dict, renames: dict, dst_versions: dict) -> None:
+        src_project = get_project_path(self.project, self.src)
+        dst_project = get_project_path(self.project, self.dst)
+        # Orphaned version dirs and sources stay behind: their names may
+        # belong to different versions in dst
+        owned = {
+            os.path.join("versions", get_version_dir_name(v["id"], v.get("tag")))
+            for v in src_state.get("versions", [])
+        } | {
+            os.path.join("sources", v["source"]["file"])
+            for v in src_state.get("versions", []) if (v.get("source") or {}).get("file")
+        }
+        pairs = [
+            (rel, self._rename(rel, renames)) for rel in _project_files(src_project)
+            if _owner(rel) is None or _owner(rel) in owned
+        ]
+
+        prefix = os.path.join("projects", self.project)
+        src_digests = self.src_manifest.digests([os.path.join(prefix, a) for a, _ in pairs], self.jobs)
+        dst_digests = self.dst_manifest.digests([os.path.join(prefix, b) for _, b in pairs], self.jobs)
+
+        # A packed version's resume.yaml is already in dst if the digests match
+        packed = {
+            os.path.join("versions", get_version_dir_name(v["id"], v.get("tag")), "resume.yaml"):
+                v["packed"]["sha256"]
+            for v in dst_versions.values() if v.get("packed")
+        }
+
+        tasks = []
+        for a, b in pairs:
+            digest = src_digests[os.path.join(prefix, a)]
+            if digest is None:
+                continue
+            existing = dst_digests[os.path.join(prefix, b)]
+            if existing == digest or (existing is None and packed.get(b) == digest):
+                self.stats.files_unchanged += 1
+                continue
+            if existing is not None:
+                if os.stat(dst_project / b).st_mtime_ns >= os.stat(src_project / a).st_mtime_ns:
+                    self.stats.kept_newer.append(os.path.join(prefix, b))
+                    continue
+            self.stats.files_copied += 1
+            self.stats.bytes_copied += os.stat(src_project / a).st_size
+            tasks.append((a, b, digest))
+
+        if self.dry_run:
+            return
+
+        def copy(a: str, b: str, digest: str) -> None:
+            target = dst_project / b
+            # Immutable sources share the destination's object where it has one
+            if b.startswith("sources" + os.sep) and object_path(digest, self.dst).exists():
+                target.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=target.parent, suffix=".tmp")
+                os.close(fd)
+                os.unlink(tmp_name)
+                try:
+                    os.link(object_path(digest, self.dst), tmp_name)
+                    Path(tmp_name).replace(target)
+                    return
+                except OSError:
+                    Path(tmp_name).unlink(missing_ok=True)
+            _copy_atomic(src_project / a, target)
+
+        _run(copy, tasks, self.jobs)
+        for _, b, digest in tasks:
+            self.dst_manifest.record(os.path.join(prefix, b), digest)
+
+    def run(self, created: bool) -> None:
+        src_state = load_project_state(self.project, self.src)
+        if created and self.dry_run:
+            dst_state = {"versions": []}
+        else:
+            dst_state = load_project_state(self.project, self.dst)
+
+        id_map, entries = self.plan_versions(src_state, dst_state)
+        dst_versions = {v["id"]: v for v in dst_state.get("versions", [])}
+        renames = self.path_map(src_state, dst_versions, id_map, {e["id"]: e for e in entries})
+        self.sync_files(src_state, renames, dst_versions)
+        self.stats.versions_added += len(entries)
+        if self.dry_run:
+            return
+
+        # Files are in place: now the entries may point at them
+        insert_versions(self.project, entries, self.dst)
+        if created:
+            metadata = src_state.get("metadata") or {}
+            if metadata:
+                update_project_state(self.project, lambda s: s.update(metadata=metadata), self.dst)
+            active = src_state.get("active_version")
+            if active in id_map:
+                set_active_version(self.project, id_map[active], self.dst)
+        if entries:
+            update_index(self.project, self.dst)
+
+
+def sync_stores(
+    src: Path,
+    dst: Path,
+    projects: Optional[list[str]] = None,
+    dry_run: bool = False,
+    jobs: Optional[int] = None,
+) -> SyncStats:
+    """Copy what ``dst`` lacks from ``src`` and merge project version lists.
+
+    Args:
+        src: Source store root
+        dst: Destination store root (created if missing)
+        projects: Only sync these projects (default: all in ``src``);
+            objects are always synced
+        dry_run: Report what would be copied without writing anything
+        jobs: Parallel copies and hashes (default: 4 per CPU, max 32)
+
+    Returns:
+        SyncStats
+
+    Raises:
+        FileNotFoundError: If ``src`` or a requested project does not exist
+        ValueError: If ``src`` and ``dst`` are the same store
+    """
+    if not src.is_dir():
+        raise FileNotFoundError(f"No resume store found at {src}")
+    if dst.exists() and src.resolve() == dst.resolve():
+        raise ValueError("Source and destination are the same store")
+    names = list_projects(src) if projects is None else projects
+    for name in names:
+        if not get_project_path(name, src).is_dir():
+            raise FileNotFoundError(f"Project not found in {src}: {name}")
+
+    stats = SyncStats()
+    if not dry_run:
+        (dst / "projects").mkdir(parents=True, exist_ok=True)
+    src_manifest = Manifest(src)
+    dst_manifest = Manifest(dst)
+
+    # Objects first, so packed entries and source links resolve on arrival
+    sync_objects(src, dst, stats, dry_run, jobs)
+    for name in names:
+        created = not get_project_path(name, dst).is_dir()
+        if created:
+            stats.projects_created.append(name)
+            if not dry_run:
+                backend = "sqlite" if uses_sqlite(name, src) else "json"
+                init_project(name, set_active=False, backend=backend, store_path=dst)
+        with ExitStack() as locks:
+            # One global order (by path), so opposite syncs cannot deadlock
+            for store in sorted((src, dst), key=lambda store: str(get_project_path(name, store))):
+                if get_project_path(name, store).is_dir():
+                    locks.enter_context(project_lock(name, store))
+            _ProjectSync(name, src, dst, (src_manifest, dst_manifest), stats, dry_run, jobs).run(created)
+        if not dry_run:
+            src_manifest.save()
+            dst_manifest.save()
+    return stats
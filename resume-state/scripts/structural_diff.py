@@ -0,0 +1,288 @@
+"""Structural, section-aware diff of resume data.
+
+Line diffs of YAML are noisy: re-indenting a block or moving a bullet
+shows up as large hunks. This module diffs the parsed data instead:
+
+- Mappings are compared key by key.
+- Lists of records (experience, positions, education, ...) are matched
+  by identity (company, title, institution, name, ...). Records whose
+  identity changed are then paired by similarity, so a renamed company
+  is reported as a change, not a removal plus an addition.
+- Lists of strings (bullets, skills) are matched exactly first, then the
+  remaining ones by similarity, so a reworded bullet is one change.
+- Matched items that changed order are reported as moves.
+
+Unchanged subtrees are skipped with one equality check, and every other
+step is linear apart from the similarity pairing of leftovers, which is
+capped (see ``MAX_FUZZY_PAIRS``). The diff costs a fraction of parsing;
+parsed documents are cached by content, so sweeping a history parses
+each version once.
+"""
+
+import difflib
+import json
+from bisect import bisect_left
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Optional
+
+import yaml
+
+_Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Fields that identify a record in a list, in order of preference
+IDENTITY_FIELDS = ("company", "institution", "organization", "title", "name", "language")
+
+# Minimum similarity (0-1) for two unmatched items to count as one changed item
+SIMILARITY_THRESHOLD = 0.6
+
+# Above this many leftover pairs, skip similarity pairing (report add/remove)
+MAX_FUZZY_PAIRS = 10_000
+
+
+@dataclass
+class Change:
+    """A single structural change."""
+
+    op: str  # "added", "removed", "changed" or "moved"
+    path: str
+    old: Any = None
+    new: Any = None
+
+
+@lru_cache(maxsize=128)
+def parse_resume_text(text: str) -> Any:
+    """Parse resume YAML (cached by content; treat the result as read-only)."""
+    return yaml.load(text, Loader=_Loader)
+
+
+def identity_field(*lists: list) -> Optional[str]:
+    """The field that identifies records across these lists, if they are records."""
+    items = [item for items in lists for item in items]
+    if not items or not all(isinstance(item, dict) for item in items):
+        return None
+    for name in IDENTITY_FIELDS:
+        if all(name in item for item in items):
+            return name
+    return None
+
+
+def _norm(value: Any) -> str:
+    return " ".join(str(value).split()).casefold()
+
+
+def similarity(a: Any, b: Any) -> float:
+    """Similarity ratio (0-1) of two values' text."""
+    a = a if isinstance(a, str) else json.dumps(a, sort_keys=True, default=str)
+    b = b if isinstance(b, str) else json.dumps(b, sort_keys=True, default=str)
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    if matcher.real_quick_ratio() < SIMILARITY_THRESHOLD:
+        return 0.0
+    if matcher.quick_ratio() < SIMILARITY_THRESHOLD:
+        return 0.0
+    return matcher.ratio()
+
+
+def _pair_similar(old: list, new: list, key) -> list[tuple[int, int]]:
+    """Greedily pair leftover items (by index) whose similarity clears the threshold."""
+    if not old or not new or len(old) * len(new) > MAX_FUZZY_PAIRS:
+        return []
+    scored = []
+    for i, a in old:
+        for j, b in new:
+            score = similarity(key(a), key(b))
+            if score >= SIMILARITY_THRESHOLD:
+                scored.append((score, i, j))
+    scored.sort(key=lambda s: (-s[0], s[1], s[2]))
+    used_old, used_new, pairs = set(), set(), []
+    for _, i, j in scored:
+        if i not in used_old and j not in used_new:
+            used_old.add(i)
+            used_new.add(j)
+            pairs.append((i, j))
+    return pairs
+
+
+def _in_order(pairs: list[tuple[int, int]]) -> set[tuple[int, int]]:
+    """Pairs on a longest run that keeps its relative order (the rest moved)."""
+    pairs = sorted(pairs, key=lambda p: p[1])
+    tails: list[int] = []
+    tail_idx: list[int] = []
+    prev = [-1] * len(pairs)
+    for k, (i, _) in enumerate(pairs):
+        pos = bisect_left(tails, i)
+        if pos == len(tails):
+            tails.append(i)
+            tail_idx.append(k)
+        else:
+            tails[pos] = i
+            tail_idx[pos] = k
+        prev[k] = tail_idx[pos - 1] if pos else -1
+    keep = set()
+    k = tail_idx[-1] if tail_idx else -1
+    while k >= 0:
+        keep.add(pairs[k])
+        k = prev[k]
+    return keep
+
+
+def _label(item: Any, field: Optional[str], index: int) -> str:
+    if field is not None:
+        return f"[{item[field]}]"
+    return f"[{index}]"
+
+
+def match_items(a: list, b: list, field: Optional[str]) -> list[tuple[int, int]]:
+    """Pair items of two lists (by index) that are the same item.
+
+    Items are matched by ``field`` (see identity_field) or by value,
+    first come first served; the leftovers are then paired by similarity.
+    """
+    def key(item):
+        if field is not None:
+            return _norm(item[field])
+        if isinstance(item, (dict, list)):
+            return json.dumps(item, sort_keys=True, default=str)
+        return _norm(item)
+
+    # Exact matches by key, first come first served
+    positions: dict[str, list[int]] = {}
+    for i, item in enumerate(a):
+        positions.setdefault(key(item), []).append(i)
+    pairs = []
+    matched_old = set()
+    for j, item in enumerate(b):
+        candidates = positions.get(key(item))
+        if candidates:
+            i = candidates.pop(0)
+            matched_old.add(i)
+            pairs.append((i, j))
+    matched_new = {j for _, j in pairs}
+
+    left_old = [(i, a[i]) for i in range(len(a)) if i not in matched_old]
+    left_new = [(j, b[j]) for j in range(len(b)) if j not in matched_new]
+    fuzzy_key = (lambda item: str(item[field])) if field is not None else (lambda item: item)
+    return pairs + _pair_similar(left_old, left_new, fuzzy_key)
+
+
+def _diff_list(a: list, b: list, path: str, changes: list[Change]) -> None:
+    field = identity_field(a, b)
+    pairs = match_items(a, b, field)
+    matched_old = {i for i, _ in pairs}
+    matched_new = {j for _, j in pairs}
+
+    ordered = _in_order(pairs)
+    for i, j in sorted(pairs, key=lambda p: p[1]):
+        item_path = path + _label(b[j], field, j)
+        if (i, j) not in ordered:
+            changes.append(Change("moved", item_path, old=i, new=j))
+        _diff(a[i], b[j], item_path, changes)
+    for i in range(len(a)):
+        if i not in matched_old:
+            changes.append(Change("removed", path + _label(a[i], field, i), old=a[i]))
+    for j in range(len(b)):
+        if j not in matched_new:
+            changes.append(Change("added", path + _label(b[j], field, j), new=b[j]))
+
+
+def _diff(a: Any, b: Any, path: str, changes: list[Change]) -> None:
+    if a == b:
+        # Unchanged subtrees (most of a tailored resume) are skipped in C
+        return
+    if isinstance(a, dict) and isinstance(b, dict):
+        for k in b:
+            sub = f"{path}.{k}" if path else str(k)
+            if k not in a:
+                changes.append(Change("added", sub, new=b[k]))
+            else:
+                _diff(a[k], b[k], sub, changes)
+        for k in a:
+            if k not in b:
+                changes.append(Change("removed", f"{path}.{k}" if path else str(k), old=a[k]))
+    elif isinstance(a, list) and isinstance(b, list):
+        _diff_list(a, b, path, changes)
+    else:
+        changes.append(Change("changed", path, old=a, new=b))
+
+
+def diff_data(a: Any, b: Any) -> list[Change]:
+    """Structurally diff two parsed resumes (or any YAML values)."""
+    changes: list[Change] = []
+    _diff(a, b, "", changes)
+    return changes
+
+
+def diff_texts(text_a: str, text_b: str) -> list[Change]:
+    """Structurally diff two resume YAML documents."""
+    if text_a == text_b:
+        return []
+    return diff_data(parse_resume_text(text_a), parse_resume_text(text_b))
+
+
+def _collect_facts(value: Any, path: str, facts: set) -> None:
+    if isinstance(value, dict):
+        for k, v in value.items():
+            _collect_facts(v, f"{path}.{k}" if path else str(k), facts)
+    elif isinstance(value, list):
+        # Positions are dropped, so moving an item does not change any fact
+        for item in value:
+            _collect_facts(item, f"{path}[]", facts)
+    else:
+        facts.add((path, _norm(value)))
+
+
+@lru_cache(maxsize=128)
+def resume_facts(text: str) -> frozenset:
+    """Leaf facts of a resume as (path, value) pairs (cached by content).
+
+    List positions are not part of the path, so reordering a resume does
+    not change its facts, and renaming a company changes one fact rather
+    than every fact under it.
+    """
+    facts: set = set()
+    _collect_facts(parse_resume_text(text), "", facts)
+    return frozenset(facts)
+
+
+def fact_similarity(a: frozenset, b: frozenset) -> float:
+    """Jaccard similarity (0-1) of two fact sets."""
+    if not a and not b:
+        return 1.0
+    common = len(a & b)
+    return common / (len(a) + len(b) - common)
+
+
+def summarize(changes: list[Change]) -> dict[str, int]:
+    """Count changes by operation."""
+    counts = {"added": 0, "removed": 0, "changed": 0, "moved": 0}
+    for change in changes:
+        counts[change.op] += 1
+    return counts
+
+
+def _short(value: Any, width: int = 70) -> str:
+    text = value if isinstance(value, str) else json.dumps(value, default=str)
+    text = " ".join(text.split())
+    return text if len(text) <= width else text[: width - 3] + "..."
+
+
+def format_changes(changes: list[Change]) -> str:
+    """Render changes as human-readable lines (+ added, - removed, ~ changed, > moved)."""
+    lines = []
+    for c in changes:
+        if c.op == "added":
+            lines.append(f"+ {c.path}: {_short(c.new)}")
+        elif c.op == "removed":
+            lines.append(f"- {c.path}: {_short(c.old)}")
+        elif c.op == "moved":
+            lines.append(f"> {c.path}: moved from position {c.old + 1} to {c.new + 1}")
+        else:
+            lines.append(f"~ {c.path}:")
+            lines.append(f"    - {_short(c.old)}")
+            lines.append(f"    + {_short(c.new)}")
+    return "\n".join(lines)
+
+
+def changes_to_json(changes: list[Change]) -> list[dict]:
+    """Convert changes to JSON-serializable dicts."""
+    return [asdict(c) for c in changes]
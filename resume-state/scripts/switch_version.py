@@ -4,39 +4,35 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from delta_store import ensure_version_yaml
 from state_utils import (
     get_store_path,
-    get_version_entry,
-    get_version_path,
-    load_project_state,
+    get_version,
     resolve_project,
-    save_project_state,
+    set_active_version,
 )
 
 
-def switch_version(project: str, version_id: str) -> Path:
+def switch_version(project: str, version_id: str, store_path: Optional[Path] = None) -> Path:
     """Switch to a different version.
 
     Returns:
         Path to the new active version's YAML
     """
-    store_path = get_store_path()
-    state = load_project_state(project, store_path)
-
-    version_entry = get_version_entry(state, version_id)
+    if store_path is None:
+        store_path = get_store_path()
+    version_entry = get_version(project, version_id, store_path)
     if not version_entry:
         raise ValueError(f"Version not found: {version_id}")
 
-    state["active_version"] = version_id
-    save_project_state(project, state, store_path)
+    set_active_version(project, version_id, store_path)
 
-    version_path = get_version_path(
-        project, version_id, version_entry.get("tag"), store_path
-    )
-    return version_path / "resume.yaml"
+    # Unpacks the YAML if pack_versions.py stored it as a delta
+    return ensure_version_yaml(project, version_entry, store_path)
 
 
 def main():
@@ -49,8 +45,9 @@ def main():
     args = parser.parse_args()
 
     try:
-        project = resolve_project(args.project)
-        yaml_path = switch_version(project, args.version)
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+        yaml_path = switch_version(project, args.version, store_path)
         print(f"Switched to {args.version}")
         print(f"  YAML: {yaml_path}")
 
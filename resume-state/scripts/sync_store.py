@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Sync one version store into another.
+
+Copies the objects and files DST lacks from SRC, and merges each
+project's version list by version id and creation time. Nothing is
+removed from DST. Only new blobs are transferred; other files are
+compared by content hash, using a per-store manifest cache so unchanged
+files are not re-hashed. An interrupted sync can simply be rerun. See
+store_sync.py for how conflicting ids and files are resolved.
+
+Use --both to sync in both directions (SRC to DST, then back).
+
+Usage:
+    uv run scripts/sync_store.py SRC DST [--project NAME] [--both] [--dry-run]
+                                 [--jobs N] [--json]
+
+Examples:
+    uv run scripts/sync_store.py ~/.resume_versions /mnt/share/.resume_versions --dry-run
+    uv run scripts/sync_store.py ~/.resume_versions /mnt/share/.resume_versions --both
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from pack_versions import format_size
+from store_sync import SyncStats, sync_stores
+
+
+def print_stats(stats: SyncStats, src: Path, dst: Path, dry_run: bool) -> None:
+    """Print what a sync copied and merged."""
+    verb = "Would copy" if dry_run else "Copied"
+    print(f"{src} -> {dst}")
+    print(f"  {verb} {stats.objects_copied} object(s) and {stats.files_copied} file(s), "
+          f"{format_size(stats.bytes_copied)}; {stats.files_unchanged} file(s) unchanged")
+    print(f"  {'Would add' if dry_run else 'Added'} {stats.versions_added} version(s)")
+    for project in stats.projects_created:
+        print(f"  New project: {project}")
+    for project, old, new in stats.renumbered:
+        print(f"  {project}: {old} renumbered to {new} (id already used in destination)")
+    for path in stats.kept_newer:
+        print(f"  Kept newer destination copy: {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync one version store into another")
+    parser.add_argument("src", type=Path, help="Source store (a .resume_versions directory)")
+    parser.add_argument("dst", type=Path, help="Destination store (created if missing)")
+    parser.add_argument(
+        "--project", "-p",
+        action="append",
+        help="Only sync this project (repeatable)",
+    )
+    parser.add_argument(
+        "--both",
+        action="store_true",
+        help="Also sync DST back into SRC afterwards",
+    )
+    parser.add_argument(
+        "--dry-run", "-n",
+        action="store_true",
+        help="Report what would be copied without writing",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Parallel copies and hashes (default: 4 per CPU, max 32)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output the result as JSON",
+    )
+    args = parser.parse_args()
+
+    directions = [(args.src, args.dst)]
+    if args.both:
+        directions.append((args.dst, args.src))
+
+    try:
+        results = []
+        for src, dst in directions:
+            stats = sync_stores(src, dst, projects=args.project, dry_run=args.dry_run, jobs=args.jobs)
+            results.append({"src": str(src), "dst": str(dst), **stats.to_dict()})
+            if not args.json:
+                print_stats(stats, src, dst, args.dry_run)
+        if args.json:
+            print(json.dumps(results, indent=2))
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
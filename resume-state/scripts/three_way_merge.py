@@ -0,0 +1,185 @@
+"""Three-way merge of structured resume data.
+
+Given a common ancestor (``base``) and two versions derived from it
+(``ours`` and ``theirs``), the merge keeps every change either side made
+to the ancestor:
+
+- Mappings are merged key by key; a key added or deleted on one side is
+  added or deleted in the result.
+- Lists are matched item by item the way structural_diff matches them
+  (records by company/title/..., bullets by text, then by similarity), so
+  a bullet reworded on one side and a bullet added on the other merge
+  cleanly. Items added on one side are placed after the item they follow
+  there. The order of one side is kept: the side that reordered the
+  ancestor's items (the preferred side if both did), else ``ours``.
+- A value both sides changed differently is a conflict. It resolves to
+  the preferred side, and is reported with its path, e.g.
+  ``experience[Acme].positions[Staff Engineer].achievements[2]``.
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Any, Optional
+
+import yaml
+
+from structural_diff import identity_field, match_items
+
+
+class _Missing:
+    """Marker for a key or item that does not exist on one side."""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING = _Missing()
+
+
+@dataclass
+class Conflict:
+    """A value both sides changed differently (MISSING values become None)."""
+
+    path: str
+    base: Any
+    ours: Any
+    theirs: Any
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def _plain(value: Any) -> Any:
+    return None if value is MISSING else value
+
+
+def _label(item: Any, field: Optional[str], index: int) -> str:
+    if field is not None and isinstance(item, dict) and field in item:
+        return f"[{item[field]}]"
+    return f"[{index}]"
+
+
+def _moved(pairs: list[tuple[int, int]]) -> bool:
+    """True if the matched items are not in the ancestor's order."""
+    order = [i for i, _ in sorted(pairs, key=lambda p: p[1])]
+    return order != sorted(order)
+
+
+class _Merger:
+    def __init__(self, prefer: str):
+        if prefer not in ("ours", "theirs"):
+            raise ValueError(f"prefer must be 'ours' or 'theirs', not {prefer!r}")
+        self.prefer = prefer
+        self.conflicts: list[Conflict] = []
+
+    def merge(self, base: Any, ours: Any, theirs: Any, path: str) -> Any:
+        if ours == theirs:
+            return ours
+        if base == ours:
+            return theirs
+        if base == theirs:
+            return ours
+        if isinstance(ours, dict) and isinstance(theirs, dict):
+            return self._merge_dict(base if isinstance(base, dict) else {}, ours, theirs, path)
+        if isinstance(ours, list) and isinstance(theirs, list):
+            return self._merge_list(base if isinstance(base, list) else [], ours, theirs, path)
+        self.conflicts.append(Conflict(path, _plain(base), _plain(ours), _plain(theirs)))
+        return theirs if self.prefer == "theirs" else ours
+
+    def _merge_dict(self, base: dict, ours: dict, theirs: dict, path: str) -> dict:
+        merged = {}
+        for key in [*ours, *(k for k in theirs if k not in ours)]:
+            sub = f"{path}.{key}" if path else str(key)
+            value = self.merge(base.get(key, MISSING), ours.get(key, MISSING),
+                               theirs.get(key, MISSING), sub)
+            if value is not MISSING:
+                merged[key] = value
+        return merged
+
+    def _merge_list(self, base: list, ours: list, theirs: list, path: str) -> list:
+        field = identity_field(base, ours, theirs)
+        to_ours = dict(match_items(base, ours, field))
+        to_theirs = dict(match_items(base, theirs, field))
+
+        # Every output item gets a token: ("b", i) for an ancestor item,
+        # ("o", j) / ("t", k) for an item added on one side
+        values: dict[tuple, Any] = {}
+        for i, item in enumerate(base):
+            ours_item = ours[to_ours[i]] if i in to_ours else MISSING
+            theirs_item = theirs[to_theirs[i]] if i in to_theirs else MISSING
+            values[("b", i)] = self.merge(item, ours_item, theirs_item, path + _label(item, field, i))
+        ours_tokens = {j: ("b", i) for i, j in to_ours.items()}
+        theirs_tokens = {k: ("b", i) for i, k in to_theirs.items()}
+
+        added_ours = [j for j in range(len(ours)) if j not in ours_tokens]
+        added_theirs = [k for k in range(len(theirs)) if k not in theirs_tokens]
+        # The same item added on both sides is one item
+        both = dict(match_items([ours[j] for j in added_ours], [theirs[k] for k in added_theirs], field))
+        for j in added_ours:
+            ours_tokens[j] = ("o", j)
+            values[("o", j)] = ours[j]
+        for a, b in both.items():
+            j, k = added_ours[a], added_theirs[b]
+            theirs_tokens[k] = ("o", j)
+            values[("o", j)] = self.merge(MISSING, ours[j], theirs[k], path + _label(ours[j], field, j))
+        for k in added_theirs:
+            if k not in theirs_tokens:
+                theirs_tokens[k] = ("t", k)
+                values[("t", k)] = theirs[k]
+
+        # Keep one side's order and thread the other side's items into it
+        ours_order = [ours_tokens[j] for j in range(len(ours))]
+        theirs_order = [theirs_tokens[k] for k in range(len(theirs))]
+        theirs_moved = _moved(list(to_theirs.items()))
+        ours_moved = _moved(list(to_ours.items()))
+        if theirs_moved and (not ours_moved or self.prefer == "theirs"):
+            skeleton, other = theirs_order, ours_order
+        else:
+            skeleton, other = ours_order, theirs_order
+        order = list(skeleton)
+        placed = set(order)
+        at = 0  # insert position: after the last placed item seen on the other side
+        for token in other:
+            if token in placed:
+                at = order.index(token) + 1
+            else:
+                order.insert(at, token)
+                placed.add(token)
+                at += 1
+        return [values[token] for token in order if values[token] is not MISSING]
+
+
+def merge_data(base: Any, ours: Any, theirs: Any, prefer: str = "theirs") -> tuple[Any, list[Conflict]]:
+    """Three-way merge parsed resume data.
+
+    Args:
+        base: Common ancestor
+        ours: One descendant (e.g. the updated master resume)
+        theirs: The other descendant (e.g. a tailored version)
+        prefer: Side that wins conflicts: "theirs" or "ours"
+
+    Returns:
+        Tuple of (merged data, conflicts)
+    """
+    merger = _Merger(prefer)
+    merged = merger.merge(base, ours, theirs, "")
+    return (None if merged is MISSING else merged), merger.conflicts
+
+
+class _Dumper(yaml.SafeDumper):
+    # Indent list items under their key, as the resume schema does
+    def increase_indent(self, flow: bool = False, indentless: bool = False):
+        return super().increase_indent(flow, False)
+
+
+def _represent_str(dumper: yaml.SafeDumper, value: str):
+    style = "|" if "\n" in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_Dumper.add_representer(str, _represent_str)
+
+
+def dump_resume(data: Any) -> str:
+    """Serialize resume data as block-style YAML, keeping key order."""
+    return yaml.dump(data, Dumper=_Dumper, sort_keys=False, allow_unicode=True,
+                     default_flow_style=False, width=100)
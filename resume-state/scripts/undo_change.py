@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Undo the last change to a project, or list its change journal.
+
+JSON-backed projects record every version creation, switch and notes
+edit in projects/<name>/journal.jsonl. Undo appends the inverse change,
+so the journal keeps the full history.
+
+Usage:
+    uv run scripts/undo_change.py [--project NAME] [--list [N]]
+
+Examples:
+    uv run scripts/undo_change.py
+    uv run scripts/undo_change.py --list 20
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from state_utils import (
+    get_store_path,
+    read_journal,
+    resolve_project,
+    undo_last_change,
+    uses_sqlite,
+)
+
+
+def describe_event(event: dict) -> str:
+    """One-line description of a journal event."""
+    kind = event["event"]
+    if kind == "version_created":
+        text = f"created {event['entry']['id']}"
+    elif kind == "version_removed":
+        text = f"removed {event['version']}"
+    elif kind == "active_switched":
+        text = f"switched {event.get('previous') or '-'} -> {event['version'] or '-'}"
+    elif kind == "notes_edited":
+        text = f"edited notes of {event['version']}"
+    else:
+        text = "saved full state"
+    if "undo_of" in event:
+        text += f" (undo of r{event['undo_of']})"
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Undo the last change to a project")
+    parser.add_argument(
+        "--project", "-p",
+        help="Project name (default: active project)",
+    )
+    parser.add_argument(
+        "--list", "-l",
+        nargs="?",
+        type=int,
+        const=10,
+        metavar="N",
+        help="List the N most recent changes instead (default: 10)",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+
+        if args.list is not None:
+            if uses_sqlite(project, store_path):
+                raise ValueError("SQLite projects do not keep a change journal")
+            for event in read_journal(project, 0, store_path)[-args.list:]:
+                print(f"r{event['revision']:<5} {event['at'][:19]}  {describe_event(event)}")
+            return
+
+        event = undo_last_change(project, store_path)
+        print(f"Undid r{event['revision']}: {describe_event(event)}")
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
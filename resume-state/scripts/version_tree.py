@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Show the lineage of a project's versions.
+
+Draws every version below the one it was derived from, or answers
+lineage queries: ancestors, descendants, common ancestor and leaves.
+
+Usage:
+    uv run scripts/version_tree.py [VERSION] [--max-depth N] [--project NAME] [--json]
+    uv run scripts/version_tree.py --ancestors VERSION
+    uv run scripts/version_tree.py --descendants VERSION
+    uv run scripts/version_tree.py --common-ancestor A B
+    uv run scripts/version_tree.py --leaves
+
+Examples:
+    uv run scripts/version_tree.py
+    uv run scripts/version_tree.py v4 --max-depth 2
+    uv run scripts/version_tree.py --common-ancestor v7 v9 --json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from lineage import lineage_index, render_tree
+from state_utils import get_store_path, load_project_state, resolve_project
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show the lineage of a project's versions")
+    parser.add_argument("version", nargs="?", help="Only draw the subtree under this version")
+    query = parser.add_mutually_exclusive_group()
+    query.add_argument("--ancestors", metavar="VERSION", help="List ancestors, parent first")
+    query.add_argument("--descendants", metavar="VERSION", help="List versions derived from VERSION")
+    query.add_argument(
+        "--common-ancestor",
+        nargs=2,
+        metavar=("A", "B"),
+        help="Nearest version both A and B derive from",
+    )
+    query.add_argument("--leaves", action="store_true", help="List versions with no children")
+    parser.add_argument(
+        "--max-depth",
+        type=int,
+        help="Stop drawing below this many levels",
+    )
+    parser.add_argument(
+        "--project", "-p",
+        help="Project name (default: active project)",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output as JSON",
+    )
+    args = parser.parse_args()
+
+    try:
+        store_path = get_store_path()
+        project = resolve_project(args.project, store_path)
+        state = load_project_state(project, store_path)
+        index = lineage_index(state)
+
+        if args.ancestors or args.descendants or args.leaves:
+            if args.ancestors:
+                result = index.ancestors(args.ancestors)
+            elif args.descendants:
+                result = index.descendants(args.descendants)
+            else:
+                result = index.leaves()
+            print(json.dumps(result) if args.json else "\n".join(result))
+            return
+
+        if args.common_ancestor:
+            result = index.common_ancestor(*args.common_ancestor)
+            if args.json:
+                print(json.dumps({"common_ancestor": result}))
+            elif result is None:
+                print(f"{' and '.join(args.common_ancestor)} share no ancestor")
+            else:
+                print(result)
+            return
+
+        if args.version is not None and args.version not in index:
+            raise ValueError(f"Version not found: {args.version}")
+        if args.json:
+            print(json.dumps(index.to_dict(), indent=2))
+            return
+        if not index.preorder:
+            print(f"No versions in project: {project}")
+            return
+        print(render_tree(index, args.version, state.get("active_version"), args.max_depth))
+
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,8 @@ Commands:
     extract     Extract text from PDF/DOCX
     format      Generate PDF from YAML
     review      Review PDF quality
-    version     Manage versions (list, switch, diff, export)
+    version     Manage versions (list, switch, diff, tree, export)
+    search      Search the content of every version
     cover       Generate cover letter
     job         Fetch job posting
     status      Show current project and version status
@@ -58,8 +59,24 @@ def run_script(skill: str, script: str, args: list[str], check: bool = True) ->
     return result.returncode
 
 
+def load_state_utils():
+    """Import resume-state's state_utils in-process (None if unavailable)."""
+    sys.path.insert(0, str(PROJECT_ROOT / "resume-state" / "scripts"))
+    try:
+        import state_utils
+    except ImportError:
+        return None
+    return state_utils
+
+
 def get_active_yaml() -> Optional[Path]:
     """Get the active resume YAML path."""
+    state_utils = load_state_utils()
+    if state_utils is not None:
+        # Fast path: the store summary, no subprocess or state load
+        yaml_path = state_utils.get_summary_yaml_path()
+        if yaml_path is not None:
+            return yaml_path
     result = subprocess.run(
         ["uv", "run", str(PROJECT_ROOT / "resume-state/scripts/get_active.py")],
         capture_output=True,
@@ -78,6 +95,8 @@ def get_active_yaml() -> Optional[Path]:
 def cmd_init(args: argparse.Namespace) -> int:
     """Initialize a new project."""
     script_args = [args.name]
+    if args.backend:
+        script_args.extend(["--backend", args.backend])
     return run_script("resume-state", "init_project.py", script_args)
 
 
@@ -86,8 +105,12 @@ def cmd_init(args: argparse.Namespace) -> int:
 # =============================================================================
 
 def cmd_import(args: argparse.Namespace) -> int:
-    """Import a resume file."""
-    script_args = [str(args.file)]
+    """Import a resume file, or every resume in a directory."""
+    script_args = [str(args.file)] if args.file else []
+    if args.dir:
+        script_args.extend(["--dir", str(args.dir)])
+    if args.jobs:
+        script_args.extend(["--jobs", str(args.jobs)])
     if args.project:
         script_args.extend(["--project", args.project])
     return run_script("resume-state", "import_resume.py", script_args)
@@ -242,6 +265,21 @@ def cmd_version(args: argparse.Namespace) -> int:
         script_args = []
         if args.project:
             script_args.extend(["--project", args.project])
+        for flag, value in (
+            ("--tag", args.tag),
+            ("--since", args.since),
+            ("--until", args.until),
+            ("--source-type", args.source_type),
+            ("--parent", args.parent),
+            ("--limit", args.limit),
+            ("--offset", args.offset),
+        ):
+            if value is not None:
+                script_args.extend([flag, str(value)])
+        if args.newest_first:
+            script_args.append("--newest-first")
+        if args.verbose:
+            script_args.append("--verbose")
         return run_script("resume-state", "list_versions.py", script_args)
 
     elif subcmd == "create":
@@ -261,18 +299,93 @@ def cmd_version(args: argparse.Namespace) -> int:
         return run_script("resume-state", "switch_version.py", script_args)
 
     elif subcmd == "diff":
-        script_args = [args.v1, args.v2]
+        script_args = [v for v in (args.v1, args.v2) if v]
         if args.project:
             script_args.extend(["--project", args.project])
+        if args.lineage is not None:
+            script_args.append("--lineage")
+            if args.lineage:
+                script_args.append(args.lineage)
+        if args.matrix:
+            script_args.append("--matrix")
+        if args.jobs:
+            script_args.extend(["--jobs", str(args.jobs)])
+        if args.structural:
+            script_args.append("--structural")
+        if args.json:
+            script_args.append("--json")
         return run_script("resume-state", "diff_versions.py", script_args)
 
     elif subcmd == "export":
-        script_args = [args.version_id, str(args.output_dir)]
+        script_args = [str(a) for a in (args.version_id, args.output_dir) if a]
         if args.project:
             script_args.extend(["--project", args.project])
+        for flag, value in (
+            ("--archive", args.archive),
+            ("--format", args.format),
+            ("--tag", args.tag),
+            ("--since", args.since),
+            ("--until", args.until),
+        ):
+            if value is not None:
+                script_args.extend([flag, str(value)])
+        if args.all:
+            script_args.append("--all")
         return run_script("resume-state", "export_version.py", script_args)
 
+    elif subcmd == "notes":
+        script_args = [args.version_id, args.notes]
+        if args.project:
+            script_args.extend(["--project", args.project])
+        return run_script("resume-state", "edit_notes.py", script_args)
+
+    elif subcmd == "undo":
+        script_args = []
+        if args.project:
+            script_args.extend(["--project", args.project])
+        if args.list is not None:
+            script_args.extend(["--list", str(args.list)])
+        return run_script("resume-state", "undo_change.py", script_args)
+
+    elif subcmd == "tree":
+        script_args = [args.version_id] if args.version_id else []
+        if args.project:
+            script_args.extend(["--project", args.project])
+        for flag, value in (
+            ("--ancestors", args.ancestors),
+            ("--descendants", args.descendants),
+            ("--max-depth", args.max_depth),
+        ):
+            if value is not None:
+                script_args.extend([flag, str(value)])
+        if args.common_ancestor:
+            script_args.extend(["--common-ancestor", *args.common_ancestor])
+        if args.leaves:
+            script_args.append("--leaves")
+        if args.json:
+            script_args.append("--json")
+        return run_script("resume-state", "version_tree.py", script_args)
+
+    elif subcmd == "rebase":
+        script_args = [*args.versions, "--onto", args.onto, "--prefer", args.prefer]
+        if args.project:
+            script_args.extend(["--project", args.project])
+        if args.jobs is not None:
+            script_args.extend(["--jobs", str(args.jobs)])
+        if args.fail_on_conflict:
+            script_args.append("--fail-on-conflict")
+        if args.dry_run:
+            script_args.append("--dry-run")
+        if args.json:
+            script_args.append("--json")
+        return run_script("resume-state", "rebase_versions.py", script_args)
+
     elif subcmd == "active":
+        state_utils = load_state_utils()
+        yaml_path = state_utils.get_summary_yaml_path() if state_utils else None
+        if yaml_path is not None:
+            print(yaml_path)
+            return 0
         return run_script("resume-state", "get_active.py", [])
 
     else:
@@ -280,6 +393,114 @@ def cmd_version(args: argparse.Namespace) -> int:
         return 1
 
 
+# =============================================================================
+# SEARCH COMMAND
+# =============================================================================
+
+def cmd_search(args: argparse.Namespace) -> int:
+    """Search the content of every version."""
+    script_args = list(args.query)
+    for flag, value in (
+        ("--project", args.project),
+        ("--field", args.field),
+        ("--limit", args.limit),
+    ):
+        if value is not None:
+            script_args.extend([flag, str(value)])
+    if args.json:
+        script_args.append("--json")
+    if args.rebuild:
+        script_args.append("--rebuild")
+    return run_script("resume-state", "search_versions.py", script_args)
+
+
+# =============================================================================
+# STORE COMMAND
+# =============================================================================
+
+def cmd_store(args: argparse.Namespace) -> int:
+    """Maintain the version store."""
+    subcmd = args.store_cmd
+
+    if subcmd == "convert":
+        script_args = ["--to", args.to]
+        if args.all:
+            script_args.append("--all")
+        elif args.project:
+            script_args.extend(["--project", args.project])
+        return run_script("resume-state", "convert_backend.py", script_args)
+
+    elif subcmd == "pack":
+        script_args = []
+        if args.all:
+            script_args.append("--all")
+        elif args.project:
+            script_args.extend(["--project", args.project])
+        if args.snapshot_every:
+            script_args.extend(["--snapshot-every", str(args.snapshot_every)])
+        return run_script("resume-state", "pack_versions.py", script_args)
+
+    elif subcmd == "gc":
+        script_args = []
+        if args.dry_run:
+            script_args.append("--dry-run")
+        if args.prune_artifacts:
+            script_args.append("--prune-artifacts")
+        for flag, value in (
+            ("--keep-recent", args.keep_recent),
+            ("--max-age", args.max_age),
+            ("--top", args.top),
+            ("--jobs", args.jobs),
+        ):
+            if value is not None:
+                script_args.extend([flag, str(value)])
+        if args.json:
+            script_args.append("--json")
+        return run_script("resume-state", "gc_store.py", script_args)
+
+    elif subcmd == "fsck":
+        script_args = []
+        for project in args.project or []:
+            script_args.extend(["--project", project])
+        if args.repair:
+            script_args.append("--repair")
+        if args.jobs is not None:
+            script_args.extend(["--jobs", str(args.jobs)])
+        if args.json:
+            script_args.append("--json")
+        return run_script("resume-state", "fsck_store.py", script_args)
+
+    elif subcmd == "sync":
+        script_args = [args.src, args.dst]
+        for project in args.project or []:
+            script_args.extend(["--project", project])
+        if args.both:
+            script_args.append("--both")
+        if args.dry_run:
+            script_args.append("--dry-run")
+        if args.jobs is not None:
+            script_args.extend(["--jobs", str(args.jobs)])
+        if args.json:
+            script_args.append("--json")
+        return run_script("resume-state", "sync_store.py", script_args)
+
+    elif subcmd == "migrate":
+        script_args = []
+        for project in args.project or []:
+            script_args.extend(["--project", project])
+        if args.dry_run:
+            script_args.append("--dry-run")
+        if args.jobs is not None:
+            script_args.extend(["--jobs", str(args.jobs)])
+        if args.json:
+            script_args.append("--json")
+        return run_script("resume-state", "migrate_store.py", script_args)
+
+    else:
+        print(f"Unknown store subcommand: {subcmd}", file=sys.stderr)
+        return 1
+
+
 # =============================================================================
 # COVER COMMAND
 # =============================================================================
@@ -354,26 +575,25 @@ def cmd_job(args: argparse.Namespace) -> int:
 
 def cmd_status(args: argparse.Namespace) -> int:
     """Show current status."""
-    # Import state utils to get status
-    sys.path.insert(0, str(PROJECT_ROOT / "resume-state" / "scripts"))
-    try:
-        from state_utils import (
-            get_store_path, load_config, get_active_project,
-            load_project_state, get_active_version_path
-        )
-    except ImportError:
+    state_utils = load_state_utils()
+    if state_utils is None:
         print("Error: Could not load state utilities", file=sys.stderr)
         return 1
 
-    store_path = get_store_path()
+    store_path = state_utils.get_store_path()
     print(f"Store: {store_path}")
 
     if not store_path.exists():
         print("\nNo resume store found. Run 'resume init <project>' to start.")
         return 0
 
-    config = load_config(store_path)
-    active_project = config.get("active_project")
+    # status.json is kept current by every state change; a store written
+    # before it existed gets one now
+    summary = state_utils.read_summary(store_path) or state_utils.refresh_summary(store_path)
+    if summary is None:
+        print("Error: Could not read the store summary", file=sys.stderr)
+        return 1
+    active_project = summary["active_project"]
 
     if not active_project:
         print("\nNo active project. Run 'resume init <project>' to start.")
@@ -381,27 +601,21 @@ def cmd_status(args: argparse.Namespace) -> int:
 
     print(f"Project: {active_project}")
 
-    try:
-        state = load_project_state(active_project, store_path)
-        active_version = state.get("active_version")
-        versions = state.get("versions", [])
-
-        print(f"Active Version: {active_version}")
-        print(f"Total Versions: {len(versions)}")
-
-        # Get active YAML path
-        try:
-            yaml_path = get_active_version_path(active_project, store_path)
-            print(f"Active YAML: {yaml_path}")
-            if yaml_path.exists():
-                print(f"  (exists, {yaml_path.stat().st_size} bytes)")
-        except Exception as e:
-            print(f"Active YAML: (error: {e})")
-
-    except FileNotFoundError:
+    if not state_utils.get_project_path(active_project, store_path).is_dir():
         print(f"Project '{active_project}' not found.")
         return 1
 
+    print(f"Active Version: {summary['active_version']}")
+    print(f"Total Versions: {summary['version_count']}")
+
+    if summary["yaml_path"]:
+        yaml_path = Path(summary["yaml_path"])
+        print(f"Active YAML: {yaml_path}")
+        if yaml_path.exists():
+            print(f"  (exists, {yaml_path.stat().st_size} bytes)")
+    else:
+        print("Active YAML: (error: no active version)")
+
     return 0
 
 
@@ -421,6 +635,7 @@ Examples:
   resume format --template executive # Generate PDF
   resume format --all-templates      # Compare all templates
   resume version list                # List versions
+  resume search kubernetes terraform # Search every version
   resume status                      # Show current status
         """,
     )
@@ -436,13 +651,17 @@ Examples:
     # -------------------------------------------------------------------------
     p_init = subparsers.add_parser("init", help="Initialize a new project")
     p_init.add_argument("name", help="Project name")
+    p_init.add_argument("--backend", choices=["json", "sqlite"],
+                        help="State backend (sqlite for large version histories)")
     p_init.set_defaults(func=cmd_init)
 
     # -------------------------------------------------------------------------
     # import
     # -------------------------------------------------------------------------
     p_import = subparsers.add_parser("import", help="Import PDF/DOCX resume")
-    p_import.add_argument("file", type=Path, help="Resume file (PDF or DOCX)")
+    p_import.add_argument("file", nargs="?", type=Path, help="Resume file (PDF or DOCX)")
+    p_import.add_argument("-d", "--dir", type=Path, help="Import every PDF/DOCX in this directory")
+    p_import.add_argument("-j", "--jobs", type=int, help="Worker processes for --dir")
     p_import.add_argument("-p", "--project", help="Project name (default: active)")
     p_import.set_defaults(func=cmd_import)
 
@@ -487,6 +706,15 @@ Examples:
     # version list
     v_list = version_sub.add_parser("list", help="List versions")
     v_list.add_argument("-p", "--project", help="Project name")
+    v_list.add_argument("-t", "--tag", help="Only versions with this tag")
+    v_list.add_argument("--since", help="Only versions created on or after this date")
+    v_list.add_argument("--until", help="Only versions created on or before this date")
+    v_list.add_argument("--source-type", help="Only versions from this source (import, edit, ...)")
+    v_list.add_argument("--parent", help="Only direct children of this version")
+    v_list.add_argument("-n", "--limit", type=int, help="Show at most N versions")
+    v_list.add_argument("--offset", type=int, help="Skip the first N matching versions")
+    v_list.add_argument("--newest-first", action="store_true", help="List newest versions first")
+    v_list.add_argument("-v", "--verbose", action="store_true", help="Show detailed version info")
 
     # version create
     v_create = version_sub.add_parser("create", help="Create new version")
@@ -501,21 +729,158 @@ Examples:
 
     # version diff
     v_diff = version_sub.add_parser("diff", help="Compare two versions")
-    v_diff.add_argument("v1", help="First version")
-    v_diff.add_argument("v2", help="Second version")
+    v_diff.add_argument("v1", nargs="?", help="First version")
+    v_diff.add_argument("v2", nargs="?", help="Second version")
+    v_diff.add_argument("-s", "--structural", action="store_true",
+                        help="Report per-field changes instead of a line diff")
+    v_diff.add_argument("--json", action="store_true", help="Structural changes as JSON")
+    v_diff.add_argument("--lineage", nargs="?", const="", metavar="VERSION",
+                        help="Diff every version (or VERSION's ancestry) against its parent")
+    v_diff.add_argument("--matrix", action="store_true",
+                        help="Pairwise similarity of all versions")
+    v_diff.add_argument("-j", "--jobs", type=int, help="Worker processes for --lineage/--matrix")
     v_diff.add_argument("-p", "--project", help="Project name")
 
     # version export
     v_export = version_sub.add_parser("export", help="Export version files")
-    v_export.add_argument("version_id", help="Version to export")
-    v_export.add_argument("output_dir", type=Path, help="Output directory")
+    v_export.add_argument("version_id", nargs="?", help="Version to export")
+    v_export.add_argument("output_dir", nargs="?", type=Path, help="Output directory")
     v_export.add_argument("-p", "--project", help="Project name")
+    v_export.add_argument("-a", "--archive", type=Path,
+                          help="Stream versions into a .tar.gz, .tar or .zip archive")
+    v_export.add_argument("-f", "--format", choices=["pdf", "yaml", "all"],
+                          help="What to export (default: all)")
+    v_export.add_argument("--all", action="store_true", help="Export every version (with --archive)")
+    v_export.add_argument("-t", "--tag", help="Export versions with this tag (with --archive)")
+    v_export.add_argument("--since", help="Export versions created on or after this date")
+    v_export.add_argument("--until", help="Export versions created on or before this date")
+
+    # version notes
+    v_notes = version_sub.add_parser("notes", help="Set version notes")
+    v_notes.add_argument("version_id", help="Version to annotate (e.g., v1, v2)")
+    v_notes.add_argument("notes", help="New notes (empty string to clear)")
+    v_notes.add_argument("-p", "--project", help="Project name")
+
+    # version undo
+    v_undo = version_sub.add_parser("undo", help="Undo the last version change")
+    v_undo.add_argument("-l", "--list", nargs="?", type=int, const=10, metavar="N",
+                        help="List the N most recent changes instead")
+    v_undo.add_argument("-p", "--project", help="Project name")
+
+    # version tree
+    v_tree = version_sub.add_parser("tree", help="Show version lineage")
+    v_tree.add_argument("version_id", nargs="?", help="Only draw the subtree under this version")
+    v_tree.add_argument("--ancestors", metavar="VERSION", help="List ancestors, parent first")
+    v_tree.add_argument("--descendants", metavar="VERSION",
+                        help="List versions derived from VERSION")
+    v_tree.add_argument("--common-ancestor", nargs=2, metavar=("A", "B"),
+                        help="Nearest version both A and B derive from")
+    v_tree.add_argument("--leaves", action="store_true", help="List versions with no children")
+    v_tree.add_argument("--max-depth", type=int, help="Stop drawing below this many levels")
+    v_tree.add_argument("--json", action="store_true", help="Output as JSON")
+    v_tree.add_argument("-p", "--project", help="Project name")
+
+    # version rebase
+    v_rebase = version_sub.add_parser("rebase", help="Merge versions onto a newer version")
+    v_rebase.add_argument("versions", nargs="*", help="Versions to rebase (default: all branch tips)")
+    v_rebase.add_argument("--onto", required=True, help="Version to rebase onto (e.g., v20)")
+    v_rebase.add_argument("--prefer", choices=["theirs", "ours"], default="theirs",
+                          help="Side kept on conflicts: the rebased version (theirs) or --onto (ours)")
+    v_rebase.add_argument("--fail-on-conflict", action="store_true",
+                          help="Skip versions whose merge has conflicts")
+    v_rebase.add_argument("-n", "--dry-run", action="store_true",
+                          help="Report merges without creating versions")
+    v_rebase.add_argument("-j", "--jobs", type=int, help="Worker processes")
+    v_rebase.add_argument("--json", action="store_true", help="Output as JSON")
+    v_rebase.add_argument("-p", "--project", help="Project name")
 
     # version active
     v_active = version_sub.add_parser("active", help="Show active version path")
 
     p_version.set_defaults(func=cmd_version)
 
+    # -------------------------------------------------------------------------
+    # search
+    # -------------------------------------------------------------------------
+    p_search = subparsers.add_parser("search", help="Search the content of every version")
+    p_search.add_argument("query", nargs="+",
+                          help="Search terms (field:word limits a word to company, title, "
+                               "bullets, skills or body; word* matches a prefix)")
+    p_search.add_argument("-p", "--project", help="Only search this project")
+    p_search.add_argument("-f", "--field",
+                          choices=["company", "title", "bullets", "skills", "body"],
+                          help="Only match in this field")
+    p_search.add_argument("-n", "--limit", type=int, help="Maximum number of hits")
+    p_search.add_argument("--json", action="store_true", help="Output hits as JSON")
+    p_search.add_argument("--rebuild", action="store_true", help="Rebuild the index first")
+    p_search.set_defaults(func=cmd_search)
+
+    # -------------------------------------------------------------------------
+    # store
+    # -------------------------------------------------------------------------
+    p_store = subparsers.add_parser("store", help="Maintain the version store")
+    store_sub = p_store.add_subparsers(dest="store_cmd", help="Store command")
+
+    # store convert
+    s_convert = store_sub.add_parser("convert", help="Convert project state backend")
+    s_convert.add_argument("--to", choices=["sqlite", "json"], default="sqlite",
+                           help="Target backend (default: sqlite)")
+    s_convert.add_argument("-p", "--project", help="Project name")
+    s_convert.add_argument("--all", action="store_true", help="Convert all projects")
+
+    # store pack
+    s_pack = store_sub.add_parser("pack", help="Delta-compress inactive versions")
+    s_pack.add_argument("-p", "--project", help="Project name")
+    s_pack.add_argument("--all", action="store_true", help="Pack all projects")
+    s_pack.add_argument("-n", "--snapshot-every", type=int,
+                        help="Full snapshot every N versions in a chain")
+
+    # store gc
+    s_gc = store_sub.add_parser("gc", help="Report store size and remove garbage")
+    s_gc.add_argument("-n", "--dry-run", action="store_true",
+                      help="Only report what would be removed")
+    s_gc.add_argument("--prune-artifacts", action="store_true",
+                      help="Also remove generated files outside the retention policy")
+    s_gc.add_argument("--keep-recent", type=int,
+                      help="Keep generated files of the N newest versions per project")
+    s_gc.add_argument("--max-age", type=float,
+                      help="Keep generated files modified within this many days")
+    s_gc.add_argument("--top", type=int, help="Number of largest versions to show")
+    s_gc.add_argument("-j", "--jobs", type=int, help="Parallel directory scanners")
+    s_gc.add_argument("--json", action="store_true", help="Output the report as JSON")
+
+    # store fsck
+    s_fsck = store_sub.add_parser("fsck", help="Check store integrity")
+    s_fsck.add_argument("-p", "--project", action="append",
+                        help="Only check this project's state (repeatable)")
+    s_fsck.add_argument("--repair", action="store_true",
+                        help="Repair what can be repaired and quarantine damaged files")
+    s_fsck.add_argument("-j", "--jobs", type=int, help="Hashing threads")
+    s_fsck.add_argument("--json", action="store_true", help="Output the report as JSON")
+
+    # store sync
+    s_sync = store_sub.add_parser("sync", help="Sync one store into another")
+    s_sync.add_argument("src", help="Source store directory")
+    s_sync.add_argument("dst", help="Destination store directory")
+    s_sync.add_argument("-p", "--project", action="append",
+                        help="Only sync this project (repeatable)")
+    s_sync.add_argument("--both", action="store_true", help="Also sync DST back into SRC")
+    s_sync.add_argument("-n", "--dry-run", action="store_true",
+                        help="Report what would be copied")
+    s_sync.add_argument("-j", "--jobs", type=int, help="Parallel copies and hashes")
+    s_sync.add_argument("--json", action="store_true", help="Output the result as JSON")
+
+    # store migrate
+    s_migrate = store_sub.add_parser("migrate", help="Upgrade the store to the current schema")
+    s_migrate.add_argument("-p", "--project", action="append",
+                           help="Only upgrade this project (repeatable)")
+    s_migrate.add_argument("-n", "--dry-run", action="store_true",
+                           help="Report what would be upgraded")
+    s_migrate.add_argument("-j", "--jobs", type=int, help="Projects upgraded in parallel")
+    s_migrate.add_argument("--json", action="store_true", help="Output the result as JSON")
+
+    p_store.set_defaults(func=cmd_store)
+
     # -------------------------------------------------------------------------
     # cover
     # -------------------------------------------------------------------------
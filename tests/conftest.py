@@ -0,0 +1,9 @@
+"""Shared fixtures for the resume-state tests."""
+
+import pytest
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("RESUME_VERSIONS_PATH", str(tmp_path / ".resume_versions"))
+    return tmp_path / ".resume_versions"
@@ -0,0 +1,119 @@
+"""Tests for resume-state/scripts/delta_store.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the delta_store module to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from delta_store import (
+    apply_delta,
+    chain_depth,
+    make_delta,
+    pack_project,
+    put_text,
+    read_object,
+    read_version_yaml,
+)
+
+BASE = "".join(f"line {i}\n" for i in range(200))
+
+
+class TestDelta:
+    """Tests for make_delta() and apply_delta()"""
+
+    def test_round_trip(self):
+        base = BASE.splitlines(keepends=True)
+        target = base[:50] + ["inserted\n"] + base[60:] + ["tail\n"]
+        assert apply_delta(base, make_delta(base, target)) == target
+
+
+class TestPutText:
+    """Tests for put_text() and read_object()"""
+
+    def test_delta_chain_snapshots(self, tmp_path):
+        digest = put_text(BASE, tmp_path)
+        texts = {digest: BASE}
+        for i in range(7):
+            text = texts[digest] + f"edit {i}\n"
+            digest = put_text(text, tmp_path, base=digest, snapshot_every=3)
+            texts[digest] = text
+            assert chain_depth(digest, tmp_path) < 3
+        for digest, text in texts.items():
+            assert read_object(digest, tmp_path) == text
+
+    def test_identical_content_does_not_cycle(self, tmp_path):
+        a = put_text(BASE, tmp_path)
+        b = put_text(BASE + "x\n", tmp_path, base=a)
+        assert put_text(BASE, tmp_path, base=b) == a
+        assert chain_depth(a, tmp_path) == 0
+
+    def test_existing_snapshot_is_kept(self, tmp_path):
+        a = put_text(BASE, tmp_path, snapshot_every=2)
+        b = put_text(BASE + "b\n", tmp_path, base=a, snapshot_every=2)
+        # c was stored in full first, and another chain deltas against it
+        c = put_text(BASE + "b\nc\n", tmp_path, base=b, snapshot_every=2)
+        d = put_text(BASE + "b\nc\nd\n", tmp_path, base=c, snapshot_every=2)
+        assert chain_depth(c, tmp_path) == 0
+
+        # Storing c again against a base must not turn the snapshot into a delta
+        assert put_text(BASE + "b\nc\n", tmp_path, base=a, snapshot_every=2) == c
+        assert chain_depth(c, tmp_path) == 0
+        assert chain_depth(d, tmp_path) == 1
+        assert read_object(d, tmp_path) == BASE + "b\nc\nd\n"
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.setenv("RESUME_VERSIONS_PATH", str(tmp_path / ".resume_versions"))
+    from create_version import create_version
+    from init_project import init_project
+    from state_utils import append_version, get_version_path, now_iso
+
+    init_project("p")
+
+    def make_entry(version_id):
+        path = get_version_path("p", version_id)
+        path.mkdir(parents=True)
+        (path / "resume.yaml").write_text(BASE)
+        return {"id": version_id, "tag": None, "created_at": now_iso(),
+                "source": {"type": "import"}, "parent": None, "notes": ""}
+
+    append_version("p", make_entry)
+    texts = {"v1": BASE}
+    for i in range(4):
+        version_id, path = create_version("p", tag=f"t{i}")
+        texts[version_id] = texts[f"v{i + 1}"] + f"edit {i}\n"
+        (path / "resume.yaml").write_text(texts[version_id])
+    return texts
+
+
+class TestPackProject:
+    """Tests for pack_project()"""
+
+    def test_packs_inactive_versions(self, project):
+        from state_utils import get_active_version_path, load_project_state
+
+        stats = pack_project("p")
+        assert stats["packed"] == 4
+        assert stats["bytes_after"] < stats["bytes_before"]
+        assert get_active_version_path("p").read_text() == project["v5"]
+
+        for entry in load_project_state("p")["versions"]:
+            assert read_version_yaml("p", entry) == project[entry["id"]]
+
+    def test_switch_unpacks(self, project):
+        from switch_version import switch_version
+
+        pack_project("p")
+        yaml_path = switch_version("p", "v2")
+        assert yaml_path.read_text() == project["v2"]
+
+    def test_create_from_packed_parent(self, project):
+        from create_version import create_version
+
+        pack_project("p")
+        _, path = create_version("p", from_version="v3")
+        assert (path / "resume.yaml").read_text() == project["v3"]
@@ -0,0 +1,98 @@
+"""Tests for export_version.export_archive()"""
+
+import hashlib
+import json
+import sys
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project with three versions (v2 tagged 'google'), v1 packed."""
+    monkeypatch.setenv("RESUME_VERSIONS_PATH", str(tmp_path / ".resume_versions"))
+    from delta_store import pack_project
+    from init_project import init_project
+    from state_utils import append_version, get_version_path
+
+    init_project("p")
+    for n, tag in enumerate([None, "google", None], start=1):
+        def make_entry(version_id, tag=tag, n=n):
+            path = get_version_path("p", version_id, tag)
+            path.mkdir(parents=True)
+            (path / "resume.yaml").write_text(f"contact:\n  name: Jane\nsummary: version {n}\n")
+            (path / "resume.pdf").write_bytes(b"%PDF-1.4 " + bytes(range(256)) * n)
+            return {"id": version_id, "tag": tag, "created_at": f"2025-0{n}-01T00:00:00+00:00",
+                    "source": {"type": "edit"}, "parent": "v1" if n > 1 else None, "notes": ""}
+        append_version("p", make_entry)
+    pack_project("p")
+    return "p"
+
+
+def read_members(path: Path) -> dict[str, bytes]:
+    if path.suffix == ".zip":
+        with zipfile.ZipFile(path) as z:
+            return {name: z.read(name) for name in z.namelist()}
+    with tarfile.open(path) as t:
+        return {m.name: t.extractfile(m).read() for m in t.getmembers()}
+
+
+class TestExportArchive:
+    """Tests for export_archive()"""
+
+    @pytest.mark.parametrize("name", ["out.tar.gz", "out.tar", "out.zip"])
+    def test_all_versions_with_manifest(self, project, tmp_path, name):
+        from export_version import export_archive
+        from state_utils import iter_versions
+
+        archive = tmp_path / name
+        manifest = export_archive(project, iter_versions(project), archive)
+        members = read_members(archive)
+
+        assert sorted(members) == [
+            "manifest.json",
+            "p/v1/resume.pdf", "p/v1/resume.yaml",
+            "p/v2_google/resume.pdf", "p/v2_google/resume.yaml",
+            "p/v3/resume.pdf", "p/v3/resume.yaml",
+        ]
+        # v1 was packed: its YAML is rebuilt from the delta store
+        assert members["p/v1/resume.yaml"] == b"contact:\n  name: Jane\nsummary: version 1\n"
+        assert json.loads(members["manifest.json"]) == manifest
+        for f in manifest["files"]:
+            assert hashlib.sha256(members[f["path"]]).hexdigest() == f["sha256"]
+            assert len(members[f["path"]]) == f["size"]
+        assert [v["id"] for v in manifest["versions"]] == ["v1", "v2", "v3"]
+
+    def test_filtered_selection(self, project, tmp_path):
+        from export_version import export_archive
+        from state_utils import iter_versions
+
+        archive = tmp_path / "google.zip"
+        export_archive(project, iter_versions(project, tag="google"), archive, format="yaml")
+        assert sorted(read_members(archive)) == ["manifest.json", "p/v2_google/resume.yaml"]
+
+        archive = tmp_path / "recent.tar.gz"
+        manifest = export_archive(project, iter_versions(project, since="2025-02"), archive)
+        assert [v["id"] for v in manifest["versions"]] == ["v2", "v3"]
+
+    def test_failure_leaves_no_partial_archive(self, project, tmp_path):
+        from export_version import export_archive
+
+        def versions():
+            yield {"id": "v1"}
+            raise RuntimeError("interrupted")
+
+        with pytest.raises(RuntimeError):
+            export_archive(project, versions(), tmp_path / "out.tar.gz")
+        assert list(tmp_path.glob("out*")) == [] and list(tmp_path.glob("*.tmp")) == []
+
+    def test_unknown_extension(self, project, tmp_path):
+        from export_version import export_archive
+
+        with pytest.raises(ValueError):
+            export_archive(project, [], tmp_path / "out.rar")
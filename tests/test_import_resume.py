@@ -0,0 +1,168 @@
+"""Tests for resume-state/scripts/import_resume.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from import_resume import import_directory
+
+FAKE_EXTRACTOR = '''
+import sys
+
+def extract_{kind}_text(path):
+    data = path.read_bytes()
+    if data.startswith(b"BROKEN"):
+        raise ValueError("not a valid file")
+    if data.startswith(b"NOLIB"):
+        sys.exit(1)
+    return "TEXT " + data.decode()
+'''
+
+
+@pytest.fixture
+def store(store, tmp_path, monkeypatch):
+    extractors = tmp_path / "extractor"
+    extractors.mkdir()
+    for kind in ("pdf", "docx"):
+        (extractors / f"extract_{kind}.py").write_text(FAKE_EXTRACTOR.format(kind=kind))
+    monkeypatch.setenv("RESUME_EXTRACTOR_PATH", str(extractors))
+    from init_project import init_project
+
+    init_project("p")
+    return store
+
+
+def make_inbox(tmp_path: Path, files: dict[str, bytes]) -> Path:
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    for name, data in files.items():
+        (inbox / name).write_bytes(data)
+    return inbox
+
+
+class TestImportDirectory:
+    """Tests for import_directory()"""
+
+    @pytest.mark.parametrize("jobs", [1, 3])
+    def test_imports_in_name_order(self, store, tmp_path, jobs):
+        from state_utils import load_project_state
+
+        inbox = make_inbox(tmp_path, {
+            "b.docx": b"bob", "a.pdf": b"ada", "c.pdf": b"cy", "notes.txt": b"skip",
+        })
+        imported = import_directory(inbox, "p", jobs=jobs, store_path=store)
+
+        assert [(vid, path.name, error) for vid, path, error in imported] == [
+            ("v1", "v1", None), ("v2", "v2", None), ("v3", "v3", None),
+        ]
+        assert (imported[1][1] / "extracted_text.txt").read_text() == "TEXT bob"
+        assert "b.docx" in (imported[1][1] / "resume.yaml").read_text()
+        state = load_project_state("p")
+        assert [v["source"]["original_name"] for v in state["versions"]] == ["a.pdf", "b.docx", "c.pdf"]
+        assert state["active_version"] == "v3"
+
+    def test_sources_stored_once(self, store, tmp_path):
+        from object_store import object_path
+        from state_utils import get_project_path, load_project_state
+
+        inbox = make_inbox(tmp_path, {"a.pdf": b"same", "b.pdf": b"same"})
+        import_directory(inbox, "p", jobs=2, store_path=store)
+
+        digests = {v["source"]["sha256"] for v in load_project_state("p")["versions"]}
+        assert len(digests) == 1
+        obj = object_path(digests.pop(), store)
+        assert obj.stat().st_nlink == 3
+        assert (get_project_path("p") / "sources" / "v2_b.pdf").samefile(obj)
+
+    def test_failed_extraction_warns(self, store, tmp_path, capsys):
+        inbox = make_inbox(tmp_path, {"a.pdf": b"BROKEN", "b.pdf": b"NOLIB", "c.pdf": b"ok"})
+        imported = import_directory(inbox, "p", jobs=1, store_path=store)
+
+        errors = [error for _, _, error in imported]
+        assert "not a valid file" in errors[0]
+        assert "uv sync" in errors[1]
+        assert errors[2] is None
+        assert not (imported[0][1] / "extracted_text.txt").exists()
+        assert (imported[0][1] / "resume.yaml").exists()
+        assert "a.pdf" in capsys.readouterr().err
+
+    def test_strict_records_nothing(self, store, tmp_path):
+        from state_utils import load_project_state
+
+        inbox = make_inbox(tmp_path, {"a.pdf": b"ok", "b.pdf": b"BROKEN"})
+        with pytest.raises(RuntimeError, match="b.pdf"):
+            import_directory(inbox, "p", strict=True, store_path=store)
+        assert load_project_state("p")["versions"] == []
+
+    def test_empty_and_missing_directory(self, store, tmp_path):
+        assert import_directory(make_inbox(tmp_path, {}), "p", store_path=store) == []
+        with pytest.raises(FileNotFoundError):
+            import_directory(tmp_path / "nope", "p", store_path=store)
+
+
+class TestImportResume:
+    """Tests for import_resume()"""
+
+    def test_extracts_outside_the_project_lock(self, store, tmp_path, monkeypatch):
+        import import_resume
+        import state_utils
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(dict(getattr(state_utils._held_locks, "locks", {})))
+            Path(cmd[cmd.index("-o") + 1]).write_text("TEXT")
+            return import_resume.subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(import_resume.subprocess, "run", fake_run)
+        pdf = tmp_path / "resume.pdf"
+        pdf.write_bytes(b"%PDF")
+        version_id, path = import_resume.import_resume(pdf, "p", store_path=store)
+        assert calls == [{}]
+        assert (path / "extracted_text.txt").read_text() == "TEXT"
+        assert not list((store / "projects" / "p").glob("*.tmp"))
+
+    def test_strict_failure_records_nothing(self, store, tmp_path, monkeypatch):
+        import import_resume
+        from state_utils import load_project_state
+
+        monkeypatch.setattr(import_resume.subprocess, "run", lambda cmd, **kwargs: (
+            import_resume.subprocess.CompletedProcess(cmd, 1, "", "boom")))
+        pdf = tmp_path / "resume.pdf"
+        pdf.write_bytes(b"%PDF")
+        with pytest.raises(RuntimeError, match="boom"):
+            import_resume.import_resume(pdf, "p", strict=True, store_path=store)
+        assert load_project_state("p")["versions"] == []
+        assert not list((store / "projects" / "p").glob("*.tmp"))
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+class TestAppendVersions:
+    """Tests for state_utils.append_versions()"""
+
+    def test_batch_ids_and_rollback(self, tmp_path, monkeypatch, backend):
+        from init_project import init_project
+        from state_utils import append_version, append_versions, load_project_state, now_iso
+
+        monkeypatch.setenv("RESUME_VERSIONS_PATH", str(tmp_path / ".resume_versions"))
+        init_project("q", backend=backend)
+
+        def entry(version_id):
+            return {"id": version_id, "tag": None, "created_at": now_iso(),
+                    "source": {"type": "edit"}, "parent": None, "notes": ""}
+
+        append_version("q", entry)
+        created = append_versions("q", [entry] * 3, activate=False)
+        assert [e["id"] for e in created] == ["v2", "v3", "v4"]
+        assert load_project_state("q")["active_version"] == "v1"
+
+        def fail(version_id):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            append_versions("q", [entry, fail])
+        state = load_project_state("q")
+        assert len(state["versions"]) == 4
@@ -0,0 +1,105 @@
+"""Tests for resume-state/scripts/lineage.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from lineage import LineageIndex, lineage_index, render_tree
+
+
+def versions(parents: dict) -> list[dict]:
+    return [{"id": vid, "parent": parent, "tag": None} for vid, parent in parents.items()]
+
+
+# v1 -> v2 -> v4 -> v6
+#    \-> v3 -> v5
+# v7 (second import)
+TREE = versions({"v1": None, "v2": "v1", "v3": "v1", "v4": "v2",
+                 "v5": "v3", "v6": "v4", "v7": None})
+
+
+class TestLineageIndex:
+    """Tests for LineageIndex"""
+
+    def test_structure(self):
+        index = LineageIndex(TREE)
+        assert index.roots == ["v1", "v7"]
+        assert index.leaves() == ["v5", "v6", "v7"]
+        assert index.children["v1"] == ["v2", "v3"]
+        assert index.depth["v6"] == 3
+        assert index.preorder == ["v1", "v2", "v4", "v6", "v3", "v5", "v7"]
+
+    def test_ancestry_queries(self):
+        index = LineageIndex(TREE)
+        assert index.ancestors("v6") == ["v4", "v2", "v1"]
+        assert index.ancestors("v1") == []
+        assert index.descendants("v2") == ["v4", "v6"]
+        assert index.descendants("v7") == []
+        assert index.is_ancestor("v1", "v5")
+        assert not index.is_ancestor("v2", "v5")
+        assert not index.is_ancestor("v5", "v5")
+        with pytest.raises(ValueError, match="v9"):
+            index.ancestors("v9")
+
+    def test_common_ancestor(self):
+        index = LineageIndex(TREE)
+        assert index.common_ancestor("v6", "v5") == "v1"
+        assert index.common_ancestor("v6", "v4") == "v4"
+        assert index.common_ancestor("v2", "v2") == "v2"
+        assert index.common_ancestor("v6", "v7") is None
+
+    def test_deep_history(self):
+        chain = {f"v{i}": f"v{i - 1}" if i > 1 else None for i in range(1, 5001)}
+        chain["v5001"] = "v2500"
+        index = LineageIndex(versions(chain))
+        assert index.depth["v5000"] == 4999
+        assert index.common_ancestor("v5000", "v5001") == "v2500"
+        assert index.common_ancestor("v4000", "v1234") == "v1234"
+        assert len(index.descendants("v2500")) == 2501
+
+    def test_missing_parent_and_cycle(self):
+        index = LineageIndex(versions({"v1": "v9", "v2": "v3", "v3": "v2"}))
+        assert index.roots == ["v1", "v2"]
+        assert index.parent == {"v3": "v2"}
+        assert index.preorder == ["v1", "v2", "v3"]
+
+    def test_cached_per_state(self):
+        from state_utils import ProjectState
+
+        state = ProjectState(versions=list(TREE))
+        assert lineage_index(state) is lineage_index(state)
+        before = lineage_index(state)
+        state["versions"].append({"id": "v8", "parent": "v7"})
+        assert lineage_index(state) is not before
+        assert lineage_index(state).parent["v8"] == "v7"
+
+
+class TestRenderTree:
+    """Tests for render_tree()"""
+
+    def test_ascii_tree(self):
+        index = LineageIndex(TREE)
+        index.tags["v3"] = "google"
+        assert render_tree(index, active="v5") == "\n".join([
+            "v1",
+            "|-- v2",
+            "|   `-- v4",
+            "|       `-- v6",
+            "`-- v3 (google)",
+            "    `-- v5 *",
+            "v7",
+        ])
+
+    def test_subtree_and_max_depth(self):
+        index = LineageIndex(TREE)
+        assert render_tree(index, root="v2") == "v2\n`-- v4\n    `-- v6"
+        assert render_tree(index, root="v1", max_depth=1) == "\n".join([
+            "v1",
+            "|-- v2",
+            "|   `-- ... (2 more)",
+            "`-- v3",
+            "    `-- ... (1 more)",
+        ])
@@ -0,0 +1,132 @@
+"""Tests for resume-state/scripts/object_store.py"""
+
+import os
+import sys
+from pathlib import Path
+
+# Add the object_store module to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+import object_store
+from object_store import (
+    COPY_STRATEGIES,
+    add_file,
+    copy_file,
+    hash_file,
+    link_object,
+    object_path,
+    put_object,
+)
+
+
+class TestPutObject:
+    """Tests for put_object()"""
+
+    def test_stores_content_once(self, tmp_path):
+        a = tmp_path / "a.yaml"
+        b = tmp_path / "b.yaml"
+        a.write_text("summary: same\n")
+        b.write_text("summary: same\n")
+        store = tmp_path / "store"
+
+        assert put_object(a, store) == put_object(b, store) == hash_file(a)
+        objects = [p for p in (store / "objects").rglob("*") if p.is_file()]
+        assert len(objects) == 1
+
+    def test_objects_are_read_only(self, tmp_path):
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4")
+        digest = put_object(src, tmp_path / "store")
+        assert oct(object_path(digest, tmp_path / "store").stat().st_mode & 0o777) == "0o444"
+
+
+class TestLinkObject:
+    """Tests for link_object() and add_file()"""
+
+    def test_immutable_files_are_hardlinked(self, tmp_path):
+        src = tmp_path / "resume.pdf"
+        src.write_bytes(b"%PDF-1.4 content")
+        store = tmp_path / "store"
+        first = tmp_path / "sources" / "v1_resume.pdf"
+        second = tmp_path / "sources" / "v2_resume.pdf"
+
+        digest = add_file(src, first, store, mutable=False)
+        assert link_object(digest, second, store, mutable=False) == "hardlink"
+        assert first.stat().st_ino == second.stat().st_ino == object_path(digest, store).stat().st_ino
+
+    def test_mutable_copies_are_independent(self, tmp_path):
+        src = tmp_path / "resume.yaml"
+        src.write_text("summary: original\n")
+        store = tmp_path / "store"
+        dst = tmp_path / "v2" / "resume.yaml"
+
+        digest = add_file(src, dst, store, mutable=True)
+        dst.write_text("summary: edited\n")
+
+        assert object_path(digest, store).read_text() == "summary: original\n"
+        assert src.read_text() == "summary: original\n"
+
+    def test_replaces_leftover_destination(self, tmp_path):
+        # An interrupted import can leave the hardlink behind; retrying must work
+        src = tmp_path / "resume.pdf"
+        src.write_bytes(b"%PDF-1.4 content")
+        store = tmp_path / "store"
+        dst = tmp_path / "sources" / "v1_resume.pdf"
+        add_file(src, dst, store, mutable=False)
+        assert link_object(hash_file(src), dst, store, mutable=False) == "hardlink"
+        assert dst.read_bytes() == b"%PDF-1.4 content"
+
+
+class TestCopyFile:
+    """Tests for copy_file()"""
+
+    def test_copies_content_and_metadata(self, tmp_path):
+        src = tmp_path / "resume.pdf"
+        src.write_bytes(b"%PDF-1.4 " * 100_000)
+        os.utime(src, (1_600_000_000, 1_600_000_000))
+        dst = tmp_path / "out" / "resume.pdf"
+        dst.parent.mkdir()
+
+        method = copy_file(src, dst)
+        assert method in COPY_STRATEGIES and method != "hardlink"
+        assert dst.read_bytes() == src.read_bytes()
+        assert dst.stat().st_mtime == 1_600_000_000
+        assert dst.stat().st_ino != src.stat().st_ino
+
+    def test_hardlink_only_when_allowed(self, tmp_path, monkeypatch):
+        def unsupported(src_fd, dst_fd, size):
+            raise OSError(95, "Operation not supported")
+
+        monkeypatch.setattr(object_store, "_KERNEL_STRATEGIES", [("reflink", unsupported)])
+        src = tmp_path / "a.pdf"
+        src.write_bytes(b"%PDF-1.4 content")
+        assert copy_file(src, tmp_path / "b.pdf", allow_hardlink=True) == "hardlink"
+        assert (tmp_path / "b.pdf").stat().st_ino == src.stat().st_ino
+        assert copy_file(src, tmp_path / "c.pdf") == "copy"
+        assert (tmp_path / "c.pdf").read_bytes() == b"%PDF-1.4 content"
+
+    def test_falls_through_partial_failures(self, tmp_path, monkeypatch):
+        def half_then_fail(src_fd, dst_fd, size):
+            os.write(dst_fd, b"garbage")
+            raise OSError(22, "Invalid argument")
+
+        monkeypatch.setattr(object_store, "_KERNEL_STRATEGIES",
+                            [("reflink", half_then_fail), ("copy_file_range", half_then_fail)])
+        src = tmp_path / "a.yaml"
+        src.write_text("summary: x\n")
+        dst = tmp_path / "b.yaml"
+        assert copy_file(src, dst) == "copy"
+        assert dst.read_text() == "summary: x\n"
+
+    def test_does_not_write_through_existing_hardlink(self, tmp_path):
+        store = tmp_path / "store"
+        src = tmp_path / "resume.pdf"
+        src.write_bytes(b"original")
+        dst = tmp_path / "sources" / "v1_resume.pdf"
+        digest = add_file(src, dst, store, mutable=False)
+
+        other = tmp_path / "other.pdf"
+        other.write_bytes(b"replacement")
+        copy_file(other, dst)
+        assert dst.read_bytes() == b"replacement"
+        assert object_path(digest, store).read_bytes() == b"original"
@@ -0,0 +1,119 @@
+"""Tests for resume-extractor/scripts/phrase_scanner.py"""
+
+import sys
+from pathlib import Path
+
+# Add the scanner and validator modules to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-extractor" / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-optimizer" / "scripts"))
+
+from phrase_scanner import PhraseMatch, PhraseScanner, load_dictionaries
+from validate_yaml import validate_content_quality
+
+
+class TestPhraseScanner:
+    """Tests for PhraseScanner"""
+
+    def test_reports_positions(self):
+        scanner = PhraseScanner({"buzzwords": ["team player"]})
+        text = "A true Team Player at heart"
+        assert scanner.scan(text) == [PhraseMatch("buzzwords", "team player", 7, 18)]
+
+    def test_overlapping_patterns(self):
+        scanner = PhraseScanner({"a": ["he", "she", "hers", "his"]}, whole_words=False)
+        phrases = sorted(m.phrase for m in scanner.scan("ushers"))
+        assert phrases == ["he", "hers", "she"]
+
+    def test_whole_words_only(self):
+        scanner = PhraseScanner({"weak_verbs": ["led"]})
+        assert scanner.scan("Called the shots") == []
+        assert len(scanner.scan("Led the team")) == 1
+
+    def test_categories_filter(self):
+        scanner = PhraseScanner({"buzzwords": ["synergy"], "ats_keywords": ["python"]})
+        matches = scanner.scan("Python synergy", categories={"ats_keywords"})
+        assert [m.phrase for m in matches] == ["python"]
+
+    def test_leading_match_prefers_longest(self):
+        scanner = PhraseScanner({"weak_verbs": ["worked", "worked on"]})
+        match = scanner.leading_match("  Worked on billing")
+        assert match.phrase == "worked on"
+        assert match.start == 2
+
+    def test_leading_match_ignores_later_words(self):
+        scanner = PhraseScanner({"weak_verbs": ["helped"]})
+        assert scanner.leading_match("Built tools that helped sales") is None
+
+    def test_duplicates_are_ignored(self):
+        scanner = PhraseScanner({"a": ["Synergy", "synergy ", "SYNERGY"]})
+        assert len(scanner) == 1
+
+    def test_many_patterns(self):
+        scanner = PhraseScanner({"generated": [f"term{i}" for i in range(5000)]})
+        matches = scanner.scan("uses term42 and term4999 but not term50000")
+        assert [m.phrase for m in matches] == ["term42", "term4999"]
+
+    def test_empty_text(self):
+        scanner = PhraseScanner({"a": ["x"]})
+        assert scanner.scan("") == []
+
+    def test_load_dictionaries(self, tmp_path):
+        path = tmp_path / "phrases.yaml"
+        path.write_text("buzzwords:\n  - ninja\nempty:\n")
+        assert load_dictionaries(path) == {"buzzwords": ["ninja"], "empty": []}
+
+
+class TestValidateContentQuality:
+    """Tests for scanner-backed validate_content_quality()"""
+
+    def make_data(self, bullets):
+        return {
+            "summary": "Platform engineer with Kubernetes experience. " * 3,
+            "skills": {"Cloud": ["Terraform"]},
+            "experience": [
+                {"company": "Acme", "positions": [{"title": "Eng", "achievements": bullets}]}
+            ],
+        }
+
+    def test_weak_verb_only_at_start(self):
+        _, suggestions = validate_content_quality(
+            self.make_data(["Helped ship 3 apps", "Shipped 3 apps that helped sales"])
+        )
+        weak = [s for s in suggestions if "weak verb" in s]
+        assert weak == ["Acme: Starts with weak verb 'helped' - consider stronger action verb"]
+
+    def test_banned_phrase_warning(self):
+        warnings, _ = validate_content_quality(self.make_data(["Tasked with 5 launches"]))
+        assert any("tasked with" in w for w in warnings)
+
+    def test_missing_keywords(self):
+        _, suggestions = validate_content_quality(
+            self.make_data(["Built 4 services"]),
+            required_keywords=["Kubernetes", "Terraform", "GraphQL"],
+        )
+        missing = [s for s in suggestions if s.startswith("Missing ATS keyword")]
+        assert missing == ["Missing ATS keyword: 'graphql'"]
+
+    def test_keywords_do_not_leak_into_scanner(self):
+        from validate_yaml import build_scanner
+
+        scanner = build_scanner()
+        before = len(scanner)
+        validate_content_quality(
+            self.make_data(["Built 4 services"]), scanner, required_keywords=["GraphQL"]
+        )
+        assert len(scanner) == before
+        _, suggestions = validate_content_quality(self.make_data(["Built 4 services"]), scanner)
+        assert not [s for s in suggestions if s.startswith("Missing ATS keyword")]
+
+    def test_linters_share_weak_verbs(self):
+        from phrase_scanner import WEAK_VERBS
+        from schema import experience_warnings
+        from validate_yaml import DEFAULT_PHRASES_PATH
+
+        assert set(WEAK_VERBS) <= set(load_dictionaries(DEFAULT_PHRASES_PATH)["weak_verbs"])
+        for verb in WEAK_VERBS:
+            bullets = [f"{verb.capitalize()} in 3 launches"]
+            assert experience_warnings(self.make_data(bullets)["experience"])
+            _, suggestions = validate_content_quality(self.make_data(bullets))
+            assert any("weak verb" in s for s in suggestions)
@@ -0,0 +1,183 @@
+"""Tests for resume-extractor/scripts/schema.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the schema module to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-extractor" / "scripts"))
+
+from pydantic import ValidationError
+
+from schema import (
+    Resume,
+    ResumeView,
+    validate_resume,
+    validate_section,
+    validation_stamp,
+)
+
+
+def make_resume() -> dict:
+    return {
+        "contact": {"name": "Jane Doe", "email": "jane@example.com"},
+        "summary": "Engineer.",
+        "experience": [
+            {
+                "company": "Acme",
+                "positions": [
+                    {
+                        "title": "Engineer",
+                        "dates": "2020 - Present",
+                        "achievements": ["Helped ship things", "Built a platform"],
+                    }
+                ],
+            }
+        ],
+        "skills": {"Languages": ["Python"]},
+        "education": [{"institution": "State U", "degree": "BS"}],
+    }
+
+
+class TestValidateResume:
+    """Tests for validate_resume()"""
+
+    def test_full_validation_builds_nested_models(self):
+        resume, warnings = validate_resume(make_resume())
+        assert resume.contact.name == "Jane Doe"
+        assert resume.experience[0].positions[0].title == "Engineer"
+        assert any("Weak verb 'helped'" in w for w in warnings)
+
+    def test_invalid_data_raises(self):
+        data = make_resume()
+        data["contact"]["email"] = "not-an-email"
+        with pytest.raises(ValidationError):
+            validate_resume(data)
+
+    def test_trusted_without_cached_stamp_validates(self):
+        data = make_resume()
+        data["contact"]["email"] = "still-not-an-email"
+        with pytest.raises(ValidationError):
+            validate_resume(data, trusted=True)
+
+    def test_trusted_hit_returns_copy_of_validated_model(self):
+        data = make_resume()
+        stamp = validation_stamp(data)
+        first, first_warnings = validate_resume(data, trusted=True, stamp=stamp)
+        first.contact.name = "Changed"
+
+        resume, warnings = validate_resume(data, trusted=True, stamp=stamp)
+        assert isinstance(resume, Resume)
+        assert resume.contact.name == "Jane Doe"
+        assert resume.experience[0].positions[0].title == "Engineer"
+        assert resume is not first
+        assert warnings == first_warnings
+
+    def test_stamp_changes_with_content(self):
+        data = make_resume()
+        before = validation_stamp(data)
+        data["summary"] = "Different."
+        assert validation_stamp(data) != before
+
+
+class TestValidateSection:
+    """Tests for validate_section()"""
+
+    def test_valid_section(self):
+        result = validate_section("education", [{"institution": "MIT", "degree": "BS"}])
+        assert result[0].institution == "MIT"
+
+    def test_invalid_section(self):
+        with pytest.raises(ValidationError):
+            validate_section("experience", [{"company": "Acme", "positions": []}])
+
+    def test_unknown_section(self):
+        with pytest.raises(KeyError):
+            validate_section("hobbies", [])
+
+
+class TestResumeView:
+    """Tests for ResumeView"""
+
+    def test_attribute_access(self):
+        view = ResumeView(make_resume())
+        assert view.contact.name == "Jane Doe"
+        assert view.experience[0].positions[0].dates == "2020 - Present"
+        assert view.missing is None
+
+    def test_read_only(self):
+        view = ResumeView(make_resume())
+        with pytest.raises(AttributeError):
+            view.summary = "changed"
+
+    def test_has_no_instance_dict(self):
+        view = ResumeView(make_resume())
+        assert not hasattr(view, "__dict__")
+
+
+class TestSchemaArtifacts:
+    """Tests for the exported JSON Schema and generated validator"""
+
+    def test_json_schema_is_current(self):
+        from export_json_schema import SCHEMA_JSON_PATH, build_json_schema, render_json_schema
+
+        assert SCHEMA_JSON_PATH.read_text() == render_json_schema(build_json_schema())
+
+    def test_yaml_reference_in_sync(self):
+        import yaml
+
+        from export_json_schema import SCHEMA_YAML_PATH, build_json_schema, check_reference_sync
+
+        example = yaml.safe_load(SCHEMA_YAML_PATH.read_text())
+        assert check_reference_sync(build_json_schema(), example) == []
+
+    def test_reference_drift_detected(self):
+        from export_json_schema import build_json_schema, check_reference_sync
+
+        example = make_resume()
+        example["contact"]["pager"] = "555-0100"
+        problems = check_reference_sync(build_json_schema(), example)
+        assert "contact.pager: documented in YAML but not in models" in problems
+
+    def test_generated_validator_is_current(self):
+        import json
+
+        from generate_validator import SCHEMA_JSON_PATH, VALIDATOR_PATH, generate_validator_source
+
+        schema = json.loads(SCHEMA_JSON_PATH.read_text())
+        assert VALIDATOR_PATH.read_text() == generate_validator_source(schema)
+
+    def test_generated_validator_accepts_valid(self):
+        from resume_validator import validate
+
+        assert validate(make_resume()) == []
+
+    @pytest.mark.parametrize(
+        "mutate, expected",
+        [
+            (lambda d: d.pop("contact"), "contact: field required"),
+            (lambda d: d["contact"].update(name=""), "contact.name: must have at least 1"),
+            (
+                lambda d: d["experience"][0].update(positions=[]),
+                "experience[0].positions: must have at least 1 item(s)",
+            ),
+            (
+                lambda d: d["experience"][0]["positions"][0].update(dates=2020),
+                "experience[0].positions[0].dates: expected string, got int",
+            ),
+            (
+                lambda d: d.update(skills={"Languages": 3}),
+                "skills.Languages: does not match any allowed type",
+            ),
+        ],
+    )
+    def test_generated_validator_agrees_with_pydantic(self, mutate, expected):
+        from resume_validator import validate
+
+        data = make_resume()
+        mutate(data)
+        errors = validate(data)
+        assert any(expected in e for e in errors), errors
+        with pytest.raises(ValidationError):
+            validate_resume(data)
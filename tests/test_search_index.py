@@ -0,0 +1,149 @@
+"""Tests for resume-state/scripts/search_index.py"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from search_index import build_query, extract_fields, refresh_index, search
+
+RESUME = """\
+contact:
+  name: Ada Lovelace
+summary: Platform engineer focused on reliability.
+experience:
+  - company: Acme Cloud
+    positions:
+      - title: Staff Engineer
+        achievements:
+          - Migrated 40 services to Kubernetes
+          - Cut deploy time by 60%
+skills:
+  Infrastructure:
+    - Terraform
+    - Kubernetes
+"""
+
+
+def add_version(project: str, text: str, tag: str = None) -> str:
+    from state_utils import append_version, get_version_path, now_iso
+
+    def make_entry(version_id):
+        path = get_version_path(project, version_id, tag)
+        path.mkdir(parents=True)
+        (path / "resume.yaml").write_text(text)
+        return {"id": version_id, "tag": tag, "created_at": now_iso(),
+                "source": {"type": "edit"}, "parent": None, "notes": ""}
+
+    return append_version(project, make_entry)["id"]
+
+
+def hits(store, query, **kwargs) -> list[str]:
+    return [f"{h['project']}/{h['version']}" for h in search(store, query, **kwargs)]
+
+
+class TestExtractFields:
+    """Tests for extract_fields()"""
+
+    def test_fields(self):
+        import yaml
+
+        fields = extract_fields(yaml.safe_load(RESUME))
+        assert fields["company"] == "Acme Cloud"
+        assert fields["title"] == "Staff Engineer"
+        assert "Migrated 40 services" in fields["bullets"]
+        assert fields["skills"].split("\n") == ["Infrastructure", "Terraform", "Kubernetes"]
+        assert "Ada Lovelace" in fields["body"] and "reliability" in fields["body"]
+
+
+class TestBuildQuery:
+    """Tests for build_query()"""
+
+    def test_terms_fields_and_prefixes(self):
+        assert build_query("kubernetes terraform") == '"kubernetes" "terraform"'
+        assert build_query('company:acme "deploy time"') == 'company : "acme" "deploy time"'
+        assert build_query("kube*") == '"kube" *'
+        assert build_query("acme", field="company") == 'company : ("acme")'
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            build_query("   ")
+        with pytest.raises(ValueError, match="Unknown field"):
+            build_query("employer:acme")
+
+
+class TestSearch:
+    """Tests for refresh_index() and search()"""
+
+    def test_ranked_hits_across_projects(self, store):
+        from init_project import init_project
+
+        init_project("ada")
+        init_project("bob")
+        add_version("ada", RESUME)
+        add_version("bob", "summary: Wrote Terraform once\nskills: [Go]\n")
+        add_version("bob", "summary: Frontend work\n")
+
+        assert sorted(hits(store, "terraform")) == ["ada/v1", "bob/v1"]
+        assert hits(store, "kubernetes terraform") == ["ada/v1"]
+        assert hits(store, "company:acme") == ["ada/v1"]
+        assert hits(store, "terraform", project="bob") == ["bob/v1"]
+        assert hits(store, "terraform", field="skills") == ["ada/v1"]
+        assert hits(store, "migrat*") == ["ada/v1"]
+        assert "[Terraform]" in search(store, "terraform", project="bob")[0]["snippet"]
+
+    def test_field_weights(self, store):
+        from init_project import init_project
+
+        init_project("p")
+        add_version("p", "summary: Consulted for Initech on billing\n"
+                         "experience: [{company: Globex, title: Engineer}]\n")
+        add_version("p", "summary: Consulted for Globex on billing\n"
+                         "experience: [{company: Initech, title: Engineer}]\n")
+        assert hits(store, "initech") == ["p/v2", "p/v1"]
+
+    def test_incremental_refresh(self, store):
+        from state_utils import get_version_path
+        from init_project import init_project
+
+        init_project("ada")
+        add_version("ada", RESUME)
+        assert refresh_index(store)["indexed"] == 1
+        assert refresh_index(store) == {"indexed": 0, "removed": 0, "total": 1}
+
+        yaml_path = get_version_path("ada", "v1") / "resume.yaml"
+        yaml_path.write_text(RESUME.replace("Acme Cloud", "Globex"))
+        st = yaml_path.stat()
+        os.utime(yaml_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1))
+        assert hits(store, "globex") == ["ada/v1"]
+        assert hits(store, "acme") == []
+
+    def test_create_updates_existing_index(self, store):
+        from create_version import create_version
+        from init_project import init_project
+
+        init_project("ada")
+        add_version("ada", RESUME)
+        refresh_index(store)
+        create_version("ada", tag="globex", store_path=store)
+        assert hits(store, "acme", refresh=False) == ["ada/v1", "ada/v2"]
+
+    def test_removed_versions_and_packed_content(self, store):
+        from delta_store import pack_project
+        from init_project import init_project
+        from state_utils import load_project_state, save_project_state
+
+        init_project("ada")
+        add_version("ada", RESUME)
+        add_version("ada", "summary: Frontend work\n")
+        pack_project("ada", store_path=store)
+        assert hits(store, "kubernetes") == ["ada/v1"]
+
+        state = load_project_state("ada")
+        state["versions"].pop(0)
+        save_project_state("ada", state)
+        assert hits(store, "kubernetes") == []
+        assert refresh_index(store)["total"] == 1
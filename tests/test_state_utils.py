@@ -90,3 +90,534 @@ class TestGetNextVersionId:
         # Ensure it finds the max, not just the last entry
         state = {"versions": [{"id": "v10"}, {"id": "v2"}, {"id": "v5"}]}
         assert get_next_version_id(state) == "v11"
+
+
+def make_project(name: str, backend: str, versions: int = 3) -> None:
+    from init_project import init_project
+    from state_utils import append_version, get_version_path, now_iso
+
+    init_project(name, backend=backend)
+    for _ in range(versions):
+        def make_entry(version_id):
+            path = get_version_path(name, version_id)
+            path.mkdir(parents=True)
+            (path / "resume.yaml").write_text(f"summary: {version_id}\n")
+            return {"id": version_id, "tag": None, "created_at": now_iso(),
+                    "source": {"type": "import"}, "parent": None, "notes": ""}
+        append_version(name, make_entry)
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+class TestStateBackends:
+    """Tests for the JSON and SQLite project state backends"""
+
+    def test_append_and_lookup(self, store, backend):
+        from state_utils import get_active_version_id, get_version, load_project_state, uses_sqlite
+
+        make_project("p", backend)
+        assert uses_sqlite("p") == (backend == "sqlite")
+        assert [v["id"] for v in load_project_state("p")["versions"]] == ["v1", "v2", "v3"]
+        assert get_active_version_id("p") == "v3"
+        assert get_version("p", "v2")["source"] == {"type": "import"}
+        assert get_version("p", "v9") is None
+
+    def test_failed_append_records_nothing(self, store, backend):
+        from state_utils import append_version, load_project_state
+
+        make_project("p", backend, versions=1)
+
+        def fail(version_id):
+            raise RuntimeError("extraction failed")
+
+        with pytest.raises(RuntimeError):
+            append_version("p", fail)
+        state = load_project_state("p")
+        assert len(state["versions"]) == 1 and state["active_version"] == "v1"
+
+    def test_save_round_trip(self, store, backend):
+        from state_utils import load_project_state, save_project_state, set_active_version
+
+        make_project("p", backend)
+        state = load_project_state("p")
+        state["versions"][0]["notes"] = "edited"
+        state["versions"].pop()
+        state["metadata"] = {"target": "staff"}
+        save_project_state("p", state)
+        set_active_version("p", "v1")
+
+        reloaded = load_project_state("p")
+        assert reloaded["versions"][0]["notes"] == "edited"
+        assert [v["id"] for v in reloaded["versions"]] == ["v1", "v2"]
+        assert reloaded["metadata"] == {"target": "staff"}
+        assert reloaded["active_version"] == "v1"
+
+
+class TestConvertBackend:
+    """Tests for convert_backend.convert_project()"""
+
+    def test_json_to_sqlite_and_back(self, store):
+        from convert_backend import convert_project
+        from state_utils import get_project_path, load_project_state, uses_sqlite
+
+        make_project("p", "json")
+        before = load_project_state("p")
+
+        assert convert_project("p", "sqlite", store)
+        assert uses_sqlite("p")
+        assert (get_project_path("p") / "project.json.bak").exists()
+        assert load_project_state("p") == before
+        assert not convert_project("p", "sqlite", store)
+
+        assert convert_project("p", "json", store)
+        assert not uses_sqlite("p")
+        assert load_project_state("p") == before
+
+
+class TestGetStorePath:
+    """Tests for get_store_path()"""
+
+    @pytest.fixture(autouse=True)
+    def no_env(self, monkeypatch):
+        from state_utils import clear_store_cache
+
+        monkeypatch.delenv("RESUME_VERSIONS_PATH", raising=False)
+        monkeypatch.delenv("RESUME_STORE_CACHE", raising=False)
+        clear_store_cache()
+        yield
+        clear_store_cache()
+
+    def test_env_override(self, tmp_path, monkeypatch):
+        from state_utils import get_store_path
+
+        monkeypatch.setenv("RESUME_VERSIONS_PATH", str(tmp_path / "custom"))
+        assert get_store_path() == tmp_path / "custom"
+
+    def test_git_root_when_no_store(self, tmp_path):
+        from state_utils import STORE_DIR, get_store_path
+
+        (tmp_path / ".git").mkdir()
+        nested = tmp_path / "a" / "b"
+        nested.mkdir(parents=True)
+        assert get_store_path(nested) == tmp_path.resolve() / STORE_DIR
+
+    def test_nearest_store_inside_repo(self, tmp_path):
+        from state_utils import STORE_DIR, get_store_path
+
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "a" / STORE_DIR).mkdir(parents=True)
+        nested = tmp_path / "a" / "b"
+        nested.mkdir()
+        assert get_store_path(nested) == tmp_path.resolve() / "a" / STORE_DIR
+
+    def test_memoized_per_process(self, tmp_path, monkeypatch):
+        import state_utils
+
+        (tmp_path / ".git").mkdir()
+        calls = []
+        original = state_utils._find_store
+        monkeypatch.setattr(state_utils, "_find_store", lambda s: calls.append(s) or original(s))
+        state_utils.get_store_path(tmp_path)
+        state_utils.get_store_path(tmp_path)
+        assert len(calls) == 1
+
+    def test_persisted_map_validated(self, tmp_path, monkeypatch):
+        import state_utils
+
+        cache_file = tmp_path / "store_map.json"
+        monkeypatch.setenv("RESUME_STORE_CACHE", str(cache_file))
+        (tmp_path / ".git").mkdir()
+        store = tmp_path / state_utils.STORE_DIR
+        store.mkdir()
+        calls = []
+        original = state_utils._find_store
+        monkeypatch.setattr(state_utils, "_find_store", lambda s: calls.append(s) or original(s))
+
+        assert state_utils.get_store_path(tmp_path) == store.resolve()
+        state_utils.clear_store_cache()
+        assert state_utils.get_store_path(tmp_path) == store.resolve()
+        assert len(calls) == 1  # second lookup came from the persisted map
+
+        # A stale entry (store removed) falls back to walking
+        store.rmdir()
+        state_utils.clear_store_cache()
+        assert state_utils.get_store_path(tmp_path) == store.resolve()
+        assert len(calls) == 2
+
+
+def _create_versions(args):
+    store, count = args
+    import os
+
+    os.environ["RESUME_VERSIONS_PATH"] = store
+    from create_version import create_version
+
+    return [create_version("p", from_version="v1")[0] for _ in range(count)]
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+class TestConcurrentMutations:
+    """Tests for locking and revision checks around state mutations"""
+
+    def test_parallel_creates_get_unique_ids(self, store, backend):
+        from concurrent.futures import ProcessPoolExecutor
+
+        from state_utils import load_project_state
+
+        make_project("p", backend, versions=1)
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(_create_versions, [(str(store), 5)] * 4))
+
+        created = [vid for batch in results for vid in batch]
+        assert len(set(created)) == 20
+        ids = [v["id"] for v in load_project_state("p")["versions"]]
+        assert sorted(ids, key=lambda v: int(v[1:])) == [f"v{i}" for i in range(1, 22)]
+
+    def test_stale_save_is_rejected(self, store, backend):
+        from state_utils import (
+            StateConflictError,
+            load_project_state,
+            save_project_state,
+            set_active_version,
+        )
+
+        make_project("p", backend)
+        stale = load_project_state("p")
+        set_active_version("p", "v1")
+        stale["notes"] = "lost update"
+        with pytest.raises(StateConflictError):
+            save_project_state("p", stale)
+
+    def test_mutations_hold_project_lock(self, store, backend, monkeypatch):
+        import state_utils
+        from state_utils import (
+            LOCK_FILE,
+            append_version,
+            append_versions,
+            get_project_path,
+            insert_versions,
+            now_iso,
+            set_active_version,
+            set_version_notes,
+        )
+
+        make_project("p", backend, versions=1)
+        lock = str(get_project_path("p") / LOCK_FILE)
+        held = []
+        refresh = state_utils.refresh_summary
+
+        def record(*args, **kwargs):
+            held.append(lock in getattr(state_utils._held_locks, "locks", {}))
+            return refresh(*args, **kwargs)
+
+        def make_entry(version_id):
+            held.append(lock in getattr(state_utils._held_locks, "locks", {}))
+            return {"id": version_id, "tag": None, "created_at": now_iso(),
+                    "source": {"type": "edit"}, "parent": None, "notes": ""}
+
+        monkeypatch.setattr(state_utils, "refresh_summary", record)
+        append_version("p", make_entry)
+        append_versions("p", [make_entry])
+        insert_versions("p", [{"id": "v9", "tag": None, "created_at": now_iso(),
+                               "source": {"type": "sync"}, "parent": None, "notes": ""}])
+        set_active_version("p", "v2")
+        set_version_notes("p", "v2", "edited")
+        assert held and all(held)
+
+    def test_update_project_state(self, store, backend):
+        from state_utils import load_project_state, update_project_state
+
+        make_project("p", backend)
+        before = load_project_state("p")["revision"]
+        update_project_state("p", lambda state: state["metadata"].update(target="staff"))
+        after = load_project_state("p")
+        assert after["metadata"] == {"target": "staff"}
+        assert after["revision"] == before + 1
+
+
+def _add_versions(name: str, specs: list[dict]) -> None:
+    from state_utils import append_version, get_version_path
+
+    for spec in specs:
+        def make_entry(version_id, spec=spec):
+            get_version_path(name, version_id).mkdir(parents=True)
+            return {"id": version_id, "tag": spec.get("tag"), "created_at": spec["created_at"],
+                    "source": {"type": spec.get("type", "edit")},
+                    "parent": spec.get("parent"), "notes": ""}
+        append_version(name, make_entry)
+
+
+class TestVersionIndex:
+    """Tests for get_version_entry() and get_versions_by_tag()"""
+
+    def test_lookup_by_id_and_tag(self):
+        from state_utils import ProjectState, get_version_entry, get_versions_by_tag
+
+        state = ProjectState(versions=[
+            {"id": "v1", "tag": "google"}, {"id": "v2", "tag": None}, {"id": "v3", "tag": "google"},
+        ])
+        assert get_version_entry(state, "v2") == {"id": "v2", "tag": None}
+        assert get_version_entry(state, "v9") is None
+        assert [v["id"] for v in get_versions_by_tag(state, "google")] == ["v1", "v3"]
+
+    def test_index_follows_appends(self):
+        from state_utils import ProjectState, get_version_entry
+
+        state = ProjectState(versions=[{"id": "v1"}])
+        assert get_version_entry(state, "v1") is not None
+        state["versions"].append({"id": "v2"})
+        assert get_version_entry(state, "v2") == {"id": "v2"}
+
+    def test_plain_dict_still_supported(self):
+        from state_utils import get_version_entry
+
+        assert get_version_entry({"versions": [{"id": "v1"}]}, "v1") == {"id": "v1"}
+
+    def test_index_not_saved(self, store):
+        from state_utils import load_project_state, save_project_state
+
+        make_project("p", "json", versions=2)
+        state = load_project_state("p")
+        assert state.index.by_id.keys() == {"v1", "v2"}
+        save_project_state("p", state)
+        assert set(load_project_state("p")) == set(state)
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+class TestIterVersions:
+    """Tests for iter_versions()"""
+
+    SPECS = [
+        {"created_at": "2025-01-10T00:00:00+00:00", "type": "import"},
+        {"created_at": "2025-03-05T00:00:00+00:00", "tag": "google", "parent": "v1"},
+        {"created_at": "2025-06-20T00:00:00+00:00", "tag": "meta", "parent": "v1"},
+        {"created_at": "2025-06-30T00:00:00+00:00", "tag": "google", "parent": "v2"},
+        {"created_at": "2025-09-01T00:00:00+00:00", "parent": "v4"},
+    ]
+
+    def ids(self, **kwargs) -> list[str]:
+        from state_utils import iter_versions
+
+        return [v["id"] for v in iter_versions("p", **kwargs)]
+
+    def test_filters(self, store, backend):
+        from init_project import init_project
+
+        init_project("p", backend=backend)
+        _add_versions("p", self.SPECS)
+        assert self.ids() == ["v1", "v2", "v3", "v4", "v5"]
+        assert self.ids(tag="google") == ["v2", "v4"]
+        assert self.ids(source_type="import") == ["v1"]
+        assert self.ids(parent="v1") == ["v2", "v3"]
+        assert self.ids(since="2025-03-05", until="2025-06") == ["v2", "v3", "v4"]
+        assert self.ids(tag="google", until="2025-05") == ["v2"]
+
+    def test_paging(self, store, backend):
+        from init_project import init_project
+
+        init_project("p", backend=backend)
+        _add_versions("p", self.SPECS)
+        assert self.ids(offset=1, limit=2) == ["v2", "v3"]
+        assert self.ids(offset=4, limit=2) == ["v5"]
+        assert self.ids(newest_first=True, limit=2) == ["v5", "v4"]
+        assert self.ids(parent="v1", newest_first=True, offset=1) == ["v2"]
+
+    def test_list_versions_pages(self, store, backend, capsys):
+        from init_project import init_project
+        from list_versions import list_versions
+
+        init_project("p", backend=backend)
+        _add_versions("p", self.SPECS)
+        capsys.readouterr()
+        list_versions("p", limit=2, offset=1)
+        out = capsys.readouterr().out
+        assert " v2 " in out and " v3 " in out and " v4 " not in out
+        assert "--offset 3" in out
+
+        list_versions("p", tag="nope")
+        assert "No matching versions" in capsys.readouterr().out
+
+
+class TestJournal:
+    """Tests for the project.json change journal"""
+
+    def test_changes_are_appended_not_saved(self, store):
+        from state_utils import (
+            get_project_path,
+            load_project_state,
+            read_journal,
+            set_active_version,
+            set_version_notes,
+        )
+
+        make_project("p", "json")
+        snapshot = (get_project_path("p") / "project.json").read_text()
+        set_active_version("p", "v1")
+        set_version_notes("p", "v2", "sent to Acme")
+
+        assert (get_project_path("p") / "project.json").read_text() == snapshot
+        events = [e["event"] for e in read_journal("p")]
+        assert events[-2:] == ["active_switched", "notes_edited"]
+        state = load_project_state("p")
+        assert state["active_version"] == "v1"
+        assert state["versions"][1]["notes"] == "sent to Acme"
+        assert state["revision"] == read_journal("p")[-1]["revision"]
+
+    def test_torn_tail_is_ignored_and_repaired(self, store):
+        from state_utils import get_project_path, load_project_state, set_active_version
+
+        make_project("p", "json")
+        journal = get_project_path("p") / "journal.jsonl"
+        with open(journal, "ab") as f:
+            f.write(b'{"event":"active_switched","vers')
+        assert load_project_state("p")["active_version"] == "v3"
+
+        set_active_version("p", "v2")
+        assert journal.read_bytes().endswith(b"\n")
+        assert load_project_state("p")["active_version"] == "v2"
+
+    def test_fold_into_snapshot(self, store, monkeypatch):
+        import json
+
+        import state_utils
+        from state_utils import get_project_path, load_project_state, set_active_version
+
+        monkeypatch.setattr(state_utils, "JOURNAL_FOLD_EVERY", 4)
+        make_project("p", "json", versions=1)
+        for _ in range(3):
+            set_active_version("p", "v1")
+
+        snapshot = json.loads((get_project_path("p") / "project.json").read_text())
+        journal = get_project_path("p") / "journal.jsonl"
+        assert snapshot["journal_offset"] == journal.stat().st_size
+        assert snapshot["revision"] == load_project_state("p")["revision"]
+        assert "journal_offset" not in load_project_state("p")
+
+    def test_undo(self, store):
+        from state_utils import (
+            load_project_state,
+            set_active_version,
+            set_version_notes,
+            undo_last_change,
+        )
+
+        make_project("p", "json")
+        set_version_notes("p", "v1", "first")
+        set_active_version("p", "v1")
+
+        assert undo_last_change("p")["event"] == "active_switched"
+        assert load_project_state("p")["active_version"] == "v3"
+        assert undo_last_change("p")["event"] == "notes_edited"
+        assert load_project_state("p")["versions"][0]["notes"] == ""
+        assert undo_last_change("p")["entry"]["id"] == "v3"
+        state = load_project_state("p")
+        assert [v["id"] for v in state["versions"]] == ["v1", "v2"]
+        assert state["active_version"] == "v2"
+
+    def test_undone_ids_are_not_reused(self, store):
+        from create_version import create_version
+        from state_utils import (
+            get_version_path,
+            load_project_state,
+            save_project_state,
+            undo_last_change,
+        )
+
+        make_project("p", "json")
+        (get_version_path("p", "v3") / "resume.pdf").write_bytes(b"%PDF old")
+        assert undo_last_change("p")["entry"]["id"] == "v3"
+
+        version_id, path = create_version("p", content="summary: new\n")
+        assert version_id == "v4"
+        assert not (path / "resume.pdf").exists()
+        save_project_state("p", load_project_state("p"))
+        assert load_project_state("p")["version_high_water"] == 3
+
+    def test_undo_skips_full_saves(self, store):
+        from state_utils import (
+            load_project_state,
+            set_version_notes,
+            undo_last_change,
+            update_project_state,
+        )
+
+        make_project("p", "json")
+        set_version_notes("p", "v2", "sent")
+        update_project_state("p", lambda state: state["metadata"].update(target="staff"))
+        assert undo_last_change("p")["event"] == "notes_edited"
+        state = load_project_state("p")
+        assert state["versions"][1]["notes"] == "" and state["metadata"] == {"target": "staff"}
+
+        # A full save that dropped v3 makes undoing its creation impossible
+        update_project_state("p", lambda state: state["versions"].pop())
+        with pytest.raises(ValueError, match="no longer exists"):
+            undo_last_change("p")
+
+    def test_nothing_to_undo(self, store):
+        from state_utils import load_project_state, save_project_state, undo_last_change
+
+        make_project("p", "json", versions=0)
+        save_project_state("p", load_project_state("p"))
+        with pytest.raises(ValueError, match="Nothing to undo"):
+            undo_last_change("p")
+
+    def test_sqlite_notes_and_no_undo(self, store):
+        from state_utils import get_version, set_version_notes, undo_last_change
+
+        make_project("p", "sqlite")
+        set_version_notes("p", "v2", "sent")
+        assert get_version("p", "v2")["notes"] == "sent"
+        with pytest.raises(ValueError):
+            set_version_notes("p", "v9", "x")
+        with pytest.raises(ValueError):
+            undo_last_change("p")
+
+
+@pytest.mark.parametrize("backend", ["json", "sqlite"])
+class TestSummary:
+    """Tests for the status.json store summary"""
+
+    def test_kept_current_by_every_change(self, store, backend):
+        from init_project import init_project
+        from state_utils import (
+            append_version,
+            get_summary_yaml_path,
+            get_version_path,
+            read_summary,
+            set_active_project,
+            set_active_version,
+        )
+
+        make_project("p", backend)
+        summary = read_summary()
+        assert (summary["active_project"], summary["active_version"], summary["version_count"]) == (
+            "p", "v3", 3)
+        assert summary["yaml_path"] == str(get_version_path("p", "v3") / "resume.yaml")
+
+        set_active_version("p", "v1")
+        assert get_summary_yaml_path() == get_version_path("p", "v1") / "resume.yaml"
+
+        init_project("q", backend=backend)
+        assert read_summary()["active_project"] == "q"
+        assert read_summary()["active_version"] is None and get_summary_yaml_path() is None
+
+        set_active_project("p")
+        # Changes to another project leave the summary alone
+        append_version("q", lambda version_id: {"id": version_id, "tag": None, "parent": None})
+        summary = read_summary()
+        assert (summary["active_project"], summary["active_version"]) == ("p", "v1")
+        assert get_summary_yaml_path("q") is None
+
+    def test_stale_or_damaged_summary_ignored(self, store, backend):
+        import json
+
+        from state_utils import SUMMARY_FILE, read_summary, refresh_summary
+
+        make_project("p", backend)
+        (store / SUMMARY_FILE).write_text("{not json")
+        assert read_summary() is None
+        assert refresh_summary()["active_version"] == "v3"
+
+        moved = json.loads((store / SUMMARY_FILE).read_text())
+        moved["store"] = "/elsewhere/.resume_versions"
+        (store / SUMMARY_FILE).write_text(json.dumps(moved))
+        assert read_summary() is None
@@ -0,0 +1,150 @@
+"""Tests for resume-state/scripts/store_fsck.py"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from store_fsck import check_store, hash_file_mmap, hash_files
+
+
+def make_store(store: Path, tmp_path: Path) -> None:
+    """Project p: v1 imported from a PDF, v2..v4 edits of it (v1..v3 packed)."""
+    from create_version import create_version
+    from delta_store import pack_project
+    from init_project import init_project
+    from object_store import add_file
+    from state_utils import append_version, get_version_path, now_iso
+
+    init_project("p")
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " * 1000)
+
+    def make_entry(version_id):
+        digest = add_file(pdf, store / "projects" / "p" / "sources" / f"{version_id}_resume.pdf",
+                          store, mutable=False)
+        path = get_version_path("p", version_id)
+        path.mkdir(parents=True)
+        (path / "resume.yaml").write_text("summary: v1\nskills: [Go]\n")
+        return {"id": version_id, "tag": None, "created_at": now_iso(),
+                "source": {"type": "import", "file": f"{version_id}_resume.pdf", "sha256": digest},
+                "parent": None, "notes": ""}
+
+    append_version("p", make_entry)
+    for n in (2, 3, 4):
+        create_version("p", content=f"summary: v{n}\nskills: [Go]\n")
+    pack_project("p")
+
+
+def kinds(result) -> list[tuple]:
+    return sorted((p.kind, p.version) for p in result["problems"])
+
+
+class TestHashing:
+    """Tests for hash_file_mmap() and hash_files()"""
+
+    def test_matches_hashlib_and_dedupes_hardlinks(self, tmp_path):
+        import hashlib
+
+        a = tmp_path / "a.bin"
+        a.write_bytes(os.urandom(100_000))
+        os.link(a, tmp_path / "b.bin")
+        (tmp_path / "empty").write_bytes(b"")
+        assert hash_file_mmap(a) == hashlib.sha256(a.read_bytes()).hexdigest()
+        assert hash_file_mmap(tmp_path / "empty") == hashlib.sha256(b"").hexdigest()
+
+        paths = [a, tmp_path / "b.bin", tmp_path / "missing"]
+        hashed = hash_files(paths, jobs=4)
+        assert hashed[a] == hashed[tmp_path / "b.bin"] == (hash_file_mmap(a), None)
+        assert hashed[tmp_path / "missing"][0] is None
+        assert hash_files(paths, jobs=1) == hashed
+
+
+class TestCheckStore:
+    """Tests for check_store()"""
+
+    def test_clean_store(self, store, tmp_path):
+        make_store(store, tmp_path)
+        result = check_store(store, jobs=2)
+        assert result["problems"] == []
+        assert result["stats"]["versions"] == 4
+        # The source and its object are one inode
+        assert result["stats"]["files_hashed"] == result["stats"]["objects"]
+
+    def test_detects_problems(self, store, tmp_path):
+        from object_store import object_path
+        from state_utils import get_version, get_version_path
+
+        make_store(store, tmp_path)
+        (get_version_path("p", "v4") / "resume.yaml").write_text("summary: [unclosed\n")
+        (store / "projects" / "p" / "versions" / "v9").mkdir()
+        packed = get_version("p", "v2")["packed"]["sha256"]
+        snapshot = object_path(packed, store)
+        snapshot.chmod(0o644)
+        snapshot.write_text("summary: tampered\n")
+
+        result = check_store(store)
+        assert kinds(result) == [
+            ("corrupt-object", None),
+            ("damaged-version", "v2"),
+            ("invalid-yaml", "v4"),
+            ("orphan-version-dir", None),
+        ]
+
+    def test_repair_relinks_source_and_quarantines(self, store, tmp_path):
+        source = store / "projects" / "p" / "sources" / "v1_resume.pdf"
+        make_store(store, tmp_path)
+        original = source.read_bytes()
+
+        # A replaced (not hardlinked) copy with different content
+        source.unlink()
+        source.write_bytes(b"%PDF garbage")
+        result = check_store(store, repair=True)
+        assert kinds(result) == [("corrupt-source", "v1")]
+        assert result["problems"][0].repaired == "relinked from object"
+        assert source.read_bytes() == original
+        quarantined = list((store / "quarantine").rglob("v1_resume.pdf"))
+        assert [p.read_bytes() for p in quarantined] == [b"%PDF garbage"]
+        assert check_store(store)["problems"] == []
+
+        source.unlink()
+        result = check_store(store, repair=True)
+        assert kinds(result) == [("missing-source", "v1")]
+        assert source.read_bytes() == original
+
+    def test_repair_restores_corrupt_object_from_source(self, store, tmp_path):
+        from object_store import object_path
+        from state_utils import load_project_state
+
+        make_store(store, tmp_path)
+        source = store / "projects" / "p" / "sources" / "v1_resume.pdf"
+        digest = load_project_state("p")["versions"][0]["source"]["sha256"]
+        obj = object_path(digest, store)
+        original = obj.read_bytes()
+
+        # A separate (not hardlinked) object file that got damaged
+        obj.unlink()
+        obj.write_bytes(b"%PDF bit rot")
+        result = check_store(store, repair=True)
+        assert kinds(result) == [("corrupt-object", None)]
+        assert result["problems"][0].repaired.endswith("restored from source")
+        assert obj.read_bytes() == original
+        assert source.read_bytes() == original
+        assert check_store(store)["problems"] == []
+
+    def test_repair_dangling_active(self, store, tmp_path):
+        from state_utils import get_active_version_id, update_project_state
+
+        make_store(store, tmp_path)
+        update_project_state("p", lambda state: state.update(active_version="v99"))
+        result = check_store(store, repair=True)
+        assert kinds(result) == [("dangling-active", "v99")]
+        assert get_active_version_id("p") == "v4"
+
+    def test_unknown_project(self, store, tmp_path):
+        make_store(store, tmp_path)
+        with pytest.raises(ValueError, match="Project not found"):
+            check_store(store, projects=["nope"])
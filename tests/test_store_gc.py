@@ -0,0 +1,220 @@
+"""Tests for resume-state/scripts/store_gc.py"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from store_gc import collect_garbage, scan_store, usage_report
+
+OLD = time.time() - 90 * 86400
+
+
+def make_versions(count: int, artifacts: bool = True) -> None:
+    """Versions v1..vN with resume.yaml and, optionally, old generated files."""
+    from state_utils import append_version, get_version_path, now_iso
+
+    for _ in range(count):
+        def make_entry(version_id):
+            path = get_version_path("p", version_id)
+            path.mkdir(parents=True)
+            (path / "resume.yaml").write_text(f"summary: {version_id}\n")
+            if artifacts:
+                for name in ("resume.typ", "resume.pdf"):
+                    (path / name).write_bytes(b"x" * 100)
+                    os.utime(path / name, (OLD, OLD))
+                os.utime(path / "resume.yaml", (OLD - 10, OLD - 10))
+            return {"id": version_id, "tag": None, "created_at": now_iso(),
+                    "source": {"type": "edit"}, "parent": None, "notes": ""}
+        append_version("p", make_entry)
+
+
+def removed(result, store) -> set:
+    return {(str(path.relative_to(store)), reason) for path, reason, _ in result["removed"]}
+
+
+class TestScanAndUsage:
+    """Tests for scan_store() and usage_report()"""
+
+    def test_attributes_files(self, store):
+        from init_project import init_project
+
+        init_project("p")
+        make_versions(2)
+        records = scan_store(store, jobs=4)
+        assert sorted(r.path for r in records) == sorted(r.path for r in scan_store(store, jobs=1))
+        usage = usage_report(records)
+        assert usage["by_version"] == {"p/v1": 212, "p/v2": 212}
+        assert usage["by_kind"]["pdf"] == 200 and usage["by_kind"]["typ"] == 200
+        assert usage["total"] == sum(r.size for r in records)
+
+    def test_hardlinks_counted_once(self, store, tmp_path):
+        from init_project import init_project
+        from object_store import add_file
+
+        init_project("p")
+        src = tmp_path / "resume.pdf"
+        src.write_bytes(b"%PDF" * 1000)
+        add_file(src, store / "projects" / "p" / "sources" / "v1_resume.pdf", store, mutable=False)
+        usage = usage_report(scan_store(store))
+        assert usage["total"] - usage["unique"] == 4000
+
+
+class TestCollectGarbage:
+    """Tests for collect_garbage()"""
+
+    def test_retention_keeps_active_and_recent(self, store):
+        from init_project import init_project
+
+        init_project("p")
+        make_versions(4)
+        assert removed(collect_garbage(store, keep_recent=2, dry_run=True), store) == set()
+
+        result = collect_garbage(store, keep_recent=2, prune_artifacts=True)
+        assert removed(result, store) == {
+            ("projects/p/versions/v1/resume.typ", "expired-artifact"),
+            ("projects/p/versions/v1/resume.pdf", "expired-artifact"),
+            ("projects/p/versions/v2/resume.typ", "expired-artifact"),
+            ("projects/p/versions/v2/resume.pdf", "expired-artifact"),
+        }
+        assert not (store / "projects/p/versions/v1/resume.pdf").exists()
+        assert (store / "projects/p/versions/v1/resume.yaml").exists()
+        assert (store / "projects/p/versions/v3/resume.pdf").exists()
+
+    def test_stale_artifacts(self, store):
+        from init_project import init_project
+        from state_utils import set_active_version
+
+        init_project("p")
+        make_versions(2)
+        for vid in ("v1", "v2"):
+            (store / f"projects/p/versions/{vid}/resume.yaml").touch()
+        set_active_version("p", "v2")
+        assert removed(collect_garbage(store, max_age_days=365, dry_run=True), store) == set()
+        # Recent versions keep their output even when it is stale
+        result = collect_garbage(store, max_age_days=365, dry_run=True, prune_artifacts=True)
+        assert removed(result, store) == set()
+
+        result = collect_garbage(store, keep_recent=0, max_age_days=365, dry_run=True,
+                                 prune_artifacts=True)
+        assert removed(result, store) == {
+            ("projects/p/versions/v1/resume.typ", "stale-artifact"),
+            ("projects/p/versions/v1/resume.pdf", "stale-artifact"),
+        }
+        # Dry run keeps everything
+        assert (store / "projects/p/versions/v1/resume.pdf").exists()
+
+    def test_orphans_and_tmp(self, store, tmp_path):
+        from init_project import init_project
+        from object_store import add_file, object_path
+
+        init_project("p")
+        make_versions(1, artifacts=False)
+        project = store / "projects" / "p"
+        (project / "versions" / "v7").mkdir()
+        (project / "versions" / "v7" / "resume.yaml").write_text("leftover\n")
+        src = tmp_path / "cv.pdf"
+        src.write_bytes(b"%PDF")
+        digest = add_file(src, project / "sources" / "v7_cv.pdf", store, mutable=False)
+        os.utime(object_path(digest, store), (OLD, OLD))
+        for name in ("old.tmp", "new.tmp"):
+            (project / name).write_text("")
+        os.utime(project / "old.tmp", (OLD, OLD))
+
+        result = collect_garbage(store)
+        reasons = {reason for _, reason in removed(result, store)}
+        assert removed(result, store) >= {
+            ("projects/p/versions/v7", "orphan-version"),
+            ("projects/p/sources/v7_cv.pdf", "orphan-source"),
+            ("projects/p/old.tmp", "tmp"),
+        }
+        assert reasons == {"orphan-version", "orphan-source", "orphan-object", "tmp"}
+        assert not (project / "versions" / "v7").exists()
+        assert (project / "new.tmp").exists()
+        assert (project / "versions" / "v1" / "resume.yaml").exists()
+
+    def test_keeps_fresh_objects(self, store, tmp_path):
+        from init_project import init_project
+        from object_store import link_object, object_path, put_object
+
+        init_project("p")
+        src = tmp_path / "cv.pdf"
+        src.write_bytes(b"%PDF")
+        os.utime(src, (OLD, OLD))
+        # An import stores its object before it takes the project lock
+        digest = put_object(src, store)
+        collect_garbage(store)
+        link_object(digest, store / "projects" / "p" / "sources" / "v1_cv.pdf", store, mutable=False)
+
+        os.utime(object_path(digest, store), (OLD, OLD))
+        put_object(src, store)
+        collect_garbage(store)
+        assert object_path(digest, store).exists()
+
+    def test_keeps_objects_of_packed_versions(self, store):
+        from delta_store import pack_project, read_version_yaml
+        from init_project import init_project
+        from state_utils import load_project_state
+
+        init_project("p")
+        make_versions(3, artifacts=False)
+        pack_project("p")
+        collect_garbage(store)
+        for entry in load_project_state("p")["versions"]:
+            assert read_version_yaml("p", entry) == f"summary: {entry['id']}\n"
+
+    def test_unreadable_state_keeps_objects(self, store, tmp_path):
+        from init_project import init_project
+        from object_store import add_file
+
+        init_project("p")
+        init_project("q")
+        make_versions(1, artifacts=False)
+        src = tmp_path / "cv.pdf"
+        src.write_bytes(b"%PDF")
+        add_file(src, store / "projects" / "q" / "sources" / "v1_cv.pdf", store, mutable=False)
+        (store / "projects" / "q" / "project.json").write_text("{broken")
+
+        result = collect_garbage(store)
+        assert list(result["unreadable"]) == ["q"]
+        assert "orphan-object" not in {reason for _, reason in removed(result, store)}
+        assert (store / "projects" / "q" / "sources" / "v1_cv.pdf").exists()
+        assert len(list((store / "objects").rglob("*"))) == 2
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_waits_for_running_create(self, store, backend):
+        import threading
+
+        from init_project import init_project
+        from state_utils import append_version, get_version_path, now_iso
+
+        init_project("p", backend=backend)
+        done = threading.Event()
+        gc = threading.Thread(target=lambda: (collect_garbage(store), done.set()))
+
+        def make_entry(version_id):
+            path = get_version_path("p", version_id)
+            path.mkdir(parents=True)
+            (path / "resume.yaml").write_text("summary: new\n")
+            gc.start()
+            # gc must block on the project lock instead of taking the directory
+            assert not done.wait(0.3)
+            return {"id": version_id, "tag": None, "created_at": now_iso(),
+                    "source": {"type": "edit"}, "parent": None, "notes": ""}
+
+        append_version("p", make_entry)
+        gc.join()
+        assert (store / "projects/p/versions/v1/resume.yaml").exists()
+
+    def test_compacts_sqlite(self, store):
+        from init_project import init_project
+
+        init_project("p", backend="sqlite")
+        make_versions(3, artifacts=False)
+        collect_garbage(store)
+        assert not (store / "projects/p/project.db-wal").exists() or \
+            (store / "projects/p/project.db-wal").stat().st_size == 0
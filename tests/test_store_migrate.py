@@ -0,0 +1,133 @@
+"""Tests for resume-state/scripts/store_migrate.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from store_migrate import CURRENT_VERSIONS, MIGRATIONS, migrate, migrate_store, plan
+
+
+def make_legacy_project(name: str, store: Path, backend: str = "json") -> Path:
+    """A 1.0.0 project with one import whose source is a plain copy."""
+    from init_project import init_project
+    from state_utils import append_version, get_version_path, now_iso, update_project_state
+
+    init_project(name, backend=backend)
+    source = store / "projects" / name / "sources" / "v1_resume.pdf"
+
+    def make_entry(version_id):
+        source.write_bytes(b"%PDF-1.4 legacy")
+        path = get_version_path(name, version_id)
+        path.mkdir(parents=True)
+        (path / "resume.yaml").write_text("summary: imported\n")
+        return {"id": version_id, "tag": None, "created_at": now_iso(),
+                "source": {"type": "import", "file": "v1_resume.pdf"},
+                "parent": None, "notes": ""}
+
+    append_version(name, make_entry)
+    update_project_state(name, lambda state: state.update(version="1.0.0"))
+    return source
+
+
+class TestPlan:
+    """Tests for plan() and migrate()"""
+
+    def test_chain_and_errors(self, store, monkeypatch):
+        monkeypatch.setitem(CURRENT_VERSIONS, "config", "1.2.0")
+        monkeypatch.setitem(MIGRATIONS, "config", {
+            "1.0.0": ("1.1.0", lambda data, ctx: data.update(a=1)),
+            "1.1.0": ("1.2.0", lambda data, ctx: "renamed b"),
+        })
+        config = {"version": "1.0.0"}
+        assert migrate("config", config, store) == ["1.0.0 -> 1.1.0", "1.1.0 -> 1.2.0: renamed b"]
+        assert config == {"version": "1.2.0", "a": 1}
+        assert migrate("config", config, store) == []
+        assert len(plan("config", None)) == 2
+
+        with pytest.raises(ValueError, match="newer than"):
+            plan("config", "3.0.0")
+        with pytest.raises(ValueError, match="No migration"):
+            plan("config", "0.9.0")
+
+
+class TestUpgradeProject:
+    """Tests for the in-memory upgrade on reads and the on-disk one on writes"""
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_reads_upgrade_in_memory_only(self, store, tmp_path, backend):
+        from state_utils import load_project_state, read_project_state
+        from store_fsck import check_store
+        from store_gc import collect_garbage
+        from store_sync import sync_stores
+
+        source = make_legacy_project("p", store, backend)
+        state = load_project_state("p")
+        assert state["version"] == "1.1.0"
+        assert "sha256" not in state["versions"][0]["source"]
+
+        check_store(store)
+        collect_garbage(store, dry_run=True)
+        sync_stores(store, tmp_path / "copy")
+        assert read_project_state("p")["version"] == "1.0.0"
+        assert not (store / "objects").exists()
+        assert source.stat().st_nlink == 1
+
+    @pytest.mark.parametrize("backend", ["json", "sqlite"])
+    def test_first_change_upgrades_on_disk(self, store, backend):
+        from object_store import hash_file
+        from state_utils import read_project_state, set_version_notes
+
+        source = make_legacy_project("p", store, backend)
+        set_version_notes("p", "v1", "edited")
+        state = read_project_state("p")
+        assert state["version"] == "1.1.0"
+        assert state["versions"][0]["source"]["sha256"] == hash_file(source)
+        assert state["versions"][0]["notes"] == "edited"
+        # The source is now a hardlink to its object
+        assert source.stat().st_nlink == 2
+
+    def test_newer_schema_rejected(self, store):
+        from state_utils import load_project_state, update_project_state
+
+        make_legacy_project("p", store)
+        update_project_state("p", lambda state: state.update(version="9.0.0"))
+        with pytest.raises(ValueError, match="newer than"):
+            load_project_state("p")
+        with pytest.raises(ValueError, match="newer than"):
+            migrate_store(store)
+
+
+class TestMigrateStore:
+    """Tests for migrate_store()"""
+
+    def test_dry_run_then_upgrade(self, store):
+        from init_project import init_project
+        from state_utils import read_project_state
+
+        make_legacy_project("a", store)
+        make_legacy_project("b", store, backend="sqlite")
+        init_project("current")
+
+        result = migrate_store(store, dry_run=True, jobs=2)
+        assert result["config"] is None
+        assert [(r["project"], r["from"], r["to"]) for r in result["projects"]] == [
+            ("a", "1.0.0", "1.1.0"), ("b", "1.0.0", "1.1.0"),
+        ]
+        assert result["projects"][0]["steps"] == [
+            "1.0.0 -> 1.1.0: recorded SHA-256 of 1 imported source(s)"
+        ]
+        assert read_project_state("a")["version"] == "1.0.0"
+        assert not (store / "objects").exists()
+
+        assert len(migrate_store(store, jobs=2)["projects"]) == 2
+        assert read_project_state("b")["version"] == "1.1.0"
+        assert read_project_state("b")["versions"][0]["source"]["sha256"]
+        assert migrate_store(store)["projects"] == []
+
+    def test_unknown_project(self, store):
+        make_legacy_project("a", store)
+        with pytest.raises(FileNotFoundError):
+            migrate_store(store, projects=["nope"])
@@ -0,0 +1,190 @@
+"""Tests for resume-state/scripts/store_sync.py"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from store_sync import Manifest, origin_key, sync_stores
+
+
+@pytest.fixture
+def stores(tmp_path):
+    return tmp_path / "laptop" / ".resume_versions", tmp_path / "share" / ".resume_versions"
+
+
+def new_store(store: Path, tmp_path: Path, backend: str = "json") -> None:
+    """Project p: v1 imported from a PDF, v2 derived from it."""
+    from create_version import create_version
+    from init_project import init_project
+    from object_store import add_file
+    from state_utils import append_version, get_version_path, now_iso
+
+    init_project("p", backend=backend, store_path=store)
+    pdf = tmp_path / "resume.pdf"
+    pdf.write_bytes(b"%PDF-1.4 " * 1000)
+
+    def make_entry(version_id):
+        digest = add_file(pdf, store / "projects" / "p" / "sources" / f"{version_id}_resume.pdf",
+                          store, mutable=False)
+        path = get_version_path("p", version_id, None, store)
+        path.mkdir(parents=True)
+        (path / "resume.yaml").write_text("summary: imported\n")
+        return {"id": version_id, "tag": None, "created_at": now_iso(),
+                "source": {"type": "import", "file": f"{version_id}_resume.pdf", "sha256": digest},
+                "parent": None, "notes": ""}
+
+    append_version("p", make_entry, store_path=store)
+    create_version("p", tag="google", content="summary: tailored\n", store_path=store)
+
+
+def ids(store: Path) -> list[str]:
+    from state_utils import load_project_state
+
+    return [v["id"] for v in load_project_state("p", store)["versions"]]
+
+
+def read_yaml(store: Path, version_id: str, tag=None) -> str:
+    from state_utils import get_version_path
+
+    return (get_version_path("p", version_id, tag, store) / "resume.yaml").read_text()
+
+
+class TestSyncStores:
+    """Tests for sync_stores()"""
+
+    def test_initial_and_repeat_sync(self, stores, tmp_path):
+        from state_utils import get_active_version_id
+
+        laptop, share = stores
+        new_store(laptop, tmp_path)
+        stats = sync_stores(laptop, share, jobs=2)
+        assert stats.projects_created == ["p"]
+        assert stats.versions_added == 2 and stats.objects_copied > 0
+        assert ids(share) == ["v1", "v2"]
+        assert get_active_version_id("p", share) == "v2"
+        assert read_yaml(share, "v2", "google") == "summary: tailored\n"
+        source = share / "projects" / "p" / "sources" / "v1_resume.pdf"
+        assert source.read_bytes() == b"%PDF-1.4 " * 1000
+
+        again = sync_stores(laptop, share)
+        assert (again.objects_copied, again.files_copied, again.versions_added) == (0, 0, 0)
+        assert again.files_unchanged == stats.files_copied
+        assert (share / "sync-manifest.json").exists()
+
+    def test_diverged_ids_are_renumbered_and_converge(self, stores, tmp_path):
+        from create_version import create_version
+        from state_utils import get_version
+
+        laptop, share = stores
+        new_store(laptop, tmp_path)
+        sync_stores(laptop, share)
+        create_version("p", content="summary: from laptop\n", store_path=laptop)
+        create_version("p", content="summary: from share\n", store_path=share)
+
+        stats = sync_stores(laptop, share)
+        assert stats.renumbered == [("p", "v3", "v4")]
+        entry = get_version("p", "v4", share)
+        assert entry["parent"] == "v2"
+        assert entry["origin"] == origin_key(get_version("p", "v3", laptop))
+        assert read_yaml(share, "v4") == "summary: from laptop\n"
+        assert read_yaml(share, "v3") == "summary: from share\n"
+
+        back = sync_stores(share, laptop)
+        assert back.renumbered == [("p", "v3", "v4")]
+        assert read_yaml(laptop, "v4") == "summary: from share\n"
+        for src, dst in ((laptop, share), (share, laptop)):
+            assert sync_stores(src, dst).versions_added == 0
+        assert len(ids(laptop)) == len(ids(share)) == 4
+
+    def test_sqlite_backend(self, stores, tmp_path):
+        from create_version import create_version
+        from state_utils import uses_sqlite
+
+        laptop, share = stores
+        new_store(laptop, tmp_path, backend="sqlite")
+        sync_stores(laptop, share)
+        assert uses_sqlite("p", share)
+        create_version("p", content="summary: from share\n", store_path=share)
+        create_version("p", content="summary: from laptop\n", store_path=laptop)
+        assert sync_stores(laptop, share).renumbered == [("p", "v3", "v4")]
+        assert ids(share) == ["v1", "v2", "v3", "v4"]
+
+    def test_newer_file_wins(self, stores, tmp_path):
+        from state_utils import get_version_path
+
+        laptop, share = stores
+        new_store(laptop, tmp_path)
+        sync_stores(laptop, share)
+        ours = get_version_path("p", "v2", "google", laptop) / "resume.yaml"
+        theirs = get_version_path("p", "v2", "google", share) / "resume.yaml"
+        ours.write_text("summary: old edit\n")
+        os.utime(ours, (1_000_000_000, 1_000_000_000))
+        theirs.write_text("summary: new edit\n")
+
+        stats = sync_stores(laptop, share)
+        assert stats.kept_newer == [os.path.join("projects", "p", "versions", "v2_google", "resume.yaml")]
+        assert theirs.read_text() == "summary: new edit\n"
+        sync_stores(share, laptop)
+        assert ours.read_text() == "summary: new edit\n"
+
+    def test_dry_run_writes_nothing(self, stores, tmp_path):
+        laptop, share = stores
+        new_store(laptop, tmp_path)
+        stats = sync_stores(laptop, share, dry_run=True)
+        assert stats.versions_added == 2 and stats.files_copied > 0
+        assert not share.exists()
+
+    def test_resumes_after_interruption(self, stores, tmp_path, monkeypatch):
+        import store_sync
+
+        laptop, share = stores
+        new_store(laptop, tmp_path)
+
+        def interrupted(*args, **kwargs):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(store_sync, "insert_versions", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            sync_stores(laptop, share)
+        assert ids(share) == []
+        monkeypatch.undo()
+
+        stats = sync_stores(laptop, share)
+        assert stats.versions_added == 2
+        assert (stats.objects_copied, stats.files_copied) == (0, 0)
+        assert ids(share) == ["v1", "v2"]
+
+    def test_same_store_rejected(self, stores, tmp_path):
+        laptop, _ = stores
+        new_store(laptop, tmp_path)
+        with pytest.raises(ValueError):
+            sync_stores(laptop, laptop)
+        with pytest.raises(FileNotFoundError):
+            sync_stores(laptop, tmp_path / "x", projects=["nope"])
+
+
+class TestManifest:
+    """Tests for Manifest"""
+
+    def test_rehashes_only_changed_files(self, tmp_path, monkeypatch):
+        import store_sync
+
+        (tmp_path / "a").write_text("one")
+        (tmp_path / "b").write_text("two")
+        manifest = Manifest(tmp_path)
+        first = manifest.digests(["a", "b", "missing"])
+        assert first["missing"] is None
+        manifest.save()
+
+        hashed = []
+        real = store_sync.hash_files
+        monkeypatch.setattr(store_sync, "hash_files",
+                            lambda paths, jobs=None: hashed.extend(paths) or real(paths, jobs))
+        (tmp_path / "b").write_text("changed")
+        second = Manifest(tmp_path).digests(["a", "b"])
+        assert hashed == [tmp_path / "b"]
+        assert second["a"] == first["a"] and second["b"] != first["b"]
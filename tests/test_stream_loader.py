@@ -0,0 +1,156 @@
+"""Tests for resume-extractor/scripts/stream_loader.py"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add the stream_loader and yaml_to_typst modules to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-extractor" / "scripts"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-formatter" / "scripts"))
+
+from stream_loader import SectionStream, StreamingResume, iter_sections, scan_section_keys
+
+RESUME = """\
+contact:
+  name: Jane Doe
+  email: jane@example.com
+summary: Researcher.
+publications:
+  - title: Paper One
+    venue: Journal A
+    date: "2020"
+  - title: Paper Two
+    venue: Journal B
+    date: 2021
+skills:
+  Languages: [Python, R]
+education: []
+"""
+
+
+@pytest.fixture
+def resume_file(tmp_path):
+    path = tmp_path / "resume.yaml"
+    path.write_text(RESUME)
+    return path
+
+
+class TestScanSectionKeys:
+    """Tests for scan_section_keys()"""
+
+    def test_top_level_keys_in_order(self, resume_file):
+        assert scan_section_keys(resume_file) == [
+            "contact", "summary", "publications", "skills", "education"
+        ]
+
+    def test_rejects_non_mapping(self, tmp_path):
+        path = tmp_path / "list.yaml"
+        path.write_text("- a\n- b\n")
+        with pytest.raises(ValueError):
+            scan_section_keys(path)
+
+
+class TestIterSections:
+    """Tests for iter_sections()"""
+
+    def test_yields_sections_and_streams(self, resume_file):
+        seen = {}
+        for key, value in iter_sections(resume_file):
+            seen[key] = list(value) if isinstance(value, SectionStream) else value
+        assert seen == yaml.safe_load(RESUME)
+
+    def test_item_errors_reported_with_line(self, resume_file):
+        errors = []
+        for _ in iter_sections(resume_file, validate=True,
+                               on_error=lambda where, msg: errors.append((where, msg))):
+            pass
+        assert errors == [("line 9", "publications[1].date: Input should be a valid string")]
+
+    def test_errors_precede_rest_of_file(self, tmp_path):
+        path = tmp_path / "broken.yaml"
+        path.write_text(RESUME + "talks: [unterminated\n")
+        errors = []
+        with pytest.raises(yaml.YAMLError):
+            for _ in iter_sections(path, validate=True,
+                                   on_error=lambda where, msg: errors.append(msg)):
+                pass
+        assert errors  # the bad publication was reported before the syntax error
+
+    def test_stream_is_single_pass(self, resume_file):
+        for key, value in iter_sections(resume_file):
+            if key == "publications":
+                assert value
+                assert len(list(value)) == 2
+                with pytest.raises(RuntimeError):
+                    list(value)
+
+
+class TestStreamingResume:
+    """Tests for StreamingResume"""
+
+    def test_membership_without_reading(self, resume_file):
+        data = StreamingResume(resume_file)
+        assert "publications" in data and "experience" not in data
+        assert data["summary"] == "Researcher."
+        assert data._streams == {}
+        data.close()
+
+    def test_out_of_order_access_buffers_skipped_list(self, resume_file):
+        data = StreamingResume(resume_file)
+        assert data["skills"] == {"Languages": ["Python", "R"]}
+        assert [p["title"] for p in data["publications"]] == ["Paper One", "Paper Two"]
+        data.close()
+
+    def test_lists_read_on_first_use(self, resume_file):
+        data = StreamingResume(resume_file)
+        publications = data["publications"]
+        assert data._streams == {}
+        assert publications
+        assert list(data._streams) == ["publications"]
+        data.close()
+
+    def test_missing_contact_reported_up_front(self, tmp_path):
+        path = tmp_path / "resume.yaml"
+        path.write_text("summary: x\n")
+        errors = []
+        StreamingResume(path, validate=True, on_error=lambda where, msg: errors.append(msg))
+        assert errors == ["contact: Field required"]
+
+
+class TestRenderTypstStream:
+    """Tests for yaml_to_typst.render_typst_stream()"""
+
+    def test_matches_in_memory_render(self, tmp_path):
+        from yaml_to_typst import get_available_templates, render_typst, render_typst_stream
+
+        script_dir = Path(__file__).parent.parent / "resume-formatter" / "scripts"
+        reference = Path(__file__).parent.parent / "resume-extractor" / "references"
+        data = yaml.safe_load((reference / "resume_schema.yaml").read_text())
+        path = tmp_path / "resume.yaml"
+        path.write_text(yaml.safe_dump(data, sort_keys=False))
+
+        for template in get_available_templates(script_dir):
+            out = io.StringIO()
+            assert render_typst_stream(path, template, script_dir, out) == 0
+            assert out.getvalue() == render_typst(data, template, script_dir)
+
+    def test_invalid_input_writes_nothing(self, tmp_path, capsys):
+        from argparse import Namespace
+
+        from yaml_to_typst import get_available_templates, stream_to_output
+
+        script_dir = Path(__file__).parent.parent / "resume-formatter" / "scripts"
+        path = tmp_path / "resume.yaml"
+        path.write_text(RESUME.replace("date: 2021", "date: [not, a, date]"))
+        template = get_available_templates(script_dir)[0]
+
+        for output in (tmp_path / "resume.typ", None):
+            args = Namespace(yaml_file=path, template=template, output=output,
+                             skip_validation=False)
+            with pytest.raises(SystemExit):
+                stream_to_output(args, script_dir)
+            assert capsys.readouterr().out == ""
+        assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,204 @@
+"""Tests for resume-state/scripts/structural_diff.py"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from structural_diff import (
+    diff_data,
+    diff_texts,
+    fact_similarity,
+    format_changes,
+    resume_facts,
+    summarize,
+)
+
+BASE = {
+    "contact": {"name": "Jane Doe", "title": "Engineer"},
+    "experience": [
+        {"company": "Acme", "positions": [{
+            "title": "Engineer",
+            "dates": "2020 - Present",
+            "achievements": [
+                "Built the billing pipeline processing 2M events per day",
+                "Mentored four junior engineers",
+                "Cut deploy time from 40 to 8 minutes",
+            ],
+        }]},
+        {"company": "Initech", "positions": [{
+            "title": "Intern", "dates": "2019", "achievements": ["Wrote TPS reports"],
+        }]},
+    ],
+    "skills": {"Languages": ["Python", "Go"]},
+}
+
+
+def edited(**changes):
+    import copy
+
+    data = copy.deepcopy(BASE)
+    for path, value in changes.items():
+        data[path] = value
+    return data
+
+
+def ops(changes):
+    return [(c.op, c.path) for c in changes]
+
+
+class TestDiffData:
+    """Tests for diff_data()"""
+
+    def test_identical(self):
+        assert diff_data(BASE, edited()) == []
+
+    def test_scalar_change(self):
+        new = edited()
+        new["contact"]["title"] = "Staff Engineer"
+        changes = diff_data(BASE, new)
+        assert ops(changes) == [("changed", "contact.title")]
+        assert (changes[0].old, changes[0].new) == ("Engineer", "Staff Engineer")
+
+    def test_reworded_bullet_is_one_change(self):
+        new = edited()
+        new["experience"][0]["positions"][0]["achievements"][0] = (
+            "Built the billing pipeline processing 3M events per day"
+        )
+        assert ops(diff_data(BASE, new)) == [
+            ("changed", "experience[Acme].positions[Engineer].achievements[0]")
+        ]
+
+    def test_records_matched_by_identity_not_position(self):
+        new = edited()
+        new["experience"].reverse()
+        new["experience"][1]["location"] = "Remote"
+        assert ops(diff_data(BASE, new)) == [
+            ("moved", "experience[Initech]"),
+            ("added", "experience[Acme].location"),
+        ]
+
+    def test_renamed_company_paired_by_similarity(self):
+        new = edited()
+        new["experience"][0]["company"] = "Acme Inc"
+        assert ops(diff_data(BASE, new)) == [("changed", "experience[Acme Inc].company")]
+
+    def test_added_and_removed_items(self):
+        new = edited(skills={"Languages": ["Python", "Rust"]})
+        del new["experience"][1]
+        assert ops(diff_data(BASE, new)) == [
+            ("removed", "experience[Initech]"),
+            ("removed", "skills.Languages[1]"),
+            ("added", "skills.Languages[1]"),
+        ]
+
+    def test_insertion_does_not_report_moves(self):
+        new = edited()
+        new["experience"][0]["positions"][0]["achievements"].insert(0, "Led the 2024 migration")
+        assert summarize(diff_data(BASE, new)) == {
+            "added": 1, "removed": 0, "changed": 0, "moved": 0
+        }
+
+
+class TestDiffTexts:
+    """Tests for diff_texts()"""
+
+    def test_reindent_is_not_a_change(self):
+        a = yaml.safe_dump(BASE, indent=2, sort_keys=False)
+        b = yaml.safe_dump(BASE, indent=4, sort_keys=False)
+        assert a != b
+        assert diff_texts(a, b) == []
+
+    def test_format_changes(self):
+        new = edited()
+        new["contact"]["title"] = "Staff Engineer"
+        out = format_changes(diff_texts(yaml.safe_dump(BASE), yaml.safe_dump(new)))
+        assert out == "~ contact.title:\n    - Engineer\n    + Staff Engineer"
+
+
+class TestResumeFacts:
+    """Tests for resume_facts() and fact_similarity()"""
+
+    def test_reordering_keeps_facts(self):
+        new = edited()
+        new["experience"].reverse()
+        new["experience"][1]["positions"][0]["achievements"].reverse()
+        assert resume_facts(yaml.safe_dump(BASE)) == resume_facts(yaml.safe_dump(new))
+
+    def test_similarity(self):
+        a = resume_facts(yaml.safe_dump(BASE))
+        new = edited()
+        new["contact"]["title"] = "Staff Engineer"
+        b = resume_facts(yaml.safe_dump(new))
+        assert fact_similarity(a, a) == 1.0
+        assert 0.8 < fact_similarity(a, b) < 1.0
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project with v1 (root), v2 and v3 (children of v1) and v4 (child of v3)."""
+    monkeypatch.setenv("RESUME_VERSIONS_PATH", str(tmp_path / ".resume_versions"))
+    from init_project import init_project
+    from state_utils import append_version, get_version_path, now_iso
+
+    init_project("p")
+    titles = {"v1": ("Engineer", None), "v2": ("Staff Engineer", "v1"),
+              "v3": ("Senior Engineer", "v1"), "v4": ("Principal Engineer", "v3")}
+    for title, parent in titles.values():
+        def make_entry(version_id, title=title, parent=parent):
+            data = edited()
+            data["contact"]["title"] = title
+            path = get_version_path("p", version_id)
+            path.mkdir(parents=True)
+            (path / "resume.yaml").write_text(yaml.safe_dump(data, sort_keys=False))
+            return {"id": version_id, "tag": None, "created_at": now_iso(),
+                    "source": {"type": "edit"}, "parent": parent, "notes": ""}
+        append_version("p", make_entry)
+    return "p"
+
+
+class TestLineageDiffs:
+    """Tests for diff_versions.lineage_diffs()"""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_every_version_against_parent(self, project, jobs):
+        from diff_versions import lineage_diffs
+
+        report = lineage_diffs(project, jobs=jobs)
+        assert [(r["version"], r["parent"]) for r in report] == [
+            ("v2", "v1"), ("v3", "v1"), ("v4", "v3")
+        ]
+        assert report[2]["changes"][0].new == "Principal Engineer"
+
+    def test_single_ancestry(self, project):
+        from diff_versions import lineage_diffs
+
+        report = lineage_diffs(project, "v4", jobs=1)
+        assert [(r["version"], r["parent"]) for r in report] == [("v3", "v1"), ("v4", "v3")]
+
+    def test_unknown_version(self, project):
+        from diff_versions import lineage_diffs
+
+        with pytest.raises(ValueError):
+            lineage_diffs(project, "v9", jobs=1)
+
+
+class TestSimilarityMatrix:
+    """Tests for diff_versions.similarity_matrix()"""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_matches_fact_similarity(self, project, jobs):
+        from diff_versions import similarity_matrix
+        from state_utils import get_version_path
+
+        ids, matrix = similarity_matrix(project, jobs=jobs)
+        assert ids == ["v1", "v2", "v3", "v4"]
+        facts = [resume_facts((get_version_path(project, v) / "resume.yaml").read_text())
+                 for v in ids]
+        for i in range(4):
+            assert matrix[i][i] == 1.0
+            for j in range(4):
+                assert matrix[i][j] == pytest.approx(fact_similarity(facts[i], facts[j]))
@@ -0,0 +1,184 @@
+"""Tests for resume-state/scripts/three_way_merge.py and rebase_versions.py"""
+
+import copy
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-state" / "scripts"))
+
+from three_way_merge import MISSING, dump_resume, merge_data
+
+BASE = {
+    "summary": "Platform engineer.",
+    "experience": [
+        {"company": "Acme", "title": "Engineer", "achievements": [
+            "Migrated 40 services to Kubernetes",
+            "Cut deploy time by 60%",
+            "Mentored four engineers",
+        ]},
+        {"company": "Initech", "title": "Developer", "achievements": ["Built billing"]},
+    ],
+    "skills": ["Go", "Python"],
+}
+
+
+def edit(data, fn):
+    data = copy.deepcopy(data)
+    fn(data)
+    return data
+
+
+class TestMergeData:
+    """Tests for merge_data()"""
+
+    def test_independent_edits_merge(self):
+        ours = edit(BASE, lambda d: d["experience"].insert(0, {"company": "Globex", "title": "Staff"}))
+        theirs = edit(BASE, lambda d: d.update(summary="Reliability engineer."))
+        merged, conflicts = merge_data(BASE, ours, theirs)
+        assert conflicts == []
+        assert merged["summary"] == "Reliability engineer."
+        assert [e["company"] for e in merged["experience"]] == ["Globex", "Acme", "Initech"]
+
+    def test_bullet_edits_on_both_sides(self):
+        def reword(d):
+            d["experience"][0]["achievements"][0] = "Migrated 40 services to Kubernetes on GKE"
+
+        def add(d):
+            d["experience"][0]["achievements"].insert(2, "Ran the on-call rotation")
+
+        merged, conflicts = merge_data(BASE, edit(BASE, reword), edit(BASE, add))
+        assert conflicts == []
+        assert merged["experience"][0]["achievements"] == [
+            "Migrated 40 services to Kubernetes on GKE",
+            "Cut deploy time by 60%",
+            "Ran the on-call rotation",
+            "Mentored four engineers",
+        ]
+
+    def test_deletions(self):
+        ours = edit(BASE, lambda d: d["experience"].pop(1))
+        theirs = edit(BASE, lambda d: d.pop("skills"))
+        merged, conflicts = merge_data(BASE, ours, theirs)
+        assert conflicts == []
+        assert [e["company"] for e in merged["experience"]] == ["Acme"]
+        assert "skills" not in merged
+
+    def test_conflict_reported_and_resolved_by_prefer(self):
+        ours = edit(BASE, lambda d: d["experience"][0].update(title="Senior Engineer"))
+        theirs = edit(BASE, lambda d: d["experience"][0].update(title="Lead Engineer"))
+        merged, conflicts = merge_data(BASE, ours, theirs)
+        assert [c.path for c in conflicts] == ["experience[Acme].title"]
+        assert conflicts[0].to_dict() == {"path": "experience[Acme].title", "base": "Engineer",
+                                          "ours": "Senior Engineer", "theirs": "Lead Engineer"}
+        assert merged["experience"][0]["title"] == "Lead Engineer"
+        merged, _ = merge_data(BASE, ours, theirs, prefer="ours")
+        assert merged["experience"][0]["title"] == "Senior Engineer"
+
+    def test_edit_delete_conflict(self):
+        ours = edit(BASE, lambda d: d.pop("summary"))
+        theirs = edit(BASE, lambda d: d.update(summary="Reliability engineer."))
+        merged, conflicts = merge_data(BASE, ours, theirs, prefer="ours")
+        assert conflicts[0].ours is None and conflicts[0].path == "summary"
+        assert "summary" not in merged
+
+    def test_reorder_on_one_side(self):
+        ours = edit(BASE, lambda d: d["skills"].append("Rust"))
+        theirs = edit(BASE, lambda d: d["experience"].reverse())
+        merged, conflicts = merge_data(BASE, ours, theirs)
+        assert conflicts == []
+        assert [e["company"] for e in merged["experience"]] == ["Initech", "Acme"]
+        assert merged["skills"] == ["Go", "Python", "Rust"]
+
+    def test_same_addition_on_both_sides(self):
+        ours = edit(BASE, lambda d: d["skills"].append("Rust"))
+        theirs = edit(BASE, lambda d: d["skills"].extend(["Rust", "SQL"]))
+        merged, conflicts = merge_data(BASE, ours, theirs)
+        assert conflicts == []
+        assert merged["skills"] == ["Go", "Python", "Rust", "SQL"]
+
+    def test_invalid_prefer(self):
+        with pytest.raises(ValueError):
+            merge_data(BASE, BASE, BASE, prefer="mine")
+        assert repr(MISSING) == "MISSING"
+
+
+class TestDumpResume:
+    """Tests for dump_resume()"""
+
+    def test_round_trip_and_style(self):
+        data = edit(BASE, lambda d: d.update(summary="Line one\nLine two\n"))
+        text = dump_resume(data)
+        assert yaml.safe_load(text) == data
+        assert text.startswith("summary: |\n")
+        assert "experience:\n  - company: Acme" in text
+
+
+class TestRebaseOnto:
+    """Tests for rebase_onto()"""
+
+    def make_tree(self, store):
+        # v1 (master) -> v2 (google, tailored) and v1 -> v3 (updated master)
+        from create_version import create_version
+        from init_project import init_project
+        from state_utils import append_version, get_version_path, now_iso
+
+        init_project("ada")
+
+        def make_entry(version_id):
+            path = get_version_path("ada", version_id, None)
+            path.mkdir(parents=True)
+            (path / "resume.yaml").write_text(dump_resume(BASE))
+            return {"id": version_id, "tag": None, "created_at": now_iso(),
+                    "source": {"type": "edit"}, "parent": None, "notes": ""}
+
+        append_version("ada", make_entry)
+        tailored = edit(BASE, lambda d: d.update(summary="Reliability engineer."))
+        create_version("ada", from_version="v1", tag="google", content=dump_resume(tailored))
+        master = edit(BASE, lambda d: d["skills"].append("Rust"))
+        create_version("ada", from_version="v1", content=dump_resume(master))
+
+    def test_rebase_creates_merged_child(self, store):
+        from rebase_versions import rebase_onto
+        from state_utils import get_active_version_id, get_version, get_version_path
+
+        self.make_tree(store)
+        [result] = rebase_onto("ada", "v3", jobs=1)
+        assert result == {"version": "v2", "base": "v1", "created": "v4",
+                          "conflicts": [], "skipped": None}
+        entry = get_version("ada", "v4")
+        assert entry["parent"] == "v3" and entry["tag"] == "google"
+        assert entry["source"]["rebased_from"] == "v2"
+        assert entry["source"]["merge_base"] == "v1"
+        assert get_active_version_id("ada") == "v3"
+        data = yaml.safe_load((get_version_path("ada", "v4", "google") / "resume.yaml").read_text())
+        assert data["summary"] == "Reliability engineer."
+        assert data["skills"] == ["Go", "Python", "Rust"]
+
+        # Already rebased: nothing left to do
+        assert rebase_onto("ada", "v3", jobs=1) == []
+
+    def test_dry_run_and_skips(self, store):
+        from rebase_versions import rebase_onto
+        from state_utils import load_project_state
+
+        self.make_tree(store)
+        results = rebase_onto("ada", "v3", versions=["v2", "v1"], dry_run=True, jobs=1)
+        assert results[0]["created"] is None and results[0]["skipped"] is None
+        assert results[1]["skipped"] == "already contained in v3"
+        assert len(load_project_state("ada")["versions"]) == 3
+        with pytest.raises(ValueError, match="Version not found"):
+            rebase_onto("ada", "v9", jobs=1)
+
+    def test_fail_on_conflict(self, store):
+        from create_version import create_version
+        from rebase_versions import rebase_onto
+
+        self.make_tree(store)
+        clash = edit(BASE, lambda d: d.update(summary="Data engineer."))
+        create_version("ada", from_version="v3", content=dump_resume(clash))
+        [result] = rebase_onto("ada", "v4", versions=["v2"], fail_on_conflict=True, jobs=1)
+        assert [c["path"] for c in result["conflicts"]] == ["summary"]
+        assert result["created"] is None and result["skipped"] == "1 conflict(s)"
@@ -0,0 +1,188 @@
+"""Tests for resume-optimizer/scripts/validate_server.py"""
+
+import io
+import json
+import sys
+from pathlib import Path
+
+# Add the server module to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "resume-optimizer" / "scripts"))
+
+from validate_server import ERROR, ValidationSession, serve, split_chunks
+
+RESUME = """\
+# Resume
+contact:
+  name: Jane Doe
+  email: jane@example.com
+summary: Platform engineer.
+experience:
+  - company: Acme
+    positions:
+      - title: Engineer
+        dates: "2020 - Present"
+        achievements:
+          - "Built 3 services"
+  - company: Beta
+    positions:
+      - title: Intern
+        dates: "2019"
+        achievements:
+          - "Shipped 2 tools"
+education: []
+skills:
+  Languages: [Python]
+"""
+
+
+class TestSplitChunks:
+    """Tests for split_chunks()"""
+
+    def test_sections_and_items(self):
+        chunks = split_chunks(RESUME)
+        paths = [(c.path, c.start_line) for c in chunks]
+        assert paths == [
+            ("<document>", 0),
+            ("contact", 1),
+            ("summary", 4),
+            ("experience", 5),
+            ("experience[0]", 6),
+            ("experience[1]", 12),
+            ("education", 18),
+            ("skills", 19),
+        ]
+
+    def test_inline_list_is_single_chunk(self):
+        chunks = split_chunks("education: []\n")
+        assert [c.path for c in chunks] == ["education"]
+
+
+class TestValidationSession:
+    """Tests for ValidationSession"""
+
+    def test_valid_document(self):
+        session = ValidationSession()
+        assert [d for d in session.update("a", RESUME) if d["severity"] == ERROR] == []
+
+    def test_error_maps_to_line_and_column(self):
+        session = ValidationSession()
+        text = RESUME.replace('dates: "2019"', "dates: 2019")
+        errors = [d for d in session.update("a", text) if d["severity"] == ERROR]
+        assert len(errors) == 1
+        assert errors[0]["path"] == "experience[1].positions[0].dates"
+        assert (errors[0]["line"], errors[0]["column"]) == (15, 15)
+
+    def test_only_changed_chunks_revalidated(self):
+        session = ValidationSession()
+        session.update("a", RESUME)
+        before = session.chunks_validated
+        session.update("a", RESUME.replace("Shipped 2 tools", "Shipped 4 tools"))
+        assert session.chunks_validated == before + 1
+
+    def test_cached_diagnostics_follow_line_shifts(self):
+        session = ValidationSession()
+        text = RESUME.replace('dates: "2019"', "dates: 2019")
+        session.update("a", text)
+        shifted = text.replace("# Resume\n", "# Resume\n# extra\n# lines\n")
+        errors = [d for d in session.update("a", shifted) if d["severity"] == ERROR]
+        assert errors[0]["line"] == 17
+
+    def test_syntax_error_is_local(self):
+        session = ValidationSession()
+        text = RESUME.replace('          - "Built 3 services"', '          - "Built 3 services')
+        errors = [d for d in session.update("a", text) if d["severity"] == ERROR]
+        assert errors and all("YAML syntax error" in d["message"] for d in errors)
+        assert all(6 <= d["line"] < 12 for d in errors)
+
+    def test_missing_contact_and_duplicates(self):
+        session = ValidationSession()
+        text = "summary: x\nskills: {a: [b]}\nskills: {c: [d]}\n"
+        messages = [d["message"] for d in session.update("a", text)]
+        assert "Missing required section: contact" in messages
+        assert any(m.startswith("Duplicate section 'skills'") for m in messages)
+
+    def test_bullet_lint_columns(self):
+        session = ValidationSession()
+        text = RESUME.replace('"Built 3 services"', '"Helped build 3 services"')
+        infos = [d for d in session.update("a", text) if "weak verb" in d["message"]]
+        assert (infos[0]["line"], infos[0]["column"]) == (11, 13)
+
+
+class TestServe:
+    """Tests for the JSON-RPC stdio loop"""
+
+    @staticmethod
+    def frame(message: dict) -> bytes:
+        body = json.dumps(message).encode()
+        return f"Content-Length: {len(body)}\r\n\r\n".encode() + body
+
+    @staticmethod
+    def read_all(data: bytes) -> list[dict]:
+        messages = []
+        stream = io.BytesIO(data)
+        from validate_server import read_message
+
+        while True:
+            message = read_message(stream)
+            if message is None:
+                return messages
+            messages.append(message)
+
+    def test_session_roundtrip(self):
+        requests = [
+            {"jsonrpc": "2.0", "id": 1, "method": "initialize", "params": {}},
+            {
+                "jsonrpc": "2.0",
+                "method": "textDocument/didOpen",
+                "params": {"textDocument": {"uri": "file:///r.yaml", "text": "summary: x\n"}},
+            },
+            {"jsonrpc": "2.0", "id": 2, "method": "resume/validate", "params": {"text": RESUME}},
+            {"jsonrpc": "2.0", "id": 3, "method": "shutdown"},
+            {"jsonrpc": "2.0", "method": "exit"},
+        ]
+        instream = io.BytesIO(b"".join(self.frame(r) for r in requests))
+        outstream = io.BytesIO()
+
+        assert serve(instream, outstream) == 0
+        responses = self.read_all(outstream.getvalue())
+
+        assert responses[0]["result"]["capabilities"]["textDocumentSync"] == 1
+        published = responses[1]
+        assert published["method"] == "textDocument/publishDiagnostics"
+        assert any(
+            d["message"] == "Missing required section: contact"
+            for d in published["params"]["diagnostics"]
+        )
+        assert responses[2]["id"] == 2
+        assert "diagnostics" in responses[2]["result"]
+        assert responses[3] == {"jsonrpc": "2.0", "id": 3, "result": None}
+
+    def test_malformed_messages_answered_with_errors(self, capsys):
+        body = b"{not json"
+        data = b"".join([
+            self.frame({"jsonrpc": "2.0", "id": 1, "method": "resume/validate", "params": {}}),
+            f"Content-Length: {len(body)}\r\n\r\n".encode() + body,
+            b"Content-Length: abc\r\n\r\n",
+            self.frame({"jsonrpc": "2.0", "method": "textDocument/didOpen", "params": {}}),
+            self.frame({"jsonrpc": "2.0", "id": 2, "method": "textDocument/didChange",
+                        "params": {"textDocument": {"uri": "file:///r.yaml"},
+                                   "contentChanges": [{}]}}),
+            self.frame({"jsonrpc": "2.0", "id": 3, "method": "resume/validate", "params": [1]}),
+            self.frame({"jsonrpc": "2.0", "id": 4, "method": "resume/validate",
+                        "params": {"text": RESUME}}),
+            self.frame({"jsonrpc": "2.0", "id": 5, "method": "shutdown"}),
+            self.frame({"jsonrpc": "2.0", "method": "exit"}),
+        ])
+        outstream = io.BytesIO()
+
+        assert serve(io.BytesIO(data), outstream) == 0
+        responses = self.read_all(outstream.getvalue())
+
+        codes = [(r["id"], r.get("error", {}).get("code")) for r in responses]
+        assert codes == [
+            (1, -32602), (None, -32700), (None, -32700), (2, -32602), (3, -32602),
+            (4, None), (5, None),
+        ]
+        assert responses[0]["error"]["message"] == "Missing params.text"
+        assert "diagnostics" in responses[5]["result"]
+        assert "Missing params.textDocument.uri" in capsys.readouterr().err